@@ -54,7 +54,8 @@ async def _handle_status(
     orchestrator: Orchestrator,
     providers_map: dict[str, Provider],
 ) -> JSONResponse:
-    """Return the status of all providers."""
+    """Return the status of all providers, with their startup times."""
+    timings = orchestrator.startup_timings.to_dict()
     provider_list: list[dict[str, Any]] = []
 
     for node_id, provider in providers_map.items():
@@ -63,10 +64,19 @@ async def _handle_status(
         except Exception:
             healthy = False
 
-        provider_list.append({"id": node_id, "name": provider.name, "healthy": healthy})
+        entry: dict[str, Any] = {"id": node_id, "name": provider.name, "healthy": healthy}
+        if node_id in timings["providers"]:
+            entry["start_ms"] = timings["providers"][node_id]
+        if hasattr(provider, "metrics"):
+            entry["metrics"] = provider.metrics()
+        provider_list.append(entry)
 
     return JSONResponse(
-        content={"running": orchestrator.running, "providers": provider_list},
+        content={
+            "running": orchestrator.running,
+            "providers": provider_list,
+            "startup": {"total_ms": timings["total_ms"], "levels": timings["levels"]},
+        },
     )
 
 
@@ -413,6 +423,7 @@ async def _handle_set_iam_auth(request: Request, iam_auth_bundle: Any) -> JSONRe
             inline_policies=identity_def.get("inline_policies", []),
             boundary_policy=identity_def.get("boundary_policy"),
         )
+    iam_auth_bundle.decision_cache.clear()
     return JSONResponse(content={"config": _serialize_iam_auth_config(config)})
 
 
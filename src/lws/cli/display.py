@@ -162,3 +162,23 @@ def print_startup_complete(
         if count:
             parts.append(f"{count} {label}")
     console.print(f"  [dim]{', '.join(parts)}[/dim]")
+
+
+def print_startup_timings(timings: dict[str, float], total_ms: float, limit: int = 10) -> None:
+    """Print a Rich table of the slowest provider start times.
+
+    Args:
+        timings: Mapping of provider node ID to start time in milliseconds.
+        total_ms: Wall-clock time of the whole startup.
+        limit: Maximum number of providers listed; the full breakdown is
+            available from ``/_ldk/status``.
+    """
+    table = Table(title=f"Provider Startup ({total_ms:.0f} ms)")
+    table.add_column("Provider", style="bold")
+    table.add_column("Time", justify="right")
+    slowest = sorted(timings.items(), key=lambda item: item[1], reverse=True)
+    for node_id, elapsed_ms in slowest[:limit]:
+        table.add_row(node_id, f"{elapsed_ms:.0f} ms")
+    if len(slowest) > limit:
+        table.add_row(f"[dim]{len(slowest) - limit} more[/dim]", "")
+    console.print(table)
@@ -8,11 +8,13 @@ starts local providers, and watches for file changes.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 import shutil
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import typer
 from rich.console import Console
@@ -22,10 +24,11 @@ from lws.cli.display import (
     print_error,
     print_resource_summary,
     print_startup_complete,
+    print_startup_timings,
 )
 from lws.cli.experimental import EXPERIMENTAL_SERVICES
 from lws.config.loader import ConfigError, LdkConfig, load_config
-from lws.graph.builder import AppGraph, NodeType, build_graph
+from lws.graph.builder import AppGraph, NodeType
 from lws.interfaces import (
     ComputeConfig,
     GsiDefinition,
@@ -35,39 +38,42 @@ from lws.interfaces import (
     Provider,
     TableConfig,
 )
-from lws.parser.assembly import AppModel, parse_assembly
-from lws.providers._shared.aws_chaos import AwsChaosConfig
-from lws.providers._shared.aws_iam_auth import IamAuthBundle
-from lws.providers._shared.aws_operation_mock import AwsMockConfig
-from lws.providers.apigateway.provider import ApiGatewayProvider, RouteConfig
-from lws.providers.cognito.provider import CognitoProvider
-from lws.providers.cognito.user_store import PasswordPolicy, UserPoolConfig
-from lws.providers.dynamodb.provider import SqliteDynamoProvider
-from lws.providers.dynamodb.routes import create_dynamodb_app
-from lws.providers.ecs.provider import EcsProvider
-from lws.providers.eventbridge.provider import (
-    EventBridgeProvider,
-    EventBusConfig,
-    RuleConfig,
-    RuleTarget,
-)
-from lws.providers.lambda_runtime.docker import DockerCompute
-from lws.providers.s3.provider import S3Provider
-from lws.providers.s3.routes import create_s3_app
-from lws.providers.sns.provider import SnsProvider, TopicConfig
-from lws.providers.sns.routes import create_sns_app
-from lws.providers.sqs.provider import QueueConfig, RedrivePolicy, SqsProvider
-from lws.providers.sqs.routes import create_sqs_app
-from lws.providers.stepfunctions.provider import (
-    StateMachineConfig,
-    StepFunctionsProvider,
-    WorkflowType,
+from lws.parser.assembly import (
+    ApiDefinition,
+    AppModel,
+    DynamoTable,
+    EventRule,
+    LambdaFunction,
+    LambdaFunctionUrl,
+    SqsQueue,
 )
+from lws.runtime.assembly_cache import load_app
+from lws.runtime.change_detector import CdkChangeDetector
 from lws.runtime.env_builder import build_lambda_env
+from lws.runtime.hot_reload import HotReloader, ResourceChange, RestartRequired
 from lws.runtime.orchestrator import Orchestrator
 from lws.runtime.sdk_env import build_sdk_env
 from lws.runtime.synth import SynthError, ensure_synth
-from lws.runtime.watcher import FileWatcher
+
+if TYPE_CHECKING:
+    from lws.providers._shared.aws_chaos import AwsChaosConfig
+    from lws.providers._shared.aws_iam_auth import IamAuthBundle
+    from lws.providers._shared.aws_operation_mock import AwsMockConfig
+    from lws.providers._shared.delivery_scheduler import DeliveryConfig, DeliveryScheduler
+    from lws.providers.apigateway.provider import ApiGatewayProvider
+    from lws.providers.cognito.password_hasher import PasswordHashConfig
+    from lws.providers.cognito.provider import CognitoProvider
+    from lws.providers.dynamodb.provider import SqliteDynamoProvider
+    from lws.providers.ecs.provider import EcsProvider
+    from lws.providers.eventbridge.provider import EventBridgeProvider, RuleConfig
+    from lws.providers.lambda_function_url.provider import LambdaFunctionUrlProvider
+    from lws.providers.lambda_runtime.worker_pool import WorkerPoolConfig
+    from lws.providers.s3.provider import S3Provider
+    from lws.providers.sns.provider import SnsProvider
+    from lws.providers.sqs.provider import QueueConfig, SqsProvider
+    from lws.providers.stepfunctions.history_store import HistoryConfig
+    from lws.providers.stepfunctions.provider import StepFunctionsProvider
+    from lws.runtime.watcher import FileWatcher
 
 _console = Console()
 
@@ -422,6 +428,11 @@ def _load_and_apply_config(
     log_level_override: str | None,
 ) -> LdkConfig:
     """Load config and apply CLI overrides."""
+    from lws.logging.middleware import (  # pylint: disable=import-outside-toplevel
+        RequestLogPolicy,
+        configure_request_logging,
+    )
+
     try:
         config = load_config(project_dir)
     except ConfigError as exc:
@@ -439,6 +450,13 @@ def _load_and_apply_config(
         level=getattr(logging, config.log_level.upper(), logging.INFO),
         format="%(levelname)s %(name)s: %(message)s",
     )
+    configure_request_logging(
+        RequestLogPolicy(
+            body_bytes=config.request_log_body_bytes,
+            sample_rate=float(config.request_log_sample_rate),
+            disabled_services=frozenset(config.request_log_disabled_services),
+        )
+    )
     return config
 
 
@@ -659,11 +677,14 @@ async def _run_dev_terraform(project_dir: Path, config: LdkConfig) -> None:
     startup_order = list(providers.keys())
 
     try:
-        await orchestrator.start(providers, startup_order)
+        # Terraform mode has no resource graph: every provider is independent
+        await orchestrator.start(providers, startup_order, AppGraph())
     except Exception as exc:
         cleanup_override(project_dir)
         print_error("Failed to start providers", str(exc))
         raise typer.Exit(1)
+    timings = orchestrator.startup_timings
+    print_startup_timings(timings.providers, timings.total_ms)
 
     # Display summary
     _console.print()
@@ -700,6 +721,28 @@ def _create_terraform_providers(
     dict[str, AwsMockConfig],
 ]:
     """Create all service providers for Terraform mode (no app model)."""
+    from lws.providers._shared.delivery_scheduler import (  # pylint: disable=import-outside-toplevel
+        DeliveryScheduler,
+    )
+    from lws.providers.cognito.provider import (  # pylint: disable=import-outside-toplevel
+        CognitoProvider,
+    )
+    from lws.providers.cognito.user_store import (  # pylint: disable=import-outside-toplevel
+        UserPoolConfig,
+    )
+    from lws.providers.dynamodb.provider import (  # pylint: disable=import-outside-toplevel
+        SqliteDynamoProvider,
+    )
+    from lws.providers.eventbridge.provider import (  # pylint: disable=import-outside-toplevel
+        EventBridgeProvider,
+    )
+    from lws.providers.s3.provider import S3Provider  # pylint: disable=import-outside-toplevel
+    from lws.providers.sns.provider import SnsProvider  # pylint: disable=import-outside-toplevel
+    from lws.providers.sqs.provider import SqsProvider  # pylint: disable=import-outside-toplevel
+    from lws.providers.stepfunctions.provider import (  # pylint: disable=import-outside-toplevel
+        StepFunctionsProvider,
+    )
+
     providers: dict[str, Provider] = {}
 
     port = config.port
@@ -728,18 +771,26 @@ def _create_terraform_providers(
         "s3tables": port + 22,
     }
 
-    dynamo_provider = SqliteDynamoProvider(data_dir=data_dir, tables=[])
-    sqs_provider = SqsProvider()
+    dynamo_provider = SqliteDynamoProvider(
+        data_dir=data_dir,
+        tables=[],
+        group_commit_window_ms=config.dynamodb_group_commit_window_ms,
+    )
+    sqs_provider = SqsProvider(**_sqs_durability(config, data_dir))
     s3_provider = S3Provider(data_dir=data_dir)
-    sns_provider = SnsProvider()
-    eb_provider = EventBridgeProvider()
-    sf_provider = StepFunctionsProvider()
+    delivery = DeliveryScheduler(_delivery_config(config))
+    providers["__delivery__"] = delivery
+    sns_provider = SnsProvider(scheduler=delivery)
+    eb_provider = EventBridgeProvider(scheduler=delivery)
+    sf_provider = StepFunctionsProvider(history=_stepfunctions_history_config(config, data_dir))
 
     pool_config = UserPoolConfig(
         user_pool_id="us-east-1_default",
         user_pool_name="default",
     )
-    cognito_provider = CognitoProvider(data_dir=data_dir, config=pool_config)
+    cognito_provider = CognitoProvider(
+        data_dir=data_dir, config=pool_config, hash_config=_cognito_hash_config(config)
+    )
     providers["__cognito_default__"] = cognito_provider
 
     chaos_configs = _create_chaos_configs()
@@ -1089,23 +1140,29 @@ async def _run_dev(
         print_error("CDK synth failed", str(exc))
         raise typer.Exit(1)
 
-    app_model = parse_assembly(cdk_out)
+    data_dir = project_dir / config.data_dir
+    cache_dir = data_dir / "cache"
+    app_model, graph = load_app(cdk_out, cache_dir)
     if not _has_any_resources(app_model):
         print_error("No resources found in cloud assembly", str(cdk_out))
         raise typer.Exit(1)
 
-    graph = build_graph(app_model)
     startup_order = graph.topological_sort()
 
-    data_dir = project_dir / config.data_dir
     data_dir.mkdir(parents=True, exist_ok=True)
     iam_auth_bundle = _create_iam_auth_bundle(config, project_dir)
+    orchestrator = Orchestrator()
+    reloader = await _create_reloader(project_dir, config, app_model, graph, cache_dir)
     providers, chaos_configs, aws_mock_configs = _create_providers(
-        app_model, graph, config, data_dir, iam_auth_bundle=iam_auth_bundle
+        app_model,
+        graph,
+        config,
+        data_dir,
+        iam_auth_bundle=iam_auth_bundle,
+        reloader=reloader,
+        orchestrator=orchestrator,
     )
 
-    orchestrator = Orchestrator()
-
     # Enable WebSocket log streaming
     from lws.logging.logger import (  # pylint: disable=import-outside-toplevel
         WebSocketLogHandler,
@@ -1135,10 +1192,12 @@ async def _run_dev(
             startup_order.append(key)
 
     try:
-        await orchestrator.start(providers, startup_order)
+        await orchestrator.start(providers, startup_order, graph)
     except Exception as exc:
         print_error("Failed to start providers", str(exc))
         raise typer.Exit(1)
+    timings = orchestrator.startup_timings
+    print_startup_timings(timings.providers, timings.total_ms)
 
     # Build function URL port mapping for display
     furl_ports: dict[str, int] = {}
@@ -1154,26 +1213,93 @@ async def _run_dev(
 
     _print_experimental_banner(_service_ports(config.port))
 
-    watcher = FileWatcher(
-        watch_dir=project_dir,
-        include_patterns=config.watch_include,
-        exclude_patterns=config.watch_exclude,
-    )
-    watcher.on_change(lambda path: logging.getLogger("ldk.watcher").info("Changed: %s", path))
-    watcher.start()
+    watcher = _start_watcher(project_dir, config, providers, reloader)
 
     try:
         await orchestrator.wait_for_shutdown()
     finally:
         watcher.stop()
+        await reloader.cancel()
         set_ws_handler(None)
         await orchestrator.stop()
         typer.echo("Goodbye")
 
 
+async def _create_reloader(
+    project_dir: Path,
+    config: LdkConfig,
+    app_model: AppModel,
+    graph: AppGraph,
+    cache_dir: Path | None = None,
+) -> HotReloader:
+    """Create the hot reloader for a CDK project, primed with the current templates."""
+    detector = CdkChangeDetector(project_dir)
+    await detector.load_current_state()
+    return HotReloader(
+        app_model,
+        graph,
+        synth=lambda: ensure_synth(project_dir),
+        detector=detector,
+        parse=lambda cdk_out: load_app(cdk_out, cache_dir)[0],
+        debounce_seconds=config.watch_reload_debounce_ms / 1000,
+    )
+
+
+def _start_watcher(
+    project_dir: Path,
+    config: LdkConfig,
+    providers: dict[str, Provider],
+    reloader: HotReloader | None = None,
+) -> FileWatcher:
+    """Start the file watcher.
+
+    Changes are logged, warm Lambda workers whose code changed are
+    recycled, and when a *reloader* is given a hot reload is scheduled.
+    """
+    from lws.runtime.watcher import FileWatcher  # pylint: disable=import-outside-toplevel
+
+    watcher = FileWatcher(
+        watch_dir=project_dir,
+        include_patterns=config.watch_include,
+        exclude_patterns=config.watch_exclude,
+    )
+    watcher.on_change(lambda path: logging.getLogger("ldk.watcher").info("Changed: %s", path))
+    loop = asyncio.get_running_loop()
+    watcher.on_change(
+        lambda path: asyncio.run_coroutine_threadsafe(
+            _recycle_lambda_workers(providers, path), loop
+        )
+    )
+    if reloader is not None:
+        watcher.on_change(lambda _path: loop.call_soon_threadsafe(reloader.request))
+    watcher.start()
+    return watcher
+
+
+async def _recycle_lambda_workers(providers: dict[str, Provider], path: Path) -> None:
+    """Retire warm Lambda workers whose code lives under the changed *path*.
+
+    This covers functions whose code path is inside the watched project;
+    functions staged under ``cdk.out`` are recycled by hot reload instead.
+    """
+    for provider in providers.values():
+        await _recycle_compute_workers(provider, path)
+
+
+async def _recycle_compute_workers(compute: Any, path: Path | None = None) -> None:
+    """Retire the warm workers of *compute*, if it runs any."""
+    from lws.providers.lambda_runtime.compute_base import (  # pylint: disable=import-outside-toplevel
+        SubprocessCompute,
+    )
+
+    if isinstance(compute, SubprocessCompute):
+        await compute.recycle_workers(path)
+
+
 def _create_dynamo_providers(
     app_model: AppModel,
     graph: AppGraph,
+    config: LdkConfig,
     data_dir: Path,
 ) -> tuple[SqliteDynamoProvider, dict[str, Provider]]:
     """Create DynamoDB table providers from the app model.
@@ -1181,16 +1307,18 @@ def _create_dynamo_providers(
     Always returns a provider (even with no CDK tables) so the DynamoDB
     HTTP endpoint is available for Terraform/CLI table creation.
     """
+    from lws.providers.dynamodb.provider import (  # pylint: disable=import-outside-toplevel
+        SqliteDynamoProvider,
+    )
+
     providers: dict[str, Provider] = {}
-    table_configs: list[TableConfig] = []
-    for table in app_model.tables:
-        ks = _build_key_schema(table.key_schema)
-        gsi_defs = [_build_gsi(g) for g in table.gsi_definitions]
-        table_configs.append(
-            TableConfig(table_name=table.name, key_schema=ks, gsi_definitions=gsi_defs)
-        )
+    table_configs = [_table_config(table) for table in app_model.tables]
 
-    dynamo_provider = SqliteDynamoProvider(data_dir=data_dir, tables=table_configs)
+    dynamo_provider = SqliteDynamoProvider(
+        data_dir=data_dir,
+        tables=table_configs,
+        group_commit_window_ms=config.dynamodb_group_commit_window_ms,
+    )
     for table in app_model.tables:
         node_id = _find_node_id(graph, NodeType.DYNAMODB_TABLE, table.name)
         if node_id:
@@ -1203,27 +1331,13 @@ def _create_compute_providers(
     graph: AppGraph,
     local_endpoints: dict[str, str],
     sdk_env: dict[str, str],
+    worker_pool: WorkerPoolConfig | None = None,
 ) -> tuple[dict[str, ICompute], dict[str, Provider]]:
     """Create Lambda compute providers from the app model (Node.js + Python)."""
     providers: dict[str, Provider] = {}
     compute_providers: dict[str, ICompute] = {}
     for func in app_model.functions:
-        func_env = build_lambda_env(
-            function_name=func.name,
-            function_env=func.environment,
-            local_endpoints=local_endpoints,
-            resolved_refs={},
-        )
-        compute_config = ComputeConfig(
-            function_name=func.name,
-            handler=func.handler,
-            runtime=func.runtime,
-            code_path=func.code_path or Path("."),
-            timeout=func.timeout,
-            memory_size=func.memory,
-            environment=func_env,
-        )
-        compute: ICompute = DockerCompute(config=compute_config, sdk_env=sdk_env)
+        compute = _build_compute(func, local_endpoints, sdk_env, worker_pool)
         compute_providers[func.name] = compute
         node_id = _find_node_id(graph, NodeType.LAMBDA_FUNCTION, func.name)
         if node_id:
@@ -1231,6 +1345,63 @@ def _create_compute_providers(
     return compute_providers, providers
 
 
+def _build_compute(
+    func: LambdaFunction,
+    local_endpoints: dict[str, str],
+    sdk_env: dict[str, str],
+    worker_pool: WorkerPoolConfig | None = None,
+) -> ICompute:
+    """Create the compute provider that runs *func*.
+
+    Functions run in Docker unless *worker_pool* is given, in which case
+    Python and Node.js functions run on warm local worker processes.
+    """
+    from lws.providers.lambda_runtime.docker import (  # pylint: disable=import-outside-toplevel
+        DockerCompute,
+    )
+
+    func_env = build_lambda_env(
+        function_name=func.name,
+        function_env=func.environment,
+        local_endpoints=local_endpoints,
+        resolved_refs={},
+    )
+    compute_config = ComputeConfig(
+        function_name=func.name,
+        handler=func.handler,
+        runtime=func.runtime,
+        code_path=func.code_path or Path("."),
+        timeout=func.timeout,
+        memory_size=func.memory,
+        environment=func_env,
+    )
+    if worker_pool is not None and func.runtime.startswith("python"):
+        from lws.providers.lambda_runtime.python import (  # pylint: disable=import-outside-toplevel
+            PythonCompute,
+        )
+
+        return PythonCompute(config=compute_config, sdk_env=sdk_env, pool=worker_pool)
+    if worker_pool is not None and func.runtime.startswith("nodejs"):
+        from lws.providers.lambda_runtime.nodejs import (  # pylint: disable=import-outside-toplevel
+            NodeJsCompute,
+        )
+
+        return NodeJsCompute(config=compute_config, sdk_env=sdk_env, pool=worker_pool)
+    return DockerCompute(config=compute_config, sdk_env=sdk_env)
+
+
+def _function_registry_config(func: LambdaFunction) -> dict[str, Any]:
+    """Return the ``LambdaRegistry`` configuration of *func*."""
+    return {
+        "FunctionName": func.name,
+        "Runtime": func.runtime,
+        "Handler": func.handler,
+        "Timeout": func.timeout,
+        "MemorySize": func.memory,
+        "Environment": {"Variables": func.environment},
+    }
+
+
 def _create_api_providers(
     app_model: AppModel,
     graph: AppGraph,
@@ -1241,48 +1412,127 @@ def _create_api_providers(
     providers: dict[str, Provider] = {}
     api_provider: ApiGatewayProvider | None = None
     for api_def in app_model.apis:
-        route_configs = [
-            RouteConfig(method=r.method, path=r.path, handler_name=r.handler_name)
-            for r in api_def.routes
-            if r.handler_name and r.handler_name in compute_providers
-        ]
-        if route_configs:
-            api_provider = ApiGatewayProvider(
-                routes=route_configs, compute_providers=compute_providers, port=port
-            )
+        provider = _api_gateway_provider(api_def, compute_providers, port)
+        if provider is not None:
+            api_provider = provider
             node_id = _find_node_id(graph, NodeType.API_GATEWAY, api_def.name)
             if node_id:
                 providers[node_id] = api_provider
     return api_provider, providers
 
 
+def _api_gateway_provider(
+    api_def: ApiDefinition, compute_providers: dict[str, ICompute], port: int
+) -> ApiGatewayProvider | None:
+    """Build the provider serving *api_def*, or None if no route has a handler."""
+    from lws.providers.apigateway.provider import (  # pylint: disable=import-outside-toplevel
+        ApiGatewayProvider,
+        RouteConfig,
+    )
+
+    route_configs = [
+        RouteConfig(method=r.method, path=r.path, handler_name=r.handler_name)
+        for r in api_def.routes
+        if r.handler_name and r.handler_name in compute_providers
+    ]
+    if not route_configs:
+        return None
+    return ApiGatewayProvider(routes=route_configs, compute_providers=compute_providers, port=port)
+
+
+def _sqs_durability(config: LdkConfig, data_dir: Path) -> dict[str, Any]:
+    """Return the ``SqsProvider`` keyword arguments for durable queues.
+
+    Queues are only written to disk when both ``persist`` and
+    ``sqs.durable`` are enabled.
+    """
+    durable = config.persist and config.sqs_durable
+    return {
+        "data_dir": data_dir if durable else None,
+        "fsync_interval_ms": config.sqs_fsync_interval_ms,
+    }
+
+
+def _cognito_hash_config(config: LdkConfig) -> PasswordHashConfig:
+    """Return the Cognito password hashing settings from ``cognito.*`` config."""
+    from lws.providers.cognito.password_hasher import (  # pylint: disable=import-outside-toplevel
+        PasswordHashConfig,
+    )
+
+    return PasswordHashConfig(
+        iterations=config.cognito_hash_iterations,
+        max_workers=config.cognito_hash_workers,
+        executor=config.cognito_hash_executor,
+        verify_cache_ttl_s=config.cognito_verify_cache_ttl_ms / 1000,
+    )
+
+
+def _lambda_worker_pool_config(config: LdkConfig) -> WorkerPoolConfig | None:
+    """Return the warm worker settings, or ``None`` to run functions in Docker."""
+    from lws.providers.lambda_runtime.worker_pool import (  # pylint: disable=import-outside-toplevel
+        WorkerPoolConfig,
+    )
+
+    if config.lambda_warm_workers <= 0:
+        return None
+    return WorkerPoolConfig(
+        max_workers=config.lambda_warm_workers,
+        idle_timeout=config.lambda_worker_idle_timeout_ms / 1000,
+    )
+
+
+def _delivery_config(config: LdkConfig) -> DeliveryConfig:
+    """Return the SNS/EventBridge fan-out settings from ``delivery.*`` config."""
+    from lws.providers._shared.delivery_scheduler import (  # pylint: disable=import-outside-toplevel
+        DeliveryConfig,
+    )
+
+    return DeliveryConfig(
+        max_concurrency=config.delivery_max_concurrency,
+        max_per_target=config.delivery_max_per_target,
+        queue_size=config.delivery_queue_size,
+        batch_size=config.delivery_batch_size,
+        max_attempts=config.delivery_max_attempts,
+        retry_backoff_s=config.delivery_retry_backoff_ms / 1000,
+    )
+
+
+def _stepfunctions_history_config(config: LdkConfig, data_dir: Path) -> HistoryConfig:
+    """Return the execution history retention from ``stepfunctions.*`` config.
+
+    Completed executions are spilled to a scratch SQLite file under the
+    data directory when ``persist`` is enabled, and kept in memory otherwise.
+    """
+    from lws.providers.stepfunctions.history_store import (  # pylint: disable=import-outside-toplevel
+        HistoryConfig,
+    )
+
+    return HistoryConfig(
+        max_executions=config.stepfunctions_history_max_executions,
+        max_age_s=config.stepfunctions_history_max_age_ms / 1000,
+        max_bytes=config.stepfunctions_history_max_bytes,
+        spill_path=data_dir / "stepfunctions" / "history.sqlite" if config.persist else None,
+    )
+
+
 def _create_sqs_providers(
     app_model: AppModel,
     graph: AppGraph,
+    config: LdkConfig,
+    data_dir: Path,
 ) -> tuple[SqsProvider, dict[str, Provider]]:
     """Create SQS queue providers from the app model.
 
     Always returns a provider (even with no CDK queues) so the SQS
     HTTP endpoint is available for Terraform/CLI queue creation.
     """
+    from lws.providers.sqs.provider import SqsProvider  # pylint: disable=import-outside-toplevel
+
     providers: dict[str, Provider] = {}
-    queue_configs = []
-    for q in app_model.queues:
-        redrive = None
-        if q.redrive_target:
-            redrive = RedrivePolicy(
-                dead_letter_queue_name=q.redrive_target, max_receive_count=q.max_receive_count
-            )
-        queue_configs.append(
-            QueueConfig(
-                queue_name=q.name,
-                visibility_timeout=q.visibility_timeout,
-                is_fifo=q.is_fifo,
-                content_based_dedup=q.content_based_dedup,
-                redrive_policy=redrive,
-            )
-        )
-    sqs_provider = SqsProvider(queues=queue_configs if queue_configs else None)
+    queue_configs = [_queue_config(q) for q in app_model.queues]
+    sqs_provider = SqsProvider(
+        queues=queue_configs if queue_configs else None, **_sqs_durability(config, data_dir)
+    )
     for q in app_model.queues:
         node_id = _find_node_id(graph, NodeType.SQS_QUEUE, q.name)
         if node_id:
@@ -1290,6 +1540,27 @@ def _create_sqs_providers(
     return sqs_provider, providers
 
 
+def _queue_config(q: SqsQueue) -> QueueConfig:
+    """Convert a parsed SQS queue to a ``QueueConfig``."""
+    from lws.providers.sqs.provider import (  # pylint: disable=import-outside-toplevel
+        QueueConfig,
+        RedrivePolicy,
+    )
+
+    redrive = None
+    if q.redrive_target:
+        redrive = RedrivePolicy(
+            dead_letter_queue_name=q.redrive_target, max_receive_count=q.max_receive_count
+        )
+    return QueueConfig(
+        queue_name=q.name,
+        visibility_timeout=q.visibility_timeout,
+        is_fifo=q.is_fifo,
+        content_based_dedup=q.content_based_dedup,
+        redrive_policy=redrive,
+    )
+
+
 def _create_s3_providers(
     app_model: AppModel,
     graph: AppGraph,
@@ -1300,6 +1571,8 @@ def _create_s3_providers(
     Always returns a provider (even with no CDK buckets) so the S3
     HTTP endpoint is available for Terraform/CLI bucket creation.
     """
+    from lws.providers.s3.provider import S3Provider  # pylint: disable=import-outside-toplevel
+
     providers: dict[str, Provider] = {}
     bucket_names = [b.name for b in app_model.buckets]
     s3_provider = S3Provider(data_dir=data_dir, buckets=bucket_names if bucket_names else None)
@@ -1315,17 +1588,23 @@ def _create_s3_providers(
 def _create_sns_providers(
     app_model: AppModel,
     graph: AppGraph,
+    delivery: DeliveryScheduler | None = None,
 ) -> tuple[SnsProvider, dict[str, Provider]]:
     """Create SNS topic providers from the app model.
 
     Always returns a provider (even with no CDK topics) so the SNS
     HTTP endpoint is available for Terraform/CLI topic creation.
     """
+    from lws.providers.sns.provider import (  # pylint: disable=import-outside-toplevel
+        SnsProvider,
+        TopicConfig,
+    )
+
     providers: dict[str, Provider] = {}
     topic_configs = [
         TopicConfig(topic_name=t.name, topic_arn=t.topic_arn) for t in app_model.topics
     ]
-    sns_provider = SnsProvider(topics=topic_configs if topic_configs else None)
+    sns_provider = SnsProvider(topics=topic_configs if topic_configs else None, scheduler=delivery)
     for t in app_model.topics:
         node_id = _find_node_id(graph, NodeType.SNS_TOPIC, t.name)
         if node_id:
@@ -1336,34 +1615,27 @@ def _create_sns_providers(
 def _create_eventbridge_providers(
     app_model: AppModel,
     graph: AppGraph,
+    delivery: DeliveryScheduler | None = None,
 ) -> tuple[EventBridgeProvider, dict[str, Provider]]:
     """Create EventBridge providers from the app model.
 
     Always returns a provider (even with no CDK buses) so the EventBridge
     HTTP endpoint is available for Terraform/CLI event bus creation.
     """
+    from lws.providers.eventbridge.provider import (  # pylint: disable=import-outside-toplevel
+        EventBridgeProvider,
+        EventBusConfig,
+    )
+
     providers: dict[str, Provider] = {}
     bus_configs = [
         EventBusConfig(bus_name=b.name, bus_arn=b.bus_arn) for b in app_model.event_buses
     ]
-    rule_configs = []
-    for r in app_model.event_rules:
-        targets = [
-            RuleTarget(target_id=t["target_id"], arn=t["arn"], input_path=t.get("input_path"))
-            for t in r.targets
-        ]
-        rule_configs.append(
-            RuleConfig(
-                rule_name=r.rule_name,
-                event_bus_name=r.event_bus_name,
-                event_pattern=r.event_pattern,
-                schedule_expression=r.schedule_expression,
-                targets=targets,
-            )
-        )
+    rule_configs = [_rule_config(r) for r in app_model.event_rules]
     eb_provider = EventBridgeProvider(
         buses=bus_configs if bus_configs else None,
         rules=rule_configs if rule_configs else None,
+        scheduler=delivery,
     )
     for b in app_model.event_buses:
         node_id = _find_node_id(graph, NodeType.EVENT_BUS, b.name)
@@ -1372,15 +1644,42 @@ def _create_eventbridge_providers(
     return eb_provider, providers
 
 
+def _rule_config(r: EventRule) -> RuleConfig:
+    """Convert a parsed EventBridge rule to a ``RuleConfig``."""
+    from lws.providers.eventbridge.provider import (  # pylint: disable=import-outside-toplevel
+        RuleConfig,
+        RuleTarget,
+    )
+
+    targets = [
+        RuleTarget(target_id=t["target_id"], arn=t["arn"], input_path=t.get("input_path"))
+        for t in r.targets
+    ]
+    return RuleConfig(
+        rule_name=r.rule_name,
+        event_bus_name=r.event_bus_name,
+        event_pattern=r.event_pattern,
+        schedule_expression=r.schedule_expression,
+        targets=targets,
+    )
+
+
 def _create_stepfunctions_providers(
     app_model: AppModel,
     graph: AppGraph,
+    history: HistoryConfig | None = None,
 ) -> tuple[StepFunctionsProvider, dict[str, Provider]]:
     """Create Step Functions providers from the app model.
 
     Always returns a provider (even with no CDK state machines) so the
     Step Functions HTTP endpoint is available for Terraform/CLI creation.
     """
+    from lws.providers.stepfunctions.provider import (  # pylint: disable=import-outside-toplevel
+        StateMachineConfig,
+        StepFunctionsProvider,
+        WorkflowType,
+    )
+
     providers: dict[str, Provider] = {}
     sm_configs = []
     for sm in app_model.state_machines:
@@ -1396,6 +1695,7 @@ def _create_stepfunctions_providers(
         )
     sf_provider = StepFunctionsProvider(
         state_machines=sm_configs if sm_configs else None,
+        history=history,
     )
     for sm in app_model.state_machines:
         node_id = _find_node_id(graph, NodeType.STATE_MACHINE, sm.name)
@@ -1412,6 +1712,8 @@ def _create_ecs_providers(
 
     Always returns a provider (even with no CDK services).
     """
+    from lws.providers.ecs.provider import EcsProvider  # pylint: disable=import-outside-toplevel
+
     providers: dict[str, Provider] = {}
     ecs_provider = EcsProvider(
         services=app_model.ecs_services if app_model.ecs_services else None,
@@ -1428,19 +1730,30 @@ def _create_cognito_providers(
     app_model: AppModel,
     data_dir: Path,
     compute_providers: dict[str, ICompute],
+    hash_config: PasswordHashConfig | None = None,
 ) -> tuple[CognitoProvider, dict[str, Provider]]:
     """Create Cognito user pool providers from the app model.
 
     Always returns a provider (even with no CDK user pools) so the
     Cognito HTTP endpoint is available for Terraform/CLI user pool creation.
     """
+    from lws.providers.cognito.provider import (  # pylint: disable=import-outside-toplevel
+        CognitoProvider,
+    )
+    from lws.providers.cognito.user_store import (  # pylint: disable=import-outside-toplevel
+        PasswordPolicy,
+        UserPoolConfig,
+    )
+
     providers: dict[str, Provider] = {}
     if not app_model.user_pools:
         pool_config = UserPoolConfig(
             user_pool_id="us-east-1_default",
             user_pool_name="default",
         )
-        cognito_provider = CognitoProvider(data_dir=data_dir, config=pool_config)
+        cognito_provider = CognitoProvider(
+            data_dir=data_dir, config=pool_config, hash_config=hash_config
+        )
         return cognito_provider, providers
     # Use the first user pool (multi-pool support can be added later)
     pool = app_model.user_pools[0]
@@ -1461,18 +1774,41 @@ def _create_cognito_providers(
         pre_authentication_trigger=pool.pre_auth_trigger,
         post_confirmation_trigger=pool.post_confirm_trigger,
     )
-    trigger_funcs = {}
-    if pool.pre_auth_trigger and pool.pre_auth_trigger in compute_providers:
-        trigger_funcs["PreAuthentication"] = compute_providers[pool.pre_auth_trigger]
-    if pool.post_confirm_trigger and pool.post_confirm_trigger in compute_providers:
-        trigger_funcs["PostConfirmation"] = compute_providers[pool.post_confirm_trigger]
+    trigger_funcs = {
+        name: _cognito_trigger(name, compute_providers)
+        for name in (pool.pre_auth_trigger, pool.post_confirm_trigger)
+        if name and name in compute_providers
+    }
     cognito_provider = CognitoProvider(
-        data_dir=data_dir, config=pool_config, trigger_functions=trigger_funcs or None
+        data_dir=data_dir,
+        config=pool_config,
+        trigger_functions=trigger_funcs or None,
+        hash_config=hash_config,
     )
     providers[f"__cognito_{pool.logical_id}__"] = cognito_provider
     return cognito_provider, providers
 
 
+def _cognito_trigger(
+    function_name: str, compute_providers: dict[str, ICompute]
+) -> Callable[[dict], Awaitable[dict]]:
+    """Return a Cognito trigger that invokes *function_name*.
+
+    The compute provider is looked up on every call, so a function
+    restarted by hot reload is used without rebuilding the user pool.
+    """
+    from lws.providers._shared.lambda_helpers import (  # pylint: disable=import-outside-toplevel
+        build_default_lambda_context,
+    )
+
+    async def _trigger(event: dict) -> dict:
+        compute = compute_providers[function_name]
+        result = await compute.invoke(event, build_default_lambda_context(function_name))
+        return result.payload or {}
+
+    return _trigger
+
+
 def _wire_remaining_providers(
     app_model: AppModel,
     graph: AppGraph,
@@ -1487,6 +1823,9 @@ def _wire_remaining_providers(
     eb_port: int,
     sf_port: int,
     cognito_port: int,
+    hash_config: PasswordHashConfig | None = None,
+    delivery: DeliveryScheduler | None = None,
+    history: HistoryConfig | None = None,
 ) -> tuple[
     SnsProvider,
     EventBridgeProvider,
@@ -1494,24 +1833,24 @@ def _wire_remaining_providers(
     CognitoProvider,
 ]:
     """Wire messaging, cognito, and API Gateway providers."""
-    sns_provider, sns_providers = _create_sns_providers(app_model, graph)
+    sns_provider, sns_providers = _create_sns_providers(app_model, graph, delivery)
     providers.update(sns_providers)
     sns_provider.set_compute_providers(compute_providers)
     sns_provider.set_queue_provider(sqs_provider)
     local_endpoints["sns"] = f"http://127.0.0.1:{sns_port}"
 
-    eb_provider, eb_providers = _create_eventbridge_providers(app_model, graph)
+    eb_provider, eb_providers = _create_eventbridge_providers(app_model, graph, delivery)
     providers.update(eb_providers)
     eb_provider.set_compute_providers(compute_providers)
     local_endpoints["events"] = f"http://127.0.0.1:{eb_port}"
 
-    sf_provider, sf_providers = _create_stepfunctions_providers(app_model, graph)
+    sf_provider, sf_providers = _create_stepfunctions_providers(app_model, graph, history)
     providers.update(sf_providers)
     sf_provider.set_compute_providers(compute_providers)
     local_endpoints["stepfunctions"] = f"http://127.0.0.1:{sf_port}"
 
     cognito_provider, cognito_providers = _create_cognito_providers(
-        app_model, data_dir, compute_providers
+        app_model, data_dir, compute_providers, hash_config
     )
     providers.update(cognito_providers)
     local_endpoints["cognito-idp"] = f"http://127.0.0.1:{cognito_port}"
@@ -1532,33 +1871,42 @@ def _create_function_url_providers(
     lambda_registry: Any,
 ) -> None:
     """Create Function URL providers for each configured URL."""
-    from lws.providers.lambda_function_url.provider import (  # pylint: disable=import-outside-toplevel
-        LambdaFunctionUrlProvider,
-    )
-
     function_url_base_port = base_port + 23
     for i, furl in enumerate(app_model.function_urls):
-        furl_port = function_url_base_port + i
         compute = compute_providers.get(furl.function_name)
         if compute is None:
             continue
-        furl_provider = LambdaFunctionUrlProvider(
-            function_name=furl.function_name,
-            compute=compute,
-            port=furl_port,
-            cors_config=furl.cors,
+        furl_provider = _register_function_url(
+            furl, compute, function_url_base_port + i, lambda_registry
         )
         providers[f"__function_url_{furl.function_name}__"] = furl_provider
-        url_config = {
-            "FunctionName": furl.function_name,
-            "FunctionArn": (f"arn:aws:lambda:us-east-1:000000000000:function:{furl.function_name}"),
-            "AuthType": furl.auth_type,
-            "Cors": furl.cors,
-            "InvokeMode": furl.invoke_mode,
-            "FunctionUrl": f"http://localhost:{furl_port}/",
-            "_port": furl_port,
-        }
-        lambda_registry.register_function_url(furl.function_name, url_config, furl_provider)
+
+
+def _register_function_url(
+    furl: LambdaFunctionUrl, compute: ICompute, port: int, lambda_registry: Any
+) -> LambdaFunctionUrlProvider:
+    """Build the provider serving *furl* on *port* and register its URL config."""
+    from lws.providers.lambda_function_url.provider import (  # pylint: disable=import-outside-toplevel
+        LambdaFunctionUrlProvider,
+    )
+
+    furl_provider = LambdaFunctionUrlProvider(
+        function_name=furl.function_name,
+        compute=compute,
+        port=port,
+        cors_config=furl.cors,
+    )
+    url_config = {
+        "FunctionName": furl.function_name,
+        "FunctionArn": (f"arn:aws:lambda:us-east-1:000000000000:function:{furl.function_name}"),
+        "AuthType": furl.auth_type,
+        "Cors": furl.cors,
+        "InvokeMode": furl.invoke_mode,
+        "FunctionUrl": f"http://localhost:{port}/",
+        "_port": port,
+    }
+    lambda_registry.register_function_url(furl.function_name, url_config, furl_provider)
+    return furl_provider
 
 
 def _register_ssm_secretsmanager_providers(
@@ -1613,12 +1961,20 @@ def _create_providers(
     config: LdkConfig,
     data_dir: Path,
     iam_auth_bundle: IamAuthBundle | None = None,
+    reloader: HotReloader | None = None,
+    orchestrator: Orchestrator | None = None,
 ) -> tuple[dict[str, Provider], dict[str, AwsChaosConfig], dict[str, AwsMockConfig]]:
     """Instantiate providers from the parsed app model.
 
     Returns a provider map (including the Lambda HTTP server on port+9)
-    and a chaos config map for runtime updates.
+    and a chaos config map for runtime updates.  When a *reloader* and the
+    *orchestrator* that will run the providers are given, appliers that
+    patch the created providers on hot reload are registered with it.
     """
+    from lws.providers._shared.delivery_scheduler import (  # pylint: disable=import-outside-toplevel
+        DeliveryScheduler,
+    )
+
     providers: dict[str, Provider] = {}
 
     # Port allocation: base+1 DynamoDB, +2 SQS, +3 S3, +4 SNS, +5 EventBridge,
@@ -1634,10 +1990,10 @@ def _create_providers(
     secretsmanager_port = config.port + 13
 
     # 1. Storage providers (no deps)
-    dynamo_provider, dynamo_providers = _create_dynamo_providers(app_model, graph, data_dir)
+    dynamo_provider, dynamo_providers = _create_dynamo_providers(app_model, graph, config, data_dir)
     providers.update(dynamo_providers)
 
-    sqs_provider, sqs_providers = _create_sqs_providers(app_model, graph)
+    sqs_provider, sqs_providers = _create_sqs_providers(app_model, graph, config, data_dir)
     providers.update(sqs_providers)
 
     s3_provider, s3_providers = _create_s3_providers(app_model, graph, data_dir)
@@ -1651,12 +2007,15 @@ def _create_providers(
 
     # 3. Compute (Lambda — Node.js + Python)
     sdk_env = build_sdk_env(local_endpoints)
+    worker_pool = _lambda_worker_pool_config(config)
     compute_providers, compute_graph_providers = _create_compute_providers(
-        app_model, graph, local_endpoints, sdk_env
+        app_model, graph, local_endpoints, sdk_env, worker_pool
     )
     providers.update(compute_graph_providers)
 
     # 4-6. Messaging, ECS, Cognito, API Gateway
+    delivery = DeliveryScheduler(_delivery_config(config))
+    providers["__delivery__"] = delivery
     sns_provider, eb_provider, sf_provider, cognito_provider = _wire_remaining_providers(
         app_model,
         graph,
@@ -1670,6 +2029,9 @@ def _create_providers(
         eb_port=eb_port,
         sf_port=sf_port,
         cognito_port=cognito_port,
+        hash_config=_cognito_hash_config(config),
+        delivery=delivery,
+        history=_stepfunctions_history_config(config, data_dir),
     )
     _ecs_provider, ecs_providers = _create_ecs_providers(app_model, graph)
     providers.update(ecs_providers)
@@ -1684,15 +2046,9 @@ def _create_providers(
     lambda_registry = LambdaRegistry()
 
     for func in app_model.functions:
-        func_config = {
-            "FunctionName": func.name,
-            "Runtime": func.runtime,
-            "Handler": func.handler,
-            "Timeout": func.timeout,
-            "MemorySize": func.memory,
-            "Environment": {"Variables": func.environment},
-        }
-        lambda_registry.register(func.name, func_config, compute_providers[func.name])
+        lambda_registry.register(
+            func.name, _function_registry_config(func), compute_providers[func.name]
+        )
 
     # 8. Add SSM and Secrets Manager endpoints, rebuild SDK env, update compute
     local_endpoints["ssm"] = f"http://127.0.0.1:{ssm_port}"
@@ -1757,9 +2113,185 @@ def _create_providers(
     # Mock server provider
     _register_mock_provider(providers, config.port, data_dir.parent)
 
+    if reloader is not None and orchestrator is not None:
+        _ReloadTargets(
+            orchestrator=orchestrator,
+            compute_providers=compute_providers,
+            lambda_registry=lambda_registry,
+            local_endpoints=local_endpoints,
+            dynamo=dynamo_provider,
+            sqs=sqs_provider,
+            s3=s3_provider,
+            sns=sns_provider,
+            eventbridge=eb_provider,
+            stepfunctions=sf_provider,
+            port=config.port,
+            worker_pool=worker_pool,
+        ).register(reloader)
+
     return providers, chaos_configs, aws_mock_configs
 
 
+@dataclass
+class _ReloadTargets:
+    """Running providers that hot reload patches in place.
+
+    Functions and their Function URLs are restarted with the new
+    configuration; new tables, queues, buckets, topics and buses are
+    created; rules, state machines and API routes are replaced.  Updating
+    or removing a storage resource would discard its data, so those need
+    a restart.
+    """
+
+    orchestrator: Orchestrator
+    compute_providers: dict[str, ICompute]
+    lambda_registry: Any
+    local_endpoints: dict[str, str]
+    dynamo: SqliteDynamoProvider
+    sqs: SqsProvider
+    s3: S3Provider
+    sns: SnsProvider
+    eventbridge: EventBridgeProvider
+    stepfunctions: StepFunctionsProvider
+    port: int
+    worker_pool: WorkerPoolConfig | None = None
+
+    def register(self, reloader: HotReloader) -> None:
+        """Register an applier for each resource kind that can be hot reloaded."""
+        reloader.register("function", self.apply_function)
+        reloader.register("function_url", self.apply_function_url)
+        reloader.register("api", self.apply_api)
+        reloader.register("table", self.apply_table)
+        reloader.register("queue", self.apply_queue)
+        reloader.register("bucket", self.apply_bucket)
+        reloader.register("topic", self.apply_topic)
+        reloader.register("event_bus", self.apply_event_bus)
+        reloader.register("event_rule", self.apply_event_rule)
+        reloader.register("state_machine", self.apply_state_machine)
+
+    async def apply_function(self, change: ResourceChange) -> None:
+        """Restart the compute provider (and Function URL) of a function.
+
+        The warm workers of the previous compute are recycled explicitly:
+        a CDK function's code is staged under ``cdk.out``, which the file
+        watcher ignores, so an edited handler only reaches its workers
+        through this reload.
+        """
+        previous = self.compute_providers.get(change.name)
+        if change.change_type == "REMOVE":
+            self.compute_providers.pop(change.name, None)
+            self.lambda_registry.delete(change.name)
+            await self.orchestrator.replace(change.name, None)
+            await _recycle_compute_workers(previous)
+            return
+        func = change.new
+        compute = _build_compute(
+            func, self.local_endpoints, build_sdk_env(self.local_endpoints), self.worker_pool
+        )
+        await self.orchestrator.replace(func.name, compute)
+        self.compute_providers[func.name] = compute
+        await _recycle_compute_workers(previous)
+        self.lambda_registry.register(func.name, _function_registry_config(func), compute)
+        url_provider = self.lambda_registry.function_url_providers.get(func.name)
+        if url_provider is not None:
+            url_provider = url_provider.with_compute(compute)
+            await self.orchestrator.replace(f"__function_url_{func.name}__", url_provider)
+            self.lambda_registry.function_url_providers[func.name] = url_provider
+
+    async def apply_function_url(self, change: ResourceChange) -> None:
+        """Serve a Function URL with its new configuration, keeping its port."""
+        node_id = f"__function_url_{change.name}__"
+        if change.change_type == "REMOVE":
+            self.lambda_registry.delete_function_url(change.name)
+            await self.orchestrator.replace(node_id, None)
+            return
+        compute = self.compute_providers.get(change.name)
+        if compute is None:
+            raise RestartRequired(f"function {change.name} is not running")
+        url_config = self.lambda_registry.get_function_url(change.name)
+        port = url_config["_port"] if url_config else self._free_function_url_port()
+        url_provider = _register_function_url(change.new, compute, port, self.lambda_registry)
+        await self.orchestrator.replace(node_id, url_provider)
+
+    def _free_function_url_port(self) -> int:
+        """Return the first Function URL port no registered URL is using."""
+        used = {cfg.get("_port") for cfg in self.lambda_registry.function_urls.values()}
+        port = self.port + 23
+        while port in used:
+            port += 1
+        return port
+
+    async def apply_api(self, change: ResourceChange) -> None:
+        """Serve the new routes of an API, or stop serving a removed one."""
+        provider = None
+        if change.change_type != "REMOVE":
+            provider = _api_gateway_provider(change.new, self.compute_providers, self.port)
+        await self.orchestrator.replace(change.name, provider)
+
+    async def apply_table(self, change: ResourceChange) -> None:
+        """Create a new table."""
+        _require_add(change)
+        await self.dynamo.create_table(_table_config(change.new))
+
+    async def apply_queue(self, change: ResourceChange) -> None:
+        """Create a new queue."""
+        _require_add(change)
+        self.sqs.create_queue_from_config(_queue_config(change.new))
+
+    async def apply_bucket(self, change: ResourceChange) -> None:
+        """Create a new bucket."""
+        _require_add(change)
+        await self.s3.create_bucket(change.name)
+        if change.new.website_configuration:
+            self.s3.put_bucket_website(change.name, change.new.website_configuration)
+
+    async def apply_topic(self, change: ResourceChange) -> None:
+        """Create a new topic."""
+        _require_add(change)
+        await self.sns.create_topic(change.name)
+
+    async def apply_event_bus(self, change: ResourceChange) -> None:
+        """Create a new event bus."""
+        _require_add(change)
+        await self.eventbridge.create_event_bus(change.name)
+
+    async def apply_event_rule(self, change: ResourceChange) -> None:
+        """Create, replace or delete an EventBridge rule."""
+        if change.change_type != "ADD":
+            with contextlib.suppress(KeyError):
+                await self.eventbridge.delete_rule(change.name)
+        if change.change_type == "REMOVE":
+            return
+        rule = _rule_config(change.new)
+        await self.eventbridge.put_rule(
+            rule.rule_name,
+            rule.event_bus_name,
+            rule.event_pattern,
+            rule.schedule_expression,
+            rule.targets,
+        )
+
+    async def apply_state_machine(self, change: ResourceChange) -> None:
+        """Create, redefine or delete a state machine."""
+        if change.change_type == "REMOVE":
+            self.stepfunctions.delete_state_machine(change.name)
+            return
+        sm = change.new
+        self.stepfunctions.create_state_machine(
+            sm.name,
+            sm.definition,
+            role_arn=sm.role_arn,
+            workflow_type=sm.workflow_type,
+            definition_substitutions=sm.definition_substitutions,
+        )
+
+
+def _require_add(change: ResourceChange) -> None:
+    """Raise ``RestartRequired`` unless *change* adds a new resource."""
+    if change.change_type != "ADD":
+        raise RestartRequired(f"existing {change.kind}s keep their data until restart")
+
+
 _CHAOS_SERVICES = [
     "dynamodb",
     "sqs",
@@ -1776,6 +2308,10 @@ _CHAOS_SERVICES = [
 
 def _create_chaos_configs() -> dict[str, AwsChaosConfig]:
     """Create a default (disabled) AwsChaosConfig for each service."""
+    from lws.providers._shared.aws_chaos import (  # pylint: disable=import-outside-toplevel
+        AwsChaosConfig,
+    )
+
     return {svc: AwsChaosConfig() for svc in _CHAOS_SERVICES}
 
 
@@ -1786,6 +2322,10 @@ def _load_aws_mock_configs(project_dir: Path | None) -> dict[str, AwsMockConfig]
     every supported service so the middleware is always mounted and rules
     can be added at runtime via the management API.
     """
+    from lws.providers._shared.aws_operation_mock import (  # pylint: disable=import-outside-toplevel
+        AwsMockConfig,
+    )
+
     configs: dict[str, AwsMockConfig] = {
         svc: AwsMockConfig(service=svc, enabled=False) for svc in _CHAOS_SERVICES
     }
@@ -1805,6 +2345,9 @@ def _create_iam_auth_bundle(
     project_dir: Path | None = None,
 ) -> IamAuthBundle:
     """Create an IamAuthBundle from config."""
+    from lws.providers._shared.aws_iam_auth import (  # pylint: disable=import-outside-toplevel
+        IamAuthBundle,
+    )
     from lws.providers._shared.iam_identity_store import (  # pylint: disable=import-outside-toplevel
         IdentityStore,
     )
@@ -1849,9 +2392,15 @@ def _register_http_providers(
     from lws.providers.cognito.routes import (  # pylint: disable=import-outside-toplevel
         create_cognito_app,
     )
+    from lws.providers.dynamodb.routes import (  # pylint: disable=import-outside-toplevel
+        create_dynamodb_app,
+    )
     from lws.providers.eventbridge.routes import (  # pylint: disable=import-outside-toplevel
         create_eventbridge_app,
     )
+    from lws.providers.s3.routes import create_s3_app  # pylint: disable=import-outside-toplevel
+    from lws.providers.sns.routes import create_sns_app  # pylint: disable=import-outside-toplevel
+    from lws.providers.sqs.routes import create_sqs_app  # pylint: disable=import-outside-toplevel
     from lws.providers.stepfunctions.routes import (  # pylint: disable=import-outside-toplevel
         create_stepfunctions_app,
     )
@@ -2140,6 +2689,9 @@ def _mount_management_api(
     from lws.api.management import (  # pylint: disable=import-outside-toplevel
         create_management_router,
     )
+    from lws.providers.apigateway.provider import (  # pylint: disable=import-outside-toplevel
+        ApiGatewayProvider,
+    )
 
     mgmt_router = create_management_router(
         orchestrator,
@@ -2177,6 +2729,15 @@ def _find_node_id(graph: AppGraph, node_type: NodeType, name: str) -> str | None
     return name
 
 
+def _table_config(table: DynamoTable) -> TableConfig:
+    """Convert a parsed DynamoDB table to a ``TableConfig``."""
+    return TableConfig(
+        table_name=table.name,
+        key_schema=_build_key_schema(table.key_schema),
+        gsi_definitions=[_build_gsi(g) for g in table.gsi_definitions],
+    )
+
+
 def _build_key_schema(raw_schema: list[dict[str, str]]) -> KeySchema:
     """Convert raw key schema dicts to a KeySchema dataclass."""
     pk: KeyAttribute | None = None
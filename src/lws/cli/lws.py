@@ -7,77 +7,87 @@ Requires a running ``ldk dev`` instance.
 from __future__ import annotations
 
 import asyncio
+import importlib
 
+import click
 import httpx
 import typer
+from typer.core import TyperGroup
 
 from lws.cli.experimental import EXPERIMENTAL_SERVICES
 from lws.cli.init import init_command
-from lws.cli.services.apigateway import app as apigateway_app
-from lws.cli.services.aws_mock import app as aws_mock_app
-from lws.cli.services.chaos import app as chaos_app
 from lws.cli.services.client import exit_with_error, output_json
-from lws.cli.services.cognito import app as cognito_app
-from lws.cli.services.docdb import app as docdb_app
-from lws.cli.services.dynamodb import app as dynamodb_app
-from lws.cli.services.elasticache import app as elasticache_app
-from lws.cli.services.es import app as es_app
-from lws.cli.services.events import app as events_app
-from lws.cli.services.glacier import app as glacier_app
-from lws.cli.services.iam_auth import app as iam_auth_app
-from lws.cli.services.lambda_service import app as lambda_app
-from lws.cli.services.memorydb import app as memorydb_app
-from lws.cli.services.mock import app as mock_app
-from lws.cli.services.neptune import app as neptune_app
-from lws.cli.services.opensearch import app as opensearch_app
-from lws.cli.services.rds import app as rds_app
-from lws.cli.services.s3 import app as s3_app
-from lws.cli.services.s3tables import app as s3tables_app
-from lws.cli.services.secretsmanager import app as secretsmanager_app
-from lws.cli.services.sns import app as sns_app
-from lws.cli.services.sqs import app as sqs_app
-from lws.cli.services.ssm import app as ssm_app
-from lws.cli.services.stepfunctions import app as stepfunctions_app
+
+# CLI service name -> module defining its ``app`` Typer, in help order.
+_SERVICES: dict[str, str] = {}
+
+
+class _LazyServiceGroup(TyperGroup):
+    """Top-level group that imports a service module only when it is invoked.
+
+    ``lws sqs send-message`` imports ``lws.cli.services.sqs`` and nothing
+    else; listing every group (``lws --help``) still imports them all.
+    """
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        eager = [name for name in super().list_commands(ctx) if name not in _SERVICES]
+        return [*_SERVICES, *eager]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in _SERVICES:
+            return command
+        command = _load_service(cmd_name)
+        self.add_command(command, cmd_name)
+        return command
+
+
+def _load_service(name: str) -> click.Command:
+    """Import the service registered as *name* and build its Click group."""
+    module = importlib.import_module(_SERVICES[name])
+    command = typer.main.get_group(module.app)
+    command.name = name
+    if name in EXPERIMENTAL_SERVICES:
+        command.help = f"{command.help or ''} [experimental]"
+    return command
+
 
 app = typer.Typer(
     name="lws",
     help="AWS CLI-style commands for local LDK resources. Requires a running 'ldk dev' instance.",
+    cls=_LazyServiceGroup,
 )
 
 
-def _add_service(typer_app: typer.Typer, name: str) -> None:
-    """Register a service typer, appending [experimental] to help when appropriate."""
-    if name in EXPERIMENTAL_SERVICES:
-        original_help = typer_app.info.help or ""
-        app.add_typer(typer_app, name=name, help=f"{original_help} [experimental]")
-    else:
-        app.add_typer(typer_app, name=name)
-
-
-_add_service(apigateway_app, "apigateway")
-_add_service(stepfunctions_app, "stepfunctions")
-_add_service(sqs_app, "sqs")
-_add_service(sns_app, "sns")
-_add_service(s3_app, "s3api")
-_add_service(dynamodb_app, "dynamodb")
-_add_service(events_app, "events")
-_add_service(lambda_app, "lambda")
-_add_service(cognito_app, "cognito-idp")
-_add_service(ssm_app, "ssm")
-_add_service(secretsmanager_app, "secretsmanager")
-_add_service(elasticache_app, "elasticache")
-_add_service(memorydb_app, "memorydb")
-_add_service(docdb_app, "docdb")
-_add_service(neptune_app, "neptune")
-_add_service(es_app, "es")
-_add_service(opensearch_app, "opensearch")
-_add_service(rds_app, "rds")
-_add_service(glacier_app, "glacier")
-_add_service(s3tables_app, "s3tables")
-_add_service(mock_app, "mock")
-_add_service(aws_mock_app, "aws-mock")
-_add_service(chaos_app, "chaos")
-_add_service(iam_auth_app, "iam-auth")
+def _add_service(module: str, name: str) -> None:
+    """Register the service typer in *module* under *name*, imported on first use."""
+    _SERVICES[name] = module
+
+
+_add_service("lws.cli.services.apigateway", "apigateway")
+_add_service("lws.cli.services.stepfunctions", "stepfunctions")
+_add_service("lws.cli.services.sqs", "sqs")
+_add_service("lws.cli.services.sns", "sns")
+_add_service("lws.cli.services.s3", "s3api")
+_add_service("lws.cli.services.dynamodb", "dynamodb")
+_add_service("lws.cli.services.events", "events")
+_add_service("lws.cli.services.lambda_service", "lambda")
+_add_service("lws.cli.services.cognito", "cognito-idp")
+_add_service("lws.cli.services.ssm", "ssm")
+_add_service("lws.cli.services.secretsmanager", "secretsmanager")
+_add_service("lws.cli.services.elasticache", "elasticache")
+_add_service("lws.cli.services.memorydb", "memorydb")
+_add_service("lws.cli.services.docdb", "docdb")
+_add_service("lws.cli.services.neptune", "neptune")
+_add_service("lws.cli.services.es", "es")
+_add_service("lws.cli.services.opensearch", "opensearch")
+_add_service("lws.cli.services.rds", "rds")
+_add_service("lws.cli.services.glacier", "glacier")
+_add_service("lws.cli.services.s3tables", "s3tables")
+_add_service("lws.cli.services.mock", "mock")
+_add_service("lws.cli.services.aws_mock", "aws-mock")
+_add_service("lws.cli.services.chaos", "chaos")
+_add_service("lws.cli.services.iam_auth", "iam-auth")
 
 app.command("init")(init_command)
 
@@ -2,14 +2,24 @@
 
 Handles discovery via the ``GET /_ldk/resources`` management endpoint and
 provides per-protocol HTTP helpers for calling provider wire protocols.
+
+Wire calls share one pooled, keep-alive ``httpx.AsyncClient`` per
+``LwsClient``.  Discovery metadata is cached on disk for a few seconds so
+a shell loop of ``lws`` commands does not rediscover on every call; a
+lookup that misses the cached metadata rediscovers before failing.
 """
 
 from __future__ import annotations
 
 import asyncio as _asyncio
+import contextlib
 import json
+import os
 import sys
-from typing import Any
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from pathlib import Path
+from typing import Any, TypeVar
 from xml.etree import ElementTree
 
 import httpx
@@ -18,54 +28,180 @@ _TRANSIENT_ERRORS = (httpx.ConnectError, httpx.ReadError, httpx.WriteError, http
 _MAX_RETRIES = 3
 _RETRY_DELAY = 0.5
 
+_DISCOVERY_TTL_ENV = "LWS_DISCOVERY_TTL"
+_CACHE_DIR_ENV = "LWS_CACHE_DIR"
+_DEFAULT_DISCOVERY_TTL = 30.0
+_MAX_CONNECTIONS = 64
+_MAX_REPORTED_ERRORS = 5
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
 
 class DiscoveryError(Exception):
     """Raised when the ``/_ldk/resources`` endpoint is unreachable."""
 
 
+class DiscoveryCache:
+    """Discovery metadata of ``ldk dev`` instances, kept on disk for *ttl* seconds.
+
+    Entries are keyed by the ``ldk dev`` port.  A *ttl* of zero or less
+    disables the cache.
+    """
+
+    def __init__(self, directory: Path, ttl: float = _DEFAULT_DISCOVERY_TTL) -> None:
+        self._directory = directory
+        self._ttl = ttl
+
+    @classmethod
+    def from_env(cls) -> DiscoveryCache:
+        """Build the cache from ``LWS_CACHE_DIR`` and ``LWS_DISCOVERY_TTL``.
+
+        The directory defaults to ``$XDG_CACHE_HOME/lws`` (``~/.cache/lws``).
+        """
+        directory = os.environ.get(_CACHE_DIR_ENV)
+        if not directory:
+            base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+            directory = str(Path(base) / "lws")
+        try:
+            ttl = float(os.environ.get(_DISCOVERY_TTL_ENV, _DEFAULT_DISCOVERY_TTL))
+        except ValueError:
+            ttl = _DEFAULT_DISCOVERY_TTL
+        return cls(Path(directory), ttl)
+
+    def _path(self, port: int) -> Path:
+        return self._directory / f"discovery-{port}.json"
+
+    def load(self, port: int) -> dict[str, Any] | None:
+        """Return the metadata stored for *port* if it is younger than the TTL."""
+        if self._ttl <= 0:
+            return None
+        path = self._path(port)
+        try:
+            if time.time() - path.stat().st_mtime > self._ttl:
+                return None
+            metadata = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+        return metadata if isinstance(metadata, dict) else None
+
+    def store(self, port: int, metadata: dict[str, Any]) -> None:
+        """Persist *metadata* for *port*; failures only cost a rediscovery."""
+        if self._ttl <= 0:
+            return
+        path = self._path(port)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with contextlib.suppress(OSError):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(metadata))
+            os.replace(tmp, path)
+
+    def invalidate(self, port: int) -> None:
+        """Forget the metadata stored for *port*."""
+        with contextlib.suppress(OSError):
+            self._path(port).unlink()
+
+
 class LwsClient:
-    """Client that discovers local resources and makes wire-protocol calls."""
+    """Client that discovers local resources and makes wire-protocol calls.
+
+    Use as an async context manager (or call :meth:`aclose`) to release
+    pooled connections when many calls are made from one process.
+    """
 
-    def __init__(self, port: int = 3000) -> None:
+    def __init__(
+        self,
+        port: int = 3000,
+        *,
+        cache: DiscoveryCache | None = None,
+        max_connections: int = _MAX_CONNECTIONS,
+    ) -> None:
         self._port = port
         self._base = f"http://localhost:{port}"
         self._metadata: dict[str, Any] | None = None
-
-    async def discover(self) -> dict[str, Any]:
-        """Fetch resource metadata from the running ``ldk dev`` instance."""
-        if self._metadata is not None:
+        self._metadata_from_cache = False
+        self._cache = cache if cache is not None else DiscoveryCache.from_env()
+        self._max_connections = max_connections
+        self._http: httpx.AsyncClient | None = None
+
+    async def __aenter__(self) -> LwsClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    def _client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_connections,
+                ),
+            )
+        return self._http
+
+    async def discover(self, *, refresh: bool = False) -> dict[str, Any]:
+        """Fetch resource metadata from the running ``ldk dev`` instance.
+
+        Metadata cached on disk by a recent call is reused unless
+        *refresh* is set.
+        """
+        if self._metadata is not None and not refresh:
             return self._metadata
+        if not refresh:
+            cached = self._cache.load(self._port)
+            if cached is not None:
+                self._metadata, self._metadata_from_cache = cached, True
+                return cached
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(f"{self._base}/_ldk/resources", timeout=5.0)
-                resp.raise_for_status()
-                self._metadata = resp.json()
-                return self._metadata
+            resp = await self._client().get(f"{self._base}/_ldk/resources", timeout=5.0)
+            resp.raise_for_status()
+            metadata = resp.json()
         except Exception as exc:
+            self._cache.invalidate(self._port)
             raise DiscoveryError(
                 f"Cannot reach ldk dev on port {self._port}. Is it running?"
             ) from exc
+        self._metadata, self._metadata_from_cache = metadata, False
+        self._cache.store(self._port, metadata)
+        return metadata
+
+    async def _service(self, service: str, found: Callable[[dict[str, Any]], bool]) -> Any:
+        """Return *service*'s metadata, rediscovering once if cached metadata lacks it."""
+        svc = (await self.discover()).get("services", {}).get(service)
+        if (svc is None or not found(svc)) and self._metadata_from_cache:
+            svc = (await self.discover(refresh=True)).get("services", {}).get(service)
+        return svc
 
     async def service_port(self, service: str) -> int:
         """Return the port for *service* (e.g. ``"sqs"``, ``"stepfunctions"``)."""
-        meta = await self.discover()
-        svc = meta.get("services", {}).get(service)
+        svc = await self._service(service, lambda _svc: True)
         if svc is None:
             raise DiscoveryError(f"Service '{service}' not found in running ldk dev")
         return int(svc["port"])
 
     async def service_resources(self, service: str) -> list[dict[str, Any]]:
         """Return the resource list for *service*."""
-        meta = await self.discover()
-        svc = meta.get("services", {}).get(service)
+        svc = await self._service(service, lambda _svc: True)
         if svc is None:
             return []
         return svc.get("resources", [])
 
     async def resolve_resource(self, service: str, name: str, key: str = "name") -> dict[str, Any]:
         """Find a resource by *name* within *service*."""
-        resources = await self.service_resources(service)
-        for r in resources:
+
+        def _has(svc: dict[str, Any]) -> bool:
+            return any(r.get(key) == name for r in svc.get("resources", []))
+
+        svc = await self._service(service, _has)
+        for r in (svc or {}).get("resources", []):
             if r.get(key) == name:
                 return r
         raise DiscoveryError(f"Resource '{name}' not found in service '{service}'")
@@ -74,6 +210,19 @@ class LwsClient:
     # Wire protocol helpers
     # ------------------------------------------------------------------
 
+    async def _send(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request on the pooled client, retrying transient errors."""
+        for attempt in range(_MAX_RETRIES):
+            try:
+                return await self._client().request(method, url, timeout=30.0, **kwargs)
+            except _TRANSIENT_ERRORS:
+                if attempt == _MAX_RETRIES - 1:
+                    # ldk dev may have stopped; do not trust its cached metadata
+                    self._cache.invalidate(self._port)
+                    raise
+                await _asyncio.sleep(_RETRY_DELAY)
+        raise RuntimeError("unreachable")  # pragma: no cover
+
     async def json_target_request(
         self,
         service: str,
@@ -87,39 +236,19 @@ class LwsClient:
             "Content-Type": content_type,
             "X-Amz-Target": target,
         }
-        for attempt in range(_MAX_RETRIES):
-            try:
-                async with httpx.AsyncClient() as client:
-                    resp = await client.post(
-                        f"http://localhost:{port}/",
-                        headers=headers,
-                        content=json.dumps(body or {}),
-                        timeout=30.0,
-                    )
-                return resp.json()
-            except _TRANSIENT_ERRORS:
-                if attempt == _MAX_RETRIES - 1:
-                    raise
-                await _asyncio.sleep(_RETRY_DELAY)
-        raise RuntimeError("unreachable")  # pragma: no cover
+        resp = await self._send(
+            "POST",
+            f"http://localhost:{port}/",
+            headers=headers,
+            content=json.dumps(body or {}),
+        )
+        return resp.json()
 
     async def form_request(self, service: str, params: dict[str, str]) -> str:
         """Send a form-encoded request and return the XML response body."""
         port = await self.service_port(service)
-        for attempt in range(_MAX_RETRIES):
-            try:
-                async with httpx.AsyncClient() as client:
-                    resp = await client.post(
-                        f"http://localhost:{port}/",
-                        data=params,
-                        timeout=30.0,
-                    )
-                return resp.text
-            except _TRANSIENT_ERRORS:
-                if attempt == _MAX_RETRIES - 1:
-                    raise
-                await _asyncio.sleep(_RETRY_DELAY)
-        raise RuntimeError("unreachable")  # pragma: no cover
+        resp = await self._send("POST", f"http://localhost:{port}/", data=params)
+        return resp.text
 
     async def rest_request(
         self,
@@ -133,23 +262,44 @@ class LwsClient:
     ) -> httpx.Response:
         """Send a REST-style request (method + path) and return the raw response."""
         port = await self.service_port(service)
-        for attempt in range(_MAX_RETRIES):
-            try:
-                async with httpx.AsyncClient() as client:
-                    resp = await client.request(
-                        method,
-                        f"http://localhost:{port}/{path.lstrip('/')}",
-                        content=body,
-                        params=params,
-                        headers=headers,
-                        timeout=30.0,
-                    )
-                return resp
-            except _TRANSIENT_ERRORS:
-                if attempt == _MAX_RETRIES - 1:
-                    raise
-                await _asyncio.sleep(_RETRY_DELAY)
-        raise RuntimeError("unreachable")  # pragma: no cover
+        return await self._send(
+            method,
+            f"http://localhost:{port}/{path.lstrip('/')}",
+            content=body,
+            params=params,
+            headers=headers,
+        )
+
+
+def read_ndjson(source: str) -> list[str]:
+    """Return the non-blank lines of *source*, a file path or ``-`` for stdin."""
+    if source == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        try:
+            lines = Path(source).read_text(encoding="utf-8").splitlines()
+        except OSError as exc:
+            exit_with_error(f"Cannot read {source}: {exc}")
+            return []  # unreachable; satisfies pylint R1710
+    return [line for line in lines if line.strip()]
+
+
+def chunked(items: list[_T], size: int) -> list[list[_T]]:
+    """Split *items* into lists of at most *size* elements."""
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+async def run_bounded(
+    fn: Callable[[_T], Awaitable[_R]], items: Iterable[_T], parallelism: int
+) -> list[_R]:
+    """Await ``fn(item)`` for every item, at most *parallelism* at a time, in order."""
+    semaphore = _asyncio.Semaphore(max(parallelism, 1))
+
+    async def _bounded(item: _T) -> _R:
+        async with semaphore:
+            return await fn(item)
+
+    return list(await _asyncio.gather(*(_bounded(item) for item in items)))
 
 
 def parse_json_option(value: str, option_name: str) -> Any:
@@ -191,6 +341,23 @@ def build_chaos_body(
     return body
 
 
+def report_batch(total: int, errors: list[str]) -> None:
+    """Print a batch summary and exit non-zero if any record failed.
+
+    *errors* holds one message per failed record; the first distinct
+    messages are included in the summary.
+    """
+    output_json(
+        {
+            "Succeeded": total - len(errors),
+            "Failed": len(errors),
+            "Errors": list(dict.fromkeys(errors))[:_MAX_REPORTED_ERRORS],
+        }
+    )
+    if errors:
+        exit_with_error(f"{len(errors)} of {total} records failed: {errors[0]}")
+
+
 def output_json(data: Any) -> None:
     """Print *data* as formatted JSON to stdout."""
     print(json.dumps(data, indent=2, default=str))
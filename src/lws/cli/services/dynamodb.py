@@ -7,12 +7,23 @@ import json
 
 import typer
 
-from lws.cli.services.client import LwsClient, exit_with_error, output_json
+from lws.cli.services.client import (
+    LwsClient,
+    chunked,
+    exit_with_error,
+    output_json,
+    read_ndjson,
+    report_batch,
+    run_bounded,
+)
 
 app = typer.Typer(help="DynamoDB commands")
 
 _SERVICE = "dynamodb"
 _TARGET_PREFIX = "DynamoDB_20120810"
+_BATCH_WRITE_LIMIT = 25
+_UNPROCESSED_RETRIES = 5
+_UNPROCESSED_BACKOFF = 0.05
 
 
 def _client(port: int) -> LwsClient:
@@ -22,10 +33,21 @@ def _client(port: int) -> LwsClient:
 @app.command("put-item")
 def put_item(
     table_name: str = typer.Option(..., "--table-name", help="Table name"),
-    item: str = typer.Option(..., "--item", help="JSON item"),
+    item: str = typer.Option(None, "--item", help="JSON item"),
+    from_file: str = typer.Option(
+        None, "--from-file", help="NDJSON file with one item per line ('-' for stdin)"
+    ),
+    parallelism: int = typer.Option(
+        8, "--parallelism", help="Concurrent BatchWriteItem calls with --from-file"
+    ),
     port: int = typer.Option(3000, "--port", "-p", help="LDK port"),
 ) -> None:
-    """Put an item into a table."""
+    """Put an item into a table, or every item of an NDJSON file."""
+    if from_file is not None:
+        asyncio.run(_put_items_from_file(table_name, from_file, parallelism, port))
+        return
+    if item is None:
+        exit_with_error("One of --item or --from-file is required")
     asyncio.run(_put_item(table_name, item, port))
 
 
@@ -46,6 +68,52 @@ async def _put_item(table_name: str, item_json: str, port: int) -> None:
     output_json(result)
 
 
+async def _put_items_from_file(table_name: str, source: str, parallelism: int, port: int) -> None:
+    items = []
+    for line_no, line in enumerate(read_ndjson(source), start=1):
+        try:
+            items.append(json.loads(line))
+        except json.JSONDecodeError as exc:
+            exit_with_error(f"Invalid JSON on line {line_no} of {source}: {exc}")
+
+    async with _client(port) as client:
+        try:
+            await client.service_port(_SERVICE)
+        except Exception as exc:
+            exit_with_error(str(exc))
+        results = await run_bounded(
+            lambda batch: _batch_write(client, table_name, batch),
+            chunked(items, _BATCH_WRITE_LIMIT),
+            parallelism,
+        )
+    report_batch(len(items), [error for errors in results for error in errors])
+
+
+async def _batch_write(client: LwsClient, table_name: str, items: list[dict]) -> list[str]:
+    """Put *items* with BatchWriteItem, retrying unprocessed items with backoff.
+
+    Returns one error message per item that was not written.
+    """
+    requests = [{"PutRequest": {"Item": item}} for item in items]
+    for attempt in range(_UNPROCESSED_RETRIES + 1):
+        if attempt:
+            await asyncio.sleep(_UNPROCESSED_BACKOFF * 2 ** (attempt - 1))
+        try:
+            result = await client.json_target_request(
+                _SERVICE,
+                f"{_TARGET_PREFIX}.BatchWriteItem",
+                {"RequestItems": {table_name: requests}},
+            )
+        except Exception as exc:
+            return [str(exc)] * len(requests)
+        if "__type" in result:
+            return [result.get("message") or result["__type"]] * len(requests)
+        requests = (result.get("UnprocessedItems") or {}).get(table_name) or []
+        if not requests:
+            return []
+    return [f"Item left unprocessed after {_UNPROCESSED_RETRIES} retries"] * len(requests)
+
+
 @app.command("get-item")
 def get_item(
     table_name: str = typer.Option(..., "--table-name", help="Table name"),
@@ -107,16 +175,60 @@ def scan(
     expression_attribute_values: str = typer.Option(
         None, "--expression-attribute-values", help="JSON expression attribute values"
     ),
+    limit: int = typer.Option(None, "--limit", help="Maximum number of items to evaluate"),
+    exclusive_start_key: str = typer.Option(
+        None, "--exclusive-start-key", help="JSON key to resume the scan after"
+    ),
+    segment: int = typer.Option(None, "--segment", help="Parallel scan segment to read"),
+    total_segments: int = typer.Option(
+        None, "--total-segments", help="Total number of parallel scan segments"
+    ),
     port: int = typer.Option(3000, "--port", "-p", help="LDK port"),
 ) -> None:
     """Scan a table."""
-    asyncio.run(_scan(table_name, filter_expression, expression_attribute_values, port))
+    asyncio.run(
+        _scan(
+            table_name,
+            filter_expression,
+            expression_attribute_values,
+            limit,
+            exclusive_start_key,
+            segment,
+            total_segments,
+            port,
+        )
+    )
+
+
+def _apply_scan_paging(
+    body: dict,
+    limit: int | None,
+    exclusive_start_key: str | None,
+    segment: int | None,
+    total_segments: int | None,
+) -> None:
+    """Add the optional paging and Parallel Scan parameters to a Scan body."""
+    if limit is not None:
+        body["Limit"] = limit
+    if exclusive_start_key:
+        try:
+            body["ExclusiveStartKey"] = json.loads(exclusive_start_key)
+        except json.JSONDecodeError as exc:
+            exit_with_error(f"Invalid JSON in --exclusive-start-key: {exc}")
+    if segment is not None:
+        body["Segment"] = segment
+    if total_segments is not None:
+        body["TotalSegments"] = total_segments
 
 
 async def _scan(
     table_name: str,
     filter_expression: str | None,
     expression_attribute_values: str | None,
+    limit: int | None,
+    exclusive_start_key: str | None,
+    segment: int | None,
+    total_segments: int | None,
     port: int,
 ) -> None:
     client = _client(port)
@@ -128,6 +240,7 @@ async def _scan(
             body["ExpressionAttributeValues"] = json.loads(expression_attribute_values)
         except json.JSONDecodeError as exc:
             exit_with_error(f"Invalid JSON in --expression-attribute-values: {exc}")
+    _apply_scan_paging(body, limit, exclusive_start_key, segment, total_segments)
     try:
         result = await client.json_target_request(_SERVICE, f"{_TARGET_PREFIX}.Scan", body)
     except Exception as exc:
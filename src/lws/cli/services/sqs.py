@@ -7,11 +7,21 @@ import json
 
 import typer
 
-from lws.cli.services.client import LwsClient, exit_with_error, output_json, xml_to_dict
+from lws.cli.services.client import (
+    LwsClient,
+    chunked,
+    exit_with_error,
+    output_json,
+    read_ndjson,
+    report_batch,
+    run_bounded,
+    xml_to_dict,
+)
 
 app = typer.Typer(help="SQS commands")
 
 _SERVICE = "sqs"
+_SEND_BATCH_LIMIT = 10
 
 
 def _client(port: int) -> LwsClient:
@@ -21,10 +31,21 @@ def _client(port: int) -> LwsClient:
 @app.command("send-message")
 def send_message(
     queue_name: str = typer.Option(..., "--queue-name", help="Queue name"),
-    message_body: str = typer.Option(..., "--message-body", help="Message body"),
+    message_body: str = typer.Option(None, "--message-body", help="Message body"),
+    from_file: str = typer.Option(
+        None, "--from-file", help="File with one message body per line ('-' for stdin)"
+    ),
+    parallelism: int = typer.Option(
+        8, "--parallelism", help="Concurrent SendMessageBatch calls with --from-file"
+    ),
     port: int = typer.Option(3000, "--port", "-p", help="LDK port"),
 ) -> None:
-    """Send a message to a queue."""
+    """Send a message to a queue, or every line of a file as a message."""
+    if from_file is not None:
+        asyncio.run(_send_messages_from_file(queue_name, from_file, parallelism, port))
+        return
+    if message_body is None:
+        exit_with_error("One of --message-body or --from-file is required")
     asyncio.run(_send_message(queue_name, message_body, port))
 
 
@@ -43,6 +64,64 @@ async def _send_message(queue_name: str, message_body: str, port: int) -> None:
     output_json(xml_to_dict(xml))
 
 
+async def _send_messages_from_file(
+    queue_name: str, source: str, parallelism: int, port: int
+) -> None:
+    bodies = read_ndjson(source)
+    async with _client(port) as client:
+        try:
+            queue_url = await _queue_url(client, queue_name)
+        except Exception as exc:
+            exit_with_error(str(exc))
+        results = await run_bounded(
+            lambda batch: _send_batch(client, queue_url, batch),
+            chunked(bodies, _SEND_BATCH_LIMIT),
+            parallelism,
+        )
+    report_batch(len(bodies), [error for errors in results for error in errors])
+
+
+async def _queue_url(client: LwsClient, queue_name: str) -> str:
+    try:
+        resource = await client.resolve_resource(_SERVICE, queue_name)
+        return resource.get("queue_url", "")
+    except Exception:
+        svc_port = await client.service_port(_SERVICE)
+        return f"http://localhost:{svc_port}/000000000000/{queue_name}"
+
+
+async def _send_batch(client: LwsClient, queue_url: str, bodies: list[str]) -> list[str]:
+    """Send *bodies* with one SendMessageBatch call.
+
+    Returns one error message per message that was not sent.
+    """
+    params = {"Action": "SendMessageBatch", "QueueUrl": queue_url}
+    for i, body in enumerate(bodies, start=1):
+        params[f"SendMessageBatchRequestEntry.{i}.Id"] = str(i)
+        params[f"SendMessageBatchRequestEntry.{i}.MessageBody"] = body
+    try:
+        response = xml_to_dict(await client.form_request(_SERVICE, params))
+    except Exception as exc:
+        return [str(exc)] * len(bodies)
+    if "SendMessageBatchResponse" not in response:
+        error = response.get("ErrorResponse", {}).get("Error", {})
+        return [error.get("Message") or "SendMessageBatch failed"] * len(bodies)
+    result = response["SendMessageBatchResponse"].get("SendMessageBatchResult") or {}
+    sent = _entries(result, "SendMessageBatchResultEntry")
+    errors = [
+        entry.get("Message") or entry.get("Code", "")
+        for entry in _entries(result, "BatchResultErrorEntry")
+    ]
+    missing = len(bodies) - len(sent) - len(errors)
+    return errors + ["No result returned for message"] * missing
+
+
+def _entries(result: dict, tag: str) -> list[dict]:
+    """Return the repeated *tag* entries of a parsed batch result."""
+    entries = result.get(tag, [])
+    return entries if isinstance(entries, list) else [entries]
+
+
 @app.command("receive-message")
 def receive_message(
     queue_name: str = typer.Option(..., "--queue-name", help="Queue name"),
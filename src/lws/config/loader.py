@@ -53,7 +53,18 @@ class LdkConfig:
 
     Supported config keys:
         port, persist, data_dir, log_level, cdk_out_dir,
-        watch_include, watch_exclude, eventual_consistency_delay_ms
+        watch_include, watch_exclude, watch_reload_debounce_ms,
+        eventual_consistency_delay_ms,
+        dynamodb_group_commit_window_ms,
+        sqs_durable, sqs_fsync_interval_ms, request_log_body_bytes,
+        request_log_sample_rate, request_log_disabled_services,
+        cognito_hash_iterations, cognito_hash_workers, cognito_hash_executor,
+        cognito_verify_cache_ttl_ms, delivery_max_concurrency,
+        delivery_max_per_target, delivery_queue_size, delivery_batch_size,
+        delivery_max_attempts, delivery_retry_backoff_ms,
+        stepfunctions_history_max_executions, stepfunctions_history_max_age_ms,
+        stepfunctions_history_max_bytes, lambda_warm_workers,
+        lambda_worker_idle_timeout_ms
     """
 
     port: int = 3000
@@ -65,7 +76,29 @@ class LdkConfig:
     watch_exclude: list[str] = field(
         default_factory=lambda: ["node_modules/**", ".git/**", "cdk.out/**"]
     )
+    watch_reload_debounce_ms: int = 500
     eventual_consistency_delay_ms: int = 200
+    dynamodb_group_commit_window_ms: int = 0
+    sqs_durable: bool = False
+    sqs_fsync_interval_ms: int = 100
+    request_log_body_bytes: int = 10240
+    request_log_sample_rate: float = 1.0
+    request_log_disabled_services: list[str] = field(default_factory=list)
+    cognito_hash_iterations: int = 100_000
+    cognito_hash_workers: int = 4
+    cognito_hash_executor: str = "thread"
+    cognito_verify_cache_ttl_ms: int = 30_000
+    delivery_max_concurrency: int = 64
+    delivery_max_per_target: int = 8
+    delivery_queue_size: int = 1000
+    delivery_batch_size: int = 10
+    delivery_max_attempts: int = 3
+    delivery_retry_backoff_ms: int = 100
+    stepfunctions_history_max_executions: int = 1000
+    stepfunctions_history_max_age_ms: int = 86_400_000
+    stepfunctions_history_max_bytes: int = 64 * 1024 * 1024
+    lambda_warm_workers: int = 0
+    lambda_worker_idle_timeout_ms: int = 300_000
     mode: str | None = None
     iam_auth: IamAuthConfig = field(default_factory=IamAuthConfig)
 
@@ -81,6 +114,24 @@ def _validate_config(config: LdkConfig) -> None:
             f"Must be one of: {', '.join(sorted(VALID_LOG_LEVELS))}."
         )
 
+    if config.cognito_hash_executor not in ("thread", "process"):
+        raise ConfigError(
+            f"Invalid cognito_hash_executor: {config.cognito_hash_executor!r}. "
+            "Must be 'thread' or 'process'."
+        )
+
+    if not 1 <= config.delivery_batch_size <= 10:
+        raise ConfigError(
+            f"Invalid delivery_batch_size: {config.delivery_batch_size}. "
+            "Must be between 1 and 10."
+        )
+
+    if not 0.0 <= float(config.request_log_sample_rate) <= 1.0:
+        raise ConfigError(
+            f"Invalid request_log_sample_rate: {config.request_log_sample_rate}. "
+            "Must be between 0.0 and 1.0."
+        )
+
 
 def _load_module_from_file(config_path: Path) -> Any:
     """Load a Python module from a file path using importlib."""
@@ -105,7 +156,7 @@ def _load_module_from_file(config_path: Path) -> Any:
 def _parse_yaml_value(value: str) -> Any:
     """Parse a single YAML value string into a Python type.
 
-    Handles booleans, integers, JSON arrays, and quoted strings.
+    Handles booleans, integers, floats, JSON arrays, and quoted strings.
     """
     lower = value.lower()
     if lower in ("true", "yes"):
@@ -113,10 +164,9 @@ def _parse_yaml_value(value: str) -> Any:
     if lower in ("false", "no"):
         return False
 
-    try:
-        return int(value)
-    except ValueError:
-        pass
+    number = _parse_yaml_number(value)
+    if number is not None:
+        return number
 
     if value.startswith("["):
         try:
@@ -131,6 +181,21 @@ def _parse_yaml_value(value: str) -> Any:
     return value
 
 
+def _parse_yaml_number(value: str) -> int | float | None:
+    """Parse an integer or float YAML value, or return None."""
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    # Require a digit so words like "nan" or "inf" stay strings
+    if any(ch.isdigit() for ch in value):
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return None
+
+
 def _load_yaml_config(config_path: Path) -> dict[str, Any]:
     """Load configuration from a YAML file.
 
@@ -176,8 +241,30 @@ def _flatten_yaml_to_config(yaml_data: dict[str, Any]) -> dict[str, Any]:
     # Dotted key mappings
     _KEY_MAP = {
         "dynamodb.eventual_consistency_delay_ms": "eventual_consistency_delay_ms",
+        "dynamodb.group_commit_window_ms": "dynamodb_group_commit_window_ms",
+        "sqs.durable": "sqs_durable",
+        "sqs.fsync_interval_ms": "sqs_fsync_interval_ms",
+        "logging.body_bytes": "request_log_body_bytes",
+        "logging.sample_rate": "request_log_sample_rate",
+        "logging.disabled_services": "request_log_disabled_services",
+        "cognito.hash_iterations": "cognito_hash_iterations",
+        "cognito.hash_workers": "cognito_hash_workers",
+        "cognito.hash_executor": "cognito_hash_executor",
+        "cognito.verify_cache_ttl_ms": "cognito_verify_cache_ttl_ms",
+        "delivery.max_concurrency": "delivery_max_concurrency",
+        "delivery.max_per_target": "delivery_max_per_target",
+        "delivery.queue_size": "delivery_queue_size",
+        "delivery.batch_size": "delivery_batch_size",
+        "delivery.max_attempts": "delivery_max_attempts",
+        "delivery.retry_backoff_ms": "delivery_retry_backoff_ms",
+        "stepfunctions.history_max_executions": "stepfunctions_history_max_executions",
+        "stepfunctions.history_max_age_ms": "stepfunctions_history_max_age_ms",
+        "stepfunctions.history_max_bytes": "stepfunctions_history_max_bytes",
+        "lambda.warm_workers": "lambda_warm_workers",
+        "lambda.worker_idle_timeout_ms": "lambda_worker_idle_timeout_ms",
         "watch.include": "watch_include",
         "watch.exclude": "watch_exclude",
+        "watch.reload_debounce_ms": "watch_reload_debounce_ms",
     }
 
     for key, value in yaml_data.items():
@@ -196,6 +283,14 @@ def _coerce_int(value: str) -> Any:
         return None
 
 
+def _coerce_float(value: str) -> Any:
+    """Coerce an environment variable string to float, or None on failure."""
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
 def _coerce_bool(value: str) -> bool:
     """Coerce an environment variable string to bool."""
     return value.lower() in ("true", "1", "yes")
@@ -206,13 +301,33 @@ def _coerce_list(value: str) -> list[str]:
     return [p.strip() for p in value.split(",") if p.strip()]
 
 
+_INT_FIELDS = frozenset(
+    {
+        "port",
+        "request_log_body_bytes",
+        "cognito_hash_iterations",
+        "cognito_hash_workers",
+        "delivery_max_concurrency",
+        "delivery_max_per_target",
+        "delivery_queue_size",
+        "delivery_batch_size",
+        "delivery_max_attempts",
+        "stepfunctions_history_max_executions",
+        "stepfunctions_history_max_bytes",
+        "lambda_warm_workers",
+    }
+)
+
+
 def _get_env_coercer(field_name: str) -> callable:
     """Return the coercion function for a given config field name."""
-    if field_name == "port" or field_name.endswith("_ms"):
+    if field_name in _INT_FIELDS or field_name.endswith("_ms"):
         return _coerce_int
-    if field_name == "persist":
+    if field_name == "request_log_sample_rate":
+        return _coerce_float
+    if field_name in ("persist", "sqs_durable"):
         return _coerce_bool
-    if field_name.startswith("watch_"):
+    if field_name.startswith("watch_") or field_name == "request_log_disabled_services":
         return _coerce_list
     return lambda v: v
 
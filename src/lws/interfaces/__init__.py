@@ -15,6 +15,7 @@ from lws.interfaces.event_bus import IEventBus
 from lws.interfaces.key_value_store import (
     GsiDefinition,
     IKeyValueStore,
+    ItemPage,
     KeyAttribute,
     KeySchema,
     TableConfig,
@@ -45,6 +46,7 @@ __all__ = [
     # key_value_store.py
     "GsiDefinition",
     "IKeyValueStore",
+    "ItemPage",
     "KeyAttribute",
     "KeySchema",
     "TableConfig",
@@ -32,12 +32,17 @@ class LambdaContext:
 
 @dataclass
 class InvocationResult:
-    """Result of a Lambda function invocation."""
+    """Result of a Lambda function invocation.
+
+    ``cold_start`` is True when the invocation had to start a new runtime,
+    False when it ran on a warm one, and None when the provider cannot tell.
+    """
 
     payload: dict | None
     error: str | None
     duration_ms: float
     request_id: str
+    cold_start: bool | None = None
 
 
 @dataclass
@@ -40,6 +40,21 @@ class TableConfig:
     gsi_definitions: list[GsiDefinition] = field(default_factory=list)
 
 
+@dataclass
+class ItemPage:
+    """A single page of Query or Scan results.
+
+    ``scanned_count`` counts items evaluated before any filter was applied.
+    ``last_evaluated_key`` is set when the page stopped at ``Limit`` and
+    can be passed back as ``exclusive_start_key`` to resume.
+    """
+
+    items: list[dict] = field(default_factory=list)
+    count: int = 0
+    scanned_count: int = 0
+    last_evaluated_key: dict | None = None
+
+
 class IKeyValueStore(Provider):
     """Abstract interface for key-value store providers (DynamoDB-like).
 
@@ -92,6 +107,41 @@ class IKeyValueStore(Provider):
     ) -> list[dict]:
         """Scan all items in a table, optionally filtering."""
 
+    @abstractmethod
+    async def query_page(
+        self,
+        table_name: str,
+        key_condition: str,
+        expression_values: dict | None = None,
+        expression_names: dict | None = None,
+        index_name: str | None = None,
+        filter_expression: str | None = None,
+        limit: int | None = None,
+        exclusive_start_key: dict | None = None,
+        scan_index_forward: bool = True,
+        count_only: bool = False,
+    ) -> ItemPage:
+        """Query a single page of items, resuming after *exclusive_start_key*."""
+
+    @abstractmethod
+    async def scan_page(
+        self,
+        table_name: str,
+        filter_expression: str | None = None,
+        expression_values: dict | None = None,
+        expression_names: dict | None = None,
+        limit: int | None = None,
+        exclusive_start_key: dict | None = None,
+        count_only: bool = False,
+        segment: int | None = None,
+        total_segments: int | None = None,
+    ) -> ItemPage:
+        """Scan a single page of items, resuming after *exclusive_start_key*.
+
+        When *segment* and *total_segments* are given, only the items that
+        belong to that Parallel Scan segment are returned.
+        """
+
     @abstractmethod
     async def batch_get_items(self, table_name: str, keys: list[dict]) -> list[dict]:
         """Get multiple items by their keys in a single batch."""
@@ -105,6 +155,14 @@ class IKeyValueStore(Provider):
     ) -> None:
         """Write (put and/or delete) multiple items in a single batch."""
 
+    @abstractmethod
+    async def transact_write_items(self, transact_items: list[dict]) -> None:
+        """Apply the Put, Delete and Update entries of a TransactWriteItems request.
+
+        Condition expressions are evaluated by the caller beforehand;
+        ``ConditionCheck`` entries are ignored here.
+        """
+
     @abstractmethod
     async def create_table(self, config: TableConfig) -> dict:
         """Create a table dynamically. Returns a table description dict."""
@@ -22,6 +22,13 @@ class IQueue(Provider):
     ) -> str:
         """Send a message to the queue. Returns the message ID."""
 
+    async def send_message_batch(self, queue_name: str, message_bodies: list[str]) -> list[str]:
+        """Send several messages to the queue. Returns their message IDs.
+
+        Providers that can enqueue a batch in one step should override this.
+        """
+        return [await self.send_message(queue_name, body) for body in message_bodies]
+
     @abstractmethod
     async def receive_messages(
         self,
@@ -35,6 +42,14 @@ class IQueue(Provider):
     async def delete_message(self, queue_name: str, receipt_handle: str) -> None:
         """Delete a message from the queue using its receipt handle."""
 
+    async def delete_message_batch(self, queue_name: str, receipt_handles: list[str]) -> None:
+        """Delete several messages from the queue.
+
+        Providers that can remove a batch in one step should override this.
+        """
+        for receipt_handle in receipt_handles:
+            await self.delete_message(queue_name, receipt_handle)
+
     @abstractmethod
     async def create_queue(self, queue_name: str, attributes: dict | None = None) -> str:
         """Create a queue. Returns the queue URL."""
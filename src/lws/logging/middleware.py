@@ -1,135 +1,201 @@
-"""FastAPI middleware for structured request logging.
+"""ASGI middleware for structured request logging.
 
 Provides a reusable middleware that logs all HTTP requests with timing,
 status codes, and structured metadata for WebSocket streaming to the GUI.
+
+The middleware is raw ASGI: request and response bodies are forwarded
+chunk by chunk, and only the first ``body_bytes`` of each are copied
+aside for the log entry, so streaming responses are never buffered.
+What is captured is governed by a process-wide :class:`RequestLogPolicy`
+(see :func:`configure_request_logging`):
+
+- services listed in ``disabled_services`` are not logged at all;
+- only a ``sample_rate`` fraction of successful requests is logged, while
+  4xx/5xx responses are always logged (without bodies when unsampled);
+- nothing is captured while the logger is below INFO.
 """
 
 from __future__ import annotations
 
+import logging
+import random
 import time
-from collections.abc import Callable
+from dataclasses import dataclass
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from lws.logging.logger import LdkLogger
 
 
-async def _get_request_body(request: Request) -> str | None:
-    """Safely extract and cache request body without consuming the stream."""
-    try:
-        body_bytes = await request.body()
-        if len(body_bytes) < 10240:  # 10KB limit
-            return body_bytes.decode("utf-8", errors="replace")
-    except Exception:
-        pass
-    return None
+@dataclass(frozen=True)
+class RequestLogPolicy:
+    """What ``RequestLoggingMiddleware`` records for each request.
+
+    Attributes:
+        body_bytes: Bytes of each request/response body kept for the log
+            entry; longer bodies are truncated.  ``0`` disables capture.
+        sample_rate: Fraction (0.0-1.0) of successful requests to log.
+        disabled_services: Service names whose requests are never logged.
+    """
+
+    body_bytes: int = 10240
+    sample_rate: float = 1.0
+    disabled_services: frozenset[str] = frozenset()
+
+
+_policy = RequestLogPolicy()
+
+
+def configure_request_logging(policy: RequestLogPolicy) -> None:
+    """Set the policy used by every ``RequestLoggingMiddleware``."""
+    global _policy  # pylint: disable=global-statement
+    _policy = policy
+
+
+def get_request_log_policy() -> RequestLogPolicy:
+    """Return the active request logging policy."""
+    return _policy
+
+
+class _BodyTee:
+    """Keeps the first *limit* bytes of a body seen in chunks."""
+
+    def __init__(self, limit: int) -> None:
+        self._limit = limit
+        self._chunks: list[bytes] = []
+        self._size = 0
+
+    def add(self, chunk: bytes) -> None:
+        """Record *chunk*, copying only what fits under the limit."""
+        if self._size < self._limit:
+            self._chunks.append(chunk[: self._limit - self._size])
+        self._size += len(chunk)
 
+    def text(self) -> str:
+        """Return the decoded body, marking it when truncated."""
+        text = b"".join(self._chunks).decode("utf-8", errors="replace")
+        if self._size > self._limit:
+            text += f"... [truncated, {self._size} bytes]"
+        return text
 
-def _get_response_body(response: Response) -> str | None:
-    """Extract response body if available."""
-    try:
-        if hasattr(response, "body") and response.body:
-            if len(response.body) < 10240:  # 10KB limit
-                return response.body.decode("utf-8", errors="replace")
-    except Exception:
-        pass
-    return None
 
+class _Exchange:
+    """Status code and body tees for one request/response pair.
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+    With ``body_bytes == 0`` nothing is copied and only the status is kept.
+    """
+
+    def __init__(self, method: str, body_bytes: int) -> None:
+        self.status_code = 500
+        self._request_tee: _BodyTee | None = None
+        self._response_tee: _BodyTee | None = None
+        if body_bytes > 0:
+            self._response_tee = _BodyTee(body_bytes)
+            if method in ("POST", "PUT", "PATCH"):
+                self._request_tee = _BodyTee(body_bytes)
+
+    def request_body(self) -> str | None:
+        """Return the captured request body, if any."""
+        return self._request_tee.text() if self._request_tee is not None else None
+
+    def response_body(self) -> str | None:
+        """Return the captured response body, if any."""
+        return self._response_tee.text() if self._response_tee is not None else None
+
+    def wrap_receive(self, receive: Receive) -> Receive:
+        """Return *receive*, teeing request body chunks when capturing."""
+        tee = self._request_tee
+        if tee is None:
+            return receive
+
+        async def _receive() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                tee.add(message.get("body", b""))
+            return message
+
+        return _receive
+
+    def wrap_send(self, send: Send) -> Send:
+        """Return a ``send`` that records the status and tees body chunks."""
+        tee = self._response_tee
+
+        async def _send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                self.status_code = message["status"]
+            elif tee is not None and message["type"] == "http.response.body":
+                tee.add(message.get("body", b""))
+            await send(message)
+
+        return _send
+
+
+class RequestLoggingMiddleware:
     """Middleware that logs all HTTP requests with timing and status.
 
     For each request:
     - Records start time
-    - Calls the next handler
+    - Calls the next handler, teeing the request and response bodies
     - Logs method, path, duration, and status code
     - Uses structured logging for terminal and WebSocket output
 
     Args:
-        app: The FastAPI application to wrap.
+        app: The ASGI application to wrap.
         logger: LdkLogger instance for structured logging.
         service_name: Optional service name to include in logs (e.g., "dynamodb", "sqs").
     """
 
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         logger: LdkLogger,
         service_name: str | None = None,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self._logger = logger
         self._service_name = service_name
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Process request, time it, log it, and return response."""
-        # Skip logging for Chrome DevTools and other well-known paths
-        if request.url.path.startswith("/.well-known/"):
-            return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        policy = _policy
+        if not self._should_log(scope, policy):
+            await self.app(scope, receive, send)
+            return
 
-        # Capture request body (limit to 10KB for logging)
-        request_body = None
-        if request.method in ("POST", "PUT", "PATCH"):
-            request_body = await _get_request_body(request)
+        request = Request(scope)
+        sampled = policy.sample_rate >= 1.0 or random.random() < policy.sample_rate
+        exchange = _Exchange(request.method, policy.body_bytes if sampled else 0)
 
         t0 = time.monotonic()
-        response = await call_next(request)
+        await self.app(scope, exchange.wrap_receive(receive), exchange.wrap_send(send))
         duration_ms = (time.monotonic() - t0) * 1000
+        if not sampled and exchange.status_code < 400:
+            return
 
-        # Capture response body by reading the stream (for StreamingResponse)
-        response, response_body = await self._capture_response_body(response)
-
+        request_body = exchange.request_body()
         # Extract operation name from path or headers (service-specific)
         operation = self._extract_operation(request, request_body)
 
-        iam_eval = getattr(request.state, "iam_eval", None)
         self._logger.log_http_request(
             method=request.method,
             path=request.url.path,
             handler_name=operation or self._service_name or "handler",
             duration_ms=duration_ms,
-            status_code=response.status_code,
+            status_code=exchange.status_code,
             service=self._service_name,
             request_body=request_body,
-            response_body=response_body,
-            iam_eval=iam_eval,
+            response_body=exchange.response_body(),
+            iam_eval=scope.get("state", {}).get("iam_eval"),
         )
 
-        return response
-
-    @staticmethod
-    async def _capture_response_body(response: Response) -> tuple[Response, str | None]:
-        """Read the streaming response body and return a new response with the captured body.
-
-        Returns a tuple of (response, response_body_str). If body reading fails,
-        the original response is returned with None as the body string.
-        """
-        try:
-            body_chunks = []
-            async for chunk in response.body_iterator:
-                body_chunks.append(chunk)
-                if sum(len(c) for c in body_chunks) > 10240:  # 10KB limit
-                    break
-
-            body_bytes = b"".join(body_chunks)
-            body_str = None
-            if len(body_bytes) < 10240:
-                body_str = body_bytes.decode("utf-8", errors="replace") or ""
-
-            from starlette.responses import (  # pylint: disable=import-outside-toplevel
-                Response as StarletteResponse,
-            )
-
-            new_response = StarletteResponse(
-                content=body_bytes,
-                status_code=response.status_code,
-                headers=dict(response.headers),
-                media_type=response.media_type,
-            )
-            return new_response, body_str
-        except Exception:
-            return response, None
+    def _should_log(self, scope: Scope, policy: RequestLogPolicy) -> bool:
+        """Return False for requests this middleware should pass straight through."""
+        if scope["type"] != "http" or not self._logger.is_enabled_for(logging.INFO):
+            return False
+        if self._service_name in policy.disabled_services:
+            return False
+        # Skip logging for Chrome DevTools and other well-known paths
+        return not scope["path"].startswith("/.well-known/")
 
     _TARGET_PREFIXES = (
         "DynamoDB",
@@ -0,0 +1,100 @@
+"""Raw ASGI building blocks shared by the AWS service middlewares.
+
+Starlette's ``BaseHTTPMiddleware`` runs every layer in its own task and
+pipes the response through an anyio memory stream, and each layer that
+needs the request body reads it again.  The middlewares in this package
+instead subclass :class:`AsgiMiddleware`, which forwards
+``(scope, receive, send)`` directly, so a stack of them costs a few
+function calls per request.
+
+The request body is read at most once: :func:`buffer_body` caches it in
+``scope`` under :data:`BODY_SCOPE_KEY` and hands back a ``receive`` that
+replays it, so later layers and the endpoint see the same bytes without
+touching the wire again.  Layers whose configuration is disabled are
+bypassed before any of this happens.
+"""
+
+from __future__ import annotations
+
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+BODY_SCOPE_KEY = "lws.body"
+
+
+async def buffer_body(scope: Scope, receive: Receive) -> tuple[bytes, Receive]:
+    """Return the request body and a ``receive`` to pass downstream.
+
+    The first caller drains *receive* and caches the body in *scope*;
+    later callers get the cached bytes and their *receive* unchanged.
+    """
+    cached = scope.get(BODY_SCOPE_KEY)
+    if cached is not None:
+        return cached, receive
+
+    chunks: list[bytes] = []
+    more_body = True
+    while more_body:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        more_body = message.get("more_body", False)
+    body = b"".join(chunks)
+    scope[BODY_SCOPE_KEY] = body
+    return body, _replay(body, receive)
+
+
+def _replay(body: bytes, receive: Receive) -> Receive:
+    """Return a ``receive`` that yields *body* once, then defers to *receive*."""
+    pending = True
+
+    async def _receive() -> Message:
+        nonlocal pending
+        if pending:
+            pending = False
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return _receive
+
+
+def set_state(scope: Scope, name: str, value: object) -> None:
+    """Set ``request.state.<name>`` for every layer sharing *scope*."""
+    scope.setdefault("state", {})[name] = value
+
+
+class AsgiMiddleware:
+    """Base class for pass-through-by-default HTTP middlewares.
+
+    Subclasses implement :meth:`handle` and may override :attr:`enabled`;
+    non-HTTP scopes and disabled layers go straight to the wrapped app.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    @property
+    def enabled(self) -> bool:
+        """Return False to bypass this layer for the current request."""
+        return True
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.enabled:
+            await self.app(scope, receive, send)
+            return
+        await self.handle(Request(scope), receive, send)
+
+    async def handle(self, request: Request, receive: Receive, send: Send) -> None:
+        """Process one HTTP request; call ``self.app`` to continue the chain."""
+        raise NotImplementedError
+
+    async def respond(
+        self, request: Request, receive: Receive, send: Send, response: Response | None
+    ) -> None:
+        """Send *response*, or continue down the chain when it is None."""
+        if response is None:
+            await self.app(request.scope, receive, send)
+            return
+        await response(request.scope, receive, send)
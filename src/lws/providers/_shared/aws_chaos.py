@@ -15,10 +15,11 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
 from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Send
 
+from lws.providers._shared.asgi import AsgiMiddleware
 from lws.providers._shared.chaos_helpers import apply_chaos_latency, should_inject_error
 
 # ------------------------------------------------------------------
@@ -186,12 +187,12 @@ def format_error(error: AwsErrorSpec, fmt: ErrorFormat) -> Response:
 # ------------------------------------------------------------------
 
 
-class AwsChaosMiddleware(BaseHTTPMiddleware):
-    """Starlette middleware that injects chaos into AWS service responses."""
+class AwsChaosMiddleware(AsgiMiddleware):
+    """ASGI middleware that injects chaos into AWS service responses."""
 
     def __init__(
         self,
-        app,  # noqa: ANN001
+        app: ASGIApp,
         chaos_config: AwsChaosConfig,
         error_format: ErrorFormat,
     ) -> None:
@@ -199,14 +200,20 @@ class AwsChaosMiddleware(BaseHTTPMiddleware):
         self.chaos = chaos_config
         self.error_format = error_format
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        """Apply chaos rules before forwarding the request."""
-        if not self.chaos.enabled:
-            return await call_next(request)
+    @property
+    def enabled(self) -> bool:
+        return self.chaos.enabled
 
+    async def handle(self, request: Request, receive: Receive, send: Send) -> None:
+        """Apply chaos rules before forwarding the request."""
         if request.url.path.startswith("/_ldk/"):
-            return await call_next(request)
+            await self.app(request.scope, receive, send)
+            return
 
+        await self.respond(request, receive, send, await self._inject())
+
+    async def _inject(self) -> Response | None:
+        """Return an injected error response, or None to forward the request."""
         # Connection reset
         if self.chaos.connection_reset_rate > 0:
             if random.random() < self.chaos.connection_reset_rate:
@@ -228,10 +235,8 @@ class AwsChaosMiddleware(BaseHTTPMiddleware):
 
         # Error rate injection
         if should_inject_error(self.chaos.error_rate):
-            error = _pick_error(self.chaos)
-            return format_error(error, self.error_format)
-
-        return await call_next(request)
+            return format_error(_pick_error(self.chaos), self.error_format)
+        return None
 
 
 def _pick_error(chaos: AwsChaosConfig) -> AwsErrorSpec:
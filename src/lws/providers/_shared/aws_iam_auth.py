@@ -2,28 +2,32 @@
 
 Intercepts requests, resolves the caller identity, looks up required
 IAM actions for the operation, evaluates policies, and either denies
-(enforce mode) or logs (audit mode) unauthorized requests.
+(enforce mode) or logs (audit mode) unauthorized requests.  Decisions
+are evaluated against the stores' precompiled policies and remembered
+in a :class:`DecisionCache` shared by every service's middleware.
 """
 
 from __future__ import annotations
 
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
 from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Send
 
 from lws.config.loader import IamAuthConfig
 from lws.logging.logger import LdkLogger, get_logger
+from lws.providers._shared.asgi import AsgiMiddleware, buffer_body, set_state
 from lws.providers._shared.aws_chaos import (
     AwsErrorSpec,
     ErrorFormat,
     format_error,
 )
 from lws.providers._shared.aws_operation_mock import extract_operation_from_request
-from lws.providers._shared.iam_identity_store import IdentityStore
+from lws.providers._shared.iam_decision_cache import DecisionCache
+from lws.providers._shared.iam_identity_store import Identity, IdentityStore
 from lws.providers._shared.iam_permissions_map import PermissionsMap
 from lws.providers._shared.iam_policy_engine import (
     Decision,
@@ -52,10 +56,10 @@ def _build_iam_eval(
     }
 
 
-async def _read_request_body(request: Request) -> str | None:
+async def _read_request_body(request: Request, receive: Receive) -> str | None:
     """Safely read up to 10 KB of the request body for logging."""
     try:
-        body = await request.body()
+        body, _ = await buffer_body(request.scope, receive)
         if body and len(body) < 10240:
             return body.decode("utf-8", errors="replace")
     except Exception:  # pylint: disable=broad-except
@@ -63,12 +67,12 @@ async def _read_request_body(request: Request) -> str | None:
     return None
 
 
-class AwsIamAuthMiddleware(BaseHTTPMiddleware):
+class AwsIamAuthMiddleware(AsgiMiddleware):
     """ASGI middleware that enforces IAM authorization on AWS requests."""
 
     def __init__(
         self,
-        app: Any,
+        app: ASGIApp,
         *,
         iam_auth_config: IamAuthConfig,
         service: str,
@@ -76,6 +80,7 @@ class AwsIamAuthMiddleware(BaseHTTPMiddleware):
         permissions_map: PermissionsMap,
         resource_policy_store: ResourcePolicyStore,
         error_format: ErrorFormat,
+        decision_cache: DecisionCache | None = None,
     ) -> None:
         super().__init__(app)
         self._config = iam_auth_config
@@ -84,20 +89,34 @@ class AwsIamAuthMiddleware(BaseHTTPMiddleware):
         self._permissions_map = permissions_map
         self._resource_policy_store = resource_policy_store
         self._error_format = error_format
+        self._decision_cache = decision_cache if decision_cache is not None else DecisionCache()
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+    @property
+    def enabled(self) -> bool:
+        return self._effective_mode() != "disabled"
+
+    async def handle(self, request: Request, receive: Receive, send: Send) -> None:
         """Evaluate IAM authorization before forwarding the request."""
-        mode = self._effective_mode()
-        if mode == "disabled":
-            return await call_next(request)
+        operation, receive = await extract_operation_from_request(request, self._service, receive)
+        required_actions = None
+        if operation is not None:
+            required_actions = self._permissions_map.get_required_actions(self._service, operation)
+        if required_actions is None:
+            await self.app(request.scope, receive, send)
+            return
 
-        operation = await extract_operation_from_request(request, self._service)
-        if operation is None:
-            return await call_next(request)
+        response = await self._authorize(request, receive, operation, required_actions)
+        await self.respond(request, receive, send, response)
 
-        required_actions = self._permissions_map.get_required_actions(self._service, operation)
-        if required_actions is None:
-            return await call_next(request)
+    async def _authorize(
+        self,
+        request: Request,
+        receive: Receive,
+        operation: str,
+        required_actions: list[str],
+    ) -> Response | None:
+        """Return a deny response, or None to let the request through."""
+        mode = self._effective_mode()
 
         t0 = time.monotonic()
         identity_name = self._resolve_identity(request)
@@ -105,19 +124,10 @@ class AwsIamAuthMiddleware(BaseHTTPMiddleware):
 
         if identity is None:
             return await self._handle_unknown_identity(
-                request, call_next, identity_name, required_actions, mode, operation, t0
+                request, receive, identity_name, required_actions, mode, operation, t0
             )
 
-        context = EvaluationContext(
-            principal=identity_name,
-            actions=required_actions,
-            resource="*",
-            identity_policies=identity.inline_policies,
-            boundary_policy=identity.boundary_policy,
-            resource_policy=self._resource_policy_store.get_policy(self._service, "*"),
-        )
-
-        decision, reason = evaluate(context)
+        decision, reason = self._decide(identity_name, identity, required_actions)
         eval_info = _build_iam_eval(
             identity_name,
             "ALLOW" if decision == Decision.ALLOW else "DENY",
@@ -128,29 +138,55 @@ class AwsIamAuthMiddleware(BaseHTTPMiddleware):
 
         if decision == Decision.DENY:
             return await self._handle_deny(
-                request, call_next, eval_info, operation, identity_name, reason, mode, t0
+                request, receive, eval_info, operation, identity_name, reason, mode, t0
             )
 
-        request.state.iam_eval = eval_info
-        return await call_next(request)
+        set_state(request.scope, "iam_eval", eval_info)
+        return None
+
+    def _decide(
+        self, identity_name: str, identity: Identity, required_actions: list[str]
+    ) -> tuple[Decision, str]:
+        """Evaluate *identity*'s compiled policies, reusing cached decisions."""
+        key = (
+            self._service,
+            identity_name,
+            tuple(required_actions),
+            "*",
+            self._identity_store.version,
+        )
+        cached = self._decision_cache.get(key)
+        if cached is not None:
+            return cached
+        context = EvaluationContext(
+            principal=identity_name,
+            actions=required_actions,
+            resource="*",
+            identity_policies=list(identity.compiled_policies),
+            boundary_policy=identity.compiled_boundary,
+            resource_policy=self._resource_policy_store.get_compiled_policy(self._service, "*"),
+        )
+        result = evaluate(context)
+        self._decision_cache.put(key, result)
+        return result
 
     async def _handle_unknown_identity(
         self,
         request: Request,
-        call_next: RequestResponseEndpoint,
+        receive: Receive,
         identity_name: str,
         required_actions: list[str],
         mode: str,
         operation: str,
         t0: float,
-    ) -> Response:
+    ) -> Response | None:
         """Handle a request from an unrecognised identity."""
         eval_info = _build_iam_eval(
             identity_name, "DENY", "Unknown identity", required_actions, mode
         )
         if mode == "enforce":
             duration_ms = (time.monotonic() - t0) * 1000
-            body = await _read_request_body(request)
+            body = await _read_request_body(request, receive)
             _logger.log_iam_deny(
                 method=request.method,
                 path=str(request.url.path),
@@ -167,24 +203,24 @@ class AwsIamAuthMiddleware(BaseHTTPMiddleware):
             self._service,
             operation,
         )
-        request.state.iam_eval = eval_info
-        return await call_next(request)
+        set_state(request.scope, "iam_eval", eval_info)
+        return None
 
     async def _handle_deny(
         self,
         request: Request,
-        call_next: RequestResponseEndpoint,
+        receive: Receive,
         eval_info: dict[str, Any],
         operation: str,
         identity_name: str,
         reason: str,
         mode: str,
         t0: float,
-    ) -> Response:
+    ) -> Response | None:
         """Handle an IAM DENY decision."""
         if mode == "enforce":
             duration_ms = (time.monotonic() - t0) * 1000
-            body = await _read_request_body(request)
+            body = await _read_request_body(request, receive)
             _logger.log_iam_deny(
                 method=request.method,
                 path=str(request.url.path),
@@ -202,8 +238,8 @@ class AwsIamAuthMiddleware(BaseHTTPMiddleware):
             identity_name,
             reason,
         )
-        request.state.iam_eval = eval_info
-        return await call_next(request)
+        set_state(request.scope, "iam_eval", eval_info)
+        return None
 
     def _effective_mode(self) -> str:
         """Return the effective mode for this service."""
@@ -252,6 +288,7 @@ class IamAuthBundle:
     identity_store: IdentityStore
     permissions_map: PermissionsMap
     resource_policy_store: ResourcePolicyStore
+    decision_cache: DecisionCache = field(default_factory=DecisionCache)
 
 
 def add_iam_auth_middleware(
@@ -271,4 +308,5 @@ def add_iam_auth_middleware(
         permissions_map=iam_auth.permissions_map,
         resource_policy_store=iam_auth.resource_policy_store,
         error_format=error_format,
+        decision_cache=iam_auth.decision_cache,
     )
@@ -15,9 +15,11 @@ from dataclasses import dataclass, field
 from typing import Any
 from urllib.parse import parse_qs
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
 from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Send
+
+from lws.providers._shared.asgi import AsgiMiddleware, buffer_body
 
 # ------------------------------------------------------------------
 # Data models
@@ -220,20 +222,25 @@ SERVICE_EXTRACTORS: dict[str, OperationExtractor] = {
 async def extract_operation_from_request(
     request: Request,
     service: str,
-) -> str | None:
+    receive: Receive,
+) -> tuple[str | None, Receive]:
     """Extract the AWS operation name from a request, or None if not possible.
 
     Skips internal ``/_ldk/`` paths and returns None when no extractor
     is registered for the service or the extractor cannot determine the
-    operation.
+    operation.  Only form-encoded requests (the SQS/SNS query protocol)
+    carry the operation in the body, so only those are buffered; the
+    returned ``receive`` must be passed downstream in place of *receive*.
     """
     if request.url.path.startswith("/_ldk/"):
-        return None
+        return None, receive
     extractor = SERVICE_EXTRACTORS.get(service)
     if extractor is None:
-        return None
-    body = await request.body()
-    return extractor(request, body)
+        return None, receive
+    body = b""
+    if "application/x-www-form-urlencoded" in request.headers.get("content-type", ""):
+        body, receive = await buffer_body(request.scope, receive)
+    return extractor(request, body), receive
 
 
 # ------------------------------------------------------------------
@@ -241,12 +248,12 @@ async def extract_operation_from_request(
 # ------------------------------------------------------------------
 
 
-class AwsOperationMockMiddleware(BaseHTTPMiddleware):
+class AwsOperationMockMiddleware(AsgiMiddleware):
     """Return canned responses for requests matching mock rules."""
 
     def __init__(
         self,
-        app,  # noqa: ANN001
+        app: ASGIApp,
         mock_config: AwsMockConfig,
         service: str,
     ) -> None:
@@ -254,21 +261,18 @@ class AwsOperationMockMiddleware(BaseHTTPMiddleware):
         self.mock_config = mock_config
         self.service = service
 
-    async def dispatch(  # pylint: disable=missing-function-docstring
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        if not self.mock_config.enabled:
-            return await call_next(request)
-
-        operation = await extract_operation_from_request(request, self.service)
-        if operation is None:
-            return await call_next(request)
-
-        matched = _find_matching_rule(operation, request, self.mock_config.rules)
-        if matched is None:
-            return await call_next(request)
-
-        return await _build_response(matched.response)
+    @property
+    def enabled(self) -> bool:
+        return self.mock_config.enabled
+
+    async def handle(self, request: Request, receive: Receive, send: Send) -> None:
+        """Answer matching operations with their canned response."""
+        operation, receive = await extract_operation_from_request(request, self.service, receive)
+        matched = None
+        if operation is not None:
+            matched = _find_matching_rule(operation, request, self.mock_config.rules)
+        response = await _build_response(matched.response) if matched is not None else None
+        await self.respond(request, receive, send, response)
 
 
 def _find_matching_rule(
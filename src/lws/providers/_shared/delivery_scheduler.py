@@ -0,0 +1,257 @@
+"""Bounded, back-pressured delivery for SNS and EventBridge fan-out.
+
+Every delivery to an SNS subscriber or EventBridge target goes through
+one shared :class:`DeliveryScheduler` instead of its own
+``asyncio.create_task``:
+
+- Each target (``lambda:<function>``, ``sqs:<queue>``) has a bounded FIFO
+  lane.  A publisher whose target lane is full waits for room, so a
+  publish storm slows the publisher down instead of piling up tasks.
+- At most ``max_per_target`` deliveries run per lane and at most
+  ``max_concurrency`` run across all lanes.
+- Queued items submitted as *batchable* for the same handler are handed
+  over together, up to ``batch_size`` at a time.
+- A delivery whose handler raises is retried with exponential backoff
+  until ``max_attempts`` is reached, then counted as failed.
+
+The scheduler is a ``Provider`` so the orchestrator stops it with the
+other providers, and its :meth:`DeliveryScheduler.metrics` (queue depth,
+in-flight deliveries, outcome counters and latency) are reported by
+``/_ldk/status``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from lws.interfaces.provider import Provider
+from lws.logging.logger import get_logger
+
+_logger = get_logger("ldk.delivery")
+
+Handler = Callable[[list[Any]], Awaitable[None]]
+
+# Number of recent delivery latencies kept for the percentile metrics.
+_LATENCY_SAMPLES = 1024
+
+
+@dataclass
+class DeliveryConfig:
+    """Concurrency, queueing, batching and retry settings.
+
+    Attributes:
+        max_concurrency: Deliveries running at once across all targets.
+        max_per_target: Deliveries running at once for one target.
+        queue_size: Deliveries queued per target before publishers wait.
+        batch_size: Most batchable items handed to a handler at once.
+        max_attempts: Attempts per delivery, including the first.
+        retry_backoff_s: Delay before the first retry; doubles each time.
+    """
+
+    max_concurrency: int = 64
+    max_per_target: int = 8
+    queue_size: int = 1000
+    batch_size: int = 10
+    max_attempts: int = 3
+    retry_backoff_s: float = 0.1
+
+
+@dataclass
+class _Delivery:
+    item: Any
+    handler: Handler
+    batchable: bool
+    enqueued_at: float
+
+
+class _Lane:
+    """Pending deliveries of one target and the workers draining them."""
+
+    def __init__(self) -> None:
+        self.pending: deque[_Delivery] = deque()
+        self.workers = 0
+        self.has_room = asyncio.Event()
+        self.has_room.set()
+
+    def take(self, batch_size: int) -> list[_Delivery]:
+        """Pop the next delivery plus any batchable ones queued behind it."""
+        first = self.pending.popleft()
+        batch = [first]
+        if not first.batchable:
+            return batch
+        while self.pending and len(batch) < batch_size:
+            following = self.pending[0]
+            if not following.batchable or following.handler != first.handler:
+                break
+            batch.append(self.pending.popleft())
+        return batch
+
+
+class DeliveryScheduler(Provider):
+    """Per-target bounded queues drained by a capped set of workers."""
+
+    def __init__(self, config: DeliveryConfig | None = None) -> None:
+        self._config = config or DeliveryConfig()
+        self._lanes: dict[str, _Lane] = {}
+        self._workers: set[asyncio.Task[None]] = set()
+        self._slots = asyncio.Semaphore(max(1, self._config.max_concurrency))
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._running = False
+        self._in_flight = 0
+        self._delivered = 0
+        self._failed = 0
+        self._retried = 0
+        self._latencies: deque[float] = deque(maxlen=_LATENCY_SAMPLES)
+
+    # -- Provider lifecycle ---------------------------------------------------
+
+    @property
+    def name(self) -> str:
+        return "delivery"
+
+    @property
+    def config(self) -> DeliveryConfig:
+        """Return the scheduler configuration."""
+        return self._config
+
+    async def start(self) -> None:
+        """Mark the scheduler as running; workers are started on demand."""
+        self._running = True
+
+    async def stop(self) -> None:
+        """Cancel running deliveries and drop queued ones."""
+        workers = list(self._workers)
+        for task in workers:
+            task.cancel()
+        for task in workers:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        for lane in self._lanes.values():
+            lane.pending.clear()
+            lane.has_room.set()
+        self._lanes.clear()
+        self._idle.set()
+        self._running = False
+
+    async def health_check(self) -> bool:
+        return self._running
+
+    # -- Public API -----------------------------------------------------------
+
+    async def submit(
+        self,
+        target: str,
+        item: Any,
+        handler: Handler,
+        *,
+        batchable: bool = False,
+    ) -> None:
+        """Queue *item* for delivery to *target* by *handler*.
+
+        Waits while the target's lane is full.  *handler* is awaited with a
+        list of items: just *item*, or, when *batchable*, up to
+        ``batch_size`` items queued consecutively with an equal handler.
+        """
+        while True:
+            lane = self._lanes.get(target)
+            if lane is None:
+                lane = self._lanes[target] = _Lane()
+            if len(lane.pending) < self._config.queue_size:
+                break
+            lane.has_room.clear()
+            await lane.has_room.wait()
+
+        lane.pending.append(_Delivery(item, handler, batchable, time.monotonic()))
+        self._idle.clear()
+        if lane.workers < max(1, self._config.max_per_target):
+            self._spawn(target, lane)
+
+    async def join(self) -> None:
+        """Wait until every queued delivery has been attempted."""
+        await self._idle.wait()
+
+    def metrics(self) -> dict[str, Any]:
+        """Return queue depth, outcome counters and recent latency."""
+        latencies = sorted(self._latencies)
+        return {
+            "queued": sum(len(lane.pending) for lane in self._lanes.values()),
+            "in_flight": self._in_flight,
+            "delivered": self._delivered,
+            "failed": self._failed,
+            "retried": self._retried,
+            "latency_ms": {
+                "p50": _percentile_ms(latencies, 0.50),
+                "p99": _percentile_ms(latencies, 0.99),
+                "max": _percentile_ms(latencies, 1.0),
+            },
+            "targets": {
+                target: len(lane.pending) for target, lane in self._lanes.items() if lane.pending
+            },
+        }
+
+    # -- Workers --------------------------------------------------------------
+
+    def _spawn(self, target: str, lane: _Lane) -> None:
+        lane.workers += 1
+        task = asyncio.create_task(self._drain(target, lane))
+        self._workers.add(task)
+        task.add_done_callback(self._workers.discard)
+
+    async def _drain(self, target: str, lane: _Lane) -> None:
+        """Deliver from *lane* until it is empty."""
+        try:
+            while lane.pending:
+                async with self._slots:
+                    if not lane.pending:
+                        break
+                    batch = lane.take(self._config.batch_size)
+                    lane.has_room.set()
+                    await self._deliver(target, batch)
+        finally:
+            lane.workers -= 1
+            if not lane.workers and not lane.pending and self._lanes.get(target) is lane:
+                del self._lanes[target]
+                if not self._lanes:
+                    self._idle.set()
+
+    async def _deliver(self, target: str, batch: list[_Delivery]) -> None:
+        self._in_flight += len(batch)
+        try:
+            await self._call_with_retry(target, batch[0].handler, [d.item for d in batch])
+        finally:
+            self._in_flight -= len(batch)
+        finished_at = time.monotonic()
+        self._latencies.extend(finished_at - d.enqueued_at for d in batch)
+
+    async def _call_with_retry(self, target: str, handler: Handler, items: list[Any]) -> None:
+        attempts = max(1, self._config.max_attempts)
+        for attempt in range(1, attempts + 1):
+            try:
+                await handler(items)
+            except Exception as exc:
+                if attempt == attempts:
+                    self._failed += len(items)
+                    _logger.error(
+                        "Delivery to %s failed after %d attempt(s): %s", target, attempt, exc
+                    )
+                    return
+                self._retried += 1
+                await asyncio.sleep(self._config.retry_backoff_s * 2 ** (attempt - 1))
+            else:
+                self._delivered += len(items)
+                return
+
+
+def _percentile_ms(ordered: list[float], fraction: float) -> float:
+    """Return the *fraction* percentile of sorted seconds, in milliseconds."""
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(fraction * len(ordered)))
+    return round(ordered[index] * 1000, 3)
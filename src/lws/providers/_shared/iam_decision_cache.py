@@ -0,0 +1,57 @@
+"""LRU cache of IAM authorization decisions.
+
+Repeated requests from one identity for one operation evaluate the same
+policies against the same actions, so the middleware remembers the
+outcome.  Entries are keyed by service, identity, actions, resource and
+the identity store's ``version``: registering an identity changes the
+version, so decisions made against older policies are never returned.
+Runtime updates through ``/_ldk/iam-auth`` also clear the cache.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+from lws.providers._shared.iam_policy_engine import Decision
+
+DecisionKey = tuple[str, str, tuple[str, ...], str, int]
+
+_DEFAULT_MAX_ENTRIES = 4096
+
+
+class DecisionCache:
+    """Bounded mapping of decision keys to ``(Decision, reason)`` tuples."""
+
+    def __init__(self, max_entries: int = _DEFAULT_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[DecisionKey, tuple[Decision, str]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: DecisionKey) -> tuple[Decision, str] | None:
+        """Return the cached decision for *key*, or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry
+
+    def put(self, key: DecisionKey, decision: tuple[Decision, str]) -> None:
+        """Store *decision* for *key*, evicting the least recently used entry."""
+        self._entries[key] = decision
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached decision."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return the entry count and hit/miss counters."""
+        return {"entries": len(self._entries), "hits": self._hits, "misses": self._misses}
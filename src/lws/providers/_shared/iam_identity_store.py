@@ -1,7 +1,10 @@
 """Load IAM identities from a YAML file.
 
 Each identity has a name, type (user/role), inline policies,
-managed policy ARNs, and an optional boundary policy.
+managed policy ARNs, and an optional boundary policy.  Policies are
+compiled when the identity is created, and the store's ``version``
+changes whenever an identity is registered so cached decisions can be
+invalidated.
 """
 
 from __future__ import annotations
@@ -12,6 +15,8 @@ from typing import Any
 
 import yaml
 
+from lws.providers._shared.iam_policy_engine import CompiledPolicy, compile_policy
+
 
 @dataclass
 class Identity:
@@ -22,6 +27,14 @@ class Identity:
     inline_policies: list[dict] = field(default_factory=list)
     managed_policy_arns: list[str] = field(default_factory=list)
     boundary_policy: dict | None = None
+    compiled_policies: list[CompiledPolicy] = field(init=False, repr=False, compare=False)
+    compiled_boundary: CompiledPolicy | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.compiled_policies = [compile_policy(p) for p in self.inline_policies]
+        self.compiled_boundary = (
+            compile_policy(self.boundary_policy) if self.boundary_policy is not None else None
+        )
 
 
 class IdentityStore:
@@ -29,6 +42,7 @@ class IdentityStore:
 
     def __init__(self, path: Path | None = None) -> None:
         self._identities: dict[str, Identity] = {}
+        self._version = 0
         if path is not None and path.exists():
             self._load(path)
 
@@ -49,6 +63,11 @@ class IdentityStore:
                 boundary_policy=props.get("boundary_policy"),
             )
 
+    @property
+    def version(self) -> int:
+        """Return a counter that changes whenever an identity is registered."""
+        return self._version
+
     def get_identity(self, name: str) -> Identity | None:
         """Return an identity by name, or None if not found."""
         return self._identities.get(name)
@@ -79,6 +98,7 @@ class IdentityStore:
             inline_policies=inline_policies or [],
             boundary_policy=boundary_policy,
         )
+        self._version += 1
 
 
 def _load_yaml(path: Path) -> dict[str, Any]:
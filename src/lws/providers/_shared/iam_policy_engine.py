@@ -10,13 +10,25 @@ evaluation logic:
 3. Boundary check: action must be allowed by boundary else DENY
 4. Identity policy Allow -> ALLOW
 5. Implicit DENY
+
+Policy documents are compiled with :func:`compile_policy` into
+statements holding pre-lowered, precompiled action and resource
+matchers.  Stores compile their policies once at load time; raw dicts
+passed to :func:`evaluate` are compiled on the fly.
 """
 
 from __future__ import annotations
 
+import re
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
-from fnmatch import fnmatch
+from fnmatch import translate
+from functools import lru_cache
+
+Matcher = Callable[[str], bool]
+
+_WILDCARD_CHARS = frozenset("*?[")
 
 
 class Decision(Enum):
@@ -26,16 +38,89 @@ class Decision(Enum):
     DENY = "DENY"
 
 
+@dataclass(frozen=True)
+class _Statement:
+    """One policy statement with compiled matchers."""
+
+    effect: str | None
+    actions: tuple[Matcher, ...]
+    resources: tuple[Matcher, ...]
+    principals: tuple[str, ...] | None
+
+    def matches(self, actions: list[str], resource: str) -> bool:
+        """Return True if any lower-cased action and the resource match."""
+        return any(m(a) for m in self.actions for a in actions) and self.matches_resource(resource)
+
+    def matches_resource(self, resource: str) -> bool:
+        """Return True if the resource matches."""
+        return any(m(resource) for m in self.resources)
+
+    def matches_principal(self, principal: str) -> bool:
+        """Return True if the statement applies to *principal*."""
+        return self.principals is None or any(p in ("*", principal) for p in self.principals)
+
+
+@dataclass(frozen=True)
+class CompiledPolicy:
+    """A policy document compiled for repeated evaluation."""
+
+    statements: tuple[_Statement, ...]
+
+    def denies(self, actions: list[str], resource: str) -> bool:
+        """Return True if a Deny statement matches."""
+        return any(s.effect == "Deny" and s.matches(actions, resource) for s in self.statements)
+
+    def allows(self, action: str, resource: str) -> bool:
+        """Return True if an Allow statement matches the lower-cased *action*."""
+        for statement in self.statements:
+            if statement.effect != "Allow":
+                continue
+            if any(m(action) for m in statement.actions) and statement.matches_resource(resource):
+                return True
+        return False
+
+    def allows_principal(self, principal: str, actions: list[str], resource: str) -> bool:
+        """Return True if an Allow statement for *principal* matches any action."""
+        return any(
+            s.effect == "Allow" and s.matches_principal(principal) and s.matches(actions, resource)
+            for s in self.statements
+        )
+
+
 @dataclass
 class EvaluationContext:
-    """All inputs needed for a single authorization decision."""
+    """All inputs needed for a single authorization decision.
+
+    Policies may be raw documents or :class:`CompiledPolicy` instances.
+    """
 
     principal: str
     actions: list[str]
     resource: str
-    identity_policies: list[dict] = field(default_factory=list)
-    boundary_policy: dict | None = None
-    resource_policy: dict | None = None
+    identity_policies: list[dict | CompiledPolicy] = field(default_factory=list)
+    boundary_policy: dict | CompiledPolicy | None = None
+    resource_policy: dict | CompiledPolicy | None = None
+
+
+def compile_policy(policy: dict) -> CompiledPolicy:
+    """Compile a policy document into matchers."""
+    statements = []
+    for statement in policy.get("Statement", []):
+        principal = statement.get("Principal", "*")
+        statements.append(
+            _Statement(
+                effect=statement.get("Effect"),
+                actions=tuple(
+                    _compile_pattern(p.lower())
+                    for p in _normalize_list(statement.get("Action", []))
+                ),
+                resources=tuple(
+                    _compile_pattern(p) for p in _normalize_list(statement.get("Resource", ["*"]))
+                ),
+                principals=None if principal == "*" else tuple(_normalize_list(principal)),
+            )
+        )
+    return CompiledPolicy(statements=tuple(statements))
 
 
 def evaluate(context: EvaluationContext) -> tuple[Decision, str]:
@@ -43,126 +128,58 @@ def evaluate(context: EvaluationContext) -> tuple[Decision, str]:
 
     Returns a (Decision, reason) tuple.
     """
-    all_policies = _collect_all_policies(context)
+    identity_policies = [_compiled(p) for p in context.identity_policies]
+    boundary = _compiled(context.boundary_policy)
+    resource_policy = _compiled(context.resource_policy)
+    actions = [a.lower() for a in context.actions]
+    resource = context.resource
 
     # Step 1: Explicit Deny in any policy
-    if _has_explicit_deny(all_policies, context.actions, context.resource):
+    if _any_denies([*identity_policies, boundary, resource_policy], actions, resource):
         return Decision.DENY, "Explicit Deny"
 
     # Step 2: Resource policy Allow
-    if _resource_policy_allows(context):
+    if resource_policy is not None and resource_policy.allows_principal(
+        context.principal, actions, resource
+    ):
         return Decision.ALLOW, "Resource policy Allow"
 
     # Step 3: Boundary check
-    if context.boundary_policy is not None:
-        if not _all_actions_allowed_by_policy(
-            context.boundary_policy, context.actions, context.resource
-        ):
-            return Decision.DENY, "Not allowed by permissions boundary"
+    if boundary is not None and not _all_allowed([boundary], actions, resource):
+        return Decision.DENY, "Not allowed by permissions boundary"
 
     # Step 4: Identity policy Allow
-    if not _all_actions_allowed_by_identity(context):
+    if not _all_allowed(identity_policies, actions, resource):
         return Decision.DENY, "Implicit Deny"
 
     return Decision.ALLOW, "Identity policy Allow"
 
 
-def _collect_all_policies(context: EvaluationContext) -> list[dict]:
-    """Collect all policies (identity, boundary, resource) into a single list."""
-    all_policies = list(context.identity_policies)
-    if context.boundary_policy is not None:
-        all_policies.append(context.boundary_policy)
-    if context.resource_policy is not None:
-        all_policies.append(context.resource_policy)
-    return all_policies
-
-
-def _has_explicit_deny(policies: list[dict], actions: list[str], resource: str) -> bool:
-    """Check if any policy contains an explicit Deny for the given actions."""
-    for policy in policies:
-        for statement in policy.get("Statement", []):
-            if statement.get("Effect") != "Deny":
-                continue
-            if _statement_matches(statement, actions, resource):
-                return True
-    return False
-
-
-def _resource_policy_allows(context: EvaluationContext) -> bool:
-    """Check if the resource policy explicitly allows the request."""
-    if context.resource_policy is None:
-        return False
-    for statement in context.resource_policy.get("Statement", []):
-        if statement.get("Effect") != "Allow":
-            continue
-        if not _principal_matches(statement, context.principal):
-            continue
-        if _statement_matches(statement, context.actions, context.resource):
-            return True
-    return False
-
-
-def _all_actions_allowed_by_policy(policy: dict, actions: list[str], resource: str) -> bool:
-    """Check if all actions are allowed by the given policy."""
-    return all(_action_allowed_by_policy(policy, action, resource) for action in actions)
-
-
-def _all_actions_allowed_by_identity(context: EvaluationContext) -> bool:
-    """Check if all actions are allowed by the identity policies."""
-    return all(
-        _action_allowed_by_identity_policies(context.identity_policies, action, context.resource)
-        for action in context.actions
-    )
-
-
-def _statement_matches(statement: dict, actions: list[str], resource: str) -> bool:
-    """Check if a statement matches any of the given actions and the resource."""
-    stmt_actions = _normalize_list(statement.get("Action", []))
-    stmt_resources = _normalize_list(statement.get("Resource", ["*"]))
-
-    action_match = any(
-        _matches_action(pattern, action) for pattern in stmt_actions for action in actions
-    )
-    resource_match = any(_matches_resource(pattern, resource) for pattern in stmt_resources)
-    return action_match and resource_match
-
-
-def _principal_matches(statement: dict, principal: str) -> bool:
-    """Check if a statement's Principal matches the given principal."""
-    stmt_principal = statement.get("Principal", "*")
-    if stmt_principal == "*":
-        return True
-    principals = _normalize_list(stmt_principal)
-    return any(p in ("*", principal) for p in principals)
-
-
-def _action_allowed_by_policy(policy: dict, action: str, resource: str) -> bool:
-    """Check if a single action is allowed by at least one Allow statement."""
-    for statement in policy.get("Statement", []):
-        if statement.get("Effect") != "Allow":
-            continue
-        stmt_actions = _normalize_list(statement.get("Action", []))
-        stmt_resources = _normalize_list(statement.get("Resource", ["*"]))
-        action_ok = any(_matches_action(p, action) for p in stmt_actions)
-        resource_ok = any(_matches_resource(p, resource) for p in stmt_resources)
-        if action_ok and resource_ok:
-            return True
-    return False
+def _any_denies(policies: list[CompiledPolicy | None], actions: list[str], resource: str) -> bool:
+    """Return True if any of *policies* explicitly denies an action."""
+    return any(p is not None and p.denies(actions, resource) for p in policies)
 
 
-def _action_allowed_by_identity_policies(policies: list[dict], action: str, resource: str) -> bool:
-    """Check if a single action is allowed by any identity policy."""
-    return any(_action_allowed_by_policy(policy, action, resource) for policy in policies)
+def _all_allowed(policies: list[CompiledPolicy], actions: list[str], resource: str) -> bool:
+    """Return True if every action is allowed by at least one of *policies*."""
+    return all(any(p.allows(a, resource) for p in policies) for a in actions)
 
 
-def _matches_action(pattern: str, action: str) -> bool:
-    """Check if an action matches a pattern using fnmatch-style wildcards."""
-    return fnmatch(action.lower(), pattern.lower())
+def _compiled(policy: dict | CompiledPolicy | None) -> CompiledPolicy | None:
+    """Return *policy* compiled, compiling raw documents on the fly."""
+    if policy is None or isinstance(policy, CompiledPolicy):
+        return policy
+    return compile_policy(policy)
 
 
-def _matches_resource(pattern: str, resource: str) -> bool:
-    """Check if a resource matches a pattern using fnmatch-style wildcards."""
-    return fnmatch(resource, pattern)
+@lru_cache(maxsize=4096)
+def _compile_pattern(pattern: str) -> Matcher:
+    """Compile an fnmatch-style pattern; literals become equality checks."""
+    if pattern == "*":
+        return lambda _value: True
+    if _WILDCARD_CHARS.isdisjoint(pattern):
+        return pattern.__eq__
+    return re.compile(translate(pattern)).match  # type: ignore[return-value]
 
 
 def _normalize_list(value: str | list[str]) -> list[str]:
@@ -11,18 +11,26 @@ from typing import Any
 
 import yaml
 
+from lws.providers._shared.iam_policy_engine import CompiledPolicy, compile_policy
+
 
 class ResourcePolicyStore:
     """Load and query resource policies from a YAML file."""
 
     def __init__(self, path: Path | None = None) -> None:
         self._policies: dict[str, dict[str, dict]] = {}
+        self._compiled: dict[tuple[str, str], CompiledPolicy] = {}
         if path is not None and path.exists():
             self._load(path)
 
     def _load(self, path: Path) -> None:
         data = _load_yaml(path)
         self._policies = data.get("resource_policies", {})
+        self._compiled = {
+            (service, resource_name): compile_policy(policy)
+            for service, policies in self._policies.items()
+            for resource_name, policy in policies.items()
+        }
 
     def get_policy(self, service: str, resource_name: str) -> dict | None:
         """Return the resource policy for a service/resource, or None."""
@@ -31,6 +39,10 @@ class ResourcePolicyStore:
             return None
         return service_policies.get(resource_name)
 
+    def get_compiled_policy(self, service: str, resource_name: str) -> CompiledPolicy | None:
+        """Return the compiled resource policy for a service/resource, or None."""
+        return self._compiled.get((service, resource_name))
+
 
 def _load_yaml(path: Path) -> dict[str, Any]:
     """Load a YAML file and return a dict."""
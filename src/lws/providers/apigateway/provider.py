@@ -210,10 +210,11 @@ class ApiGatewayProvider(Provider):
     def _register_route(self, app: FastAPI, route: RouteConfig) -> None:
         """Register a single route on the FastAPI app.
 
-        A closure captures the ``route`` and ``compute_provider`` so each
-        endpoint knows which Lambda to invoke.
+        A closure captures the ``route`` so each endpoint knows which Lambda
+        to invoke.  The compute provider is looked up per request, so a
+        function restarted by hot reload is picked up without rebuilding
+        the app.
         """
-        compute_provider = self._compute_providers[route.handler_name]
 
         async def _handler(request: Request) -> Response:
             event = build_proxy_event(request, route)
@@ -237,6 +238,7 @@ class ApiGatewayProvider(Provider):
                 ),
             )
 
+            compute_provider = self._compute_providers[route.handler_name]
             result = await compute_provider.invoke(event, context)
             return build_http_response(result)
 
@@ -0,0 +1,193 @@
+"""Compiled route table for API Gateway V2 (HTTP API) proxying.
+
+Each HTTP API keeps a :class:`RouteTable` that is updated when a route
+is created or deleted, so a proxied request needs no per-route regex.
+Route paths are split into a segment trie with three kinds of edges:
+
+- literal segments (``/orders``), tried first;
+- ``{param}`` segments, which match any single non-empty segment;
+- a trailing ``{proxy+}``, which greedily matches one or more segments.
+
+Candidates are produced most specific first, following API Gateway's
+precedence: a literal beats a path variable and a path variable beats a
+greedy variable.  At the same node, a route for the request's method is
+preferred over an ``ANY`` route.  Results for recently seen concrete
+paths are kept in a small LRU cache, which is cleared whenever the
+table changes.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+
+DEFAULT_ROUTE_KEY = "$default"
+_ANY_METHOD = "ANY"
+_CACHE_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class RouteMatch:
+    """A route matching a request, with its extracted path parameters."""
+
+    route_id: str
+    path_parameters: dict[str, str] | None
+
+
+@dataclass(frozen=True)
+class _Entry:
+    route_id: str
+    method: str
+    param_names: tuple[str, ...]
+    greedy_name: str | None = None
+
+
+@dataclass
+class _Node:
+    literals: dict[str, _Node] = field(default_factory=dict)
+    param: _Node | None = None
+    routes: list[_Entry] = field(default_factory=list)
+    greedy: list[_Entry] = field(default_factory=list)
+
+
+class RouteTable:
+    """Routes of one HTTP API, compiled into a segment trie."""
+
+    def __init__(self) -> None:
+        self._root = _Node()
+        self._keys: dict[str, str] = {}
+        self._defaults: list[str] = []
+        self._cache: OrderedDict[tuple[str | None, str], tuple[RouteMatch, ...]] = OrderedDict()
+
+    def add(self, route_id: str, route_key: str) -> None:
+        """Compile the route *route_id* with key ``"METHOD /path"`` or ``$default``."""
+        self.remove(route_id)
+        self._keys[route_id] = route_key
+        self._cache.clear()
+        if route_key == DEFAULT_ROUTE_KEY:
+            self._defaults.append(route_id)
+        else:
+            self._insert(route_id, route_key)
+
+    def remove(self, route_id: str) -> None:
+        """Drop the route *route_id*, if compiled."""
+        route_key = self._keys.pop(route_id, None)
+        if route_key is None:
+            return
+        self._cache.clear()
+        if route_key == DEFAULT_ROUTE_KEY:
+            self._defaults.remove(route_id)
+            return
+        # Deletes are rare next to lookups, so rebuild rather than prune
+        self._root = _Node()
+        for other_id, other_key in self._keys.items():
+            if other_key != DEFAULT_ROUTE_KEY:
+                self._insert(other_id, other_key)
+
+    @property
+    def default_route_ids(self) -> list[str]:
+        """Return the ``$default`` route IDs, oldest first."""
+        return list(self._defaults)
+
+    def match(self, method: str | None, path: str) -> tuple[RouteMatch, ...]:
+        """Return the routes matching *method* and *path*, most specific first.
+
+        A *method* of ``None`` matches routes for every method.  ``$default``
+        routes are not included.  Each call gets its own path parameter
+        dicts, so callers may modify them without affecting the cache.
+        """
+        key = (method, path)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return _copied(cached)
+        result = tuple(_walk(self._root, _segments(path), 0, (), method))
+        self._cache[key] = result
+        if len(self._cache) > _CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return _copied(result)
+
+    def _insert(self, route_id: str, route_key: str) -> None:
+        parts = route_key.split(" ", 1)
+        if len(parts) != 2:
+            return
+        method, path = parts
+        node, names, greedy_name = self._root, [], None
+        segments = _segments(path)
+        for index, segment in enumerate(segments):
+            name = _variable_name(segment)
+            if name is None:
+                node = node.literals.setdefault(segment, _Node())
+            elif name.endswith("+") and index == len(segments) - 1:
+                greedy_name = name[:-1]
+            else:
+                names.append(name.rstrip("+"))
+                node.param = node.param or _Node()
+                node = node.param
+        entry = _Entry(route_id, method, tuple(names), greedy_name)
+        (node.greedy if greedy_name is not None else node.routes).append(entry)
+
+
+def _copied(matches: tuple[RouteMatch, ...]) -> tuple[RouteMatch, ...]:
+    """Return *matches* with fresh path parameter dicts."""
+    return tuple(
+        m if m.path_parameters is None else RouteMatch(m.route_id, dict(m.path_parameters))
+        for m in matches
+    )
+
+
+def _segments(path: str) -> list[str]:
+    """Split ``/a/b`` into ``["a", "b"]``; ``/`` becomes ``[""]``."""
+    return path.split("/")[1:] if path.startswith("/") else path.split("/")
+
+
+def _variable_name(segment: str) -> str | None:
+    """Return ``id`` for a ``{id}`` segment, or None for a literal."""
+    if len(segment) > 2 and segment[0] == "{" and segment[-1] == "}":
+        return segment[1:-1]
+    return None
+
+
+def _walk(
+    node: _Node,
+    segments: list[str],
+    index: int,
+    captured: tuple[str, ...],
+    method: str | None,
+) -> Iterator[RouteMatch]:
+    """Yield matches below *node* for ``segments[index:]``, most specific first."""
+    if index == len(segments):
+        for entry in _by_method(node.routes, method):
+            yield RouteMatch(entry.route_id, _parameters(entry, captured, None))
+        return
+    segment = segments[index]
+    child = node.literals.get(segment)
+    if child is not None:
+        yield from _walk(child, segments, index + 1, captured, method)
+    if node.param is not None and segment:
+        yield from _walk(node.param, segments, index + 1, (*captured, segment), method)
+    rest = "/".join(segments[index:])
+    if node.greedy and rest:
+        for entry in _by_method(node.greedy, method):
+            yield RouteMatch(entry.route_id, _parameters(entry, captured, rest))
+
+
+def _by_method(entries: list[_Entry], method: str | None) -> list[_Entry]:
+    """Return the entries for *method*, then the ``ANY`` entries."""
+    if method is None:
+        return entries
+    exact = [e for e in entries if e.method == method]
+    return exact + [e for e in entries if e.method == _ANY_METHOD and method != _ANY_METHOD]
+
+
+def _parameters(
+    entry: _Entry, captured: tuple[str, ...], rest: str | None
+) -> dict[str, str] | None:
+    """Build the path parameters of *entry*, or None if it has no variables."""
+    if not entry.param_names and entry.greedy_name is None:
+        return None
+    params = dict(zip(entry.param_names, captured, strict=False))
+    if entry.greedy_name is not None and rest is not None:
+        params[entry.greedy_name] = rest
+    return params
@@ -13,7 +13,6 @@ from __future__ import annotations
 
 import base64
 import json
-import re
 import time
 import uuid
 from dataclasses import dataclass, field
@@ -25,6 +24,7 @@ from lws.logging.logger import get_logger
 from lws.logging.middleware import RequestLoggingMiddleware
 from lws.providers._shared.lambda_helpers import build_default_lambda_context
 from lws.providers._shared.request_helpers import is_binary_content_type, parse_json_body
+from lws.providers.apigateway.route_table import RouteTable
 
 if TYPE_CHECKING:
     from lws.providers.lambda_runtime.routes import LambdaRegistry
@@ -104,6 +104,44 @@ class _HttpApi:
     stages: dict[str, dict[str, Any]] = field(default_factory=dict)
     cors_configuration: dict[str, Any] | None = None
     authorizers: dict[str, dict[str, Any]] = field(default_factory=dict)
+    route_table: RouteTable = field(default_factory=RouteTable, repr=False)
+
+    def add_route(self, route: dict[str, Any]) -> None:
+        """Store *route* and compile it into the route table."""
+        self.routes[route["routeId"]] = route
+        self.route_table.add(route["routeId"], route.get("routeKey", ""))
+
+    def remove_route(self, route_id: str) -> None:
+        """Delete the route *route_id* and drop it from the route table."""
+        self.routes.pop(route_id, None)
+        self.route_table.remove(route_id)
+
+    def match_route(
+        self, method: str, path: str
+    ) -> tuple[dict[str, Any], dict[str, Any], dict[str, str] | None] | None:
+        """Return (route, integration, path_parameters) for a request, or None.
+
+        The most specific route whose integration exists wins.
+        """
+        for match in self.route_table.match(method, path):
+            route = self.routes[match.route_id]
+            integration = self._integration_for(route)
+            if integration is not None:
+                return route, integration, match.path_parameters
+        return None
+
+    def default_route(self) -> tuple[dict[str, Any], dict[str, Any]] | None:
+        """Return the newest ``$default`` route with an integration, or None."""
+        for route_id in reversed(self.route_table.default_route_ids):
+            route = self.routes[route_id]
+            integration = self._integration_for(route)
+            if integration is not None:
+                return route, integration
+        return None
+
+    def _integration_for(self, route: dict[str, Any]) -> dict[str, Any] | None:
+        integration_id = route.get("target", "").replace("integrations/", "")
+        return self.integrations.get(integration_id) or None
 
 
 class _ApiGatewayV2State:
@@ -895,7 +933,7 @@ class ApiGatewayV2Router:
             "authorizationType": auth_type,
             "authorizerId": auth_id,
         }
-        api.routes[route_id] = route
+        api.add_route(route)
         _logger.debug("V2 created route: key=%r target=%r api=%s", route_key, target, api_id)
         return _json_response(route, 201)
 
@@ -917,7 +955,7 @@ class ApiGatewayV2Router:
     async def _delete_route(self, api_id: str, route_id: str) -> Response:
         api = self._state.get_api(api_id)
         if api is not None:
-            api.routes.pop(route_id, None)
+            api.remove_route(route_id)
         return Response(status_code=204)
 
     async def _list_stages(self, api_id: str) -> Response:
@@ -970,34 +1008,19 @@ class ApiGatewayV2Router:
 
     def _find_matching_route(
         self, method: str, path: str
-    ) -> tuple[_HttpApi, dict[str, Any], dict[str, Any]] | None:
+    ) -> tuple[_HttpApi, dict[str, Any], dict[str, Any], dict[str, str] | None] | None:
         """Find a V2 route matching the given method and path.
 
-        Returns (api, route, integration) or None.
+        Returns (api, route, integration, path_parameters) or None.
         """
         default_match = None
         for api in self._state.list_apis():
-            for route in api.routes.values():
-                route_key = route.get("routeKey", "")
-                # Route key format: "METHOD /path" or "$default"
-                if route_key == "$default":
-                    target = route.get("target", "")
-                    integration_id = target.replace("integrations/", "")
-                    integration = api.integrations.get(integration_id)
-                    if integration:
-                        default_match = (api, route, integration)
-                    continue
-
-                parts = route_key.split(" ", 1)
-                if len(parts) != 2:
-                    continue
-                route_method, route_path = parts
-                if route_method == method and _route_path_matches(route_path, path):
-                    target = route.get("target", "")
-                    integration_id = target.replace("integrations/", "")
-                    integration = api.integrations.get(integration_id)
-                    if integration:
-                        return api, route, integration
+            match = api.match_route(method, path)
+            if match is not None:
+                return (api, *match)
+            default = api.default_route()
+            if default is not None:
+                default_match = (api, *default, None)
 
         # Fall back to $default route if no specific match
         return default_match
@@ -1007,13 +1030,8 @@ class ApiGatewayV2Router:
         for api in self._state.list_apis():
             if not api.cors_configuration:
                 continue
-            for route in api.routes.values():
-                route_key = route.get("routeKey", "")
-                if route_key == "$default":
-                    return api
-                parts = route_key.split(" ", 1)
-                if len(parts) == 2 and _route_path_matches(parts[1], path):
-                    return api
+            if api.route_table.default_route_ids or api.route_table.match(None, path):
+                return api
         return None
 
     async def handle_cors_preflight(self, request: Request, path: str) -> Response | None:
@@ -1054,15 +1072,13 @@ class ApiGatewayV2Router:
         if match is None:
             return None
 
-        _api, route, integration = match
+        _api, route, integration, path_params = match
         function_name, compute = self._resolve_compute(integration)
         if compute is None:
             return None
 
         body_str, is_base64 = await _encode_request_body(request)
         route_key = route.get("routeKey", "")
-        route_path = route_key.split(" ", 1)[-1] if " " in route_key else ""
-        path_params = _extract_path_parameters(route_path, request_path)
 
         event = _build_apigw_v2_event(
             request, request_path, body_str, route_key, path_params, is_base64
@@ -1078,51 +1094,6 @@ class ApiGatewayV2Router:
         return response
 
 
-def _route_path_matches(route_path: str, request_path: str) -> bool:
-    """Check if a route path pattern matches the request path.
-
-    Handles exact paths (``/orders``) and path variables like
-    ``/orders/{id}`` or ``/orders/{proxy+}``.
-    """
-    if route_path == request_path:
-        return True
-
-    # Convert route path variables to regex
-    # {proxy+} matches one or more path segments
-    pattern = re.sub(r"\{[^}]+\+\}", r"(.+)", route_path)
-    # {param} matches a single path segment
-    pattern = re.sub(r"\{[^}]+\}", r"([^/]+)", pattern)
-    pattern = f"^{pattern}$"
-
-    return bool(re.match(pattern, request_path))
-
-
-def _extract_path_parameters(route_path: str, request_path: str) -> dict[str, str] | None:
-    """Extract path parameters from a route pattern and request path.
-
-    For route ``/orders/{id}`` and path ``/orders/abc``, returns ``{"id": "abc"}``.
-    Returns ``None`` if there are no path variables.
-    """
-    param_names = re.findall(r"\{([^}]+)\}", route_path)
-    if not param_names:
-        return None
-
-    # Build regex with named groups
-    pattern = route_path
-    for name in param_names:
-        if name.endswith("+"):
-            clean = name.rstrip("+")
-            pattern = pattern.replace(f"{{{name}}}", f"(?P<{clean}>.+)")
-        else:
-            pattern = pattern.replace(f"{{{name}}}", f"(?P<{name}>[^/]+)")
-    pattern = f"^{pattern}$"
-
-    m = re.match(pattern, request_path)
-    if m:
-        return m.groupdict()
-    return None
-
-
 def _extract_function_name(uri: str) -> str | None:
     """Extract Lambda function name from an integration URI.
 
@@ -0,0 +1,151 @@
+"""PBKDF2 password hashing off the event loop for the Cognito provider.
+
+PBKDF2-HMAC-SHA256 at 100,000 iterations costs tens of milliseconds of
+CPU per call.  :class:`PasswordHasher` runs it on a bounded thread (or
+process) pool so a login never blocks the event loop shared by every
+emulated service; ``hashlib.pbkdf2_hmac`` releases the GIL, so threads
+hash in parallel.
+
+Two knobs trade fidelity for speed in local development:
+
+- ``iterations`` lowers the work factor for newly hashed passwords.  The
+  count is stored alongside each hash, so existing users keep verifying
+  after it changes.
+- ``verify_cache_ttl_s`` remembers recently verified credentials, keyed
+  by a digest of username, password and stored hash, so repeated logins
+  skip PBKDF2 entirely.  Changing a password changes the stored hash and
+  thereby invalidates its entries.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+
+DEFAULT_ITERATIONS = 100_000
+_HASH_ALGORITHM = "sha256"
+_SALT_LENGTH = 16
+_VERIFY_CACHE_SIZE = 1024
+
+
+@dataclass
+class PasswordHashConfig:
+    """Work factor, pool and cache settings for password hashing.
+
+    Attributes:
+        iterations: PBKDF2 iterations for newly hashed passwords.
+        max_workers: Maximum concurrent hashing jobs.
+        executor: ``"thread"`` or ``"process"``.
+        verify_cache_ttl_s: Seconds a verified credential is remembered;
+            ``0`` disables the cache.
+    """
+
+    iterations: int = DEFAULT_ITERATIONS
+    max_workers: int = 4
+    executor: str = "thread"
+    verify_cache_ttl_s: float = 30.0
+
+
+def hash_password(
+    password: str, salt: bytes | None = None, iterations: int = DEFAULT_ITERATIONS
+) -> tuple[str, str]:
+    """Hash a password using PBKDF2-HMAC-SHA256.
+
+    Returns (stored_hash, hex_salt).  The stored hash is the hex digest,
+    prefixed with ``<iterations>$`` when the count is not the default.
+    """
+    if salt is None:
+        salt = os.urandom(_SALT_LENGTH)
+    dk = hashlib.pbkdf2_hmac(_HASH_ALGORITHM, password.encode(), salt, iterations)
+    if iterations == DEFAULT_ITERATIONS:
+        return dk.hex(), salt.hex()
+    return f"{iterations}${dk.hex()}", salt.hex()
+
+
+def verify_password(password: str, stored_hash: str, stored_salt: str) -> bool:
+    """Verify a password against a stored hash and salt."""
+    iterations = DEFAULT_ITERATIONS
+    if "$" in stored_hash:
+        count, _, _ = stored_hash.partition("$")
+        iterations = int(count)
+    computed_hash, _ = hash_password(password, bytes.fromhex(stored_salt), iterations)
+    return hmac.compare_digest(computed_hash, stored_hash)
+
+
+class PasswordHasher:
+    """Hashes and verifies passwords on a bounded worker pool.
+
+    The pool is created on first use and shut down by :meth:`close`.
+    """
+
+    def __init__(self, config: PasswordHashConfig | None = None) -> None:
+        self._config = config or PasswordHashConfig()
+        self._executor: Executor | None = None
+        self._verified: OrderedDict[str, float] = OrderedDict()
+
+    @property
+    def config(self) -> PasswordHashConfig:
+        """Return the hashing configuration."""
+        return self._config
+
+    async def hash(self, password: str) -> tuple[str, str]:
+        """Hash *password* with a fresh salt; returns (stored_hash, hex_salt)."""
+        return await self._run(hash_password, password, None, self._config.iterations)
+
+    async def verify(
+        self, username: str, password: str, stored_hash: str, stored_salt: str
+    ) -> bool:
+        """Return True if *password* matches the stored hash for *username*."""
+        key = _cache_key(username, password, stored_hash)
+        if self._cache_hit(key):
+            return True
+        ok = await self._run(verify_password, password, stored_hash, stored_salt)
+        if ok and self._config.verify_cache_ttl_s > 0:
+            self._remember(key)
+        return ok
+
+    def close(self) -> None:
+        """Shut down the worker pool and forget cached credentials."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._verified.clear()
+
+    async def _run(self, func, *args):  # noqa: ANN001, ANN202
+        if self._executor is None:
+            workers = max(1, self._config.max_workers)
+            if self._config.executor == "process":
+                self._executor = ProcessPoolExecutor(max_workers=workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="cognito-hash"
+                )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def _cache_hit(self, key: str) -> bool:
+        expires_at = self._verified.get(key)
+        if expires_at is None:
+            return False
+        if expires_at < time.monotonic():
+            del self._verified[key]
+            return False
+        return True
+
+    def _remember(self, key: str) -> None:
+        self._verified[key] = time.monotonic() + self._config.verify_cache_ttl_s
+        self._verified.move_to_end(key)
+        while len(self._verified) > _VERIFY_CACHE_SIZE:
+            self._verified.popitem(last=False)
+
+
+def _cache_key(username: str, password: str, stored_hash: str) -> str:
+    """Digest identifying one credential; the password itself is never kept."""
+    material = "\0".join((username, password, stored_hash)).encode()
+    return hashlib.sha256(material).hexdigest()
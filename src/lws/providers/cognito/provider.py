@@ -10,6 +10,7 @@ from typing import Any
 
 from lws.interfaces.provider import Provider
 from lws.logging.logger import get_logger
+from lws.providers.cognito.password_hasher import PasswordHashConfig
 from lws.providers.cognito.tokens import TokenIssuer
 from lws.providers.cognito.user_store import (
     CognitoError,
@@ -39,6 +40,8 @@ class CognitoProvider(Provider):
         User pool configuration parsed from CDK cloud assembly.
     trigger_functions : dict[str, TriggerFunc] | None
         Map of trigger names to async callables for Lambda trigger invocation.
+    hash_config : PasswordHashConfig | None
+        Password hashing work factor, worker pool and verify-cache settings.
     """
 
     def __init__(
@@ -46,10 +49,11 @@ class CognitoProvider(Provider):
         data_dir: Path,
         config: UserPoolConfig,
         trigger_functions: dict[str, TriggerFunc] | None = None,
+        hash_config: PasswordHashConfig | None = None,
     ) -> None:
         self._data_dir = data_dir
         self._config = config
-        self._store = UserStore(data_dir, config)
+        self._store = UserStore(data_dir, config, hash_config)
         self._token_issuer = TokenIssuer(
             user_pool_id=config.user_pool_id,
             client_id=config.client_id or "local-client-id",
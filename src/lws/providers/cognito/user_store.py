@@ -2,9 +2,7 @@
 
 from __future__ import annotations
 
-import hashlib
 import json
-import os
 import random
 import re
 import time
@@ -14,6 +12,8 @@ from pathlib import Path
 
 import aiosqlite
 
+from lws.providers.cognito.password_hasher import PasswordHashConfig, PasswordHasher
+
 # ---------------------------------------------------------------------------
 # Configuration dataclasses
 # ---------------------------------------------------------------------------
@@ -114,32 +114,6 @@ class CodeMismatchException(CognitoError):
         super().__init__("CodeMismatchException", "Invalid verification code provided.")
 
 
-# ---------------------------------------------------------------------------
-# Password hashing helpers
-# ---------------------------------------------------------------------------
-
-_HASH_ITERATIONS = 100_000
-_HASH_ALGORITHM = "sha256"
-_SALT_LENGTH = 16
-
-
-def _hash_password(password: str, salt: bytes | None = None) -> tuple[str, str]:
-    """Hash a password using PBKDF2-HMAC-SHA256.
-
-    Returns (hex_hash, hex_salt).
-    """
-    if salt is None:
-        salt = os.urandom(_SALT_LENGTH)
-    dk = hashlib.pbkdf2_hmac(_HASH_ALGORITHM, password.encode(), salt, _HASH_ITERATIONS)
-    return dk.hex(), salt.hex()
-
-
-def _verify_password(password: str, stored_hash: str, stored_salt: str) -> bool:
-    """Verify a password against a stored hash and salt."""
-    computed_hash, _ = _hash_password(password, bytes.fromhex(stored_salt))
-    return computed_hash == stored_hash
-
-
 # ---------------------------------------------------------------------------
 # Password policy validation
 # ---------------------------------------------------------------------------
@@ -191,12 +165,20 @@ class UserStore:
         Directory for storing the SQLite database file.
     config : UserPoolConfig
         User pool configuration including password policy.
+    hash_config : PasswordHashConfig | None
+        Work factor, worker pool and verify-cache settings for hashing.
     """
 
-    def __init__(self, data_dir: Path, config: UserPoolConfig) -> None:
+    def __init__(
+        self,
+        data_dir: Path,
+        config: UserPoolConfig,
+        hash_config: PasswordHashConfig | None = None,
+    ) -> None:
         self._data_dir = data_dir
         self._config = config
         self._conn: aiosqlite.Connection | None = None
+        self._hasher = PasswordHasher(hash_config)
 
     @property
     def config(self) -> UserPoolConfig:
@@ -237,7 +219,8 @@ class UserStore:
         await self._conn.commit()
 
     async def stop(self) -> None:
-        """Close the SQLite database."""
+        """Close the SQLite database and the hashing pool."""
+        self._hasher.close()
         if self._conn is not None:
             await self._conn.close()
             self._conn = None
@@ -265,7 +248,7 @@ class UserStore:
         self._validate_required_attributes(attributes)
 
         sub = str(uuid.uuid4())
-        pw_hash, pw_salt = _hash_password(password)
+        pw_hash, pw_salt = await self._hasher.hash(password)
         confirmed = 1 if self._config.auto_confirm else 0
 
         await self._conn.execute(
@@ -300,7 +283,7 @@ class UserStore:
 
         stored_hash = user["password_hash"]
         stored_salt = user["password_salt"]
-        if not _verify_password(password, stored_hash, stored_salt):
+        if not await self._hasher.verify(username, password, stored_hash, stored_salt):
             raise NotAuthorizedException()
 
         if not user["confirmed"]:
@@ -367,7 +350,7 @@ class UserStore:
             validate_password(password, self._config.password_policy)
 
         sub = str(uuid.uuid4())
-        pw_hash, pw_salt = _hash_password(password)
+        pw_hash, pw_salt = await self._hasher.hash(password)
 
         await self._conn.execute(
             "INSERT INTO users (username, sub, password_hash, password_salt, confirmed, attributes)"
@@ -469,7 +452,7 @@ class UserStore:
         if stored_code != code:
             raise CodeMismatchException()
         validate_password(new_password, self._config.password_policy)
-        pw_hash, pw_salt = _hash_password(new_password)
+        pw_hash, pw_salt = await self._hasher.hash(new_password)
         await self._conn.execute(
             "UPDATE users SET password_hash = ?, password_salt = ? WHERE username = ?",
             (pw_hash, pw_salt, username),
@@ -486,10 +469,12 @@ class UserStore:
         user = await self._get_user_row(username)
         if user is None:
             raise NotAuthorizedException("User not found.")
-        if not _verify_password(old_password, user["password_hash"], user["password_salt"]):
+        if not await self._hasher.verify(
+            username, old_password, user["password_hash"], user["password_salt"]
+        ):
             raise NotAuthorizedException("Incorrect username or password.")
         validate_password(new_password, self._config.password_policy)
-        pw_hash, pw_salt = _hash_password(new_password)
+        pw_hash, pw_salt = await self._hasher.hash(new_password)
         await self._conn.execute(
             "UPDATE users SET password_hash = ?, password_salt = ? WHERE username = ?",
             (pw_hash, pw_salt, username),
@@ -11,6 +11,8 @@ Supports:
 from __future__ import annotations
 
 import re
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
 from lws.providers.dynamodb.parser_base import BaseParser, Token, scan_number_literal
@@ -39,6 +41,10 @@ _KEYWORDS = {"AND", "OR", "NOT", "BETWEEN", "IN"}
 
 _OPERATOR_RE = re.compile(r"<>|<=|>=|[=<>]")
 
+# Number of distinct expression strings kept parsed.  Applications send a
+# small, fixed set of expression shapes, so a modest bound covers them all.
+EXPRESSION_CACHE_SIZE = 512
+
 
 # ---------------------------------------------------------------------------
 # Lexer
@@ -314,10 +320,17 @@ def _parse_number(s: str) -> int | float:
 # AST Evaluator
 # ---------------------------------------------------------------------------
 
+# A compiled AST node: evaluates the node against one item.
+_Compiled = Callable[[dict], Any]
+
 
 def _resolve_path(item: dict, path: str) -> tuple[bool, Any]:
     """Resolve a dotted attribute path against an item. Returns (found, value)."""
-    parts = path.split(".")
+    return _lookup(item, tuple(path.split(".")))
+
+
+def _lookup(item: dict, parts: tuple[str, ...]) -> tuple[bool, Any]:
+    """Resolve a pre-split attribute path against an item. Returns (found, value)."""
     current: Any = item
     for part in parts:
         if isinstance(current, dict) and part in current:
@@ -328,7 +341,11 @@ def _resolve_path(item: dict, path: str) -> tuple[bool, Any]:
 
 
 class ExpressionEvaluator:
-    """Evaluates a parsed DynamoDB filter expression AST against an item.
+    """Evaluates a parsed DynamoDB filter expression AST against items.
+
+    The AST is compiled once into nested closures: placeholder values are
+    unwrapped, attribute paths split and operators resolved at compile
+    time, so evaluating an item only runs the closures.
 
     Parameters
     ----------
@@ -348,69 +365,102 @@ class ExpressionEvaluator:
 
     def evaluate(self, ast: dict, item: dict) -> bool:
         """Evaluate the AST against a single item. Returns True if the item matches."""
-        result = self._eval_node(ast, item)
-        return bool(result)
+        return self.compile(ast)(item)
 
-    def _eval_node(self, node: dict, item: dict) -> Any:
-        """Dispatch evaluation based on node op type."""
+    def compile(self, ast: dict) -> Callable[[dict], bool]:
+        """Compile the AST into a predicate that can be applied to many items."""
+        node = self._compile_node(ast)
+        return lambda item: bool(node(item))
+
+    def _compile_node(self, node: dict) -> _Compiled:
+        """Dispatch compilation based on node op type."""
         op = node["op"]
         dispatch = {
-            "AND": self._eval_and,
-            "OR": self._eval_or,
-            "NOT": self._eval_not,
-            "compare": self._eval_compare,
-            "BETWEEN": self._eval_between,
-            "IN": self._eval_in,
-            "function": self._eval_function,
-            "value_ref": self._eval_value_ref,
-            "name_ref": self._eval_name_ref,
-            "path": self._eval_path,
-            "literal": self._eval_literal,
+            "AND": self._compile_and,
+            "OR": self._compile_or,
+            "NOT": self._compile_not,
+            "compare": self._compile_compare,
+            "BETWEEN": self._compile_between,
+            "IN": self._compile_in,
+            "function": self._compile_function,
+            "value_ref": self._compile_value_ref,
+            "name_ref": self._compile_name_ref,
+            "path": self._compile_path,
+            "literal": self._compile_literal,
         }
         handler = dispatch.get(op)
         if handler is None:
             raise ValueError(f"Unknown AST node op: {op}")
-        return handler(node, item)
-
-    def _eval_and(self, node: dict, item: dict) -> bool:
-        return bool(self._eval_node(node["left"], item) and self._eval_node(node["right"], item))
-
-    def _eval_or(self, node: dict, item: dict) -> bool:
-        return bool(self._eval_node(node["left"], item) or self._eval_node(node["right"], item))
-
-    def _eval_not(self, node: dict, item: dict) -> bool:
-        return not self._eval_node(node["operand"], item)
-
-    def _eval_compare(self, node: dict, item: dict) -> bool:
-        left = self._eval_node(node["left"], item)
-        right = self._eval_node(node["right"], item)
-        if left is None or right is None:
-            return False
-        left, right = _coerce_for_comparison(left, right)
-        return _apply_comparator(node["comparator"], left, right)
-
-    def _eval_between(self, node: dict, item: dict) -> bool:
-        val = self._eval_node(node["operand"], item)
-        low = self._eval_node(node["low"], item)
-        high = self._eval_node(node["high"], item)
-        if val is None or low is None or high is None:
+        return handler(node)
+
+    def _compile_and(self, node: dict) -> _Compiled:
+        left = self._compile_node(node["left"])
+        right = self._compile_node(node["right"])
+        return lambda item: bool(left(item) and right(item))
+
+    def _compile_or(self, node: dict) -> _Compiled:
+        left = self._compile_node(node["left"])
+        right = self._compile_node(node["right"])
+        return lambda item: bool(left(item) or right(item))
+
+    def _compile_not(self, node: dict) -> _Compiled:
+        operand = self._compile_node(node["operand"])
+        return lambda item: not operand(item)
+
+    def _compile_compare(self, node: dict) -> _Compiled:
+        left = self._compile_node(node["left"])
+        right = self._compile_node(node["right"])
+        cmp_fn = _COMPARATORS.get(node["comparator"])
+        if cmp_fn is None:
+            raise ValueError(f"Unknown comparator: {node['comparator']}")
+
+        def compare(item: dict) -> bool:
+            left_val = left(item)
+            right_val = right(item)
+            if left_val is None or right_val is None:
+                return False
+            left_val, right_val = _coerce_for_comparison(left_val, right_val)
+            try:
+                return bool(cmp_fn(left_val, right_val))
+            except TypeError:
+                return False
+
+        return compare
+
+    def _compile_between(self, node: dict) -> _Compiled:
+        operand = self._compile_node(node["operand"])
+        low = self._compile_node(node["low"])
+        high = self._compile_node(node["high"])
+
+        def between(item: dict) -> bool:
+            val = operand(item)
+            low_val = low(item)
+            high_val = high(item)
+            if val is None or low_val is None or high_val is None:
+                return False
+            val, low_val = _coerce_for_comparison(val, low_val)
+            val, high_val = _coerce_for_comparison(val, high_val)
+            return low_val <= val <= high_val
+
+        return between
+
+    def _compile_in(self, node: dict) -> _Compiled:
+        operand = self._compile_node(node["operand"])
+        candidates = [self._compile_node(v_node) for v_node in node["values"]]
+
+        def in_list(item: dict) -> bool:
+            val = operand(item)
+            if val is None:
+                return False
+            for candidate in candidates:
+                coerced_val, coerced_candidate = _coerce_for_comparison(val, candidate(item))
+                if coerced_val == coerced_candidate:
+                    return True
             return False
-        val, low = _coerce_for_comparison(val, low)
-        val, high = _coerce_for_comparison(val, high)
-        return low <= val <= high
 
-    def _eval_in(self, node: dict, item: dict) -> bool:
-        val = self._eval_node(node["operand"], item)
-        if val is None:
-            return False
-        for v_node in node["values"]:
-            candidate = self._eval_node(v_node, item)
-            coerced_val, coerced_candidate = _coerce_for_comparison(val, candidate)
-            if coerced_val == coerced_candidate:
-                return True
-        return False
-
-    def _eval_function(self, node: dict, item: dict) -> Any:
+        return in_list
+
+    def _compile_function(self, node: dict) -> _Compiled:
         name = node["name"]
         func_map = {
             "attribute_exists": self._func_attribute_exists,
@@ -422,61 +472,71 @@ class ExpressionEvaluator:
         func = func_map.get(name)
         if func is None:
             raise ValueError(f"Unknown function: {name}")
-        return func(node["args"], item)
+        return func(node["args"])
 
-    def _eval_value_ref(self, node: dict, _item: dict) -> Any:
-        ref = node["ref"]
-        raw = self._values.get(ref)
-        return _unwrap_dynamo_value(raw)
+    def _compile_value_ref(self, node: dict) -> _Compiled:
+        value = _unwrap_dynamo_value(self._values.get(node["ref"]))
+        return lambda _item: value
 
-    def _eval_name_ref(self, node: dict, item: dict) -> Any:
-        ref = node["ref"]
-        real_name = self._names.get(ref, ref)
-        found, val = _resolve_path(item, real_name)
-        return val if found else None
+    def _compile_name_ref(self, node: dict) -> _Compiled:
+        real_name = self._names.get(node["ref"], node["ref"])
+        return _compile_lookup(real_name)
 
-    def _eval_path(self, node: dict, item: dict) -> Any:
-        found, val = _resolve_path(item, node["path"])
-        return val if found else None
+    def _compile_path(self, node: dict) -> _Compiled:
+        return _compile_lookup(node["path"])
 
-    def _eval_literal(self, node: dict, _item: dict) -> Any:
-        return node["value"]
+    def _compile_literal(self, node: dict) -> _Compiled:
+        value = node["value"]
+        return lambda _item: value
 
     # -- Built-in functions ---
 
-    def _func_attribute_exists(self, args: list[dict], item: dict) -> bool:
-        path = self._resolve_attr_path(args[0])
-        found, _ = _resolve_path(item, path)
-        return found
+    def _func_attribute_exists(self, args: list[dict]) -> _Compiled:
+        parts = tuple(self._resolve_attr_path(args[0]).split("."))
+        return lambda item: _lookup(item, parts)[0]
+
+    def _func_attribute_not_exists(self, args: list[dict]) -> _Compiled:
+        parts = tuple(self._resolve_attr_path(args[0]).split("."))
+        return lambda item: not _lookup(item, parts)[0]
+
+    def _func_begins_with(self, args: list[dict]) -> _Compiled:
+        operand = self._compile_node(args[0])
+        prefix = self._compile_node(args[1])
+
+        def begins_with(item: dict) -> bool:
+            val = operand(item)
+            prefix_val = prefix(item)
+            if not isinstance(val, str) or not isinstance(prefix_val, str):
+                return False
+            return val.startswith(prefix_val)
+
+        return begins_with
+
+    def _func_contains(self, args: list[dict]) -> _Compiled:
+        container = self._compile_node(args[0])
+        operand = self._compile_node(args[1])
+
+        def contains(item: dict) -> bool:
+            val = container(item)
+            operand_val = operand(item)
+            if isinstance(val, str) and isinstance(operand_val, str):
+                return operand_val in val
+            if isinstance(val, (list, set)):
+                return operand_val in val
+            return False
 
-    def _func_attribute_not_exists(self, args: list[dict], item: dict) -> bool:
-        path = self._resolve_attr_path(args[0])
-        found, _ = _resolve_path(item, path)
-        return not found
+        return contains
 
-    def _func_begins_with(self, args: list[dict], item: dict) -> bool:
-        val = self._eval_node(args[0], item)
-        prefix = self._eval_node(args[1], item)
-        if not isinstance(val, str) or not isinstance(prefix, str):
-            return False
-        return val.startswith(prefix)
-
-    def _func_contains(self, args: list[dict], item: dict) -> bool:
-        val = self._eval_node(args[0], item)
-        operand = self._eval_node(args[1], item)
-        if isinstance(val, str) and isinstance(operand, str):
-            return operand in val
-        if isinstance(val, (list, set)):
-            return operand in val
-        return False
-
-    def _func_size(self, args: list[dict], item: dict) -> int:
-        val = self._eval_node(args[0], item)
-        if val is None:
+    def _func_size(self, args: list[dict]) -> _Compiled:
+        operand = self._compile_node(args[0])
+
+        def size(item: dict) -> int:
+            val = operand(item)
+            if isinstance(val, (str, list, dict, set)):
+                return len(val)
             return 0
-        if isinstance(val, (str, list, dict, set)):
-            return len(val)
-        return 0
+
+        return size
 
     def _resolve_attr_path(self, node: dict) -> str:
         """Resolve an AST node to an attribute path string."""
@@ -487,6 +547,20 @@ class ExpressionEvaluator:
         return str(node.get("ref", node.get("path", "")))
 
 
+def _compile_lookup(path: str) -> _Compiled:
+    """Compile an attribute path into a closure returning its value (or None)."""
+    parts = tuple(path.split("."))
+    if len(parts) == 1:
+        name = parts[0]
+        return lambda item: item.get(name)
+
+    def lookup(item: dict) -> Any:
+        _, val = _lookup(item, parts)
+        return val
+
+    return lookup
+
+
 # ---------------------------------------------------------------------------
 # Helper functions
 # ---------------------------------------------------------------------------
@@ -541,26 +615,18 @@ _COMPARATORS: dict[str, Any] = {
 }
 
 
-def _apply_comparator(op: str, left: Any, right: Any) -> bool:
-    """Apply a comparison operator to two values."""
-    cmp_fn = _COMPARATORS.get(op)
-    if cmp_fn is None:
-        raise ValueError(f"Unknown comparator: {op}")
-    try:
-        return bool(cmp_fn(left, right))
-    except TypeError:
-        return False
-
-
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
 def parse_filter_expression(expression: str) -> dict:
     """Parse a DynamoDB FilterExpression string into an AST.
 
-    Returns a dict representing the abstract syntax tree.
+    Returns a dict representing the abstract syntax tree.  Results are
+    cached by expression text, so the returned AST is shared between
+    callers and must not be mutated.
     """
     tokens = tokenize(expression)
     parser = _Parser(tokens)
@@ -596,6 +662,21 @@ def evaluate_filter_expression(
     return evaluator.evaluate(ast, item)
 
 
+def compile_filter_predicate(
+    expression: str | None,
+    expression_names: dict[str, str] | None = None,
+    expression_values: dict[str, Any] | None = None,
+) -> Callable[[dict], bool] | None:
+    """Parse a FilterExpression once and return a per-item predicate.
+
+    Returns None if expression is None or empty, meaning every item matches.
+    """
+    if not expression:
+        return None
+    ast = parse_filter_expression(expression)
+    return ExpressionEvaluator(expression_names, expression_values).compile(ast)
+
+
 def apply_filter_expression(
     items: list[dict],
     expression: str | None,
@@ -606,8 +687,7 @@ def apply_filter_expression(
 
     If expression is None or empty, returns all items unchanged.
     """
-    if not expression:
+    predicate = compile_filter_predicate(expression, expression_names, expression_values)
+    if predicate is None:
         return items
-    ast = parse_filter_expression(expression)
-    evaluator = ExpressionEvaluator(expression_names, expression_values)
-    return [item for item in items if evaluator.evaluate(ast, item)]
+    return [item for item in items if predicate(item)]
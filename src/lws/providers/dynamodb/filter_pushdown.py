@@ -0,0 +1,236 @@
+"""Translate DynamoDB FilterExpression ASTs into SQLite JSON1 predicates.
+
+Query and Scan pages normally decode every row and run the Python
+``ExpressionEvaluator`` over it.  The subset of filter expressions that
+maps cleanly onto SQL is pushed down into the page's SELECT instead, so
+rows that cannot match are rejected by SQLite before they are decoded:
+
+- comparisons (``=``, ``<``, ``<=``, ``>``, ``>=``) against a string or
+  number placeholder
+- ``BETWEEN`` and ``IN`` with string or number placeholders
+- ``begins_with(attr, :prefix)``
+- ``attribute_exists`` and ``attribute_not_exists``
+- ``AND`` / ``OR`` combinations of the above
+
+Only top-level attributes are translated.  Items may be stored in plain
+JSON (``{"status": "open"}``) or DynamoDB JSON
+(``{"status": {"S": "open"}}``), so every attribute is read through an
+expression that accepts both spellings.  SQLite compares a string
+placeholder with string attributes and a number placeholder with number
+attributes.  The Python evaluator coerces numeric strings when the types
+differ, so rows whose attribute has another type are let through for it
+to decide rather than rejected.
+
+Anything else stays with the Python evaluator.  A conjunction may be
+pushed down partially, with the evaluator re-checking the rows SQLite
+lets through.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+from lws.providers.dynamodb.expressions import _unwrap_dynamo_value
+
+# Attribute names that can be embedded in a JSON path literal.
+_ATTRIBUTE_RE = re.compile(r"^[\w-]+$")
+
+_PUSHDOWN_COMPARATORS = {"=", "<", "<=", ">", ">="}
+
+# Comparator to use when the placeholder is on the left: ``:v < a`` is ``a > :v``.
+_FLIPPED = {"=": "=", "<": ">", "<=": ">=", ">": "<", ">=": "<="}
+
+
+@dataclass
+class SqlFilter:
+    """A FilterExpression, or part of one, translated to SQL.
+
+    ``exact`` is True when ``sql`` captures the whole expression, so rows
+    it accepts need no further evaluation in Python.
+    """
+
+    sql: str
+    params: list[object] = field(default_factory=list)
+    exact: bool = True
+
+
+def is_pushdown_attribute(name: str) -> bool:
+    """Return True if *name* can be referenced by pushed-down SQL."""
+    return bool(_ATTRIBUTE_RE.match(name))
+
+
+def string_value_sql(name: str) -> str:
+    """SQL expression reading attribute *name* as a string, or NULL."""
+    path = _json_path(name)
+    return (
+        f"COALESCE(json_extract(item_json, '{path}.S'), "
+        f"CASE json_type(item_json, '{path}') "
+        f"WHEN 'text' THEN json_extract(item_json, '{path}') END)"
+    )
+
+
+def number_value_sql(name: str) -> str:
+    """SQL expression reading attribute *name* as a number, or NULL."""
+    path = _json_path(name)
+    return (
+        f"COALESCE(CASE json_type(item_json, '{path}') "
+        f"WHEN 'integer' THEN json_extract(item_json, '{path}') "
+        f"WHEN 'real' THEN json_extract(item_json, '{path}') END, "
+        f"CAST(json_extract(item_json, '{path}.N') AS NUMERIC))"
+    )
+
+
+def compile_filter_sql(
+    ast: dict,
+    expression_names: dict[str, str] | None = None,
+    expression_values: dict[str, Any] | None = None,
+) -> SqlFilter | None:
+    """Translate as much of a parsed FilterExpression as possible into SQL.
+
+    Returns None if no part of the expression can be pushed down.
+    """
+    translator = _Translator(expression_names or {}, expression_values or {})
+    conjuncts: list[tuple[str, list[object]]] = []
+    exact = translator.collect_conjuncts(ast, conjuncts)
+    if not conjuncts:
+        return None
+    sql = " AND ".join(f"({clause})" for clause, _ in conjuncts)
+    params = [param for _, clause_params in conjuncts for param in clause_params]
+    return SqlFilter(sql=sql, params=params, exact=exact and not translator.coerces)
+
+
+def _json_path(name: str) -> str:
+    return f'$."{name}"'
+
+
+class _Translator:
+    """Translate filter AST nodes into ``(sql, params)`` pairs.
+
+    ``coerces`` is set once a typed comparison has been translated, since
+    the rows it lets through for coercion must be re-checked in Python.
+    """
+
+    def __init__(self, names: dict[str, str], values: dict[str, Any]) -> None:
+        self._names = names
+        self._values = values
+        self.coerces = False
+
+    def collect_conjuncts(self, node: dict, out: list[tuple[str, list[object]]]) -> bool:
+        """Append the translatable conjuncts of *node* to *out*.
+
+        Returns True if every conjunct was translated.
+        """
+        if node["op"] == "AND":
+            left_exact = self.collect_conjuncts(node["left"], out)
+            right_exact = self.collect_conjuncts(node["right"], out)
+            return left_exact and right_exact
+        translated = self._translate(node)
+        if translated is None:
+            return False
+        out.append(translated)
+        return True
+
+    def _translate(self, node: dict) -> tuple[str, list[object]] | None:
+        dispatch = {
+            "AND": self._translate_logical,
+            "OR": self._translate_logical,
+            "compare": self._translate_compare,
+            "BETWEEN": self._translate_between,
+            "IN": self._translate_in,
+            "function": self._translate_function,
+        }
+        handler = dispatch.get(node["op"])
+        return handler(node) if handler is not None else None
+
+    def _translate_logical(self, node: dict) -> tuple[str, list[object]] | None:
+        left = self._translate(node["left"])
+        right = self._translate(node["right"])
+        if left is None or right is None:
+            return None
+        return f"({left[0]}) {node['op']} ({right[0]})", left[1] + right[1]
+
+    def _translate_compare(self, node: dict) -> tuple[str, list[object]] | None:
+        comparator = node["comparator"]
+        if comparator not in _PUSHDOWN_COMPARATORS:
+            return None
+        attribute, value = self._attribute(node["left"]), self._value(node["right"])
+        if attribute is None:
+            attribute, value = self._attribute(node["right"]), self._value(node["left"])
+            comparator = _FLIPPED[comparator]
+        column = _typed_column(attribute, [value])
+        if column is None:
+            return None
+        return self._typed_clause(attribute, column, f"{comparator} ?"), [value]
+
+    def _translate_between(self, node: dict) -> tuple[str, list[object]] | None:
+        low, high = self._value(node["low"]), self._value(node["high"])
+        attribute = self._attribute(node["operand"])
+        column = _typed_column(attribute, [low, high])
+        if column is None:
+            return None
+        return self._typed_clause(attribute, column, "BETWEEN ? AND ?"), [low, high]
+
+    def _translate_in(self, node: dict) -> tuple[str, list[object]] | None:
+        values = [self._value(v_node) for v_node in node["values"]]
+        attribute = self._attribute(node["operand"])
+        column = _typed_column(attribute, values)
+        if column is None:
+            return None
+        placeholders = ", ".join("?" for _ in values)
+        return self._typed_clause(attribute, column, f"IN ({placeholders})"), list(values)
+
+    def _translate_function(self, node: dict) -> tuple[str, list[object]] | None:
+        name, args = node["name"], node["args"]
+        attribute = self._attribute(args[0]) if args else None
+        if attribute is None:
+            return None
+        if name == "attribute_exists":
+            return f"json_type(item_json, '{_json_path(attribute)}') IS NOT NULL", []
+        if name == "attribute_not_exists":
+            return f"json_type(item_json, '{_json_path(attribute)}') IS NULL", []
+        if name == "begins_with" and len(args) == 2:
+            prefix = self._value(args[1])
+            if isinstance(prefix, str):
+                return f"substr({string_value_sql(attribute)}, 1, ?) = ?", [len(prefix), prefix]
+        return None
+
+    def _typed_clause(self, attribute: str, column: str, condition: str) -> str:
+        """Apply *condition* to *column*, letting other-typed values through."""
+        self.coerces = True
+        present = f"json_type(item_json, '{_json_path(attribute)}') IS NOT NULL"
+        return f"{column} {condition} OR ({column} IS NULL AND {present})"
+
+    def _attribute(self, node: dict) -> str | None:
+        """Return the top-level attribute a path or ``#name`` node refers to."""
+        if node["op"] == "path":
+            name = node["path"]
+        elif node["op"] == "name_ref":
+            name = self._names.get(node["ref"], node["ref"])
+        else:
+            return None
+        return name if is_pushdown_attribute(name) else None
+
+    def _value(self, node: dict) -> Any:
+        """Return the plain value of a placeholder or literal node, or None."""
+        if node["op"] == "value_ref":
+            return _unwrap_dynamo_value(self._values.get(node["ref"]))
+        if node["op"] == "literal":
+            return node["value"]
+        return None
+
+
+def _typed_column(attribute: str | None, values: list[Any]) -> str | None:
+    """Pick the string or number reading of *attribute* matching *values*.
+
+    Returns None unless every value is a string, or every value is a
+    number (booleans excluded).
+    """
+    if attribute is None or not values:
+        return None
+    if all(isinstance(v, str) for v in values):
+        return string_value_sql(attribute)
+    if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+        return number_value_sql(attribute)
+    return None
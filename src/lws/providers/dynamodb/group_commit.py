@@ -0,0 +1,100 @@
+"""Group commit for the per-table SQLite writer connection.
+
+Every write to a table database goes through a ``GroupCommitter``.  Each
+write stages its statements inside a savepoint while holding the table's
+writer lock.  With the default window of 0 ms, each write commits as soon
+as it has staged.  With a positive window, the first write opens a
+shared commit that fires when the window expires.  Every write that
+stages before then joins it, so a burst of single-item writes costs one
+fsync instead of one per item.  Callers return only after the commit that
+covers their write has completed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+import aiosqlite
+
+_T = TypeVar("_T")
+
+_SAVEPOINT = "lws_write"
+
+
+class GroupCommitter:
+    """Serialize and coalesce commits on one writer connection.
+
+    Parameters
+    ----------
+    conn : aiosqlite.Connection
+        The table's writer connection.
+    window_ms : int
+        How long a pending commit waits for further writes to join it.
+        ``0`` commits every write immediately.
+    """
+
+    def __init__(self, conn: aiosqlite.Connection, window_ms: int = 0) -> None:
+        self._conn = conn
+        self._window_seconds = max(0, window_ms) / 1000.0
+        self._lock = asyncio.Lock()
+        self._pending: asyncio.Future[None] | None = None
+        self._timer: asyncio.Task[None] | None = None
+
+    async def write(self, stage: Callable[[aiosqlite.Connection], Awaitable[_T]]) -> _T:
+        """Run *stage* atomically and return once its changes are committed.
+
+        *stage* receives the writer connection and must only execute
+        statements.  The connection is committed for it.  If *stage*
+        raises, its statements are rolled back without disturbing other
+        writes waiting on the same commit.
+        """
+        async with self._lock:
+            result = await self._stage(stage)
+            if self._window_seconds <= 0:
+                await self._conn.commit()
+                return result
+            if self._pending is None:
+                self._pending = asyncio.get_running_loop().create_future()
+                self._timer = asyncio.create_task(self._commit_after_window())
+            pending = self._pending
+        await asyncio.shield(pending)
+        return result
+
+    async def flush(self) -> None:
+        """Commit any pending group immediately."""
+        async with self._lock:
+            await self._commit_pending()
+
+    async def _stage(self, stage: Callable[[aiosqlite.Connection], Awaitable[_T]]) -> _T:
+        if not self._conn.in_transaction:
+            await self._conn.execute("BEGIN")
+        await self._conn.execute(f"SAVEPOINT {_SAVEPOINT}")
+        try:
+            result = await stage(self._conn)
+        except BaseException:
+            await self._conn.execute(f"ROLLBACK TO {_SAVEPOINT}")
+            await self._conn.execute(f"RELEASE {_SAVEPOINT}")
+            raise
+        await self._conn.execute(f"RELEASE {_SAVEPOINT}")
+        return result
+
+    async def _commit_after_window(self) -> None:
+        await asyncio.sleep(self._window_seconds)
+        async with self._lock:
+            await self._commit_pending()
+
+    async def _commit_pending(self) -> None:
+        pending, self._pending = self._pending, None
+        timer, self._timer = self._timer, None
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+        if pending is None:
+            return
+        try:
+            await self._conn.commit()
+        except Exception as exc:  # pylint: disable=broad-except
+            pending.set_exception(exc)
+            return
+        pending.set_result(None)
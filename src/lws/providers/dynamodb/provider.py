@@ -5,6 +5,10 @@ from __future__ import annotations
 import json
 import re
 import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Any
 
@@ -13,26 +17,55 @@ import aiosqlite
 from lws.interfaces import (
     GsiDefinition,
     IKeyValueStore,
+    ItemPage,
     KeyAttribute,
+    KeySchema,
     TableConfig,
 )
-from lws.providers.dynamodb.expressions import apply_filter_expression
+from lws.providers.dynamodb.expressions import (
+    EXPRESSION_CACHE_SIZE,
+    compile_filter_predicate,
+    parse_filter_expression,
+)
+from lws.providers.dynamodb.filter_pushdown import SqlFilter, compile_filter_sql
+from lws.providers.dynamodb.group_commit import GroupCommitter
+from lws.providers.dynamodb.read_pool import (
+    DEFAULT_READ_POOL_SIZE,
+    SEGMENT_FUNCTION,
+    ReadConnectionPool,
+)
 from lws.providers.dynamodb.streams import EventName, StreamDispatcher
 from lws.providers.dynamodb.update_expression import apply_update_expression
 
 # Maximum number of items in a single batch operation (DynamoDB limit)
 _MAX_BATCH_SIZE = 25
 
+# Maximum TotalSegments for a Parallel Scan (DynamoDB limit)
+_MAX_TOTAL_SEGMENTS = 1_000_000
+
+# Range of numbers SQLite stores as INTEGER; larger N keys are stored as REAL
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+# Key columns are declared without a type so that they have no affinity:
+# S keys are stored as TEXT and N keys as INTEGER/REAL, which SQLite orders
+# numerically.
+_KEY_TABLE_COLUMNS = "(pk, sk, item_json TEXT, PRIMARY KEY (pk, sk))"
+
+# A value as stored in a pk or sk column
+_StoredKey = str | int | float
+
 # ---------------------------------------------------------------------------
 # Helpers: DynamoDB JSON conversion
 # ---------------------------------------------------------------------------
 
 
-def _extract_key_value(item: dict, key_attr: KeyAttribute) -> str:
-    """Extract and stringify a key value from a DynamoDB-format or plain item.
+def _extract_key_value(item: dict, key_attr: KeyAttribute) -> _StoredKey:
+    """Extract a key value from a DynamoDB-format or plain item as stored.
 
     Handles both DynamoDB wire format ``{"pk": {"S": "val"}}`` and plain
-    ``{"pk": "val"}``.
+    ``{"pk": "val"}``.  Number keys are returned as numbers so that they
+    sort numerically; every other key is stringified.
     """
     raw = item.get(key_attr.name)
     if raw is None:
@@ -41,8 +74,21 @@ def _extract_key_value(item: dict, key_attr: KeyAttribute) -> str:
     if isinstance(raw, dict) and len(raw) == 1:
         type_key = next(iter(raw))
         if type_key in ("S", "N", "B"):
-            return str(raw[type_key])
-    return str(raw)
+            raw = raw[type_key]
+    return _key_column_value(raw, key_attr)
+
+
+def _key_column_value(value: object, key_attr: KeyAttribute | None) -> _StoredKey:
+    """Convert a plain key value to the form stored in a ``pk``/``sk`` column."""
+    if key_attr is None or key_attr.type != "N" or isinstance(value, bool):
+        return str(value)
+    try:
+        number = Decimal(str(value))
+    except InvalidOperation:
+        return str(value)
+    if number == number.to_integral_value() and _INT64_MIN <= number <= _INT64_MAX:
+        return int(number)
+    return float(number)
 
 
 def _is_dynamo_json(item: dict) -> bool:
@@ -158,10 +204,7 @@ def _from_dynamo_json_value(typed_val: dict) -> object:
 
 def _extract_key_names(config: TableConfig) -> list[str]:
     """Get all key attribute names for the main table."""
-    names = [config.key_schema.partition_key.name]
-    if config.key_schema.sort_key:
-        names.append(config.key_schema.sort_key.name)
-    return names
+    return _key_schema_names(config.key_schema)
 
 
 def _project_item_for_gsi(item: dict, gsi: GsiDefinition, table_config: TableConfig) -> str:
@@ -199,13 +242,6 @@ def _project_item_for_gsi(item: dict, gsi: GsiDefinition, table_config: TableCon
 # ---------------------------------------------------------------------------
 
 
-def _resolve_name(token: str, expression_names: dict | None) -> str:
-    """Resolve an expression attribute name like ``#attr`` to its real name."""
-    if expression_names and token.startswith("#"):
-        return expression_names.get(token, token)
-    return token
-
-
 def _resolve_value(token: str, expression_values: dict | None) -> object:
     """Resolve an expression attribute value like ``:val`` to its real value."""
     if expression_values and token.startswith(":"):
@@ -222,6 +258,7 @@ def _parse_key_condition(
     key_condition: str,
     expression_values: dict | None,
     expression_names: dict | None,
+    key_schema: KeySchema | None = None,
 ) -> tuple[str, list[object]]:
     """Parse a DynamoDB KeyConditionExpression into a SQL WHERE clause + params.
 
@@ -231,24 +268,44 @@ def _parse_key_condition(
     - ``pk = :val AND sk > :val2``  (also <, >=, <=)
     - ``pk = :val AND sk BETWEEN :a AND :b``
     - ``pk = :val AND begins_with(sk, :prefix)``
+
+    Key columns are positional (``pk`` then ``sk``), so *expression_names*
+    does not affect the generated SQL.  With *key_schema*, values compared
+    against a number key are bound as numbers to match the stored keys.
+    """
+    del expression_names
+    where, value_tokens = _compile_key_condition(key_condition)
+    if key_schema is None:
+        return where, [_resolve_value(token, expression_values) for _, token in value_tokens]
+    key_attrs = {"pk": key_schema.partition_key, "sk": key_schema.sort_key}
+    return where, [
+        _key_column_value(_resolve_value(token, expression_values), key_attrs[column])
+        for column, token in value_tokens
+    ]
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _compile_key_condition(key_condition: str) -> tuple[str, tuple[tuple[str, str], ...]]:
+    """Translate a KeyConditionExpression into SQL, cached by expression text.
+
+    Returns the WHERE clause and the ``(column, placeholder)`` pairs bound
+    to its parameters, in order.
     """
     expr = key_condition.strip()
     parts = re.split(r"\bAND\b", expr, flags=re.IGNORECASE)
 
     sql_parts: list[str] = []
-    params: list[object] = []
+    value_tokens: list[tuple[str, str]] = []
 
     i = 0
     while i < len(parts):
         part = parts[i].strip()
-        consumed, i = _parse_key_part(
-            part, parts, i, sql_parts, params, expression_values, expression_names
-        )
+        consumed, i = _parse_key_part(part, parts, i, sql_parts, value_tokens)
         if not consumed:
             i += 1
 
     where = " AND ".join(sql_parts) if sql_parts else "1=1"
-    return where, params
+    return where, tuple(value_tokens)
 
 
 def _parse_key_part(
@@ -256,32 +313,24 @@ def _parse_key_part(
     parts: list[str],
     i: int,
     sql_parts: list[str],
-    params: list[object],
-    expression_values: dict | None,
-    expression_names: dict | None,
+    value_tokens: list[tuple[str, str]],
 ) -> tuple[bool, int]:
     """Parse a single key condition part. Returns (consumed, next_index)."""
-    if _try_parse_begins_with(part, sql_parts, params, expression_values, expression_names):
+    if _try_parse_begins_with(part, sql_parts, value_tokens):
         return True, i + 1
 
-    consumed, new_i = _try_parse_between(
-        part, parts, i, sql_parts, params, expression_values, expression_names
-    )
+    consumed, new_i = _try_parse_between(part, parts, i, sql_parts, value_tokens)
     if consumed:
         return True, new_i
 
-    if _try_parse_comparison(part, sql_parts, params, expression_values, expression_names):
+    if _try_parse_comparison(part, sql_parts, value_tokens):
         return True, i + 1
 
     return False, i
 
 
 def _try_parse_begins_with(
-    part: str,
-    sql_parts: list[str],
-    params: list[object],
-    expression_values: dict | None,
-    expression_names: dict | None,
+    part: str, sql_parts: list[str], value_tokens: list[tuple[str, str]]
 ) -> bool:
     """Try to parse a begins_with condition. Returns True if matched."""
     bw_match = re.match(
@@ -291,11 +340,9 @@ def _try_parse_begins_with(
     )
     if not bw_match:
         return False
-    _resolve_name(bw_match.group(1), expression_names)
-    val = _resolve_value(bw_match.group(2), expression_values)
     col = "pk" if not sql_parts else "sk"
     sql_parts.append(f"{col} LIKE ? || '%'")
-    params.append(val)
+    value_tokens.append((col, bw_match.group(2)))
     return True
 
 
@@ -304,9 +351,7 @@ def _try_parse_between(
     parts: list[str],
     i: int,
     sql_parts: list[str],
-    params: list[object],
-    expression_values: dict | None,
-    expression_names: dict | None,
+    value_tokens: list[tuple[str, str]],
 ) -> tuple[bool, int]:
     """Try to parse a BETWEEN condition. Returns (matched, next_index)."""
     between_match = re.match(
@@ -316,22 +361,14 @@ def _try_parse_between(
     )
     if not between_match:
         return False, i
-    _resolve_name(between_match.group(1), expression_names)
-    val_a = _resolve_value(between_match.group(2), expression_values)
-    val_b_raw = parts[i + 1].strip() if i + 1 < len(parts) else ""
-    val_b = _resolve_value(val_b_raw, expression_values)
-    col = "sk"
-    sql_parts.append(f"{col} BETWEEN ? AND ?")
-    params.extend([val_a, val_b])
+    high = parts[i + 1].strip() if i + 1 < len(parts) else ""
+    sql_parts.append("sk BETWEEN ? AND ?")
+    value_tokens.extend([("sk", between_match.group(2)), ("sk", high)])
     return True, i + 2
 
 
 def _try_parse_comparison(
-    part: str,
-    sql_parts: list[str],
-    params: list[object],
-    expression_values: dict | None,
-    expression_names: dict | None,
+    part: str, sql_parts: list[str], value_tokens: list[tuple[str, str]]
 ) -> bool:
     """Try to parse a comparison condition. Returns True if matched."""
     cmp_match = re.match(
@@ -340,15 +377,357 @@ def _try_parse_comparison(
     )
     if not cmp_match:
         return False
-    _resolve_name(cmp_match.group(1), expression_names)
     op = cmp_match.group(2)
-    val = _resolve_value(cmp_match.group(3), expression_values)
     col = "pk" if not sql_parts else "sk"
     sql_parts.append(f"{col} {op} ?")
-    params.append(val)
+    value_tokens.append((col, cmp_match.group(3)))
     return True
 
 
+# ---------------------------------------------------------------------------
+# Keyset pagination helpers
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _PageRequest:
+    """SQL-level description of one Query/Scan page.
+
+    Rows are walked in ``(pk, sk)`` order so that ``start`` (the stored key
+    of the last evaluated item) can resume the walk with a row-value
+    comparison instead of an OFFSET.  ``segment`` is a
+    ``(segment, total_segments)`` pair restricting a Parallel Scan to the
+    partitions that hash into that segment.  ``filter`` is the part of
+    the FilterExpression pushed down into SQL.  It is selected as a per-row
+    match flag rather than applied in the WHERE clause, so every row in the
+    key range is still counted as scanned and ``limit`` counts evaluated
+    rows.
+    """
+
+    table: str
+    where: str = "1=1"
+    params: list[object] | None = None
+    limit: int | None = None
+    start: tuple[_StoredKey, _StoredKey] | None = None
+    forward: bool = True
+    count_only: bool = False
+    segment: tuple[int, int] | None = None
+    filter: SqlFilter | None = None
+
+
+def _build_page_sql(request: _PageRequest) -> tuple[str, list[object]]:
+    """Build the keyset-paginated SELECT for a page request."""
+    clauses = [request.where]
+    params = list(request.params or [])
+    if request.start is not None:
+        comparator = ">" if request.forward else "<"
+        clauses.append(f"(pk, sk) {comparator} (?, ?)")
+        params.extend(request.start)
+    if request.segment is not None:
+        segment, total_segments = request.segment
+        clauses.append(f"{SEGMENT_FUNCTION}(pk, ?) = ?")
+        params.extend([total_segments, segment])
+    columns = "item_json"
+    if request.filter is not None:
+        columns = f"item_json, ({request.filter.sql})"
+        params = request.filter.params + params
+    direction = "ASC" if request.forward else "DESC"
+    sql = (
+        f"SELECT {columns} FROM {request.table} WHERE {' AND '.join(clauses)} "
+        f"ORDER BY pk {direction}, sk {direction}"
+    )
+    if request.limit is not None:
+        sql += " LIMIT ?"
+        params.append(request.limit)
+    return sql, params
+
+
+def _start_key_values(
+    exclusive_start_key: dict | None, key_schema: KeySchema
+) -> tuple[_StoredKey, _StoredKey] | None:
+    """Convert an ``ExclusiveStartKey`` into the stored ``(pk, sk)`` column values."""
+    if not exclusive_start_key:
+        return None
+    pk = _extract_key_value(exclusive_start_key, key_schema.partition_key)
+    sk = _extract_key_value(exclusive_start_key, key_schema.sort_key) if key_schema.sort_key else ""
+    return pk, sk
+
+
+async def _fetch_page(
+    conn: aiosqlite.Connection,
+    request: _PageRequest,
+    key_names: list[str],
+    predicate: Callable[[dict], bool] | None = None,
+    transform: Callable[[dict], dict] | None = None,
+) -> ItemPage:
+    """Stream rows for *request*, decoding and filtering them one at a time.
+
+    Rows rejected by a pushed-down filter are counted but never decoded.
+    """
+    page = ItemPage()
+    last_json: str | None = None
+    sql, params = _build_page_sql(request)
+    async with conn.execute(sql, params) as cursor:
+        async for row in cursor:
+            last_json = row[0]
+            if len(row) > 1 and not row[1]:
+                page.scanned_count += 1
+                continue
+            _add_to_page(page, json.loads(last_json), request.count_only, predicate, transform)
+    if request.limit is not None and page.scanned_count >= request.limit and last_json:
+        last_item = json.loads(last_json)
+        page.last_evaluated_key = {k: last_item[k] for k in key_names if k in last_item}
+    return page
+
+
+def _add_to_page(
+    page: ItemPage,
+    item: dict,
+    count_only: bool,
+    predicate: Callable[[dict], bool] | None,
+    transform: Callable[[dict], dict] | None,
+) -> None:
+    """Count one evaluated item and keep it if it passes the filter."""
+    page.scanned_count += 1
+    if transform is not None:
+        item = transform(item)
+    if predicate is not None and not predicate(item):
+        return
+    page.count += 1
+    if not count_only:
+        page.items.append(item)
+
+
+def _compile_filter(
+    filter_expression: str | None,
+    expression_names: dict | None,
+    expression_values: dict | None,
+    pushdown: bool = True,
+) -> tuple[SqlFilter | None, Callable[[dict], bool] | None]:
+    """Split a FilterExpression into a SQL pushdown and a Python predicate.
+
+    The predicate is None when the pushdown captures the whole expression.
+    Items stored in DynamoDB JSON are evaluated by their plain values.
+    """
+    if not filter_expression:
+        return None, None
+    evaluate = compile_filter_predicate(filter_expression, expression_names, expression_values)
+    predicate = (lambda item: evaluate(_from_dynamo_json(item))) if evaluate else None
+    if not pushdown:
+        return None, predicate
+    sql_filter = compile_filter_sql(
+        parse_filter_expression(filter_expression), expression_names, expression_values
+    )
+    if sql_filter is not None and sql_filter.exact:
+        return sql_filter, None
+    return sql_filter, predicate
+
+
+# ---------------------------------------------------------------------------
+# Write staging helpers
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _WriteEffect:
+    """One item-level change staged inside a write transaction.
+
+    Effects are published (version tracking and stream events) only after
+    the transaction that staged them has committed.  ``new_item`` is None
+    for deletes.
+    """
+
+    pk: _StoredKey
+    sk: _StoredKey
+    old_item_json: str | None
+    new_item: dict | None = None
+    new_item_json: str | None = None
+
+
+async def _stage_writes(
+    conn: aiosqlite.Connection,
+    config: TableConfig,
+    put_items: list[dict],
+    delete_keys: list[dict],
+) -> list[_WriteEffect]:
+    """Stage puts then deletes with one statement per table via ``executemany``."""
+    pk_attr = config.key_schema.partition_key
+    puts = [(_extract_key_value(i, pk_attr), _extract_sk(i, config), i) for i in put_items]
+    deletes = [(_extract_key_value(k, pk_attr), _extract_sk(k, config)) for k in delete_keys]
+
+    # Old images for streams and consistency tracking, fetched in one query
+    images = await _fetch_item_jsons(conn, [(pk, sk) for pk, sk, _ in puts] + deletes)
+
+    effects: list[_WriteEffect] = []
+    for pk, sk, item in puts:
+        item_json = json.dumps(item)
+        effects.append(_WriteEffect(pk, sk, images.get((pk, sk)), item, item_json))
+        images[(pk, sk)] = item_json
+    for pk, sk in deletes:
+        effects.append(_WriteEffect(pk, sk, images.get((pk, sk))))
+        images[(pk, sk)] = None
+
+    await _execute_writes(conn, config, effects)
+    return effects
+
+
+async def _fetch_item_jsons(
+    conn: aiosqlite.Connection, keys: list[tuple[_StoredKey, _StoredKey]]
+) -> dict[tuple[_StoredKey, _StoredKey], str | None]:
+    """Fetch the stored JSON of every existing item among *keys*."""
+    if not keys:
+        return {}
+    placeholders = ", ".join("(?, ?)" for _ in keys)
+    params = [part for key in keys for part in key]
+    async with conn.execute(
+        f"SELECT pk, sk, item_json FROM items WHERE (pk, sk) IN (VALUES {placeholders})",
+        params,
+    ) as cursor:
+        return {(row[0], row[1]): row[2] async for row in cursor}
+
+
+async def _execute_writes(
+    conn: aiosqlite.Connection, config: TableConfig, effects: list[_WriteEffect]
+) -> None:
+    """Apply staged effects to the items table and every GSI table."""
+    puts = [e for e in effects if e.new_item is not None]
+    deletes = [e for e in effects if e.new_item is None]
+
+    await conn.executemany(
+        "INSERT OR REPLACE INTO items (pk, sk, item_json) VALUES (?, ?, ?)",
+        [(e.pk, e.sk, e.new_item_json) for e in puts],
+    )
+    await conn.executemany(
+        "DELETE FROM items WHERE pk = ? AND sk = ?",
+        [(e.pk, e.sk) for e in deletes],
+    )
+
+    # Maintain GSI tables with projection support (P1-22)
+    for gsi in config.gsi_definitions:
+        await _execute_gsi_writes(conn, gsi, config, puts, deletes)
+
+
+async def _execute_gsi_writes(
+    conn: aiosqlite.Connection,
+    gsi: GsiDefinition,
+    config: TableConfig,
+    puts: list[_WriteEffect],
+    deletes: list[_WriteEffect],
+) -> None:
+    """Apply staged puts and deletes to one GSI table."""
+    put_rows = [_gsi_row(gsi, e.new_item, config) for e in puts]
+    await conn.executemany(
+        f"INSERT OR REPLACE INTO gsi_{gsi.index_name} (pk, sk, item_json) VALUES (?, ?, ?)",
+        [row for row in put_rows if row is not None],
+    )
+    await conn.executemany(
+        f"DELETE FROM gsi_{gsi.index_name} WHERE pk = ? AND sk = ?",
+        [_gsi_key(gsi, json.loads(e.old_item_json)) for e in deletes if e.old_item_json],
+    )
+
+
+def _gsi_row(
+    gsi: GsiDefinition, item: dict | None, table_config: TableConfig
+) -> tuple[_StoredKey, _StoredKey, str] | None:
+    """Return the GSI table row for *item*, or None if it doesn't project into *gsi*."""
+    if item is None:
+        return None
+    gsi_pk, gsi_sk = _gsi_key(gsi, item)
+    if not gsi_pk:
+        return None
+    return gsi_pk, gsi_sk, _project_item_for_gsi(item, gsi, table_config)
+
+
+def _gsi_key(gsi: GsiDefinition, item: dict) -> tuple[_StoredKey, _StoredKey]:
+    """Return the ``(pk, sk)`` an item is stored under in a GSI table."""
+    gsi_pk = _extract_key_value(item, gsi.key_schema.partition_key)
+    gsi_sk = _extract_key_value(item, gsi.key_schema.sort_key) if gsi.key_schema.sort_key else ""
+    return gsi_pk, gsi_sk
+
+
+async def _stage_transact_writes(
+    conn: aiosqlite.Connection, config: TableConfig, operations: list[dict]
+) -> list[_WriteEffect]:
+    """Stage TransactWriteItems operations for one table in request order."""
+    effects: list[_WriteEffect] = []
+    for operation in operations:
+        if "Put" in operation:
+            effects += await _stage_writes(conn, config, [operation["Put"]["Item"]], [])
+        elif "Delete" in operation:
+            effects += await _stage_writes(conn, config, [], [operation["Delete"]["Key"]])
+        else:
+            update = operation["Update"]
+            key = update["Key"]
+            pk = _extract_key_value(key, config.key_schema.partition_key)
+            images = await _fetch_item_jsons(conn, [(pk, _extract_sk(key, config))])
+            existing_json = next(iter(images.values()), None)
+            updated = _apply_update(
+                json.loads(existing_json) if existing_json else None,
+                key,
+                update.get("UpdateExpression", ""),
+                update.get("ExpressionAttributeValues"),
+                update.get("ExpressionAttributeNames"),
+            )
+            effects += await _stage_writes(conn, config, [updated], [])
+    return effects
+
+
+def _transact_write_operation(transact_item: dict) -> dict | None:
+    """Return the Put/Delete/Update body of a TransactItems entry, if it writes."""
+    for op_name in ("Put", "Delete", "Update"):
+        if op_name in transact_item:
+            return transact_item[op_name]
+    return None
+
+
+def _apply_update(
+    existing: dict | None,
+    key: dict,
+    update_expression: str,
+    expression_values: dict | None,
+    expression_names: dict | None,
+) -> dict:
+    """Apply an UpdateExpression to *existing* (or a new item built from *key*)."""
+    item = existing if existing is not None else dict(key)
+
+    # Remember whether the item was stored in DynamoDB JSON format so
+    # we can restore it after the evaluator runs.
+    needs_rewrap = _is_dynamo_json(item)
+
+    # Use the enhanced update expression evaluator (P1-24)
+    apply_update_expression(item, update_expression, expression_names, expression_values)
+
+    if needs_rewrap:
+        # The evaluator unwraps DynamoDB-typed expression values to
+        # plain Python values, producing a mixed-format item.  Re-wrap
+        # so the stored item and any returned Attributes stay in
+        # DynamoDB JSON.
+        item = _ensure_dynamo_json(item)
+    return item
+
+
+async def _retype_text_keys(conn: aiosqlite.Connection, table: str, key_schema: KeySchema) -> None:
+    """Rebuild a table whose key columns were declared TEXT if it has a number key.
+
+    TEXT affinity stores number keys as strings, which sort as ``"10" < "9"``.
+    """
+    key_attrs = [key_schema.partition_key, key_schema.sort_key]
+    if not any(attr is not None and attr.type == "N" for attr in key_attrs):
+        return
+    async with conn.execute(f"PRAGMA table_info({table})") as cursor:
+        column_types = {row[1]: row[2].upper() async for row in cursor}
+    if column_types.get("pk") != "TEXT":
+        return
+    pk, sk = (
+        f"CAST({column} AS NUMERIC)" if attr is not None and attr.type == "N" else column
+        for column, attr in zip(("pk", "sk"), key_attrs)
+    )
+    await conn.execute(f"ALTER TABLE {table} RENAME TO {table}_text_keys")
+    await conn.execute(f"CREATE TABLE {table} {_KEY_TABLE_COLUMNS}")
+    await conn.execute(f"INSERT INTO {table} SELECT {pk}, {sk}, item_json FROM {table}_text_keys")
+    await conn.execute(f"DROP TABLE {table}_text_keys")
+
+
 # ---------------------------------------------------------------------------
 # Eventual consistency helpers (P1-27)
 # ---------------------------------------------------------------------------
@@ -365,10 +744,10 @@ class _VersionStore:
     def __init__(self, delay_ms: int = 200) -> None:
         self._delay_seconds = delay_ms / 1000.0
         # (table, pk, sk) -> (write_timestamp, previous_item_json | None)
-        self._versions: dict[tuple[str, str, str], tuple[float, str | None]] = {}
+        self._versions: dict[tuple[str, _StoredKey, _StoredKey], tuple[float, str | None]] = {}
 
     def record_write(
-        self, table_name: str, pk: str, sk: str, previous_item_json: str | None
+        self, table_name: str, pk: _StoredKey, sk: _StoredKey, previous_item_json: str | None
     ) -> None:
         """Record a write event for eventual consistency tracking."""
         self._versions[(table_name, pk, sk)] = (time.monotonic(), previous_item_json)
@@ -376,8 +755,8 @@ class _VersionStore:
     def get_consistent_item(
         self,
         table_name: str,
-        pk: str,
-        sk: str,
+        pk: _StoredKey,
+        sk: _StoredKey,
         current_item_json: str | None,
         consistent_read: bool,
     ) -> str | None:
@@ -396,7 +775,7 @@ class _VersionStore:
             return previous_json
         return current_item_json
 
-    def is_stale(self, table_name: str, pk: str, sk: str) -> bool:
+    def is_stale(self, table_name: str, pk: _StoredKey, sk: _StoredKey) -> bool:
         """Check if an item is within the staleness window."""
         key = (table_name, pk, sk)
         version_info = self._versions.get(key)
@@ -428,6 +807,12 @@ class SqliteDynamoProvider(IKeyValueStore):
         Default is 200ms. Set to 0 to disable.
     stream_dispatcher : StreamDispatcher | None
         Optional stream dispatcher for DynamoDB Streams emulation.
+    read_pool_size : int
+        Maximum number of read-only connections per table used to serve
+        Query and Scan pages alongside the single writer connection.
+    group_commit_window_ms : int
+        How long a table's pending commit waits for concurrent writes to
+        join it.  Default is 0, which commits every write immediately.
     """
 
     def __init__(
@@ -436,10 +821,16 @@ class SqliteDynamoProvider(IKeyValueStore):
         tables: list[TableConfig] | None = None,
         consistency_delay_ms: int = 200,
         stream_dispatcher: StreamDispatcher | None = None,
+        read_pool_size: int = DEFAULT_READ_POOL_SIZE,
+        group_commit_window_ms: int = 0,
     ) -> None:
         self._data_dir = data_dir
         self._tables = {t.table_name: t for t in (tables or [])}
         self._connections: dict[str, aiosqlite.Connection] = {}
+        self._committers: dict[str, GroupCommitter] = {}
+        self._read_pools: dict[str, ReadConnectionPool] = {}
+        self._read_pool_size = read_pool_size
+        self._group_commit_window_ms = group_commit_window_ms
         self._version_store = _VersionStore(delay_ms=consistency_delay_ms)
         self._stream_dispatcher = stream_dispatcher
 
@@ -465,38 +856,21 @@ class SqliteDynamoProvider(IKeyValueStore):
         return "dynamodb"
 
     async def start(self) -> None:
-        db_dir = self._data_dir / "dynamodb"
-        db_dir.mkdir(parents=True, exist_ok=True)
-
-        for table_name, config in self._tables.items():
-            db_path = db_dir / f"{table_name}.db"
-            conn = await aiosqlite.connect(str(db_path))
-            self._connections[table_name] = conn
-
-            # Enable WAL mode for better concurrent access (P1-28)
-            await conn.execute("PRAGMA journal_mode=WAL")
-
-            # Main items table
-            await conn.execute(
-                "CREATE TABLE IF NOT EXISTS items "
-                "(pk TEXT, sk TEXT, item_json TEXT, PRIMARY KEY (pk, sk))"
-            )
-
-            # GSI tables
-            for gsi in config.gsi_definitions:
-                await conn.execute(
-                    f"CREATE TABLE IF NOT EXISTS gsi_{gsi.index_name} "
-                    "(pk TEXT, sk TEXT, item_json TEXT, PRIMARY KEY (pk, sk))"
-                )
-
-            await conn.commit()
+        for config in self._tables.values():
+            await self._open_table(config)
 
         if self._stream_dispatcher is not None:
             await self._stream_dispatcher.start()
 
     async def stop(self) -> None:
+        for committer in self._committers.values():
+            await committer.flush()
+        self._committers.clear()
         if self._stream_dispatcher is not None:
             await self._stream_dispatcher.stop()
+        for pool in self._read_pools.values():
+            await pool.close()
+        self._read_pools.clear()
         for conn in self._connections.values():
             await conn.close()
         self._connections.clear()
@@ -512,34 +886,7 @@ class SqliteDynamoProvider(IKeyValueStore):
     # -- CRUD -----------------------------------------------------------------
 
     async def put_item(self, table_name: str, item: dict) -> None:
-        table_name = self._resolve_table_name(table_name)
-        config = self._tables[table_name]
-        conn = self._connections[table_name]
-
-        pk = _extract_key_value(item, config.key_schema.partition_key)
-        sk = _extract_sk(item, config)
-
-        # Fetch old item for streams and consistency tracking
-        old_item_json = await self._fetch_item_json(conn, pk, sk)
-
-        item_json = json.dumps(item)
-
-        await conn.execute(
-            "INSERT OR REPLACE INTO items (pk, sk, item_json) VALUES (?, ?, ?)",
-            (pk, sk, item_json),
-        )
-
-        # Maintain GSI tables with projection support (P1-22)
-        for gsi in config.gsi_definitions:
-            await self._update_gsi_entry(conn, gsi, item, config)
-
-        await conn.commit()
-
-        # Eventual consistency tracking (P1-27)
-        self._version_store.record_write(table_name, pk, sk, old_item_json)
-
-        # Stream events (P1-26)
-        await self._emit_stream_event(table_name, item, old_item_json, config)
+        await self._write(table_name, put_items=[item])
 
     async def get_item(
         self,
@@ -549,12 +896,14 @@ class SqliteDynamoProvider(IKeyValueStore):
     ) -> dict | None:
         table_name = self._resolve_table_name(table_name)
         config = self._tables[table_name]
-        conn = self._connections[table_name]
 
         pk = _extract_key_value(key, config.key_schema.partition_key)
         sk = _extract_sk(key, config)
 
-        current_json = await self._fetch_item_json(conn, pk, sk)
+        # Read committed state only: the writer connection may hold writes
+        # staged for a pending group commit that have not landed yet.
+        async with self._read_pools[table_name].acquire() as conn:
+            current_json = await self._fetch_item_json(conn, pk, sk)
 
         # Apply eventual consistency (P1-27)
         result_json = self._version_store.get_consistent_item(
@@ -566,35 +915,7 @@ class SqliteDynamoProvider(IKeyValueStore):
         return json.loads(result_json)
 
     async def delete_item(self, table_name: str, key: dict) -> None:
-        table_name = self._resolve_table_name(table_name)
-        config = self._tables[table_name]
-        conn = self._connections[table_name]
-
-        pk = _extract_key_value(key, config.key_schema.partition_key)
-        sk = _extract_sk(key, config)
-
-        # Fetch old item for cleanup and streams
-        old_item_json = await self._fetch_item_json(conn, pk, sk)
-
-        await conn.execute(
-            "DELETE FROM items WHERE pk = ? AND sk = ?",
-            (pk, sk),
-        )
-
-        # Clean up GSI entries
-        if old_item_json is not None:
-            item = json.loads(old_item_json)
-            for gsi in config.gsi_definitions:
-                await self._delete_gsi_entry(conn, gsi, item)
-
-        await conn.commit()
-
-        # Eventual consistency tracking (P1-27)
-        self._version_store.record_write(table_name, pk, sk, old_item_json)
-
-        # Stream events (P1-26)
-        if old_item_json is not None:
-            await self._emit_delete_stream_event(table_name, json.loads(old_item_json), config)
+        await self._write(table_name, delete_keys=[key])
 
     async def update_item(
         self,
@@ -605,25 +926,11 @@ class SqliteDynamoProvider(IKeyValueStore):
         expression_names: dict | None = None,
     ) -> dict:
         existing = await self.get_item(table_name, key)
-        if existing is None:
-            existing = dict(key)
-
-        # Remember whether the item was stored in DynamoDB JSON format so
-        # we can restore it after the evaluator runs.
-        needs_rewrap = _is_dynamo_json(existing)
-
-        # Use the enhanced update expression evaluator (P1-24)
-        apply_update_expression(existing, update_expression, expression_names, expression_values)
-
-        if needs_rewrap:
-            # The evaluator unwraps DynamoDB-typed expression values to
-            # plain Python values, producing a mixed-format item.  Re-wrap
-            # so the stored item and any returned Attributes stay in
-            # DynamoDB JSON.
-            existing = _ensure_dynamo_json(existing)
-
-        await self.put_item(table_name, existing)
-        return existing
+        updated = _apply_update(
+            existing, key, update_expression, expression_values, expression_names
+        )
+        await self.put_item(table_name, updated)
+        return updated
 
     # -- Query / Scan ---------------------------------------------------------
 
@@ -636,47 +943,107 @@ class SqliteDynamoProvider(IKeyValueStore):
         index_name: str | None = None,
         filter_expression: str | None = None,
     ) -> list[dict]:
-        table_name = self._resolve_table_name(table_name)
-        conn = self._connections[table_name]
-        table = f"gsi_{index_name}" if index_name else "items"
-
-        where, params = _parse_key_condition(key_condition, expression_values, expression_names)
+        page = await self.query_page(
+            table_name,
+            key_condition,
+            expression_values,
+            expression_names,
+            index_name,
+            filter_expression,
+        )
+        return page.items
 
-        cursor = await conn.execute(
-            f"SELECT item_json FROM {table} WHERE {where}",
-            params,
+    async def scan(
+        self,
+        table_name: str,
+        filter_expression: str | None = None,
+        expression_values: dict | None = None,
+        expression_names: dict | None = None,
+    ) -> list[dict]:
+        page = await self.scan_page(
+            table_name,
+            filter_expression=filter_expression,
+            expression_values=expression_values,
+            expression_names=expression_names,
         )
-        rows = await cursor.fetchall()
-        items = [json.loads(row[0]) for row in rows]
+        return page.items
 
-        # Apply GSI projection filtering (P1-22)
-        if index_name:
-            items = self._apply_gsi_projection(table_name, index_name, items)
+    async def query_page(
+        self,
+        table_name: str,
+        key_condition: str,
+        expression_values: dict | None = None,
+        expression_names: dict | None = None,
+        index_name: str | None = None,
+        filter_expression: str | None = None,
+        limit: int | None = None,
+        exclusive_start_key: dict | None = None,
+        scan_index_forward: bool = True,
+        count_only: bool = False,
+    ) -> ItemPage:
+        table_name = self._resolve_table_name(table_name)
+        config = self._tables[table_name]
 
-        # Apply post-fetch filter using enhanced expression evaluator (P1-23)
-        items = apply_filter_expression(
-            items, filter_expression, expression_names, expression_values
+        key_schema = config.key_schema
+        key_names = _extract_key_names(config)
+        transform = None
+        if index_name:
+            gsi = _find_gsi(config, index_name)
+            if gsi is not None:
+                key_schema = gsi.key_schema
+                key_names = list(dict.fromkeys(key_names + _key_schema_names(gsi.key_schema)))
+            # Apply GSI projection filtering (P1-22)
+            transform = self._gsi_projector(table_name, index_name)
+
+        where, params = _parse_key_condition(
+            key_condition, expression_values, expression_names, key_schema
+        )
+        request = _PageRequest(
+            table=f"gsi_{index_name}" if index_name else "items",
+            where=where,
+            params=params,
+            limit=limit,
+            start=_start_key_values(exclusive_start_key, key_schema),
+            forward=scan_index_forward,
+            count_only=count_only,
         )
-        return items
+        # Push the filter down into SQL where possible and evaluate the rest
+        # with the enhanced expression evaluator (P1-23).  A projecting GSI
+        # is filtered after projection, so it is always evaluated in Python.
+        request.filter, predicate = _compile_filter(
+            filter_expression, expression_names, expression_values, pushdown=transform is None
+        )
+        async with self._read_pools[table_name].acquire() as conn:
+            return await _fetch_page(conn, request, key_names, predicate, transform)
 
-    async def scan(
+    async def scan_page(
         self,
         table_name: str,
         filter_expression: str | None = None,
         expression_values: dict | None = None,
         expression_names: dict | None = None,
-    ) -> list[dict]:
+        limit: int | None = None,
+        exclusive_start_key: dict | None = None,
+        count_only: bool = False,
+        segment: int | None = None,
+        total_segments: int | None = None,
+    ) -> ItemPage:
         table_name = self._resolve_table_name(table_name)
-        conn = self._connections[table_name]
-        cursor = await conn.execute("SELECT item_json FROM items")
-        rows = await cursor.fetchall()
-        items = [json.loads(row[0]) for row in rows]
-
-        # Apply post-fetch filter using enhanced expression evaluator (P1-23)
-        items = apply_filter_expression(
-            items, filter_expression, expression_names, expression_values
+        config = self._tables[table_name]
+        request = _PageRequest(
+            table="items",
+            limit=limit,
+            start=_start_key_values(exclusive_start_key, config.key_schema),
+            count_only=count_only,
+            segment=_validate_segment(segment, total_segments),
+        )
+        # Push the filter down into SQL where possible and evaluate the rest
+        # with the enhanced expression evaluator (P1-23)
+        request.filter, predicate = _compile_filter(
+            filter_expression, expression_names, expression_values
         )
-        return items
+        async with self._read_pools[table_name].acquire() as conn:
+            return await _fetch_page(conn, request, _extract_key_names(config), predicate)
 
     # -- Batch ----------------------------------------------------------------
 
@@ -697,10 +1064,27 @@ class SqliteDynamoProvider(IKeyValueStore):
     ) -> None:
         total = len(put_items or []) + len(delete_keys or [])
         _validate_batch_size_count(total, "batch_write_items")
-        for item in put_items or []:
-            await self.put_item(table_name, item)
-        for key in delete_keys or []:
-            await self.delete_item(table_name, key)
+        await self._write(table_name, put_items, delete_keys)
+
+    # -- Transactions ---------------------------------------------------------
+
+    async def transact_write_items(self, transact_items: list[dict]) -> None:
+        by_table: dict[str, list[dict]] = {}
+        for transact_item in transact_items:
+            operation = _transact_write_operation(transact_item)
+            if operation is None:
+                continue
+            table_name = self._resolve_table_name(operation["TableName"])
+            if table_name not in self._tables:
+                raise KeyError(f"Table not found: {table_name}")
+            by_table.setdefault(table_name, []).append(transact_item)
+
+        for table_name, operations in by_table.items():
+            config = self._tables[table_name]
+            effects = await self._committers[table_name].write(
+                partial(_stage_transact_writes, config=config, operations=operations)
+            )
+            await self._publish(table_name, config, effects)
 
     # -- Table management ------------------------------------------------------
 
@@ -710,24 +1094,7 @@ class SqliteDynamoProvider(IKeyValueStore):
 
         self._tables[config.table_name] = config
 
-        db_dir = self._data_dir / "dynamodb"
-        db_dir.mkdir(parents=True, exist_ok=True)
-        db_path = db_dir / f"{config.table_name}.db"
-        conn = await aiosqlite.connect(str(db_path))
-        self._connections[config.table_name] = conn
-
-        await conn.execute("PRAGMA journal_mode=WAL")
-        await conn.execute(
-            "CREATE TABLE IF NOT EXISTS items "
-            "(pk TEXT, sk TEXT, item_json TEXT, PRIMARY KEY (pk, sk))"
-        )
-        for gsi in config.gsi_definitions:
-            await conn.execute(
-                f"CREATE TABLE IF NOT EXISTS gsi_{gsi.index_name} "
-                "(pk TEXT, sk TEXT, item_json TEXT, PRIMARY KEY (pk, sk))"
-            )
-        await conn.commit()
-
+        await self._open_table(config)
         return self._build_table_description(config)
 
     async def delete_table(self, table_name: str) -> dict:
@@ -737,6 +1104,12 @@ class SqliteDynamoProvider(IKeyValueStore):
         config = self._tables[table_name]
         description = self._build_table_description(config)
 
+        committer = self._committers.pop(table_name, None)
+        if committer is not None:
+            await committer.flush()
+        pool = self._read_pools.pop(table_name, None)
+        if pool is not None:
+            await pool.close()
         conn = self._connections.pop(table_name)
         await conn.close()
         del self._tables[table_name]
@@ -844,69 +1217,87 @@ class SqliteDynamoProvider(IKeyValueStore):
 
     # -- Private helpers -------------------------------------------------------
 
-    async def _fetch_item_json(self, conn: aiosqlite.Connection, pk: str, sk: str) -> str | None:
+    async def _fetch_item_json(
+        self, conn: aiosqlite.Connection, pk: _StoredKey, sk: _StoredKey
+    ) -> str | None:
         """Fetch raw item JSON from the items table."""
-        cursor = await conn.execute(
+        async with conn.execute(
             "SELECT item_json FROM items WHERE pk = ? AND sk = ?",
             (pk, sk),
-        )
-        row = await cursor.fetchone()
+        ) as cursor:
+            row = await cursor.fetchone()
         return row[0] if row else None
 
-    async def _update_gsi_entry(
+    async def _open_table(self, config: TableConfig) -> None:
+        """Open a table's writer connection and read pool, creating its schema."""
+        db_dir = self._data_dir / "dynamodb"
+        db_dir.mkdir(parents=True, exist_ok=True)
+        db_path = db_dir / f"{config.table_name}.db"
+        conn = await aiosqlite.connect(str(db_path))
+        self._connections[config.table_name] = conn
+
+        # Enable WAL mode for better concurrent access (P1-28)
+        await conn.execute("PRAGMA journal_mode=WAL")
+
+        # Main items table, then one table per GSI
+        key_tables = [("items", config.key_schema)] + [
+            (f"gsi_{gsi.index_name}", gsi.key_schema) for gsi in config.gsi_definitions
+        ]
+        for table, key_schema in key_tables:
+            await _retype_text_keys(conn, table, key_schema)
+            await conn.execute(f"CREATE TABLE IF NOT EXISTS {table} {_KEY_TABLE_COLUMNS}")
+
+        await conn.commit()
+        self._committers[config.table_name] = GroupCommitter(conn, self._group_commit_window_ms)
+        self._read_pools[config.table_name] = ReadConnectionPool(db_path, self._read_pool_size)
+
+    async def _write(
         self,
-        conn: aiosqlite.Connection,
-        gsi: GsiDefinition,
-        item: dict,
-        table_config: TableConfig,
+        table_name: str,
+        put_items: list[dict] | None = None,
+        delete_keys: list[dict] | None = None,
     ) -> None:
-        """Insert or replace an item in a GSI table with projection support."""
-        gsi_pk = _extract_key_value(item, gsi.key_schema.partition_key)
-        if not gsi_pk:
-            return  # Item doesn't project into this GSI
-        gsi_sk = (
-            _extract_key_value(item, gsi.key_schema.sort_key) if gsi.key_schema.sort_key else ""
-        )
-        projected_json = _project_item_for_gsi(item, gsi, table_config)
-        await conn.execute(
-            f"INSERT OR REPLACE INTO gsi_{gsi.index_name} (pk, sk, item_json) VALUES (?, ?, ?)",
-            (gsi_pk, gsi_sk, projected_json),
+        """Apply puts then deletes in one transaction and publish the results."""
+        table_name = self._resolve_table_name(table_name)
+        config = self._tables[table_name]
+        effects = await self._committers[table_name].write(
+            partial(
+                _stage_writes,
+                config=config,
+                put_items=put_items or [],
+                delete_keys=delete_keys or [],
+            )
         )
+        await self._publish(table_name, config, effects)
 
-    async def _delete_gsi_entry(
-        self,
-        conn: aiosqlite.Connection,
-        gsi: GsiDefinition,
-        item: dict,
+    async def _publish(
+        self, table_name: str, config: TableConfig, effects: list[_WriteEffect]
     ) -> None:
-        """Delete an item from a GSI table."""
-        gsi_pk = _extract_key_value(item, gsi.key_schema.partition_key)
-        gsi_sk = (
-            _extract_key_value(item, gsi.key_schema.sort_key) if gsi.key_schema.sort_key else ""
-        )
-        await conn.execute(
-            f"DELETE FROM gsi_{gsi.index_name} WHERE pk = ? AND sk = ?",
-            (gsi_pk, gsi_sk),
-        )
+        """Record consistency versions and emit stream events for committed writes."""
+        for effect in effects:
+            # Eventual consistency tracking (P1-27)
+            self._version_store.record_write(table_name, effect.pk, effect.sk, effect.old_item_json)
+
+            # Stream events (P1-26)
+            if effect.new_item is not None:
+                await self._emit_stream_event(
+                    table_name, effect.new_item, effect.old_item_json, config
+                )
+            elif effect.old_item_json is not None:
+                await self._emit_delete_stream_event(
+                    table_name, json.loads(effect.old_item_json), config
+                )
 
-    def _apply_gsi_projection(
-        self, table_name: str, index_name: str, items: list[dict]
-    ) -> list[dict]:
-        """Apply GSI projection filtering to query results."""
+    def _gsi_projector(self, table_name: str, index_name: str) -> Callable[[dict], dict] | None:
+        """Return a per-item GSI projection function, or None if nothing is dropped."""
         config = self._tables[table_name]
         gsi = _find_gsi(config, index_name)
-        if gsi is None or gsi.projection_type.upper() == "ALL":
-            return items
+        if gsi is None or gsi.projection_type.upper() != "KEYS_ONLY":
+            return None
 
         key_attrs = set(_extract_key_names(config))
-        key_attrs.add(gsi.key_schema.partition_key.name)
-        if gsi.key_schema.sort_key:
-            key_attrs.add(gsi.key_schema.sort_key.name)
-
-        if gsi.projection_type.upper() == "KEYS_ONLY":
-            return [{k: v for k, v in item.items() if k in key_attrs} for item in items]
-
-        return items
+        key_attrs.update(_key_schema_names(gsi.key_schema))
+        return lambda item: {k: v for k, v in item.items() if k in key_attrs}
 
     async def _emit_stream_event(
         self,
@@ -953,13 +1344,21 @@ class SqliteDynamoProvider(IKeyValueStore):
 # ---------------------------------------------------------------------------
 
 
-def _extract_sk(item: dict, config: TableConfig) -> str:
+def _extract_sk(item: dict, config: TableConfig) -> _StoredKey:
     """Extract the sort key value from an item, or empty string if no SK."""
     if config.key_schema.sort_key:
         return _extract_key_value(item, config.key_schema.sort_key)
     return ""
 
 
+def _key_schema_names(key_schema: KeySchema) -> list[str]:
+    """Get the partition and (optional) sort key names of a key schema."""
+    names = [key_schema.partition_key.name]
+    if key_schema.sort_key:
+        names.append(key_schema.sort_key.name)
+    return names
+
+
 def _find_gsi(config: TableConfig, index_name: str) -> GsiDefinition | None:
     """Find a GSI definition by name."""
     for gsi in config.gsi_definitions:
@@ -981,6 +1380,19 @@ def _build_keys_dict(item: dict, config: TableConfig) -> dict[str, Any]:
     return keys
 
 
+def _validate_segment(segment: int | None, total_segments: int | None) -> tuple[int, int] | None:
+    """Validate Parallel Scan parameters and return ``(segment, total_segments)``."""
+    if segment is None and total_segments is None:
+        return None
+    if segment is None or total_segments is None:
+        raise ValueError("Segment and TotalSegments must be specified together")
+    if not 1 <= total_segments <= _MAX_TOTAL_SEGMENTS:
+        raise ValueError(f"TotalSegments must be between 1 and {_MAX_TOTAL_SEGMENTS}")
+    if not 0 <= segment < total_segments:
+        raise ValueError("Segment must be greater than or equal to 0 and less than TotalSegments")
+    return segment, total_segments
+
+
 def _validate_batch_size(items: list, operation: str) -> None:
     """Validate that a batch doesn't exceed the DynamoDB 25-item limit."""
     if len(items) > _MAX_BATCH_SIZE:
@@ -0,0 +1,91 @@
+"""Read-only SQLite connection pool for DynamoDB table reads.
+
+Each table database has a single writer connection owned by
+``SqliteDynamoProvider``.  Because the databases run in WAL mode, any
+number of readers can proceed alongside that writer, so Query and Scan
+pages are served from a small pool of read-only connections instead of
+queueing behind writes on the writer's thread.  Each aiosqlite
+connection runs on its own thread, which lets Parallel Scan segments
+execute side by side.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import zlib
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import aiosqlite
+
+# Name of the SQL function that maps a partition key to its scan segment.
+SEGMENT_FUNCTION = "lws_segment"
+
+DEFAULT_READ_POOL_SIZE = 4
+
+
+def segment_of(pk: str | int | float, total_segments: int) -> int:
+    """Return the Parallel Scan segment that owns partition key *pk*.
+
+    Items are bucketed by a stable hash of the stored partition key, so
+    every item of a partition lands in the same segment and the segments
+    together cover the table exactly once.
+    """
+    return zlib.crc32(str(pk).encode("utf-8")) % total_segments
+
+
+class ReadConnectionPool:
+    """Lazily opened pool of read-only connections to one table database.
+
+    Parameters
+    ----------
+    db_path : Path
+        Path to the table's SQLite database file.  The writer connection
+        must already have created it and enabled WAL mode.
+    size : int
+        Maximum number of read connections to open.
+    """
+
+    def __init__(self, db_path: Path, size: int = DEFAULT_READ_POOL_SIZE) -> None:
+        self._db_path = db_path
+        self._size = max(1, size)
+        self._idle: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self._connections: list[aiosqlite.Connection] = []
+        self._open_lock = asyncio.Lock()
+
+    @property
+    def size(self) -> int:
+        """Return the maximum number of read connections."""
+        return self._size
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a read connection for the duration of the ``async with`` block."""
+        conn = await self._checkout()
+        try:
+            yield conn
+        finally:
+            if conn in self._connections:
+                self._idle.put_nowait(conn)
+
+    async def close(self) -> None:
+        """Close every pooled connection."""
+        connections, self._connections = self._connections, []
+        self._idle = asyncio.Queue()
+        for conn in connections:
+            await conn.close()
+
+    async def _checkout(self) -> aiosqlite.Connection:
+        if self._idle.empty():
+            async with self._open_lock:
+                if len(self._connections) < self._size:
+                    conn = await self._open()
+                    self._connections.append(conn)
+                    return conn
+        return await self._idle.get()
+
+    async def _open(self) -> aiosqlite.Connection:
+        conn = await aiosqlite.connect(f"{self._db_path.resolve().as_uri()}?mode=ro", uri=True)
+        await conn.create_function(SEGMENT_FUNCTION, 2, segment_of, deterministic=True)
+        return conn
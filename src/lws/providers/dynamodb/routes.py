@@ -14,6 +14,7 @@ from fastapi import APIRouter, FastAPI, Request, Response
 from lws.interfaces.key_value_store import (
     GsiDefinition,
     IKeyValueStore,
+    ItemPage,
     KeyAttribute,
     KeySchema,
     TableConfig,
@@ -136,28 +137,48 @@ class DynamoDbRouter:
         expression_names = body.get("ExpressionAttributeNames")
         index_name = body.get("IndexName")
         filter_expression = body.get("FilterExpression")
-        items = await self.store.query(
+        error = _validate_limit(body)
+        if error is not None:
+            return error
+        count_only = body.get("Select") == "COUNT"
+        page = await self.store.query_page(
             table_name,
             key_condition,
             expression_values=expression_values,
             expression_names=expression_names,
             index_name=index_name,
             filter_expression=filter_expression,
+            limit=body.get("Limit"),
+            exclusive_start_key=body.get("ExclusiveStartKey"),
+            scan_index_forward=body.get("ScanIndexForward", True),
+            count_only=count_only,
         )
-        return _json_response({"Items": items, "Count": len(items)})
+        return _json_response(_page_result(page, count_only))
 
     async def _scan(self, body: dict) -> Response:
         table_name = body["TableName"]
         filter_expression = body.get("FilterExpression")
         expression_values = body.get("ExpressionAttributeValues")
         expression_names = body.get("ExpressionAttributeNames")
-        items = await self.store.scan(
-            table_name,
-            filter_expression=filter_expression,
-            expression_values=expression_values,
-            expression_names=expression_names,
-        )
-        return _json_response({"Items": items, "Count": len(items)})
+        error = _validate_limit(body)
+        if error is not None:
+            return error
+        count_only = body.get("Select") == "COUNT"
+        try:
+            page = await self.store.scan_page(
+                table_name,
+                filter_expression=filter_expression,
+                expression_values=expression_values,
+                expression_names=expression_names,
+                limit=body.get("Limit"),
+                exclusive_start_key=body.get("ExclusiveStartKey"),
+                count_only=count_only,
+                segment=body.get("Segment"),
+                total_segments=body.get("TotalSegments"),
+            )
+        except ValueError as exc:
+            return _error_response("ValidationException", str(exc))
+        return _json_response(_page_result(page, count_only))
 
     async def _batch_get_item(self, body: dict) -> Response:
         request_items = body.get("RequestItems", {})
@@ -255,23 +276,8 @@ class DynamoDbRouter:
         if failure is not None:
             return failure
 
-        # Pass 2: execute writes
-        for transact_item in transact_items:
-            if "Put" in transact_item:
-                put = transact_item["Put"]
-                await self.store.put_item(put["TableName"], put["Item"])
-            elif "Delete" in transact_item:
-                delete = transact_item["Delete"]
-                await self.store.delete_item(delete["TableName"], delete["Key"])
-            elif "Update" in transact_item:
-                update = transact_item["Update"]
-                await self.store.update_item(
-                    update["TableName"],
-                    update["Key"],
-                    update.get("UpdateExpression", ""),
-                    expression_values=update.get("ExpressionAttributeValues"),
-                    expression_names=update.get("ExpressionAttributeNames"),
-                )
+        # Pass 2: execute writes, one transaction per table
+        await self.store.transact_write_items(transact_items)
         return _json_response({})
 
     async def _check_transact_conditions(self, transact_items: list) -> Response | None:
@@ -368,6 +374,28 @@ def _json_response(data: dict, status_code: int = 200) -> Response:
     )
 
 
+def _validate_limit(body: dict) -> Response | None:
+    """Return a ValidationException response if ``Limit`` is not a positive integer."""
+    limit = body.get("Limit")
+    if limit is None or (isinstance(limit, int) and limit >= 1):
+        return None
+    return _error_response(
+        "ValidationException",
+        "1 validation error detected: Value at 'limit' failed to satisfy constraint: "
+        "Member must have value greater than or equal to 1",
+    )
+
+
+def _page_result(page: ItemPage, count_only: bool) -> dict:
+    """Build a Query/Scan response body from a result page."""
+    result: dict = {"Count": page.count, "ScannedCount": page.scanned_count}
+    if not count_only:
+        result["Items"] = page.items
+    if page.last_evaluated_key is not None:
+        result["LastEvaluatedKey"] = page.last_evaluated_key
+    return result
+
+
 def _parse_table_config(body: dict) -> TableConfig:
     """Parse an AWS CreateTable request body into a TableConfig."""
     table_name = body["TableName"]
@@ -12,9 +12,14 @@ Supports:
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
-from lws.providers.dynamodb.expressions import _resolve_path, _unwrap_dynamo_value
+from lws.providers.dynamodb.expressions import (
+    EXPRESSION_CACHE_SIZE,
+    _resolve_path,
+    _unwrap_dynamo_value,
+)
 from lws.providers.dynamodb.parser_base import BaseParser, Token, scan_number_literal
 
 # ---------------------------------------------------------------------------
@@ -571,8 +576,13 @@ def _add_values(current: Any, value: Any) -> Any:
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
 def parse_update_expression(expression: str) -> UpdateActions:
-    """Parse a DynamoDB UpdateExpression string into UpdateActions."""
+    """Parse a DynamoDB UpdateExpression string into UpdateActions.
+
+    Results are cached by expression text, so the returned actions are
+    shared between callers and must not be mutated.
+    """
     tokens = tokenize(expression)
     parser = _Parser(tokens)
     return parser.parse()
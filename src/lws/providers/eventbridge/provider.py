@@ -2,7 +2,8 @@
 
 Implements the ``IEventBus`` interface and ``Provider`` lifecycle.
 Manages event buses, rules, pattern-based routing, and scheduled rules.
-Lambda targets are invoked via registered compute providers.
+Lambda targets are invoked via registered compute providers, with
+deliveries queued on a ``DeliveryScheduler``.
 """
 
 from __future__ import annotations
@@ -17,7 +18,8 @@ from dataclasses import dataclass, field
 from lws.interfaces.compute import ICompute, LambdaContext
 from lws.interfaces.event_bus import IEventBus
 from lws.interfaces.provider import ProviderStatus
-from lws.providers.eventbridge.pattern_matcher import match_event
+from lws.providers._shared.delivery_scheduler import DeliveryScheduler
+from lws.providers.eventbridge.rule_index import RuleIndex
 from lws.providers.eventbridge.scheduler import ScheduledRule, ScheduleRunner
 
 logger = logging.getLogger(__name__)
@@ -62,22 +64,31 @@ class EventBridgeProvider(IEventBus):
         List of event bus configurations to create at startup.
     rules:
         List of rule configurations to register at startup.
+    scheduler:
+        Delivery scheduler shared with other fan-out providers.  A private
+        one is created when omitted.
     """
 
     def __init__(
         self,
         buses: list[EventBusConfig] | None = None,
         rules: list[RuleConfig] | None = None,
+        scheduler: DeliveryScheduler | None = None,
     ) -> None:
         self._bus_configs = buses or []
         self._rule_configs = rules or []
         self._buses: dict[str, EventBusConfig] = {}
         self._rules: dict[str, RuleConfig] = {}
+        # Compiled patterns per bus, maintained alongside ``_rules``
+        self._indexes: dict[str, RuleIndex] = {}
         self._tags: dict[str, dict[str, str]] = {}
         self._status = ProviderStatus.STOPPED
         self._compute_providers: dict[str, ICompute] = {}
         self._lock = asyncio.Lock()
         self._scheduler = ScheduleRunner()
+        # A delivery scheduler passed in is shared and stopped by its owner
+        self._owns_delivery = scheduler is None
+        self._delivery = scheduler or DeliveryScheduler()
 
     # -- Provider lifecycle ---------------------------------------------------
 
@@ -92,7 +103,9 @@ class EventBridgeProvider(IEventBus):
             for bus_config in self._bus_configs:
                 self._buses[bus_config.bus_name] = bus_config
             for rule_config in self._rule_configs:
-                self._rules[rule_config.rule_name] = rule_config
+                self._store_rule(rule_config)
+            if self._owns_delivery:
+                await self._delivery.start()
             self._status = ProviderStatus.RUNNING
 
         scheduled = self._build_scheduled_rules()
@@ -102,9 +115,12 @@ class EventBridgeProvider(IEventBus):
     async def stop(self) -> None:
         """Stop all scheduled tasks and clear state."""
         await self._scheduler.stop()
+        if self._owns_delivery:
+            await self._delivery.stop()
         async with self._lock:
             self._buses.clear()
             self._rules.clear()
+            self._indexes.clear()
             self._tags.clear()
             self._status = ProviderStatus.STOPPED
 
@@ -123,14 +139,20 @@ class EventBridgeProvider(IEventBus):
         """Publish one or more events to the event bus.
 
         Each entry should contain: Source, DetailType, Detail, and
-        optionally EventBusName.  Returns a list of result entries.
+        optionally EventBusName.  Returns a list of result entries.  The
+        whole batch is matched against the compiled rule indexes before
+        any target is dispatched.
         """
-        results: list[dict] = []
+        batch = []
         for entry in entries:
             event_id = str(uuid.uuid4())
             event = _build_event_envelope(entry, event_id)
             bus_name = entry.get("EventBusName", "default")
-            matched = await self._route_event(event, bus_name)
+            batch.append((event_id, event, bus_name, self._match_rules(event, bus_name)))
+
+        results: list[dict] = []
+        for event_id, event, bus_name, rules in batch:
+            matched = await self._dispatch_rules(rules, event)
             results.append({"EventId": event_id, "ErrorCode": None, "ErrorMessage": None})
             logger.debug(
                 "Event %s routed to %d rule(s) on bus '%s'",
@@ -159,7 +181,7 @@ class EventBridgeProvider(IEventBus):
             targets=targets or [],
         )
         async with self._lock:
-            self._rules[rule_name] = rule
+            self._store_rule(rule)
         arn = f"arn:aws:events:us-east-1:000000000000:rule/{rule_name}"
         return arn
 
@@ -209,9 +231,10 @@ class EventBridgeProvider(IEventBus):
     async def delete_rule(self, rule_name: str) -> None:
         """Delete a rule. Raises KeyError if not found."""
         async with self._lock:
-            if rule_name not in self._rules:
+            rule = self._rules.pop(rule_name, None)
+            if rule is None:
                 raise KeyError(f"Rule not found: {rule_name}")
-            del self._rules[rule_name]
+            self._indexes[rule.event_bus_name].remove(rule_name)
 
     def describe_rule(
         self,
@@ -336,25 +359,39 @@ class EventBridgeProvider(IEventBus):
 
     # -- Routing --------------------------------------------------------------
 
-    async def _route_event(self, event: dict, bus_name: str) -> int:
-        """Route an event to all matching rules on the given bus.
+    def _store_rule(self, rule: RuleConfig) -> None:
+        """Store *rule* and compile it into its bus's index."""
+        previous = self._rules.get(rule.rule_name)
+        if previous is not None and previous.event_bus_name != rule.event_bus_name:
+            self._indexes[previous.event_bus_name].remove(rule.rule_name)
+        self._rules[rule.rule_name] = rule
+        self._indexes.setdefault(rule.event_bus_name, RuleIndex()).add(rule)
 
-        Returns the number of rules that matched.
+    def _match_rules(self, event: dict, bus_name: str) -> list[RuleConfig]:
+        """Return the enabled rules on *bus_name* whose pattern matches *event*."""
+        index = self._indexes.get(bus_name)
+        return index.match(event) if index is not None else []
+
+    async def _dispatch_rules(self, rules: list[RuleConfig], event: dict) -> int:
+        """Queue delivery of *event* to every target of *rules*.
+
+        Returns the number of rules.
         """
-        matched = 0
-        rules = self.list_rules(bus_name)
         for rule in rules:
-            if not rule.enabled or not rule.event_pattern:
-                continue
-            if match_event(rule.event_pattern, event):
-                matched += 1
-                for target in rule.targets:
-                    asyncio.create_task(self._dispatch_target(target, event))
-        return matched
-
-    async def _dispatch_target(self, target: RuleTarget, event: dict) -> None:
-        """Dispatch an event to a single rule target."""
-        try:
+            for target in rule.targets:
+                await self._submit_target(target, event)
+        return len(rules)
+
+    async def _submit_target(self, target: RuleTarget, event: dict) -> None:
+        """Queue delivery of *event* to a single rule target."""
+        function_name = _extract_function_name(target.arn)
+        await self._delivery.submit(
+            f"lambda:{function_name}", (target, event), self._dispatch_target
+        )
+
+    async def _dispatch_target(self, items: list[tuple[RuleTarget, dict]]) -> None:
+        """Invoke the Lambda function behind each queued rule target."""
+        for target, event in items:
             function_name = _extract_function_name(target.arn)
             compute = self._compute_providers.get(function_name)
             if compute is None:
@@ -362,7 +399,7 @@ class EventBridgeProvider(IEventBus):
                     "No compute provider for target: %s",
                     target.arn,
                 )
-                return
+                continue
             context = LambdaContext(
                 function_name=function_name,
                 memory_limit_in_mb=128,
@@ -371,11 +408,6 @@ class EventBridgeProvider(IEventBus):
                 invoked_function_arn=target.arn,
             )
             await compute.invoke(event, context)
-        except Exception:
-            logger.exception(
-                "Failed to dispatch event to target %s",
-                target.arn,
-            )
 
     # -- Scheduling -----------------------------------------------------------
 
@@ -400,7 +432,7 @@ class EventBridgeProvider(IEventBus):
         async def _callback() -> None:
             event = _build_scheduled_event(rule)
             for target in rule.targets:
-                await self._dispatch_target(target, event)
+                await self._submit_target(target, event)
 
         return _callback
 
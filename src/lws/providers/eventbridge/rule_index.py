@@ -0,0 +1,246 @@
+"""Compiled EventBridge rule index.
+
+``match_event`` interprets a pattern dict on every call.  For buses with
+hundreds of rules and high event rates, this module instead compiles each
+rule's pattern once, when the rule is stored, into nested closures:
+exact values become set lookups and prefix/numeric/anything-but/exists
+conditions become precompiled predicates.
+
+:class:`RuleIndex` also prunes rules before running those predicates.
+A rule whose pattern lists only exact values for ``source``,
+``detail-type`` or another top-level field is filed under each of those
+values, so an event only reaches the rules filed under its own values
+plus the few rules that could not be indexed.  Matching semantics are
+identical to :func:`~lws.providers.eventbridge.pattern_matcher.match_event`.
+"""
+
+from __future__ import annotations
+
+import operator
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from lws.providers._shared.numeric import eval_numeric_range
+
+ValuePredicate = Callable[[object], bool]
+EventPredicate = Callable[[dict], bool]
+
+# Top-level fields tried first when choosing a rule's index key.
+_PREFERRED_KEYS = ("source", "detail-type")
+
+_NUMERIC_OPS: dict[str, Callable[[float, float], bool]] = {
+    "=": operator.eq,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+
+# ------------------------------------------------------------------
+# Pattern compilation
+# ------------------------------------------------------------------
+
+
+def compile_pattern(pattern: dict) -> EventPredicate:
+    """Compile an EventBridge *pattern* into a predicate over event dicts."""
+    checks = [(key, _compile_key(conditions)) for key, conditions in pattern.items()]
+
+    def _match(event: dict) -> bool:
+        for key, check in checks:
+            if not check(event.get(key)):
+                return False
+        return True
+
+    return _match
+
+
+def _compile_key(conditions: object) -> ValuePredicate:
+    """Compile the conditions of one pattern key (nested dict or list)."""
+    if isinstance(conditions, dict):
+        nested = compile_pattern(conditions)
+        return lambda value: isinstance(value, dict) and nested(value)
+    if not isinstance(conditions, list):
+        return lambda _value: False
+    return _compile_condition_list(conditions)
+
+
+def _compile_condition_list(conditions: list) -> ValuePredicate:
+    """Compile a list of conditions, at least one of which must match."""
+    exact = [c for c in conditions if not isinstance(c, dict)]
+    predicates = [_compile_condition(c) for c in conditions if isinstance(c, dict)]
+    exact_set = _hashable_set(exact)
+
+    def _match(value: object) -> bool:
+        if exact_set is not None:
+            try:
+                if value in exact_set:
+                    return True
+            except TypeError:
+                pass
+        elif any(value == candidate for candidate in exact):
+            return True
+        for predicate in predicates:
+            if predicate(value):
+                return True
+        return False
+
+    return _match
+
+
+def _compile_condition(condition: dict) -> ValuePredicate:
+    """Compile a structured condition; key precedence mirrors ``match_event``."""
+    if "exists" in condition:
+        should_exist = condition["exists"]
+        return lambda value: (value is not None) == bool(should_exist)
+    if "prefix" in condition:
+        prefix = condition["prefix"]
+        return lambda value: isinstance(value, str) and value.startswith(prefix)
+    if "numeric" in condition:
+        return _compile_numeric(condition["numeric"])
+    if "anything-but" in condition:
+        return _compile_anything_but(condition["anything-but"])
+    return lambda _value: False
+
+
+def _compile_numeric(operators: list) -> ValuePredicate:
+    """Compile ``[">=", 100, "<", 200]`` into a range check."""
+    try:
+        bounds = [
+            (_NUMERIC_OPS.get(operators[i]), float(operators[i + 1]))
+            for i in range(0, len(operators) - 1, 2)
+        ]
+    except (TypeError, ValueError, LookupError):
+        # Malformed operands: defer to the interpreter's behaviour
+        return lambda value: eval_numeric_range(value, operators)
+
+    def _match(value: object) -> bool:
+        try:
+            number = float(value)  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            return False
+        return all(op is not None and op(number, operand) for op, operand in bounds)
+
+    return _match
+
+
+def _compile_anything_but(exclusions: object) -> ValuePredicate:
+    """Compile an ``anything-but`` value or list of values."""
+    excluded = exclusions if isinstance(exclusions, list) else [exclusions]
+    return lambda value: value is not None and all(value != exc for exc in excluded)
+
+
+def _hashable_set(values: list) -> frozenset | None:
+    """Return *values* as a frozenset, or None if any is unhashable."""
+    if not all(isinstance(v, Hashable) for v in values):
+        return None
+    return frozenset(values)
+
+
+# ------------------------------------------------------------------
+# Index
+# ------------------------------------------------------------------
+
+
+@dataclass
+class CompiledRule:
+    """A rule together with its compiled pattern and insertion order."""
+
+    rule: Any
+    matches: EventPredicate
+    seq: int
+
+
+class RuleIndex:
+    """Rules of one event bus, filed by an exact-match top-level field.
+
+    Rules are duck-typed: they need ``rule_name``, ``event_pattern`` and
+    ``enabled`` attributes.  ``enabled`` is read at match time, so
+    enabling or disabling a rule needs no re-indexing.
+    """
+
+    def __init__(self) -> None:
+        self._rules: dict[str, CompiledRule] = {}
+        self._keys: dict[str, tuple[str, frozenset] | None] = {}
+        self._by_value: dict[str, dict[Hashable, list[CompiledRule]]] = {}
+        self._unindexed: list[CompiledRule] = []
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def add(self, rule: Any) -> None:
+        """Compile and index *rule*, replacing any rule with the same name."""
+        previous = self._rules.get(rule.rule_name)
+        self.remove(rule.rule_name)
+        pattern = rule.event_pattern
+        if not pattern:
+            return
+        # A replaced rule keeps its position, as in the provider's rule dict
+        if previous is not None:
+            seq = previous.seq
+        else:
+            self._seq += 1
+            seq = self._seq
+        index_key = _choose_index_key(pattern)
+        self._keys[rule.rule_name] = index_key
+        if index_key is None:
+            compiled = CompiledRule(rule=rule, matches=compile_pattern(pattern), seq=seq)
+            self._rules[rule.rule_name] = compiled
+            self._unindexed.append(compiled)
+            return
+        field_name, values = index_key
+        # The bucket lookup already checked the indexed field
+        rest = {k: v for k, v in pattern.items() if k != field_name}
+        compiled = CompiledRule(rule=rule, matches=compile_pattern(rest), seq=seq)
+        self._rules[rule.rule_name] = compiled
+        buckets = self._by_value.setdefault(field_name, {})
+        for value in values:
+            buckets.setdefault(value, []).append(compiled)
+
+    def remove(self, rule_name: str) -> None:
+        """Drop the rule named *rule_name*, if indexed."""
+        compiled = self._rules.pop(rule_name, None)
+        if compiled is None:
+            return
+        index_key = self._keys.pop(rule_name)
+        if index_key is None:
+            self._unindexed.remove(compiled)
+            return
+        field_name, values = index_key
+        buckets = self._by_value[field_name]
+        for value in values:
+            buckets[value].remove(compiled)
+            if not buckets[value]:
+                del buckets[value]
+
+    def match(self, event: dict) -> list[Any]:
+        """Return the enabled rules matching *event*, in insertion order."""
+        candidates = list(self._unindexed)
+        for field_name, buckets in self._by_value.items():
+            value = event.get(field_name)
+            if isinstance(value, Hashable):
+                candidates.extend(buckets.get(value, ()))
+        candidates.sort(key=lambda c: c.seq)
+        return [c.rule for c in candidates if c.rule.enabled and c.matches(event)]
+
+
+def _choose_index_key(pattern: dict) -> tuple[str, frozenset] | None:
+    """Pick a top-level field whose conditions are all hashable exact values."""
+    ordered = [k for k in _PREFERRED_KEYS if k in pattern]
+    ordered += [k for k in pattern if k not in _PREFERRED_KEYS]
+    for key in ordered:
+        values = _exact_values(pattern[key])
+        if values is not None:
+            return key, values
+    return None
+
+
+def _exact_values(conditions: object) -> frozenset | None:
+    """Return the values of a non-empty list of plain exact conditions, or None."""
+    if not isinstance(conditions, list) or not conditions:
+        return None
+    if any(isinstance(c, (dict, list)) for c in conditions):
+        return None
+    return _hashable_set(conditions)
@@ -44,6 +44,15 @@ class LambdaFunctionUrlProvider(Provider):
         """Return the Lambda function name."""
         return self._function_name
 
+    def with_compute(self, compute: Any) -> LambdaFunctionUrlProvider:
+        """Return a provider serving the same URL from another compute provider."""
+        return LambdaFunctionUrlProvider(
+            function_name=self._function_name,
+            compute=compute,
+            port=self._port,
+            cors_config=self._cors_config,
+        )
+
     async def start(self) -> None:
         app = create_lambda_function_url_app(self._function_name, self._compute, self._cors_config)
         self._server, self._task = await start_uvicorn_server(app, self._port)
@@ -6,6 +6,7 @@ import asyncio
 import json
 import os
 import time
+from pathlib import Path
 
 from lws.interfaces import (
     ComputeConfig,
@@ -15,18 +16,29 @@ from lws.interfaces import (
     ProviderStatus,
 )
 from lws.providers.lambda_runtime.result_parser import parse_invocation_output
+from lws.providers.lambda_runtime.worker_pool import WorkerPool, WorkerPoolConfig
 
 
 class SubprocessCompute(ICompute):
     """Base class for Lambda compute providers that run handlers via subprocess.
 
     Subclasses must implement ``_run_subprocess`` and ``_build_env``.
+
+    By default every invocation starts a fresh subprocess.  Passing a
+    ``WorkerPoolConfig`` as *pool* keeps warm runtimes instead, started
+    with the command returned by ``_serve_command``.
     """
 
-    def __init__(self, config: ComputeConfig, sdk_env: dict[str, str]) -> None:
+    def __init__(
+        self,
+        config: ComputeConfig,
+        sdk_env: dict[str, str],
+        pool: WorkerPoolConfig | None = None,
+    ) -> None:
         self._config = config
         self._sdk_env = sdk_env
         self._status = ProviderStatus.STOPPED
+        self._pool = WorkerPool(self._serve_command(), pool) if pool is not None else None
 
     @property
     def sdk_env(self) -> dict[str, str]:
@@ -37,6 +49,9 @@ class SubprocessCompute(ICompute):
     def sdk_env(self, value: dict[str, str]) -> None:
         """Set the SDK environment variables."""
         self._sdk_env = value
+        if self._pool is not None:
+            # Warm workers captured the old environment at start-up
+            self._pool.retire_all()
 
     # -- Provider lifecycle ---------------------------------------------------
 
@@ -46,7 +61,9 @@ class SubprocessCompute(ICompute):
         return f"lambda:{self._config.function_name}"
 
     async def stop(self) -> None:
-        """Mark provider as STOPPED."""
+        """Stop warm workers and mark provider as STOPPED."""
+        if self._pool is not None:
+            await self._pool.close()
         self._status = ProviderStatus.STOPPED
 
     async def health_check(self) -> bool:
@@ -58,20 +75,37 @@ class SubprocessCompute(ICompute):
     async def invoke(self, event: dict, context: LambdaContext) -> InvocationResult:
         """Invoke a Lambda handler in a subprocess with timeout enforcement."""
         env = self._build_env(context)
-        event_json = json.dumps(event)
 
         start = time.monotonic()
         try:
-            result = await asyncio.wait_for(
-                self._run_subprocess(env, event_json),
+            output, cold_start = await asyncio.wait_for(
+                self._run_handler(env, event, context),
                 timeout=self._config.timeout,
             )
         except TimeoutError:
             duration_ms = (time.monotonic() - start) * 1000
             return self._timeout_result(duration_ms, context.aws_request_id)
+        except (ConnectionError, EOFError):
+            # A warm worker died mid-call and the pool discarded it; report
+            # it the way a one-shot subprocess with no output is reported.
+            output, cold_start = "", False
 
         duration_ms = (time.monotonic() - start) * 1000
-        return parse_invocation_output(result, duration_ms, context.aws_request_id)
+        result = parse_invocation_output(output, duration_ms, context.aws_request_id)
+        result.cold_start = cold_start
+        return result
+
+    async def recycle_workers(self, changed_path: Path | None = None) -> None:
+        """Retire warm workers so the next invocation loads fresh code.
+
+        When *changed_path* is given, workers are only recycled if it lies
+        inside this function's code path.
+        """
+        if self._pool is None:
+            return
+        if changed_path is not None and not changed_path.is_relative_to(self._config.code_path):
+            return
+        await self._pool.recycle()
 
     def _timeout_result(self, duration_ms: float, request_id: str) -> InvocationResult:
         """Build a timeout error result."""
@@ -98,10 +132,27 @@ class SubprocessCompute(ICompute):
         env["AWS_LAMBDA_FUNCTION_MEMORY_SIZE"] = str(self._config.memory_size)
         return env
 
+    async def _run_handler(
+        self, env: dict[str, str], event: dict, context: LambdaContext
+    ) -> tuple[str, bool]:
+        """Run the handler and return its raw output and whether it was cold."""
+        if self._pool is None:
+            return await self._run_subprocess(env, json.dumps(event)), True
+        request = {
+            "event": event,
+            "request_id": context.aws_request_id,
+            "function_arn": context.invoked_function_arn,
+        }
+        return await self._pool.invoke(env, request)
+
     async def _run_subprocess(self, env: dict[str, str], event_json: str) -> str:
         """Spawn the subprocess and return its stdout. Must be overridden."""
         raise NotImplementedError
 
+    def _serve_command(self) -> list[str]:
+        """Return the command that starts a warm worker. Must be overridden."""
+        raise NotImplementedError
+
     @staticmethod
     async def _exec_and_communicate(*cmd: str, env: dict[str, str], event_json: str) -> str:
         """Create a subprocess, send event_json on stdin, return stdout."""
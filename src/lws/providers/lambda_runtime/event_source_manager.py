@@ -48,13 +48,12 @@ class EventSourceManager:
         esm_uuid = mapping.get("UUID", "")
         event_source_arn = mapping.get("EventSourceArn", "")
         function_ref = mapping.get("FunctionArn", "") or mapping.get("FunctionName", "")
-        batch_size = mapping.get("BatchSize", 10)
 
         # Extract function name from ARN if needed
         function_name = _extract_function_name(function_ref)
 
         if ":sqs:" in event_source_arn:
-            await self._activate_sqs(esm_uuid, event_source_arn, function_name, batch_size)
+            await self._activate_sqs(esm_uuid, event_source_arn, function_name, mapping)
         elif ":dynamodb:" in event_source_arn and "/stream" in event_source_arn:
             self._activate_dynamodb_stream(esm_uuid, event_source_arn, function_name)
         else:
@@ -83,7 +82,7 @@ class EventSourceManager:
         esm_uuid: str,
         event_source_arn: str,
         function_name: str,
-        batch_size: int,
+        mapping: dict[str, Any],
     ) -> None:
         """Activate an SQS event source mapping."""
         queue_name = _extract_queue_name(event_source_arn)
@@ -97,15 +96,10 @@ class EventSourceManager:
             logger.warning("Compute provider not found for %s", function_name)
             return
 
-        mapping = EventSourceMapping(
-            queue_name=queue_name,
-            function_name=function_name,
-            batch_size=batch_size,
-        )
         poller = SqsEventSourcePoller(
             queue_provider=queue_provider,
             compute_providers={function_name: compute},
-            mappings=[mapping],
+            mappings=[_build_sqs_mapping(queue_name, function_name, mapping)],
         )
         await poller.start()
         self._active_pollers[esm_uuid] = poller
@@ -138,6 +132,23 @@ class EventSourceManager:
         logger.info("Activated DynamoDB stream: %s -> %s", table_name, function_name)
 
 
+def _build_sqs_mapping(
+    queue_name: str, function_name: str, mapping: dict[str, Any]
+) -> EventSourceMapping:
+    """Translate CreateEventSourceMapping fields into an ``EventSourceMapping``."""
+    scaling = mapping.get("ScalingConfig") or {}
+    return EventSourceMapping(
+        queue_name=queue_name,
+        function_name=function_name,
+        batch_size=mapping.get("BatchSize", 10),
+        maximum_batching_window=mapping.get("MaximumBatchingWindowInSeconds", 0),
+        maximum_concurrency=scaling.get("MaximumConcurrency", 1),
+        report_batch_item_failures=(
+            "ReportBatchItemFailures" in mapping.get("FunctionResponseTypes", [])
+        ),
+    )
+
+
 def _extract_function_name(function_ref: str) -> str:
     """Extract function name from an ARN or return the string as-is."""
     if function_ref.startswith("arn:"):
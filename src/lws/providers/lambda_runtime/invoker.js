@@ -1,23 +1,34 @@
 // Node.js invoker script for LDK Lambda runtime
 // Reads event from stdin, loads handler, invokes, writes result to stdout
+//
+// With --serve it runs as a warm pool worker instead: the handler is loaded
+// once, each stdin line is a request ({event, request_id, function_arn}) and
+// each response is written as one stdout line.
 
 const fs = require('fs');
 
-async function main() {
+function loadHandler() {
     const handlerSpec = process.env.LDK_HANDLER; // e.g., "index.handler"
     const codePath = process.env.LDK_CODE_PATH;
 
-    // Read event from stdin
-    const input = fs.readFileSync('/dev/stdin', 'utf8');
-    const event = JSON.parse(input);
-
     // Parse handler spec: "file.function"
     const lastDot = handlerSpec.lastIndexOf('.');
     const modulePath = handlerSpec.substring(0, lastDot);
     const functionName = handlerSpec.substring(lastDot + 1);
 
+    // Load handler
+    const fullPath = require('path').resolve(codePath, modulePath);
+    const handler = require(fullPath)[functionName];
+
+    if (!handler) {
+        throw new Error(`Handler function '${functionName}' not found in '${modulePath}'`);
+    }
+    return handler;
+}
+
+function buildContext() {
     // Build context from env
-    const context = {
+    return {
         functionName: process.env.AWS_LAMBDA_FUNCTION_NAME || 'local-function',
         functionVersion: '$LATEST',
         memoryLimitInMB: process.env.AWS_LAMBDA_FUNCTION_MEMORY_SIZE || '128',
@@ -27,16 +38,24 @@ async function main() {
         invokedFunctionArn: process.env.LDK_FUNCTION_ARN || 'arn:ldk:lambda:local:000000000000:function:local',
         getRemainingTimeInMillis: () => 30000,
     };
+}
 
-    // Load and invoke handler
-    const fullPath = require('path').resolve(codePath, modulePath);
-    const handler = require(fullPath)[functionName];
+function errorPayload(err) {
+    return {
+        error: {
+            errorMessage: err.message,
+            errorType: err.constructor.name,
+            stackTrace: err.stack ? err.stack.split('\n') : []
+        }
+    };
+}
 
-    if (!handler) {
-        throw new Error(`Handler function '${functionName}' not found in '${modulePath}'`);
-    }
+async function main() {
+    // Read event from stdin
+    const input = fs.readFileSync('/dev/stdin', 'utf8');
+    const event = JSON.parse(input);
 
-    const result = await handler(event, context);
+    const result = await loadHandler()(event, buildContext());
 
     // Use synchronous write to fd 1 (stdout) to guarantee the data is
     // flushed before process.exit(). The callback-based process.stdout.write
@@ -45,13 +64,33 @@ async function main() {
     process.exit(0);
 }
 
-main().catch(err => {
-    fs.writeFileSync(1, JSON.stringify({
-        error: {
-            errorMessage: err.message,
-            errorType: err.constructor.name,
-            stackTrace: err.stack ? err.stack.split('\n') : []
+async function serve() {
+    // Responses go straight to fd 1; console output is sent to stderr so
+    // it cannot interleave with the protocol stream.
+    process.stdout.write = process.stderr.write.bind(process.stderr);
+
+    let handler = null;
+    const lines = require('readline').createInterface({input: process.stdin});
+    for await (const line of lines) {
+        let response;
+        try {
+            const request = JSON.parse(line);
+            process.env.LDK_REQUEST_ID = request.request_id;
+            process.env.LDK_FUNCTION_ARN = request.function_arn;
+            handler = handler || loadHandler();
+            const result = await handler(request.event, buildContext());
+            response = JSON.stringify({result: result});
+        } catch (err) {
+            response = JSON.stringify(errorPayload(err));
         }
-    }));
+        fs.writeSync(1, response + '\n');
+    }
+    process.exit(0);
+}
+
+const entry = process.argv.includes('--serve') ? serve : main;
+
+entry().catch(err => {
+    fs.writeFileSync(1, JSON.stringify(errorPayload(err)));
     process.exit(1);
 });
@@ -18,7 +18,8 @@ class NodeJsCompute(SubprocessCompute):
     """SubprocessCompute implementation that runs Lambda handlers via Node.js subprocess.
 
     Each invocation spawns ``node invoker.js``, passing the event payload over
-    stdin and reading the result from stdout.
+    stdin and reading the result from stdout.  With a *pool* configuration,
+    warm ``node invoker.js --serve`` workers are reused instead.
     """
 
     # -- Provider lifecycle ---------------------------------------------------
@@ -33,6 +34,10 @@ class NodeJsCompute(SubprocessCompute):
 
     # -- Internal helpers -----------------------------------------------------
 
+    def _serve_command(self) -> list[str]:
+        """Start ``node invoker.js`` in warm worker mode."""
+        return ["node", str(_INVOKER_JS), "--serve"]
+
     async def _run_subprocess(self, env: dict[str, str], event_json: str) -> str:
         """Spawn ``node invoker.js`` and return its stdout."""
         return await self._exec_and_communicate(
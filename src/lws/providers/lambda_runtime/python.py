@@ -15,6 +15,7 @@ from lws.interfaces import (
     ProviderStatus,
 )
 from lws.providers.lambda_runtime.compute_base import SubprocessCompute
+from lws.providers.lambda_runtime.worker_pool import WorkerPoolConfig
 
 _BOOTSTRAP_PY = Path(__file__).parent / "python_bootstrap.py"
 
@@ -23,7 +24,9 @@ class PythonCompute(SubprocessCompute):
     """SubprocessCompute implementation that runs Lambda handlers via Python subprocess.
 
     Each invocation spawns ``python3 python_bootstrap.py``, passing the event
-    payload over stdin and reading the result from stdout.
+    payload over stdin and reading the result from stdout.  With a *pool*
+    configuration, warm ``python_bootstrap.py --serve`` workers are reused
+    instead.
 
     Supports optional debugpy integration: when ``debug_port`` is set, the
     ``LDK_DEBUG_PORT`` environment variable is forwarded to the bootstrap so it
@@ -35,8 +38,9 @@ class PythonCompute(SubprocessCompute):
         config: ComputeConfig,
         sdk_env: dict[str, str],
         debug_port: int | None = None,
+        pool: WorkerPoolConfig | None = None,
     ) -> None:
-        super().__init__(config, sdk_env)
+        super().__init__(config, sdk_env, pool)
         self._debug_port = debug_port
 
     # -- Provider lifecycle ---------------------------------------------------
@@ -71,6 +75,10 @@ class PythonCompute(SubprocessCompute):
             env["LDK_DEBUG_PORT"] = str(self._debug_port)
         return env
 
+    def _serve_command(self) -> list[str]:
+        """Start ``python3 python_bootstrap.py`` in warm worker mode."""
+        return ["python3", str(_BOOTSTRAP_PY), "--serve"]
+
     async def _run_subprocess(self, env: dict[str, str], event_json: str) -> str:
         """Spawn ``python3 python_bootstrap.py`` and return its stdout."""
         process = await asyncio.create_subprocess_exec(
@@ -4,6 +4,10 @@ This module is executed as a subprocess by :class:`PythonCompute`.  It reads
 the event from stdin, loads the user-supplied handler, invokes it with a
 :class:`LambdaContext`, and writes the JSON result to stdout.
 
+With ``--serve`` it runs as a warm pool worker instead: the handler is
+loaded once and each stdin line is a request carrying the event, request
+ID and function ARN; each response is written as one stdout line.
+
 Environment variables consumed:
 
     LDK_HANDLER       Handler spec, e.g. ``"handler.main"``
@@ -108,8 +112,48 @@ def _maybe_attach_debugger() -> None:
         pass
 
 
+def _error_payload(exc: Exception) -> dict:
+    return {
+        "error": {
+            "errorMessage": str(exc),
+            "errorType": type(exc).__name__,
+        }
+    }
+
+
+def serve() -> None:
+    """Warm worker loop: answer one JSON request per stdin line."""
+    # Keep the real stdout for responses; handler prints go to stderr.
+    protocol = os.fdopen(os.dup(sys.stdout.fileno()), "w", encoding="utf-8")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    sys.stdout = sys.stderr
+
+    handler_spec = os.environ.get("LDK_HANDLER", "")
+    code_path = os.environ.get("LDK_CODE_PATH", "")
+    _configure_s3_path_style()
+    _maybe_attach_debugger()
+
+    handler_fn = None
+    for line in sys.stdin:
+        try:
+            request = json.loads(line)
+            os.environ["LDK_REQUEST_ID"] = request["request_id"]
+            os.environ["LDK_FUNCTION_ARN"] = request["function_arn"]
+            if handler_fn is None:
+                handler_fn = _load_handler(handler_spec, code_path)
+            result = handler_fn(request["event"], _build_context())
+            response = json.dumps({"result": result})
+        except Exception as exc:
+            response = json.dumps(_error_payload(exc))
+        protocol.write(response + "\n")
+        protocol.flush()
+
+
 def main() -> None:
     """Entry point for the bootstrap script."""
+    if "--serve" in sys.argv[1:]:
+        serve()
+        return
     try:
         handler_spec = os.environ.get("LDK_HANDLER", "")
         code_path = os.environ.get("LDK_CODE_PATH", "")
@@ -139,13 +183,7 @@ def main() -> None:
         sys.exit(0)
 
     except Exception as exc:
-        error_payload = {
-            "error": {
-                "errorMessage": str(exc),
-                "errorType": type(exc).__name__,
-            }
-        }
-        sys.stdout.write(json.dumps(error_payload))
+        sys.stdout.write(json.dumps(_error_payload(exc)))
         sys.exit(1)
 
 
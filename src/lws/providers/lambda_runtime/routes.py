@@ -638,6 +638,13 @@ class LambdaManagementRouter:
             "State": "Enabled",
             "BatchSize": body.get("BatchSize", 10),
         }
+        for optional in (
+            "MaximumBatchingWindowInSeconds",
+            "ScalingConfig",
+            "FunctionResponseTypes",
+        ):
+            if optional in body:
+                mapping[optional] = body[optional]
         self._state.event_source_mappings[esm_uuid] = mapping
         return _json_response(mapping, 202)
 
@@ -0,0 +1,191 @@
+"""Warm worker pool for subprocess-based Lambda runtimes.
+
+A worker is a long-lived bootstrap process (``python_bootstrap.py --serve``
+or ``invoker.js --serve``) that loads the handler once and then answers
+invocations over its stdin/stdout pipes, one JSON document per line:
+
+    request   {"event": ..., "request_id": "...", "function_arn": "..."}
+    response  {"result": ...} or {"error": {"errorMessage": ..., ...}}
+
+Handler output written to stdout is redirected to stderr inside the
+worker so it cannot corrupt the protocol stream.
+
+``WorkerPool`` keeps up to ``max_workers`` workers per function, evicts
+workers that stay idle for ``idle_timeout`` seconds, and retires every
+worker when :meth:`WorkerPool.recycle` is called after a code change.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import signal
+import time
+from dataclasses import dataclass
+
+from lws.logging.logger import get_logger
+
+_logger = get_logger("ldk.lambda.pool")
+
+# Worker responses can carry large payloads; raise asyncio's 64 KiB line limit.
+_STREAM_LIMIT = 16 * 1024 * 1024
+
+
+@dataclass
+class WorkerPoolConfig:
+    """Sizing and lifetime settings for a function's warm workers."""
+
+    max_workers: int = 1
+    idle_timeout: float = 300.0
+
+
+class _Worker:
+    """One warm runtime process."""
+
+    def __init__(self, process: asyncio.subprocess.Process, generation: int) -> None:
+        self.process = process
+        self.generation = generation
+        self.last_used = time.monotonic()
+
+    @property
+    def alive(self) -> bool:
+        """Return True while the process has not exited."""
+        return self.process.returncode is None
+
+    async def call(self, request_line: bytes) -> str:
+        """Send one request and return the raw response line."""
+        assert self.process.stdin is not None and self.process.stdout is not None
+        self.process.stdin.write(request_line)
+        await self.process.stdin.drain()
+        response = await self.process.stdout.readline()
+        if not response:
+            raise ConnectionError("worker exited before responding")
+        return response.decode()
+
+    async def terminate(self) -> None:
+        """Stop the process, escalating to SIGKILL after one second."""
+        if not self.alive:
+            return
+        with contextlib.suppress(ProcessLookupError):
+            self.process.send_signal(signal.SIGTERM)
+        try:
+            await asyncio.wait_for(self.process.wait(), timeout=1.0)
+        except TimeoutError:
+            with contextlib.suppress(ProcessLookupError):
+                self.process.kill()
+
+
+class WorkerPool:
+    """Warm runtime processes for a single function.
+
+    Args:
+        command: Command line that starts a worker in serve mode.
+        config: Pool sizing and idle eviction settings.
+    """
+
+    def __init__(self, command: list[str], config: WorkerPoolConfig | None = None) -> None:
+        self._command = command
+        self._config = config or WorkerPoolConfig()
+        self._slots = asyncio.Semaphore(self._config.max_workers)
+        self._idle: list[_Worker] = []
+        self._busy: set[_Worker] = set()
+        self._generation = 0
+        self._reaper: asyncio.Task | None = None
+
+    @property
+    def size(self) -> int:
+        """Return the number of live workers, idle or busy."""
+        return len(self._idle) + len(self._busy)
+
+    async def invoke(self, env: dict[str, str], request: dict) -> tuple[str, bool]:
+        """Run *request* on a warm worker, starting one if needed.
+
+        *env* is only used when a new worker has to be started.  Returns
+        the raw response line and whether the invocation was a cold start.
+        """
+        request_line = (json.dumps(request) + "\n").encode()
+        async with self._slots:
+            worker, cold = await self._acquire(env)
+            try:
+                response = await worker.call(request_line)
+            except BaseException:
+                # Timed out, cancelled, or crashed: the worker's state is unknown
+                self._busy.discard(worker)
+                await worker.terminate()
+                raise
+            await self._release(worker)
+        return response, cold
+
+    def retire_all(self) -> None:
+        """Mark every current worker as stale.
+
+        Stale workers are never reused; they stop when next released or
+        picked from the idle list.
+        """
+        self._generation += 1
+
+    async def recycle(self) -> None:
+        """Retire all workers so the next invocations load fresh code.
+
+        Idle workers stop now; busy workers stop when their call returns.
+        """
+        self.retire_all()
+        idle, self._idle = self._idle, []
+        await asyncio.gather(*(worker.terminate() for worker in idle))
+        if idle:
+            _logger.info("Recycled %d warm worker(s)", len(idle))
+
+    async def close(self) -> None:
+        """Stop every worker and the idle reaper."""
+        if self._reaper is not None:
+            self._reaper.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._reaper
+            self._reaper = None
+        workers = [*self._idle, *self._busy]
+        self._idle.clear()
+        self._busy.clear()
+        await asyncio.gather(*(worker.terminate() for worker in workers))
+
+    async def _acquire(self, env: dict[str, str]) -> tuple[_Worker, bool]:
+        while self._idle:
+            worker = self._idle.pop()
+            if worker.generation == self._generation and worker.alive:
+                self._busy.add(worker)
+                return worker, False
+            await worker.terminate()
+        process = await asyncio.create_subprocess_exec(
+            *self._command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            env=env,
+            limit=_STREAM_LIMIT,
+        )
+        worker = _Worker(process, self._generation)
+        self._busy.add(worker)
+        if self._reaper is None:
+            self._reaper = asyncio.create_task(self._reap_idle())
+        return worker, True
+
+    async def _release(self, worker: _Worker) -> None:
+        self._busy.discard(worker)
+        if worker.generation != self._generation or not worker.alive:
+            await worker.terminate()
+            return
+        worker.last_used = time.monotonic()
+        self._idle.append(worker)
+
+    async def _reap_idle(self) -> None:
+        """Stop workers that have been idle longer than ``idle_timeout``."""
+        interval = max(self._config.idle_timeout / 2, 0.01)
+        while True:
+            await asyncio.sleep(interval)
+            cutoff = time.monotonic() - self._config.idle_timeout
+            expired = [worker for worker in self._idle if worker.last_used <= cutoff]
+            if not expired:
+                continue
+            self._idle = [worker for worker in self._idle if worker.last_used > cutoff]
+            await asyncio.gather(*(worker.terminate() for worker in expired))
+            _logger.debug("Evicted %d idle worker(s)", len(expired))
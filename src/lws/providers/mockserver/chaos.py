@@ -8,30 +8,37 @@ from __future__ import annotations
 import asyncio
 import random
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Receive, Send
 
+from lws.providers._shared.asgi import AsgiMiddleware
 from lws.providers._shared.chaos_helpers import apply_chaos_latency, should_inject_error
 from lws.providers.mockserver.models import ChaosConfig
 
 
-class ChaosMiddleware(BaseHTTPMiddleware):
-    """Starlette middleware that injects chaos into mock server responses."""
+class ChaosMiddleware(AsgiMiddleware):
+    """ASGI middleware that injects chaos into mock server responses."""
 
-    def __init__(self, app, chaos_config: ChaosConfig) -> None:  # noqa: ANN001
+    def __init__(self, app: ASGIApp, chaos_config: ChaosConfig) -> None:
         super().__init__(app)
         self.chaos = chaos_config
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        """Apply chaos rules before forwarding the request."""
-        if not self.chaos.enabled:
-            return await call_next(request)
+    @property
+    def enabled(self) -> bool:
+        return self.chaos.enabled
 
+    async def handle(self, request: Request, receive: Receive, send: Send) -> None:
+        """Apply chaos rules before forwarding the request."""
         # Skip chaos for management endpoints
         if request.url.path.startswith("/_mock/"):
-            return await call_next(request)
+            await self.app(request.scope, receive, send)
+            return
 
+        await self.respond(request, receive, send, await self._inject())
+
+    async def _inject(self) -> Response | None:
+        """Return an injected error response, or None to forward the request."""
         # Connection reset
         reset_rate = self.chaos.connection_reset_rate
         if reset_rate > 0 and random.random() < reset_rate:
@@ -52,8 +59,7 @@ class ChaosMiddleware(BaseHTTPMiddleware):
                 status_code=status,
                 content={"error": "chaos_injected", "status": status},
             )
-
-        return await call_next(request)
+        return None
 
 
 def _pick_error_status(chaos: ChaosConfig) -> int:
@@ -0,0 +1,255 @@
+"""Persistent sorted key index for S3 object listings.
+
+Every stored object has a row ``(bucket, key, size, etag, last_modified)``
+in ``<data_dir>/s3/.index.sqlite``.  The table's primary key is
+``(bucket, key)`` in a WITHOUT ROWID table, so rows are physically kept
+in key order and a ListObjectsV2 page is a B-tree seek followed by a
+short range scan -- O(log n + page) regardless of bucket size -- instead
+of a filesystem walk plus a sidecar read per key.
+
+Delimiter roll-ups skip over each common prefix with a fresh seek rather
+than scanning the keys beneath it.
+
+The index is updated synchronously by ``LocalBucketStorage`` writes and
+deletes.  It is rebuilt from the bucket directories and metadata sidecars
+when it is opened and any of these holds:
+
+- the database file does not exist yet (first start, or an upgrade from a
+  version without an index);
+- the last session did not close it cleanly, so an object write may have
+  landed without its index row;
+- the number of objects on disk differs from the number of rows, because
+  objects were added or removed outside the provider.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+_CREATE_TABLE_SQL = (
+    "CREATE TABLE IF NOT EXISTS objects ("
+    "bucket TEXT NOT NULL, key TEXT NOT NULL, size INTEGER NOT NULL, "
+    "etag TEXT NOT NULL, last_modified TEXT NOT NULL, "
+    "PRIMARY KEY (bucket, key)) WITHOUT ROWID"
+)
+
+_UPSERT_SQL = "INSERT OR REPLACE INTO objects VALUES (?, ?, ?, ?, ?)"
+
+# ``PRAGMA user_version`` values: the index is marked open while in use and
+# closed by :meth:`S3KeyIndex.close`.
+_OPEN = 0
+_CLOSED_CLEANLY = 1
+
+_SELECT_SQL = (
+    "SELECT key, size, etag, last_modified FROM objects "
+    "WHERE bucket = ? AND key {lower_op} ? {upper_clause}ORDER BY key LIMIT ?"
+)
+
+
+@dataclass
+class ListPage:
+    """One page of a listing: object rows, rolled-up prefixes and the resume token."""
+
+    contents: list[dict] = field(default_factory=list)
+    common_prefixes: list[str] = field(default_factory=list)
+    is_truncated: bool = False
+    next_token: str | None = None
+
+
+def _successor(text: str) -> str | None:
+    """Return the smallest string greater than every string starting with *text*."""
+    for idx in range(len(text) - 1, -1, -1):
+        code = ord(text[idx])
+        if code < 0x10FFFF:
+            return text[:idx] + chr(code + 1)
+    return None
+
+
+class S3KeyIndex:
+    """SQLite-backed sorted index of object keys, sizes, ETags and timestamps.
+
+    Args:
+        s3_dir: The ``<data_dir>/s3`` directory holding buckets and sidecars.
+    """
+
+    def __init__(self, s3_dir: Path) -> None:
+        self._s3_dir = s3_dir
+        self._db_path = s3_dir / ".index.sqlite"
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def put(self, bucket: str, key: str, size: int, etag: str, last_modified: str) -> None:
+        """Insert or replace the row for an object."""
+        with self._lock:
+            self._connect().execute(_UPSERT_SQL, (bucket, key, size, etag, last_modified))
+
+    def delete(self, bucket: str, key: str) -> None:
+        """Remove the row for an object, if present."""
+        with self._lock:
+            self._connect().execute(
+                "DELETE FROM objects WHERE bucket = ? AND key = ?", (bucket, key)
+            )
+
+    def drop_bucket(self, bucket: str) -> None:
+        """Remove every row belonging to *bucket*."""
+        with self._lock:
+            self._connect().execute("DELETE FROM objects WHERE bucket = ?", (bucket,))
+
+    def close(self) -> None:
+        """Close the database connection; it reopens on next use."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.execute(f"PRAGMA user_version = {_CLOSED_CLEANLY}")
+                self._conn.close()
+                self._conn = None
+
+    def list_page(
+        self,
+        bucket: str,
+        prefix: str = "",
+        delimiter: str = "",
+        max_keys: int = 1000,
+        after: str | None = None,
+    ) -> ListPage:
+        """Return up to *max_keys* keys and common prefixes after *after*.
+
+        *after* is exclusive and may be a key or a common prefix returned
+        by an earlier page; ``next_token`` is suitable for passing back in.
+        """
+        page = ListPage()
+        if max_keys <= 0:
+            return page
+        lower, inclusive = S3KeyIndex._lower_bound(prefix, delimiter, after)
+        upper = _successor(prefix) if prefix else None
+        with self._lock:
+            conn = self._connect()
+            while lower is not None and len(page.contents) + len(page.common_prefixes) <= max_keys:
+                wanted = max_keys + 1 - len(page.contents) - len(page.common_prefixes)
+                rows = self._select(conn, bucket, lower, inclusive, upper, wanted)
+                if not rows:
+                    break
+                lower, inclusive = self._collect(page, rows, prefix, delimiter, max_keys)
+        return page
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _lower_bound(prefix: str, delimiter: str, after: str | None) -> tuple[str, bool]:
+        if after is None or after < prefix:
+            return prefix, True
+        rolled_up = _common_prefix(after, prefix, delimiter)
+        if rolled_up is not None:
+            return _successor(rolled_up) or after, True
+        return after, False
+
+    @staticmethod
+    def _select(
+        conn: sqlite3.Connection,
+        bucket: str,
+        lower: str,
+        inclusive: bool,
+        upper: str | None,
+        limit: int,
+    ) -> list[tuple]:
+        sql = _SELECT_SQL.format(
+            lower_op=">=" if inclusive else ">",
+            upper_clause="AND key < ? " if upper is not None else "",
+        )
+        params = (bucket, lower, upper, limit) if upper is not None else (bucket, lower, limit)
+        return conn.execute(sql, params).fetchall()
+
+    @staticmethod
+    def _collect(
+        page: ListPage, rows: list[tuple], prefix: str, delimiter: str, max_keys: int
+    ) -> tuple[str | None, bool]:
+        """Add *rows* to *page*; return where the next query should start."""
+        for key, size, etag, last_modified in rows:
+            if len(page.contents) + len(page.common_prefixes) == max_keys:
+                page.is_truncated = True
+                return None, False
+            rolled_up = _common_prefix(key, prefix, delimiter)
+            if rolled_up is None:
+                page.contents.append(
+                    {"key": key, "size": size, "etag": etag, "last_modified": last_modified}
+                )
+                page.next_token = key
+                continue
+            page.common_prefixes.append(rolled_up)
+            page.next_token = rolled_up
+            # Seek past everything under this prefix instead of scanning it
+            return _successor(rolled_up), True
+        return rows[-1][0], False
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            created = not self._db_path.exists()
+            self._s3_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self._db_path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_CREATE_TABLE_SQL)
+            if created or self._is_stale(conn):
+                conn.execute("BEGIN")
+                conn.execute("DELETE FROM objects")
+                conn.executemany(_UPSERT_SQL, _scan_buckets(self._s3_dir))
+                conn.execute("COMMIT")
+            conn.execute(f"PRAGMA user_version = {_OPEN}")
+            self._conn = conn
+        return self._conn
+
+    def _is_stale(self, conn: sqlite3.Connection) -> bool:
+        """Return True if the index may not match the objects on disk."""
+        if conn.execute("PRAGMA user_version").fetchone()[0] != _CLOSED_CLEANLY:
+            return True
+        (rows,) = conn.execute("SELECT COUNT(*) FROM objects").fetchone()
+        return rows != _count_objects(self._s3_dir)
+
+
+def _common_prefix(key: str, prefix: str, delimiter: str) -> str | None:
+    """Return the CommonPrefixes entry *key* rolls up into, or None."""
+    if not delimiter or not key.startswith(prefix):
+        return None
+    idx = key.find(delimiter, len(prefix))
+    if idx < 0:
+        return None
+    return key[: idx + len(delimiter)]
+
+
+def _bucket_dirs(s3_dir: Path) -> list[Path]:
+    """Return the bucket directories, skipping ``.metadata``, ``.tmp`` and the like."""
+    return [
+        path for path in sorted(s3_dir.iterdir()) if path.is_dir() and not path.name.startswith(".")
+    ]
+
+
+def _count_objects(s3_dir: Path) -> int:
+    """Count the object files under every bucket directory."""
+    return sum(
+        len(files) for bucket_dir in _bucket_dirs(s3_dir) for _, _, files in os.walk(bucket_dir)
+    )
+
+
+def _scan_buckets(s3_dir: Path) -> Iterator[tuple]:
+    """Yield index rows for every object found on disk."""
+    for bucket_dir in _bucket_dirs(s3_dir):
+        for file_path in bucket_dir.rglob("*"):
+            if not file_path.is_file():
+                continue
+            key = file_path.relative_to(bucket_dir).as_posix()
+            sidecar = s3_dir / ".metadata" / bucket_dir.name / (key + ".json")
+            meta = json.loads(sidecar.read_text(encoding="utf-8")) if sidecar.exists() else {}
+            yield (
+                bucket_dir.name,
+                key,
+                meta.get("size", file_path.stat().st_size),
+                meta.get("etag", ""),
+                meta.get("last_modified", ""),
+            )
@@ -0,0 +1,149 @@
+"""Disk-backed spool for S3 multipart uploads.
+
+Each upload owns a directory ``<data_dir>/s3/.multipart/<upload_id>/``
+holding an ``upload.json`` manifest and, per part, ``<n>.part`` with an
+``<n>.json`` sidecar recording its ETag and size.  Parts are written to a
+temporary file and renamed into place, so concurrent ``UploadPart`` calls
+for different parts never contend and a retried part replaces the old
+one atomically.  Because everything lives on disk, in-progress uploads
+survive a restart of the emulator.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from collections.abc import AsyncIterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from lws.providers.s3.storage import write_stream
+
+_MANIFEST = "upload.json"
+
+
+@dataclass
+class UploadedPart:
+    """ETag (MD5 hex) and size of one stored part."""
+
+    etag: str
+    size: int
+
+
+@dataclass
+class MultipartUpload:
+    """Tracks an in-progress multipart upload."""
+
+    upload_id: str
+    bucket: str
+    key: str
+    parts: dict[int, UploadedPart] = field(default_factory=dict)
+    created_at: float = field(default_factory=time.time)
+
+
+def multipart_etag(parts: list[UploadedPart]) -> str:
+    """Return the S3 multipart ETag: MD5 of the part digests plus ``-<count>``."""
+    digest = hashlib.md5(b"".join(bytes.fromhex(p.etag) for p in parts))  # noqa: S324
+    return f"{digest.hexdigest()}-{len(parts)}"
+
+
+class MultipartSpool:
+    """Stores multipart upload parts as files under ``<data_dir>/s3/.multipart``."""
+
+    def __init__(self, data_dir: Path) -> None:
+        self._root = data_dir / "s3" / ".multipart"
+
+    def upload_dir(self, upload_id: str) -> Path:
+        """Return the spool directory of an upload."""
+        return self._root / upload_id
+
+    def part_path(self, upload_id: str, part_number: int) -> Path:
+        """Return the file holding one part of an upload."""
+        return self.upload_dir(upload_id) / f"{part_number}.part"
+
+    def create(self, upload: MultipartUpload) -> None:
+        """Create the spool directory and manifest for *upload*."""
+        directory = self.upload_dir(upload.upload_id)
+        directory.mkdir(parents=True, exist_ok=True)
+        manifest = {"bucket": upload.bucket, "key": upload.key, "created_at": upload.created_at}
+        (directory / _MANIFEST).write_text(json.dumps(manifest), encoding="utf-8")
+
+    def write_part(self, upload: MultipartUpload, part_number: int, data: bytes) -> UploadedPart:
+        """Store an in-memory part and return its record."""
+        digest = hashlib.md5(data)  # noqa: S324
+        staging = self._staging_path(upload.upload_id)
+        staging.write_bytes(data)
+        return self._commit_part(upload, part_number, staging, digest.hexdigest(), len(data))
+
+    async def write_part_stream(
+        self, upload: MultipartUpload, part_number: int, chunks: AsyncIterable[bytes]
+    ) -> UploadedPart:
+        """Stream a part to disk, hashing it incrementally, and return its record."""
+        staging = self._staging_path(upload.upload_id)
+        digest = hashlib.md5()  # noqa: S324
+        handle = await asyncio.to_thread(staging.open, "wb")
+        try:
+            size = await write_stream(handle, digest, chunks)
+            await asyncio.to_thread(handle.close)
+        except BaseException:
+            handle.close()
+            staging.unlink(missing_ok=True)
+            raise
+        return await asyncio.to_thread(
+            self._commit_part, upload, part_number, staging, digest.hexdigest(), size
+        )
+
+    def remove(self, upload_id: str) -> None:
+        """Delete the spool directory of an upload."""
+        shutil.rmtree(self.upload_dir(upload_id), ignore_errors=True)
+
+    def load_all(self) -> list[MultipartUpload]:
+        """Rebuild upload records from the spool after a restart."""
+        if not self._root.exists():
+            return []
+        uploads: list[MultipartUpload] = []
+        for directory in sorted(self._root.iterdir()):
+            manifest_path = directory / _MANIFEST
+            if not manifest_path.is_file():
+                continue
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            upload = MultipartUpload(
+                upload_id=directory.name,
+                bucket=manifest["bucket"],
+                key=manifest["key"],
+                created_at=manifest.get("created_at", time.time()),
+            )
+            upload.parts = _load_parts(directory)
+            uploads.append(upload)
+        return uploads
+
+    def _staging_path(self, upload_id: str) -> Path:
+        return self.upload_dir(upload_id) / f".{uuid.uuid4().hex}.tmp"
+
+    def _commit_part(
+        self, upload: MultipartUpload, part_number: int, staging: Path, etag: str, size: int
+    ) -> UploadedPart:
+        part = UploadedPart(etag=etag, size=size)
+        os.replace(staging, self.part_path(upload.upload_id, part_number))
+        sidecar = self.upload_dir(upload.upload_id) / f"{part_number}.json"
+        sidecar.write_text(json.dumps({"etag": etag, "size": size}), encoding="utf-8")
+        upload.parts[part_number] = part
+        return part
+
+
+def _load_parts(directory: Path) -> dict[int, UploadedPart]:
+    """Read part sidecars; parts without one never finished uploading."""
+    parts: dict[int, UploadedPart] = {}
+    for sidecar in directory.glob("*.json"):
+        if sidecar.name == _MANIFEST or not sidecar.stem.isdigit():
+            continue
+        if not (directory / f"{sidecar.stem}.part").is_file():
+            continue
+        doc = json.loads(sidecar.read_text(encoding="utf-8"))
+        parts[int(sidecar.stem)] = UploadedPart(etag=doc["etag"], size=doc["size"])
+    return parts
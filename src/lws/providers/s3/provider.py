@@ -2,30 +2,19 @@
 
 from __future__ import annotations
 
-import hashlib
+import asyncio
 import shutil
 import time
 import uuid
-from collections.abc import Callable
-from dataclasses import dataclass, field
+from collections.abc import AsyncIterable, Callable
 from pathlib import Path
 
 from lws.interfaces.object_store import IObjectStore
+from lws.providers.s3.multipart import MultipartSpool, MultipartUpload, multipart_etag
 from lws.providers.s3.notifications import NotificationDispatcher
 from lws.providers.s3.storage import LocalBucketStorage
 
 
-@dataclass
-class MultipartUpload:
-    """Tracks an in-progress multipart upload."""
-
-    upload_id: str
-    bucket: str
-    key: str
-    parts: dict[int, bytes] = field(default_factory=dict)
-    created_at: float = field(default_factory=time.time)
-
-
 class S3Provider(IObjectStore):
     """Local S3 provider backed by the filesystem.
 
@@ -42,6 +31,7 @@ class S3Provider(IObjectStore):
         self._bucket_tagging: dict[str, dict[str, str]] = {}
         self._bucket_policies: dict[str, str] = {}
         self._bucket_notification_configs: dict[str, str] = {}
+        self._multipart_spool = MultipartSpool(data_dir)
         self._multipart_uploads: dict[str, MultipartUpload] = {}
         self._bucket_websites: dict[str, dict[str, str]] = {}
 
@@ -58,10 +48,13 @@ class S3Provider(IObjectStore):
             bucket_dir = self._data_dir / "s3" / bucket
             bucket_dir.mkdir(parents=True, exist_ok=True)
             self._bucket_created.setdefault(bucket, now)
+        uploads = await asyncio.to_thread(self._multipart_spool.load_all)
+        self._multipart_uploads = {upload.upload_id: upload for upload in uploads}
         self._started = True
 
     async def stop(self) -> None:
-        """No-op for filesystem storage."""
+        """Close the key index; objects stay on disk."""
+        self._storage.close()
         self._started = False
 
     async def health_check(self) -> bool:
@@ -112,6 +105,7 @@ class S3Provider(IObjectStore):
         bucket_dir = self._data_dir / "s3" / bucket_name
         if bucket_dir.exists():
             shutil.rmtree(bucket_dir)
+        await self._storage.forget_bucket(bucket_name)
         self._buckets.remove(bucket_name)
         self._bucket_created.pop(bucket_name, None)
         self._bucket_tagging.pop(bucket_name, None)
@@ -224,30 +218,41 @@ class S3Provider(IObjectStore):
     def create_multipart_upload(self, bucket_name: str, key: str) -> str:
         """Create a multipart upload. Returns the upload_id."""
         upload_id = str(uuid.uuid4())
-        self._multipart_uploads[upload_id] = MultipartUpload(
-            upload_id=upload_id, bucket=bucket_name, key=key
-        )
+        upload = MultipartUpload(upload_id=upload_id, bucket=bucket_name, key=key)
+        self._multipart_spool.create(upload)
+        self._multipart_uploads[upload_id] = upload
         return upload_id
 
     def upload_part(
         self, _bucket_name: str, _key: str, upload_id: str, part_number: int, data: bytes
     ) -> str:
         """Store a part. Returns the ETag (md5 hex)."""
-        upload = self._multipart_uploads.get(upload_id)
-        if upload is None:
-            raise KeyError(f"Upload not found: {upload_id}")
-        upload.parts[part_number] = data
-        return hashlib.md5(data).hexdigest()  # noqa: S324
+        upload = self._get_upload(upload_id)
+        return self._multipart_spool.write_part(upload, part_number, data).etag
+
+    async def upload_part_stream(
+        self,
+        _bucket_name: str,
+        _key: str,
+        upload_id: str,
+        part_number: int,
+        chunks: AsyncIterable[bytes],
+    ) -> str:
+        """Stream a part to the upload's spool directory. Returns the ETag (md5 hex)."""
+        upload = self._get_upload(upload_id)
+        part = await self._multipart_spool.write_part_stream(upload, part_number, chunks)
+        return part.etag
 
     async def complete_multipart_upload(self, bucket_name: str, key: str, upload_id: str) -> dict:
-        """Concatenate parts, store the final object, and clean up."""
-        upload = self._multipart_uploads.get(upload_id)
-        if upload is None:
-            raise KeyError(f"Upload not found: {upload_id}")
-        merged = b"".join(upload.parts[n] for n in sorted(upload.parts))
-        etag = hashlib.md5(merged).hexdigest()  # noqa: S324
-        await self.put_object(bucket_name, key, merged)
+        """Concatenate the spooled parts into the final object, and clean up."""
+        upload = self._get_upload(upload_id)
+        numbers = sorted(upload.parts)
+        etag = multipart_etag([upload.parts[n] for n in numbers])
+        sources = [self._multipart_spool.part_path(upload_id, n) for n in numbers]
+        await self._storage.put_object_from_files(bucket_name, key, sources, etag)
+        self._dispatcher.dispatch(bucket_name, "ObjectCreated:Put", key)
         del self._multipart_uploads[upload_id]
+        await asyncio.to_thread(self._multipart_spool.remove, upload_id)
         return {
             "Location": f"/{bucket_name}/{key}",
             "Bucket": bucket_name,
@@ -256,22 +261,23 @@ class S3Provider(IObjectStore):
         }
 
     def abort_multipart_upload(self, upload_id: str) -> None:
-        """Remove tracking entry for a multipart upload."""
+        """Remove tracking entry and spooled parts for a multipart upload."""
         self._multipart_uploads.pop(upload_id, None)
+        self._multipart_spool.remove(upload_id)
 
     def list_parts(self, upload_id: str) -> list[dict]:
         """Return part info list for a multipart upload."""
+        upload = self._get_upload(upload_id)
+        return [
+            {"PartNumber": part_num, "Size": part.size, "ETag": part.etag}
+            for part_num, part in sorted(upload.parts.items())
+        ]
+
+    def _get_upload(self, upload_id: str) -> MultipartUpload:
         upload = self._multipart_uploads.get(upload_id)
         if upload is None:
             raise KeyError(f"Upload not found: {upload_id}")
-        return [
-            {
-                "PartNumber": part_num,
-                "Size": len(data),
-                "ETag": hashlib.md5(data).hexdigest(),  # noqa: S324
-            }
-            for part_num, data in sorted(upload.parts.items())
-        ]
+        return upload
 
     # -- Notification support -------------------------------------------------
 
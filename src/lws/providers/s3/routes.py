@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import xml.etree.ElementTree as ET
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 
 from fastapi import FastAPI, Request, Response
 from fastapi.responses import StreamingResponse
@@ -68,10 +70,11 @@ def _error_xml(code: str, message: str, status_code: int = 400) -> Response:
 
 
 async def _put_object(bucket: str, key: str, request: Request, provider: S3Provider) -> Response:
-    """Handle PutObject requests."""
-    body = await request.body()
+    """Handle PutObject requests, streaming the body to disk."""
     content_type = request.headers.get("content-type")
-    result = await provider.storage.put_object(bucket, key, body, content_type=content_type)
+    result = await provider.storage.put_object_stream(
+        bucket, key, request.stream(), content_type=content_type
+    )
     provider.dispatcher.dispatch(bucket, "ObjectCreated:Put", key)
     return Response(
         status_code=200,
@@ -79,41 +82,118 @@ async def _put_object(bucket: str, key: str, request: Request, provider: S3Provi
     )
 
 
-async def _get_object(bucket: str, key: str, provider: S3Provider) -> Response:
+async def _get_object(bucket: str, key: str, request: Request, provider: S3Provider) -> Response:
     """Handle GetObject requests."""
-    try:
-        result = await provider.storage.get_object(bucket, key)
-    except IsADirectoryError:
-        result = None
-    if result is None:
+    meta = await provider.storage.readable_object(bucket, key)
+    if meta is None:
         # Try website-aware resolution
         buckets = await provider.list_buckets()
         website = provider.get_bucket_website(bucket) if bucket in buckets else None
         if website:
-            return await _serve_website_fallback(bucket, key, website, provider)
+            return await _serve_website_fallback(bucket, key, website, request, provider)
         return _error_xml("NoSuchKey", f"The specified key does not exist: {key}", 404)
 
-    return StreamingResponse(
-        iter([result["body"]]),
-        media_type=result["content_type"],
-        headers={
-            "ETag": f'"{result["etag"]}"',
-            "Content-Length": str(result["size"]),
-            "Last-Modified": result["last_modified"],
-        },
-    )
+    return _object_response(bucket, key, meta, request, provider)
+
+
+class _UnsatisfiableRangeError(Exception):
+    """Raised when a well-formed Range header lies outside the object."""
+
+
+def _parse_range_spec(header: str | None) -> tuple[int | None, int | None] | None:
+    """Split a single ``bytes=first-last`` range into its two bounds.
 
+    Returns None for absent, multi-range, or malformed headers, which S3
+    answers with the whole object.
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    first, sep, last = header[len("bytes=") :].strip().partition("-")
+    if not sep or not (first or last) or not (first + last).isdigit():
+        return None
+    return (int(first) if first else None, int(last) if last else None)
+
+
+def _byte_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """Resolve a Range header to an inclusive ``(start, end)`` for *size* bytes."""
+    spec = _parse_range_spec(header)
+    if spec is None:
+        return None
+    first, last = spec
+    if first is None:
+        # Suffix range: the final *last* bytes
+        start, end = size - min(last or 0, size), size - 1
+        if not last:
+            raise _UnsatisfiableRangeError
+    else:
+        if last is not None and last < first:
+            return None
+        start, end = first, size - 1 if last is None else min(last, size - 1)
+    if start >= size:
+        raise _UnsatisfiableRangeError
+    return start, end
+
+
+def _parse_http_date(value: str) -> datetime | None:
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def _not_modified(request: Request, meta: dict) -> bool:
+    """Evaluate If-None-Match, then If-Modified-Since, against *meta*."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/").strip('"') for tag in if_none_match.split(",")}
+        return "*" in tags or meta["etag"] in tags
+    since = _parse_http_date(request.headers.get("if-modified-since", ""))
+    if since is None or not meta["last_modified"]:
+        return False
+    try:
+        modified = datetime.fromisoformat(meta["last_modified"])
+    except ValueError:
+        return False
+    return modified.replace(microsecond=0) <= since
 
-def _streaming_object_response(result: dict) -> StreamingResponse:
-    """Build a StreamingResponse from a storage result dict."""
+
+def _object_response(
+    bucket: str,
+    key: str,
+    meta: dict,
+    request: Request,
+    provider: S3Provider,
+    status_code: int = 200,
+) -> Response:
+    """Stream an object from disk, honouring conditional and Range headers."""
+    headers = {
+        "ETag": f'"{meta["etag"]}"',
+        "Last-Modified": meta["last_modified"],
+        "Accept-Ranges": "bytes",
+    }
+    if status_code == 200 and _not_modified(request, meta):
+        return Response(status_code=304, headers=headers)
+
+    size = meta["size"]
+    try:
+        byte_range = _byte_range(request.headers.get("range"), size) if status_code == 200 else None
+    except _UnsatisfiableRangeError:
+        response = _error_xml("InvalidRange", "The requested range is not satisfiable", 416)
+        response.headers["Content-Range"] = f"bytes */{size}"
+        return response
+
+    if byte_range is None:
+        headers["Content-Length"] = str(size)
+        body = provider.storage.iter_object(bucket, key)
+    else:
+        start, end = byte_range
+        status_code = 206
+        headers["Content-Length"] = str(end - start + 1)
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+        body = provider.storage.iter_object(bucket, key, start, end)
     return StreamingResponse(
-        iter([result["body"]]),
-        media_type=result["content_type"],
-        headers={
-            "ETag": f'"{result["etag"]}"',
-            "Content-Length": str(result["size"]),
-            "Last-Modified": result["last_modified"],
-        },
+        body, status_code=status_code, media_type=meta["content_type"], headers=headers
     )
 
 
@@ -130,25 +210,21 @@ def _website_index_candidates(key: str, index_doc: str) -> list[str]:
 
 
 async def _serve_website_fallback(
-    bucket: str, key: str, website: dict[str, str], provider: S3Provider
+    bucket: str, key: str, website: dict[str, str], request: Request, provider: S3Provider
 ) -> Response:
     """Try index document and error document resolution for website-enabled buckets."""
     candidates = _website_index_candidates(key, website.get("index_document", ""))
     for candidate_key in candidates:
-        result = await provider.storage.get_object(bucket, candidate_key)
-        if result is not None:
-            return _streaming_object_response(result)
+        meta = await provider.storage.readable_object(bucket, candidate_key)
+        if meta is not None:
+            return _object_response(bucket, candidate_key, meta, request, provider)
 
     # Serve error document with 404 status
     error_doc = website.get("error_document", "")
     if error_doc:
-        result = await provider.storage.get_object(bucket, error_doc)
-        if result is not None:
-            return Response(
-                content=result["body"],
-                status_code=404,
-                media_type=result["content_type"],
-            )
+        meta = await provider.storage.readable_object(bucket, error_doc)
+        if meta is not None:
+            return _object_response(bucket, error_doc, meta, request, provider, status_code=404)
 
     return _error_xml("NoSuchKey", f"The specified key does not exist: {key}", 404)
 
@@ -180,6 +256,8 @@ async def _head_object(bucket: str, key: str, provider: S3Provider) -> Response:
 async def _list_objects_v2(bucket: str, request: Request, provider: S3Provider) -> Response:
     """Handle ListObjectsV2 requests."""
     prefix = request.query_params.get("prefix", "")
+    delimiter = request.query_params.get("delimiter", "")
+    start_after = request.query_params.get("start-after")
     max_keys_str = request.query_params.get("max-keys", "1000")
     continuation_token = request.query_params.get("continuation-token")
 
@@ -193,6 +271,8 @@ async def _list_objects_v2(bucket: str, request: Request, provider: S3Provider)
         prefix=prefix,
         max_keys=max_keys,
         continuation_token=continuation_token,
+        start_after=start_after,
+        delimiter=delimiter,
     )
 
     contents_xml = ""
@@ -205,6 +285,10 @@ async def _list_objects_v2(bucket: str, request: Request, provider: S3Provider)
             f"<LastModified>{_xml_escape(item['last_modified'])}</LastModified>"
             "</Contents>"
         )
+    prefixes_xml = "".join(
+        f"<CommonPrefixes><Prefix>{_xml_escape(common)}</Prefix></CommonPrefixes>"
+        for common in result["common_prefixes"]
+    )
 
     is_truncated = "true" if result["is_truncated"] else "false"
     token_xml = ""
@@ -212,17 +296,22 @@ async def _list_objects_v2(bucket: str, request: Request, provider: S3Provider)
         token_xml = (
             f"<NextContinuationToken>{_xml_escape(result['next_token'])}</NextContinuationToken>"
         )
+    delimiter_xml = f"<Delimiter>{_xml_escape(delimiter)}</Delimiter>" if delimiter else ""
+    start_after_xml = f"<StartAfter>{_xml_escape(start_after)}</StartAfter>" if start_after else ""
 
     body = (
         '<?xml version="1.0" encoding="UTF-8"?>'
         '<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
         f"<Name>{_xml_escape(bucket)}</Name>"
         f"<Prefix>{_xml_escape(prefix)}</Prefix>"
-        f"<KeyCount>{len(result['contents'])}</KeyCount>"
+        f"{delimiter_xml}"
+        f"{start_after_xml}"
+        f"<KeyCount>{len(result['contents']) + len(result['common_prefixes'])}</KeyCount>"
         f"<MaxKeys>{max_keys}</MaxKeys>"
         f"<IsTruncated>{is_truncated}</IsTruncated>"
         f"{token_xml}"
         f"{contents_xml}"
+        f"{prefixes_xml}"
         "</ListBucketResult>"
     )
 
@@ -243,12 +332,15 @@ async def _copy_object(bucket: str, key: str, request: Request, provider: S3Prov
         return _error_xml("InvalidArgument", "Invalid x-amz-copy-source header", 400)
 
     src_bucket, src_key = copy_source.split("/", 1)
-    result = await provider.storage.get_object(src_bucket, src_key)
+    result = await provider.storage.readable_object(src_bucket, src_key)
     if result is None:
         return _error_xml("NoSuchKey", f"The specified key does not exist: {src_key}", 404)
 
-    put_result = await provider.storage.put_object(
-        bucket, key, result["body"], content_type=result["content_type"]
+    put_result = await provider.storage.put_object_stream(
+        bucket,
+        key,
+        provider.storage.iter_object(src_bucket, src_key),
+        content_type=result["content_type"],
     )
     provider.dispatcher.dispatch(bucket, "ObjectCreated:Copy", key)
 
@@ -563,9 +655,10 @@ async def _upload_part(bucket: str, key: str, request: Request, provider: S3Prov
     """Handle UploadPart (PUT /{bucket}/{key}?partNumber=N&uploadId=X)."""
     part_number = int(request.query_params.get("partNumber", "0"))
     upload_id = request.query_params.get("uploadId", "")
-    data = await request.body()
     try:
-        etag = provider.upload_part(bucket, key, upload_id, part_number, data)
+        etag = await provider.upload_part_stream(
+            bucket, key, upload_id, part_number, request.stream()
+        )
     except KeyError:
         return _error_xml("NoSuchUpload", f"Upload not found: {upload_id}", 404)
     return Response(status_code=200, headers={"ETag": f'"{etag}"'})
@@ -815,7 +908,7 @@ def _register_object_routes(app: FastAPI, provider: S3Provider) -> None:
     async def get_object(bucket: str, key: str, request: Request) -> Response:
         if "uploadId" in request.query_params:
             return await _list_parts_handler(bucket, key, request, provider)
-        return await _get_object(bucket, key, provider)
+        return await _get_object(bucket, key, request, provider)
 
     @app.api_route("/{bucket}/{key:path}", methods=["DELETE"])
     async def delete_object(bucket: str, key: str, request: Request) -> Response:
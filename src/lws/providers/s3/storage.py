@@ -5,8 +5,22 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import json
+import os
+import shutil
+import uuid
+from collections.abc import AsyncIterable, AsyncIterator
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import BinaryIO
+
+from lws.providers.s3.key_index import S3KeyIndex
+
+# Bytes read per chunk when streaming an object back to the client.
+READ_CHUNK_SIZE = 256 * 1024
+
+# Upload chunks are coalesced up to this size before each threaded write
+# (see write_stream).
+_WRITE_BUFFER_SIZE = 1024 * 1024
 
 
 class LocalBucketStorage:
@@ -14,10 +28,14 @@ class LocalBucketStorage:
 
     Objects are stored at ``<data_dir>/s3/<bucket>/<key>``.
     Metadata sidecars live at ``<data_dir>/s3/.metadata/<bucket>/<key>.json``.
+    Uploads are staged under ``<data_dir>/s3/.tmp`` and renamed into place,
+    so readers never observe a partially written object.  Listings are
+    served from an :class:`S3KeyIndex` kept up to date by every write.
     """
 
     def __init__(self, data_dir: Path) -> None:
         self._data_dir = data_dir
+        self._index = S3KeyIndex(data_dir / "s3")
 
     # ------------------------------------------------------------------
     # Path helpers
@@ -29,6 +47,9 @@ class LocalBucketStorage:
     def _metadata_path(self, bucket: str, key: str) -> Path:
         return self._data_dir / "s3" / ".metadata" / bucket / (key + ".json")
 
+    def _staging_path(self) -> Path:
+        return self._data_dir / "s3" / ".tmp" / uuid.uuid4().hex
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -42,25 +63,94 @@ class LocalBucketStorage:
         metadata: dict | None = None,
     ) -> dict:
         """Store an object and its metadata sidecar. Returns dict with ETag."""
-        etag = hashlib.md5(body).hexdigest()  # noqa: S324
-        now = datetime.now(UTC).isoformat()
-
-        obj_path = self._object_path(bucket, key)
-        meta_path = self._metadata_path(bucket, key)
+        return await self.put_object_stream(
+            bucket, key, _single_chunk(body), content_type=content_type, metadata=metadata
+        )
 
+    async def put_object_stream(
+        self,
+        bucket: str,
+        key: str,
+        chunks: AsyncIterable[bytes],
+        content_type: str | None = None,
+        metadata: dict | None = None,
+    ) -> dict:
+        """Store an object from an async stream of chunks. Returns dict with ETag.
+
+        The body is written to a staging file while its MD5 is computed
+        incrementally, then committed with :meth:`_commit`.
+        """
+        staging_path = self._staging_path()
+        digest = hashlib.md5()  # noqa: S324
+        handle = await asyncio.to_thread(self._open_staging, staging_path)
+        try:
+            size = await write_stream(handle, digest, chunks)
+            await asyncio.to_thread(handle.close)
+        except BaseException:
+            await asyncio.to_thread(self._discard_staging, handle, staging_path)
+            raise
+
+        etag = digest.hexdigest()
         meta_doc = {
             "content_type": content_type or "application/octet-stream",
             "etag": etag,
-            "size": len(body),
-            "last_modified": now,
+            "size": size,
+            "last_modified": datetime.now(UTC).isoformat(),
             "metadata": metadata or {},
         }
+        await self._commit(bucket, key, staging_path, meta_doc)
+        return {"ETag": f'"{etag}"'}
 
-        await asyncio.to_thread(self._write_object, obj_path, body)
-        await asyncio.to_thread(self._write_metadata, meta_path, meta_doc)
+    async def put_object_from_files(
+        self,
+        bucket: str,
+        key: str,
+        sources: list[Path],
+        etag: str,
+        content_type: str | None = None,
+    ) -> dict:
+        """Store the concatenation of *sources* as one object. Returns dict with ETag.
+
+        The files are copied into a staging file in bounded chunks and
+        atomically renamed over the object path.  *etag* is recorded as-is,
+        which lets multipart uploads keep their ``-N`` ETag.
+        """
+        staging_path = self._staging_path()
+        try:
+            size = await asyncio.to_thread(self._concatenate, sources, staging_path)
+        except BaseException:
+            await asyncio.to_thread(staging_path.unlink, missing_ok=True)
+            raise
 
+        meta_doc = {
+            "content_type": content_type or "application/octet-stream",
+            "etag": etag,
+            "size": size,
+            "last_modified": datetime.now(UTC).isoformat(),
+            "metadata": {},
+        }
+        await self._commit(bucket, key, staging_path, meta_doc)
         return {"ETag": f'"{etag}"'}
 
+    async def _commit(self, bucket: str, key: str, staging_path: Path, meta_doc: dict) -> None:
+        """Publish a staged body with its metadata sidecar and index entry.
+
+        The sidecar is written before the body is renamed into place, so a
+        reader that sees the new body also sees its ETag.  Readers take the
+        size from the body file itself (see :meth:`head_object`).
+        """
+        try:
+            await asyncio.to_thread(
+                self._write_metadata, self._metadata_path(bucket, key), meta_doc
+            )
+            await asyncio.to_thread(
+                self._commit_object, staging_path, self._object_path(bucket, key)
+            )
+        except BaseException:
+            await asyncio.to_thread(staging_path.unlink, missing_ok=True)
+            raise
+        await asyncio.to_thread(self._index_object, bucket, key, meta_doc)
+
     async def get_object(self, bucket: str, key: str) -> dict | None:
         """Retrieve an object and its metadata. Returns None if not found."""
         obj_path = self._object_path(bucket, key)
@@ -76,7 +166,7 @@ class LocalBucketStorage:
             "body": body,
             "content_type": meta.get("content_type", "application/octet-stream"),
             "etag": meta.get("etag", ""),
-            "size": meta.get("size", len(body)),
+            "size": len(body),
             "last_modified": meta.get("last_modified", ""),
             "metadata": meta.get("metadata", {}),
         }
@@ -89,6 +179,7 @@ class LocalBucketStorage:
         existed = await asyncio.to_thread(obj_path.exists)
         if existed:
             await asyncio.to_thread(obj_path.unlink)
+            await asyncio.to_thread(self._index.delete, bucket, key)
         if await asyncio.to_thread(meta_path.exists):
             await asyncio.to_thread(meta_path.unlink)
 
@@ -103,6 +194,9 @@ class LocalBucketStorage:
             return None
 
         meta = await asyncio.to_thread(self._read_metadata, meta_path)
+        if await asyncio.to_thread(obj_path.is_file):
+            # The body may have been replaced after the sidecar was read
+            meta["size"] = (await asyncio.to_thread(obj_path.stat)).st_size
         return {
             "content_type": meta.get("content_type", "application/octet-stream"),
             "etag": meta.get("etag", ""),
@@ -111,61 +205,111 @@ class LocalBucketStorage:
             "metadata": meta.get("metadata", {}),
         }
 
+    async def readable_object(self, bucket: str, key: str) -> dict | None:
+        """Return :meth:`head_object` metadata if the object's body can be read.
+
+        Unlike :meth:`head_object`, directories under the bucket are not
+        treated as objects.
+        """
+        if not await asyncio.to_thread(self._object_path(bucket, key).is_file):
+            return None
+        return await self.head_object(bucket, key)
+
+    async def iter_object(
+        self,
+        bucket: str,
+        key: str,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = READ_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Yield the bytes of an object from *start* up to and including *end*.
+
+        Only the requested range is read from disk, one chunk at a time.
+        Raises ``FileNotFoundError`` if the object does not exist.
+        """
+        handle = await asyncio.to_thread(self._object_path(bucket, key).open, "rb")
+        try:
+            await asyncio.to_thread(handle.seek, start)
+            remaining = None if end is None else end - start + 1
+            while remaining is None or remaining > 0:
+                want = chunk_size if remaining is None else min(chunk_size, remaining)
+                chunk = await asyncio.to_thread(handle.read, want)
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+        finally:
+            await asyncio.to_thread(handle.close)
+
     async def list_objects(
         self,
         bucket: str,
         prefix: str = "",
         max_keys: int = 1000,
         continuation_token: str | None = None,
+        start_after: str | None = None,
+        delimiter: str = "",
     ) -> dict:
-        """List objects in *bucket* matching *prefix* with pagination support."""
-        bucket_dir = self._data_dir / "s3" / bucket
-
-        all_keys = await asyncio.to_thread(self._collect_keys, bucket_dir, prefix)
-        all_keys.sort()
-
-        # Apply continuation token (alphabetical ordering)
-        if continuation_token:
-            start_idx = 0
-            for i, k in enumerate(all_keys):
-                if k > continuation_token:
-                    start_idx = i
-                    break
-            else:
-                # All keys are <= token, nothing left
-                return {"contents": [], "is_truncated": False, "next_token": None}
-            all_keys = all_keys[start_idx:]
-
-        is_truncated = len(all_keys) > max_keys
-        page_keys = all_keys[:max_keys]
-        next_token = page_keys[-1] if is_truncated else None
-
-        contents: list[dict] = []
-        for key in page_keys:
-            meta = await self.head_object(bucket, key)
-            contents.append(
-                {
-                    "key": key,
-                    "size": meta["size"] if meta else 0,
-                    "etag": meta["etag"] if meta else "",
-                    "last_modified": meta["last_modified"] if meta else "",
-                }
-            )
-
+        """List objects in *bucket* matching *prefix* with pagination support.
+
+        Keys sort alphabetically; *continuation_token* and *start_after*
+        both resume strictly after the given key (the later of the two
+        wins).  With a *delimiter*, keys sharing a prefix up to the next
+        delimiter are rolled up into ``common_prefixes``.
+        """
+        after = max(filter(None, (continuation_token, start_after)), default=None)
+        page = await asyncio.to_thread(
+            self._index.list_page,
+            bucket,
+            prefix=prefix,
+            delimiter=delimiter,
+            max_keys=max_keys,
+            after=after,
+        )
         return {
-            "contents": contents,
-            "is_truncated": is_truncated,
-            "next_token": next_token,
+            "contents": page.contents,
+            "common_prefixes": page.common_prefixes,
+            "is_truncated": page.is_truncated,
+            "next_token": page.next_token if page.is_truncated else None,
         }
 
+    async def forget_bucket(self, bucket: str) -> None:
+        """Drop every index entry of a bucket whose directory has been removed."""
+        await asyncio.to_thread(self._index.drop_bucket, bucket)
+
+    def close(self) -> None:
+        """Close the key index database."""
+        self._index.close()
+
     # ------------------------------------------------------------------
     # Synchronous filesystem helpers (run via asyncio.to_thread)
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _write_object(path: Path, data: bytes) -> None:
+    def _open_staging(path: Path) -> BinaryIO:
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_bytes(data)
+        return path.open("wb")
+
+    @staticmethod
+    def _concatenate(sources: list[Path], target: Path) -> int:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with target.open("wb") as out:
+            for source in sources:
+                with source.open("rb") as src:
+                    shutil.copyfileobj(src, out, _WRITE_BUFFER_SIZE)
+            return out.tell()
+
+    @staticmethod
+    def _commit_object(staging_path: Path, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(staging_path, path)
+
+    @staticmethod
+    def _discard_staging(handle: BinaryIO, path: Path) -> None:
+        handle.close()
+        path.unlink(missing_ok=True)
 
     @staticmethod
     def _write_metadata(path: Path, meta: dict) -> None:
@@ -182,15 +326,34 @@ class LocalBucketStorage:
             return {}
         return json.loads(path.read_text(encoding="utf-8"))
 
-    @staticmethod
-    def _collect_keys(bucket_dir: Path, prefix: str) -> list[str]:
-        """Walk *bucket_dir* and return all keys matching *prefix*."""
-        if not bucket_dir.exists():
-            return []
-        keys: list[str] = []
-        for file_path in bucket_dir.rglob("*"):
-            if file_path.is_file():
-                relative = file_path.relative_to(bucket_dir).as_posix()
-                if relative.startswith(prefix):
-                    keys.append(relative)
-        return keys
+    def _index_object(self, bucket: str, key: str, meta: dict) -> None:
+        self._index.put(bucket, key, meta["size"], meta["etag"], meta["last_modified"])
+
+
+async def write_stream(
+    handle: BinaryIO, digest: hashlib._Hash, chunks: AsyncIterable[bytes]
+) -> int:
+    """Write *chunks* to *handle*, updating *digest*, and return the byte count.
+
+    Chunks are coalesced up to ``_WRITE_BUFFER_SIZE`` so each threaded
+    write moves a sizeable block rather than one network chunk.
+    """
+    size = 0
+    pending = bytearray()
+    async for chunk in chunks:
+        pending += chunk
+        if len(pending) >= _WRITE_BUFFER_SIZE:
+            size += await asyncio.to_thread(_write_chunk, handle, digest, pending)
+            pending = bytearray()
+    size += await asyncio.to_thread(_write_chunk, handle, digest, pending)
+    return size
+
+
+def _write_chunk(handle: BinaryIO, digest: hashlib._Hash, data: bytearray) -> int:
+    digest.update(data)
+    handle.write(data)
+    return len(data)
+
+
+async def _single_chunk(body: bytes) -> AsyncIterator[bytes]:
+    yield body
@@ -3,7 +3,8 @@
 Implements the ``Provider`` lifecycle and exposes publish/subscribe
 operations.  Lambda subscriptions invoke the compute handler with an
 SNS event; SQS subscriptions forward the message wrapped in an SNS
-envelope.
+envelope.  Deliveries are queued on a ``DeliveryScheduler``, which
+bounds concurrency and batches SQS sends.
 """
 
 from __future__ import annotations
@@ -18,6 +19,7 @@ from dataclasses import dataclass
 from lws.interfaces.compute import ICompute, LambdaContext
 from lws.interfaces.provider import Provider, ProviderStatus
 from lws.interfaces.queue import IQueue
+from lws.providers._shared.delivery_scheduler import DeliveryScheduler
 from lws.providers.sns.topic import LocalTopic
 
 logger = logging.getLogger(__name__)
@@ -38,10 +40,20 @@ class SnsProvider(Provider):
     ----------
     topics:
         List of topic configurations to create at startup.
+    scheduler:
+        Delivery scheduler shared with other fan-out providers.  A private
+        one is created when omitted.
     """
 
-    def __init__(self, topics: list[TopicConfig] | None = None) -> None:
+    def __init__(
+        self,
+        topics: list[TopicConfig] | None = None,
+        scheduler: DeliveryScheduler | None = None,
+    ) -> None:
         self._topic_configs = topics or []
+        # A scheduler passed in is shared and stopped by its owner
+        self._owns_delivery = scheduler is None
+        self._delivery = scheduler or DeliveryScheduler()
         self._topics: dict[str, LocalTopic] = {}
         self._status = ProviderStatus.STOPPED
         self._compute_providers: dict[str, ICompute] = {}
@@ -63,12 +75,16 @@ class SnsProvider(Provider):
                     topic_arn=config.topic_arn,
                 )
                 self._topics[config.topic_name] = topic
+            if self._owns_delivery:
+                await self._delivery.start()
             self._status = ProviderStatus.RUNNING
 
     async def stop(self) -> None:
         """Clear all topics and mark the provider as stopped."""
         async with self._lock:
             self._topics.clear()
+            if self._owns_delivery:
+                await self._delivery.stop()
             self._status = ProviderStatus.STOPPED
 
     async def health_check(self) -> bool:
@@ -104,18 +120,16 @@ class SnsProvider(Provider):
             message_attributes=message_attributes,
         )
 
-        # Fan-out to matching subscribers via asyncio tasks
+        # Fan-out to matching subscribers through the delivery scheduler
         subscribers = topic.get_matching_subscribers(message_attributes)
         for sub in subscribers:
-            asyncio.create_task(
-                self._dispatch(
-                    subscription=sub,
-                    topic_arn=topic.topic_arn,
-                    message=message,
-                    message_id=message_id,
-                    subject=subject,
-                    message_attributes=message_attributes,
-                )
+            await self._submit(
+                subscription=sub,
+                topic_arn=topic.topic_arn,
+                message=message,
+                message_id=message_id,
+                subject=subject,
+                message_attributes=message_attributes,
             )
 
         return message_id
@@ -242,7 +256,7 @@ class SnsProvider(Provider):
 
     # -- Dispatch helpers -----------------------------------------------------
 
-    async def _dispatch(
+    async def _submit(
         self,
         subscription: object,
         topic_arn: str,
@@ -251,99 +265,71 @@ class SnsProvider(Provider):
         subject: str | None,
         message_attributes: dict | None,
     ) -> None:
-        """Route a published message to a single subscriber."""
+        """Queue a published message for a single subscriber."""
         from lws.providers.sns.topic import Subscription  # pylint: disable=import-outside-toplevel
 
         sub: Subscription = subscription  # type: ignore[assignment]
-        try:
-            if sub.protocol == "lambda":
-                await self._dispatch_lambda(
-                    endpoint=sub.endpoint,
-                    topic_arn=topic_arn,
-                    message=message,
-                    message_id=message_id,
-                    subject=subject,
-                    message_attributes=message_attributes,
-                )
-            elif sub.protocol == "sqs":
-                await self._dispatch_sqs(
-                    endpoint=sub.endpoint,
-                    topic_arn=topic_arn,
-                    message=message,
-                    message_id=message_id,
-                    subject=subject,
-                    message_attributes=message_attributes,
-                )
-            else:
-                logger.warning("Unsupported subscription protocol: %s", sub.protocol)
-        except Exception:
-            logger.exception(
-                "Failed to dispatch message %s to %s (%s)",
-                message_id,
-                sub.endpoint,
-                sub.protocol,
+        if sub.protocol == "lambda":
+            event = _build_sns_lambda_event(
+                topic_arn=topic_arn,
+                message=message,
+                message_id=message_id,
+                subject=subject,
+                message_attributes=message_attributes,
             )
+            await self._delivery.submit(
+                f"lambda:{sub.endpoint}", (sub.endpoint, event), self._dispatch_lambda
+            )
+        elif sub.protocol == "sqs":
+            # Extract queue name from ARN (last segment)
+            queue_name = sub.endpoint.rsplit(":", 1)[-1] if ":" in sub.endpoint else sub.endpoint
+            envelope = _build_sns_sqs_envelope(
+                topic_arn=topic_arn,
+                message=message,
+                message_id=message_id,
+                subject=subject,
+                message_attributes=message_attributes,
+            )
+            await self._delivery.submit(
+                f"sqs:{queue_name}",
+                (queue_name, json.dumps(envelope)),
+                self._dispatch_sqs,
+                batchable=True,
+            )
+        else:
+            logger.warning("Unsupported subscription protocol: %s", sub.protocol)
+
+    async def _dispatch_lambda(self, items: list[tuple[str, dict]]) -> None:
+        """Invoke a Lambda function with each queued SNS event."""
+        for endpoint, event in items:
+            compute = self._compute_providers.get(endpoint)
+            if compute is None:
+                logger.error("No compute provider found for function: %s", endpoint)
+                continue
+            context = LambdaContext(
+                function_name=endpoint,
+                memory_limit_in_mb=128,
+                timeout_seconds=30,
+                aws_request_id=str(uuid.uuid4()),
+                invoked_function_arn=f"arn:aws:lambda:us-east-1:000000000000:function:{endpoint}",
+            )
+            await compute.invoke(event, context)
 
-    async def _dispatch_lambda(
-        self,
-        endpoint: str,
-        topic_arn: str,
-        message: str,
-        message_id: str,
-        subject: str | None,
-        message_attributes: dict | None,
-    ) -> None:
-        """Invoke a Lambda function with an SNS event."""
-        compute = self._compute_providers.get(endpoint)
-        if compute is None:
-            logger.error("No compute provider found for function: %s", endpoint)
-            return
-
-        event = _build_sns_lambda_event(
-            topic_arn=topic_arn,
-            message=message,
-            message_id=message_id,
-            subject=subject,
-            message_attributes=message_attributes,
-        )
-        context = LambdaContext(
-            function_name=endpoint,
-            memory_limit_in_mb=128,
-            timeout_seconds=30,
-            aws_request_id=str(uuid.uuid4()),
-            invoked_function_arn=f"arn:aws:lambda:us-east-1:000000000000:function:{endpoint}",
-        )
-        await compute.invoke(event, context)
-
-    async def _dispatch_sqs(
-        self,
-        endpoint: str,
-        topic_arn: str,
-        message: str,
-        message_id: str,
-        subject: str | None,
-        message_attributes: dict | None,
-    ) -> None:
-        """Send an SNS-wrapped message to an SQS queue."""
+    async def _dispatch_sqs(self, items: list[tuple[str, str]]) -> None:
+        """Send SNS-wrapped messages to an SQS queue, batched when possible."""
         if self._queue_provider is None:
             logger.error("No queue provider configured for SQS dispatch")
             return
 
-        # Extract queue name from ARN (last segment)
-        queue_name = endpoint.rsplit(":", 1)[-1] if ":" in endpoint else endpoint
-
-        envelope = _build_sns_sqs_envelope(
-            topic_arn=topic_arn,
-            message=message,
-            message_id=message_id,
-            subject=subject,
-            message_attributes=message_attributes,
-        )
-
-        await self._queue_provider.send_message(
-            queue_name=queue_name,
-            message_body=json.dumps(envelope),
-        )
+        queue_name = items[0][0]
+        bodies = [body for _, body in items]
+        if len(bodies) == 1:
+            await self._queue_provider.send_message(
+                queue_name=queue_name,
+                message_body=bodies[0],
+            )
+        else:
+            await self._queue_provider.send_message_batch(queue_name, bodies)
 
     # -- Internal helpers -----------------------------------------------------
 
@@ -1,14 +1,16 @@
 """SQS event-source poller for Lambda integration.
 
-Polls SQS queues at a configurable interval and invokes Lambda handlers
-with SQS-format event batches, emulating the AWS Lambda SQS event-source
-mapping behaviour.
+Long-polls SQS queues and invokes Lambda handlers with SQS-format event
+batches, emulating the AWS Lambda SQS event-source mapping behaviour:
+batching windows, several concurrent invocations per mapping, and
+partial batch failure reporting.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import time
 import uuid
 from dataclasses import dataclass
 
@@ -17,20 +19,37 @@ from lws.interfaces.queue import IQueue
 
 logger = logging.getLogger(__name__)
 
+# Longest long poll SQS allows, used while waiting for the first message.
+_LONG_POLL_SECONDS = 20
+
 
 @dataclass
 class EventSourceMapping:
-    """Maps an SQS queue to a Lambda function."""
+    """Maps an SQS queue to a Lambda function.
+
+    ``maximum_batching_window`` is ``MaximumBatchingWindowInSeconds``,
+    ``maximum_concurrency`` is ``ScalingConfig.MaximumConcurrency``, and
+    ``report_batch_item_failures`` is set when ``FunctionResponseTypes``
+    contains ``ReportBatchItemFailures``.
+    """
 
     queue_name: str
     function_name: str
     batch_size: int = 10
     enabled: bool = True
+    maximum_batching_window: float = 0.0
+    maximum_concurrency: int = 1
+    report_batch_item_failures: bool = False
 
 
 class SqsEventSourcePoller:
     """Polls SQS queues and invokes Lambda functions with event batches.
 
+    Each enabled mapping runs ``maximum_concurrency`` workers.  A worker
+    long-polls the queue, so it wakes as soon as a message is sent rather
+    than after a sleep.  Backoff only applies to queue providers that
+    return empty results without waiting.
+
     Parameters
     ----------
     queue_provider:
@@ -40,7 +59,7 @@ class SqsEventSourcePoller:
     mappings:
         A list of ``EventSourceMapping`` configurations.
     poll_interval:
-        Base polling interval in seconds.
+        Base backoff interval in seconds after an empty, non-blocking poll.
     max_backoff:
         Maximum backoff interval in seconds when queues are empty.
     """
@@ -66,13 +85,15 @@ class SqsEventSourcePoller:
     # ------------------------------------------------------------------
 
     async def start(self) -> None:
-        """Start polling tasks for each enabled mapping."""
+        """Start polling workers for each enabled mapping."""
         self._running = True
         for mapping in self._mappings:
-            if mapping.enabled:
+            if not mapping.enabled:
+                continue
+            for worker in range(max(1, mapping.maximum_concurrency)):
                 task = asyncio.create_task(
                     self._poll_loop(mapping),
-                    name=f"sqs-poller-{mapping.queue_name}",
+                    name=f"sqs-poller-{mapping.queue_name}-{worker}",
                 )
                 self._tasks.append(task)
 
@@ -95,19 +116,24 @@ class SqsEventSourcePoller:
 
         while self._running:
             try:
+                started = time.monotonic()
                 messages = await self._queue_provider.receive_messages(
                     queue_name=mapping.queue_name,
                     max_messages=mapping.batch_size,
+                    wait_time_seconds=_LONG_POLL_SECONDS,
                 )
 
                 if not messages:
-                    backoff = min(backoff * 2, self._max_backoff)
-                    await asyncio.sleep(backoff)
+                    # Only back off if the provider answered without waiting
+                    if time.monotonic() - started < _LONG_POLL_SECONDS:
+                        backoff = min(backoff * 2, self._max_backoff)
+                        await asyncio.sleep(backoff)
                     continue
 
                 # Reset backoff on successful receive
                 backoff = self._poll_interval
 
+                messages += await self._fill_batch(mapping, len(messages))
                 result = await self._invoke_function(mapping, messages)
                 await self._handle_result(mapping, messages, result)
 
@@ -121,6 +147,28 @@ class SqsEventSourcePoller:
                 )
                 await asyncio.sleep(backoff)
 
+    async def _fill_batch(self, mapping: EventSourceMapping, received: int) -> list[dict]:
+        """Gather more messages until the batch is full or the window closes.
+
+        Each receive long-polls for the whole seconds left in the window, so
+        it returns on its own rather than being cancelled after messages
+        have already been made invisible.
+        """
+        extra: list[dict] = []
+        deadline = time.monotonic() + mapping.maximum_batching_window
+        wait = int(mapping.maximum_batching_window)
+        while wait > 0 and received + len(extra) < mapping.batch_size:
+            batch = await self._queue_provider.receive_messages(
+                queue_name=mapping.queue_name,
+                max_messages=mapping.batch_size - received - len(extra),
+                wait_time_seconds=wait,
+            )
+            if not batch:
+                break
+            extra += batch
+            wait = int(deadline - time.monotonic())
+        return extra
+
     # ------------------------------------------------------------------
     # Invocation
     # ------------------------------------------------------------------
@@ -155,23 +203,27 @@ class SqsEventSourcePoller:
         result: InvocationResult,
     ) -> None:
         """Delete successfully processed messages or leave them for retry."""
-        if result.error is None:
-            # Success -- delete all messages
-            for msg in messages:
-                receipt_handle = msg.get("ReceiptHandle", "")
-                if receipt_handle:
-                    await self._queue_provider.delete_message(
-                        mapping.queue_name,
-                        receipt_handle,
-                    )
-        else:
+        failed_ids: set[str] | None = set()
+        if result.error is None and mapping.report_batch_item_failures:
+            failed_ids = _batch_item_failures(result.payload, messages)
+
+        if result.error is not None or failed_ids is None:
             # Failure -- messages will become visible again after timeout
             logger.warning(
                 "Function %s failed for queue %s: %s",
                 mapping.function_name,
                 mapping.queue_name,
-                result.error,
+                result.error or "invalid batchItemFailures response",
             )
+            return
+
+        receipt_handles = [
+            msg["ReceiptHandle"]
+            for msg in messages
+            if msg.get("ReceiptHandle") and msg.get("MessageId") not in failed_ids
+        ]
+        if receipt_handles:
+            await self._queue_provider.delete_message_batch(mapping.queue_name, receipt_handles)
 
 
 # ------------------------------------------------------------------
@@ -197,3 +249,21 @@ def _build_sqs_event(messages: list[dict], queue_name: str) -> dict:
             }
         )
     return {"Records": records}
+
+
+def _batch_item_failures(payload: object, messages: list[dict]) -> set[str] | None:
+    """Return the message IDs a function reported as failed.
+
+    Returns None when the response cannot be trusted, in which case
+    Lambda treats the whole batch as failed.
+    """
+    if not isinstance(payload, dict) or not payload.get("batchItemFailures"):
+        return set()
+    message_ids = {msg.get("MessageId") for msg in messages}
+    failed: set[str] = set()
+    for failure in payload["batchItemFailures"]:
+        item_id = failure.get("itemIdentifier") if isinstance(failure, dict) else None
+        if item_id not in message_ids:
+            return None
+        failed.add(item_id)
+    return failed
@@ -3,17 +3,29 @@
 Persists queue state (messages, visibility timeouts, receive counts) to
 disk so that messages survive ``ldk dev`` restarts.  Each queue gets its
 own SQLite database file under ``<data_dir>/sqs/<queue_name>.db``.
+
+``SqsPersistence`` saves and loads whole snapshots.  ``QueueJournal``
+keeps a queue durable while it runs: every change is appended to
+``<data_dir>/sqs/<queue_name>.log`` in batches, and the log is
+periodically compacted into the snapshot database.  On start the
+snapshot is loaded and the log replayed on top of it.  FIFO deduplication
+IDs are journaled alongside the messages, so a retried send is still
+recognised as a duplicate after a restart.
 """
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import json
+import os
+import sqlite3
 from pathlib import Path
 
 import aiosqlite
 
 from lws.logging.logger import get_logger
-from lws.providers.sqs.queue import SqsMessage
+from lws.providers.sqs.queue import LocalQueue, SqsMessage
 
 _logger = get_logger("ldk.sqs.persistence")
 
@@ -32,6 +44,27 @@ CREATE TABLE IF NOT EXISTS messages (
 )
 """
 
+_CREATE_DEDUP_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS dedup (
+    dedup_id TEXT PRIMARY KEY,
+    message_id TEXT NOT NULL,
+    expires_at REAL NOT NULL
+)
+"""
+
+_INSERT_DEDUP_SQL = "INSERT INTO dedup (dedup_id, message_id, expires_at) VALUES (?, ?, ?)"
+
+_INSERT_SQL = (
+    "INSERT INTO messages "
+    "(message_id, body, attributes, message_attributes, "
+    "receipt_handle, receive_count, sent_timestamp, "
+    "visibility_timeout_until, message_group_id, message_dedup_id) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+# Log records written before the journal compacts them into the snapshot.
+COMPACT_AFTER_RECORDS = 10_000
+
 
 class SqsPersistence:
     """SQLite-backed persistence for SQS queue state.
@@ -69,27 +102,7 @@ class SqsPersistence:
         async with aiosqlite.connect(str(db_path)) as conn:
             await self._ensure_table(conn)
             await conn.execute("DELETE FROM messages")
-
-            for msg in messages:
-                await conn.execute(
-                    "INSERT INTO messages "
-                    "(message_id, body, attributes, message_attributes, "
-                    "receipt_handle, receive_count, sent_timestamp, "
-                    "visibility_timeout_until, message_group_id, message_dedup_id) "
-                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                    (
-                        msg.message_id,
-                        msg.body,
-                        json.dumps(msg.attributes),
-                        json.dumps(msg.message_attributes),
-                        msg.receipt_handle,
-                        msg.receive_count,
-                        msg.sent_timestamp,
-                        msg.visibility_timeout_until,
-                        msg.message_group_id,
-                        msg.message_dedup_id,
-                    ),
-                )
+            await conn.executemany(_INSERT_SQL, [_message_to_row(msg) for msg in messages])
             await conn.commit()
 
         _logger.debug("Saved %d messages for queue %s", len(messages), queue_name)
@@ -111,26 +124,12 @@ class SqsPersistence:
         if not db_path.exists():
             return []
 
-        messages: list[SqsMessage] = []
         async with aiosqlite.connect(str(db_path)) as conn:
             await self._ensure_table(conn)
             cursor = await conn.execute("SELECT * FROM messages")
             rows = await cursor.fetchall()
 
-            for row in rows:
-                msg = SqsMessage(
-                    message_id=row[0],
-                    body=row[1],
-                    attributes=json.loads(row[2]),
-                    message_attributes=json.loads(row[3]),
-                    receipt_handle=row[4],
-                    receive_count=row[5],
-                    sent_timestamp=row[6],
-                    visibility_timeout_until=0.0,  # Reset on restart
-                    message_group_id=row[8],
-                    message_dedup_id=row[9],
-                )
-                messages.append(msg)
+            messages = [_row_to_message(row) for row in rows]
 
         _logger.debug("Loaded %d messages for queue %s", len(messages), queue_name)
         return messages
@@ -142,14 +141,252 @@ class SqsPersistence:
             queue_name: Logical queue name.
         """
         db_path = self._db_path(queue_name)
-        if db_path.exists():
-            db_path.unlink()
+        log_path = db_path.with_suffix(".log")
+        if db_path.exists() or log_path.exists():
+            db_path.unlink(missing_ok=True)
+            log_path.unlink(missing_ok=True)
             _logger.info("Reset state for queue %s", queue_name)
 
     async def reset_all(self) -> None:
         """Delete all persisted SQS state across all queues."""
         if not self._sqs_dir.exists():
             return
-        for db_file in self._sqs_dir.glob("*.db"):
-            db_file.unlink()
-            _logger.info("Deleted %s", db_file.name)
+        for state_file in [*self._sqs_dir.glob("*.db"), *self._sqs_dir.glob("*.log")]:
+            state_file.unlink()
+            _logger.info("Deleted %s", state_file.name)
+
+
+class QueueJournal:
+    """Append-only change log plus snapshot for one queue.
+
+    ``LocalQueue`` hands each change to :meth:`append`, which only
+    buffers it, so sends and receives never wait on disk.  :meth:`flush`
+    writes the buffer to the log and fsyncs it; :meth:`compact` writes a
+    fresh snapshot and truncates the log.  Replaying a log over a
+    snapshot that already contains its changes is harmless, so a crash
+    between the snapshot commit and the truncation loses nothing.
+
+    Args:
+        sqs_dir: Directory holding the queue's snapshot and log files.
+        queue_name: Logical queue name.
+        compact_after_records: Log length at which
+            :attr:`needs_compaction` becomes true.
+    """
+
+    def __init__(
+        self,
+        sqs_dir: Path,
+        queue_name: str,
+        compact_after_records: int = COMPACT_AFTER_RECORDS,
+    ) -> None:
+        sqs_dir.mkdir(parents=True, exist_ok=True)
+        self._snapshot_path = sqs_dir / f"{queue_name}.db"
+        self._log_path = sqs_dir / f"{queue_name}.log"
+        self._compact_after = compact_after_records
+        self._pending: list[tuple] = []
+        self._log_records = 0
+        self._lock = asyncio.Lock()
+        self._removed = False
+
+    @property
+    def needs_compaction(self) -> bool:
+        """Return *True* once the log has grown past the compaction threshold."""
+        return self._log_records >= self._compact_after
+
+    def append(self, record: tuple) -> None:
+        """Buffer a change record emitted by ``LocalQueue``."""
+        self._pending.append(record)
+
+    def replay(self) -> list[SqsMessage]:
+        """Rebuild the queue's messages from the snapshot and the log.
+
+        As with ``SqsPersistence.load_queue_state``, visibility timeouts
+        are reset so in-flight messages are available again.
+        """
+        messages, _ = self._replay_state()
+        return messages
+
+    def restore(self, queue: LocalQueue) -> None:
+        """Load the replayed messages and deduplication IDs into *queue*."""
+        messages, dedup = self._replay_state()
+        for msg in messages:
+            queue.add_message(msg)
+        queue.restore_dedup(
+            [
+                (dedup_id, message_id, expires_at)
+                for dedup_id, (message_id, expires_at) in dedup.items()
+            ]
+        )
+
+    def _replay_state(self) -> tuple[list[SqsMessage], dict[str, tuple[str, float]]]:
+        messages, dedup = _read_snapshot(self._snapshot_path)
+        for record in _read_log(self._log_path):
+            _apply_record(messages, dedup, record)
+            self._log_records += 1
+        for msg in messages.values():
+            msg.visibility_timeout_until = 0.0
+        _logger.debug(
+            "Replayed %d log records for %s (%d messages)",
+            self._log_records,
+            self._snapshot_path.stem,
+            len(messages),
+        )
+        return list(messages.values()), dedup
+
+    async def flush(self) -> None:
+        """Append buffered records to the log and fsync it."""
+        async with self._lock:
+            await self._write_pending()
+
+    async def compact(self, queue: LocalQueue) -> None:
+        """Snapshot *queue* and truncate the log."""
+        async with self._lock:
+            if self._removed:
+                return
+            await self._write_pending()
+            rows = [_message_to_row(msg) for msg in queue.messages]
+            await asyncio.to_thread(
+                _write_snapshot, self._snapshot_path, self._log_path, rows, queue.dedup_entries
+            )
+            self._log_records = 0
+
+    async def remove(self) -> None:
+        """Drop buffered records and delete the queue's files.
+
+        Waits for an in-progress flush or compaction, so neither can
+        recreate the files after they are deleted.
+        """
+        async with self._lock:
+            self._removed = True
+            self._pending.clear()
+            self._snapshot_path.unlink(missing_ok=True)
+            self._log_path.unlink(missing_ok=True)
+
+    async def _write_pending(self) -> None:
+        if self._removed or not self._pending:
+            return
+        records, self._pending = self._pending, []
+        lines = "".join(json.dumps(_encode_record(record)) + "\n" for record in records)
+        await asyncio.to_thread(_append_durably, self._log_path, lines)
+        self._log_records += len(records)
+
+
+def _message_to_row(msg: SqsMessage) -> tuple:
+    return (
+        msg.message_id,
+        msg.body,
+        json.dumps(msg.attributes),
+        json.dumps(msg.message_attributes),
+        msg.receipt_handle,
+        msg.receive_count,
+        msg.sent_timestamp,
+        msg.visibility_timeout_until,
+        msg.message_group_id,
+        msg.message_dedup_id,
+    )
+
+
+def _row_to_message(row: tuple) -> SqsMessage:
+    return SqsMessage(
+        message_id=row[0],
+        body=row[1],
+        attributes=json.loads(row[2]),
+        message_attributes=json.loads(row[3]),
+        receipt_handle=row[4],
+        receive_count=row[5],
+        sent_timestamp=row[6],
+        visibility_timeout_until=0.0,  # Reset on restart
+        message_group_id=row[8],
+        message_dedup_id=row[9],
+    )
+
+
+def _encode_record(record: tuple) -> dict:
+    """Turn a ``LocalQueue`` change record into a JSON-ready dict."""
+    op = record[0]
+    if op == "add":
+        return {"op": op, "message": dataclasses.asdict(record[1])}
+    if op == "receive":
+        return {"op": op, "id": record[1], "count": record[2]}
+    if op == "delete":
+        return {"op": op, "id": record[1]}
+    if op == "dedup":
+        return {"op": op, "id": record[1], "message_id": record[2], "expires_at": record[3]}
+    return {"op": op}
+
+
+def _apply_record(
+    messages: dict[str, SqsMessage], dedup: dict[str, tuple[str, float]], record: dict
+) -> None:
+    """Apply one decoded log record to *messages* and *dedup*, idempotently."""
+    op = record["op"]
+    if op == "add":
+        msg = SqsMessage(**record["message"])
+        messages[msg.message_id] = msg
+    elif op == "receive" and record["id"] in messages:
+        msg = messages[record["id"]]
+        msg.receive_count = record["count"]
+        msg.attributes["ApproximateReceiveCount"] = str(record["count"])
+    elif op == "delete":
+        messages.pop(record["id"], None)
+    elif op == "purge":
+        messages.clear()
+    elif op == "dedup":
+        dedup[record["id"]] = (record["message_id"], record["expires_at"])
+
+
+def _read_snapshot(
+    path: Path,
+) -> tuple[dict[str, SqsMessage], dict[str, tuple[str, float]]]:
+    if not path.exists():
+        return {}, {}
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute(_CREATE_TABLE_SQL)
+        conn.execute(_CREATE_DEDUP_TABLE_SQL)
+        rows = conn.execute("SELECT * FROM messages ORDER BY rowid").fetchall()
+        dedup_rows = conn.execute("SELECT dedup_id, message_id, expires_at FROM dedup").fetchall()
+    finally:
+        conn.close()
+    messages = {msg.message_id: msg for msg in map(_row_to_message, rows)}
+    return messages, {row[0]: (row[1], row[2]) for row in dedup_rows}
+
+
+def _read_log(path: Path) -> list[dict]:
+    """Read log records, stopping at a torn final line left by a crash."""
+    if not path.exists():
+        return []
+    records: list[dict] = []
+    with path.open(encoding="utf-8") as log:
+        for line in log:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                _logger.warning("Ignoring truncated record at the end of %s", path.name)
+                break
+    return records
+
+
+def _append_durably(path: Path, text: str) -> None:
+    with path.open("a", encoding="utf-8") as log:
+        log.write(text)
+        log.flush()
+        os.fsync(log.fileno())
+
+
+def _write_snapshot(
+    snapshot_path: Path, log_path: Path, rows: list[tuple], dedup_rows: list[tuple]
+) -> None:
+    conn = sqlite3.connect(snapshot_path)
+    try:
+        conn.execute(_CREATE_TABLE_SQL)
+        conn.execute(_CREATE_DEDUP_TABLE_SQL)
+        with conn:
+            conn.execute("DELETE FROM messages")
+            conn.executemany(_INSERT_SQL, rows)
+            conn.execute("DELETE FROM dedup")
+            conn.executemany(_INSERT_DEDUP_SQL, dedup_rows)
+    finally:
+        conn.close()
+    with log_path.open("w", encoding="utf-8") as log:
+        os.fsync(log.fileno())
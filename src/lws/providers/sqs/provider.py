@@ -7,12 +7,19 @@ as a pluggable provider.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import time
 from dataclasses import dataclass, field
+from pathlib import Path
 
 from lws.interfaces.queue import IQueue
+from lws.logging.logger import get_logger
+from lws.providers.sqs.persistence import COMPACT_AFTER_RECORDS, QueueJournal
 from lws.providers.sqs.queue import LocalQueue
 
+_logger = get_logger("ldk.sqs.provider")
+
 _FAKE_ACCOUNT = "000000000000"
 _FAKE_REGION = "us-east-1"
 
@@ -61,12 +68,30 @@ class SqsProvider(IQueue):
 
     Manages creation and lifecycle of local queues and implements the
     ``IQueue`` interface for interoperability with the rest of LDK.
+
+    When *data_dir* is given, every queue is made durable with a
+    ``QueueJournal`` under ``<data_dir>/sqs/``: changes are logged in
+    the background every *fsync_interval_ms*, the log is compacted into a
+    snapshot once it reaches *compact_after_records* records, and queues
+    are rebuilt from disk when they are created.  Sends and receives
+    still only touch memory.
     """
 
-    def __init__(self, queues: list[QueueConfig] | None = None) -> None:
+    def __init__(
+        self,
+        queues: list[QueueConfig] | None = None,
+        data_dir: Path | None = None,
+        fsync_interval_ms: int = 100,
+        compact_after_records: int = COMPACT_AFTER_RECORDS,
+    ) -> None:
         self._configs = {q.queue_name: q for q in (queues or [])}
         self._queues: dict[str, LocalQueue] = {}
         self._running = False
+        self._sqs_dir = data_dir / "sqs" if data_dir is not None else None
+        self._fsync_interval = fsync_interval_ms / 1000.0
+        self._compact_after = compact_after_records
+        self._journals: dict[str, QueueJournal] = {}
+        self._flush_task: asyncio.Task | None = None
 
     @property
     def queues(self) -> dict[str, LocalQueue]:
@@ -90,12 +115,7 @@ class SqsProvider(IQueue):
         """Create ``LocalQueue`` instances for each configured queue."""
         # First pass: create all queues without DLQ links
         for config in self._configs.values():
-            self._queues[config.queue_name] = LocalQueue(
-                queue_name=config.queue_name,
-                visibility_timeout=config.visibility_timeout,
-                is_fifo=config.is_fifo,
-                content_based_dedup=config.content_based_dedup,
-            )
+            self._queues[config.queue_name] = self._new_queue(config)
 
         # Second pass: wire up redrive policies (DLQ references)
         for config in self._configs.values():
@@ -107,13 +127,34 @@ class SqsProvider(IQueue):
                     queue.dead_letter_queue = dlq
                     queue.max_receive_count = config.redrive_policy.max_receive_count
 
+        if self._sqs_dir is not None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
         self._running = True
 
     async def stop(self) -> None:
-        """Stop the provider and release resources."""
+        """Stop the provider, writing out any buffered log records."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+            self._flush_task = None
+        for journal in self._journals.values():
+            await journal.flush()
+        self._journals.clear()
         self._queues.clear()
         self._running = False
 
+    async def flush(self) -> None:
+        """Compact every durable queue's log into its snapshot.
+
+        Called by the orchestrator before shutdown so the next start only
+        has to load snapshots.
+        """
+        for queue_name, journal in list(self._journals.items()):
+            queue = self._queues.get(queue_name)
+            if queue is not None:
+                await journal.compact(queue)
+
     async def health_check(self) -> bool:
         """Return *True* when the provider is running."""
         return self._running
@@ -137,6 +178,11 @@ class SqsProvider(IQueue):
             delay_seconds=delay_seconds,
         )
 
+    async def send_message_batch(self, queue_name: str, message_bodies: list[str]) -> list[str]:
+        """Send several messages to the named queue under one lock."""
+        queue = self._get_queue(queue_name)
+        return await queue.send_messages(message_bodies)
+
     async def receive_messages(
         self,
         queue_name: str,
@@ -172,6 +218,11 @@ class SqsProvider(IQueue):
         queue = self._get_queue(queue_name)
         await queue.delete_message(receipt_handle)
 
+    async def delete_message_batch(self, queue_name: str, receipt_handles: list[str]) -> None:
+        """Delete several messages from the named queue under one lock."""
+        queue = self._get_queue(queue_name)
+        await queue.delete_messages(receipt_handles)
+
     # ------------------------------------------------------------------
     # Queue management helpers
     # ------------------------------------------------------------------
@@ -186,12 +237,7 @@ class SqsProvider(IQueue):
         existing = self._queues.get(config.queue_name)
         if existing is not None:
             return existing
-        queue = LocalQueue(
-            queue_name=config.queue_name,
-            visibility_timeout=config.visibility_timeout,
-            is_fifo=config.is_fifo,
-            content_based_dedup=config.content_based_dedup,
-        )
+        queue = self._new_queue(config)
         self._queues[config.queue_name] = queue
         self._configs[config.queue_name] = config
         return queue
@@ -212,6 +258,9 @@ class SqsProvider(IQueue):
             raise KeyError(f"Queue not found: {queue_name}")
         del self._queues[queue_name]
         self._configs.pop(queue_name, None)
+        journal = self._journals.pop(queue_name, None)
+        if journal is not None:
+            await journal.remove()
 
     async def get_queue_attributes(self, queue_name: str) -> dict:
         """Return queue attributes dict. Raises KeyError if not found."""
@@ -220,7 +269,7 @@ class SqsProvider(IQueue):
             raise KeyError(f"Queue not found: {queue_name}")
         attrs: dict[str, str] = {
             "QueueArn": f"arn:aws:sqs:{_FAKE_REGION}:{_FAKE_ACCOUNT}:{queue_name}",
-            "ApproximateNumberOfMessages": str(len(queue.messages)),
+            "ApproximateNumberOfMessages": str(queue.message_count),
             "VisibilityTimeout": str(queue.visibility_timeout),
             "CreatedTimestamp": str(int(time.time())),
             "LastModifiedTimestamp": str(int(time.time())),
@@ -239,13 +288,40 @@ class SqsProvider(IQueue):
         queue = self._queues.get(queue_name)
         if queue is None:
             raise KeyError(f"Queue not found: {queue_name}")
-        async with queue.lock:
-            queue.messages.clear()
+        await queue.purge()
 
     # ------------------------------------------------------------------
     # Internal
     # ------------------------------------------------------------------
 
+    def _new_queue(self, config: QueueConfig) -> LocalQueue:
+        """Build a ``LocalQueue``, restoring it from disk when durable."""
+        queue = LocalQueue(
+            queue_name=config.queue_name,
+            visibility_timeout=config.visibility_timeout,
+            is_fifo=config.is_fifo,
+            content_based_dedup=config.content_based_dedup,
+        )
+        if self._sqs_dir is not None:
+            journal = QueueJournal(self._sqs_dir, config.queue_name, self._compact_after)
+            journal.restore(queue)
+            queue.journal = journal.append
+            self._journals[config.queue_name] = journal
+        return queue
+
+    async def _flush_loop(self) -> None:
+        """Background loop that fsyncs queue logs and compacts long ones."""
+        while True:
+            await asyncio.sleep(self._fsync_interval)
+            for queue_name, journal in list(self._journals.items()):
+                try:
+                    await journal.flush()
+                    queue = self._queues.get(queue_name)
+                    if queue is not None and journal.needs_compaction:
+                        await journal.compact(queue)
+                except Exception as exc:
+                    _logger.error("Error persisting SQS queue %s: %s", queue_name, exc)
+
     def _get_queue(self, queue_name: str) -> LocalQueue:
         """Look up a queue by name, raising ``KeyError`` if missing."""
         queue = self._queues.get(queue_name)
@@ -3,16 +3,40 @@
 Provides ``LocalQueue``, an asyncio-safe in-memory message queue that
 faithfully emulates SQS semantics including visibility timeout, FIFO
 ordering, content-based deduplication, and dead-letter queue routing.
+
+Messages are indexed so that receive, delete, and visibility changes do
+not scan the whole queue:
+
+- visible messages sit in a per-group heap ordered by send sequence
+  (standard queues use a single, ungrouped heap)
+- a ready-group heap orders the groups by the sequence of their head
+  message, so a receive merges groups in send order
+- in-flight and delayed messages sit in a heap keyed by the time they
+  become visible again, and are released lazily on the next receive
+- receipt handles map directly to their message
+
+Heap entries are invalidated lazily: each message carries a generation
+number that is bumped whenever its state changes, and stale entries are
+skipped when they surface.
 """
 
 from __future__ import annotations
 
 import asyncio
 import hashlib
+import heapq
 import time
 import uuid
+from collections.abc import Callable
 from dataclasses import dataclass, field
 
+# Group key for messages that never block each other: every message in a
+# standard queue, and FIFO messages sent without a group ID.
+_UNGROUPED = ""
+
+# How long a FIFO deduplication ID suppresses repeated sends, in seconds.
+DEDUP_WINDOW_SECONDS = 300
+
 
 @dataclass
 class SqsMessage:
@@ -30,6 +54,17 @@ class SqsMessage:
     message_dedup_id: str | None = None
 
 
+@dataclass(eq=False)
+class _Slot:
+    """Index bookkeeping for one message held by a ``LocalQueue``."""
+
+    message: SqsMessage
+    seq: int
+    group: str
+    hidden: bool = False
+    generation: int = 0
+
+
 class LocalQueue:
     """In-memory message queue that emulates core SQS behaviour.
 
@@ -49,6 +84,14 @@ class LocalQueue:
         *max_receive_count*.
     max_receive_count:
         Number of receives before routing to the dead-letter queue.
+
+    Attributes
+    ----------
+    journal:
+        Optional callback receiving a change record for every add,
+        receive, delete, purge, and new deduplication ID, e.g.
+        ``QueueJournal.append``.  It is called under the queue lock and
+        must not block.
     """
 
     def __init__(
@@ -66,18 +109,56 @@ class LocalQueue:
         self.content_based_dedup = content_based_dedup
         self.dead_letter_queue = dead_letter_queue
         self.max_receive_count = max_receive_count
+        self.journal: Callable[[tuple], None] | None = None
 
-        self._messages: list[SqsMessage] = []
         self._lock = asyncio.Lock()
         self._message_available = asyncio.Event()
-
-        # FIFO deduplication: maps dedup_id -> expiry monotonic time
-        self._dedup_cache: dict[str, float] = {}
+        self._next_seq = 0
+
+        # All messages by message_id, in send order
+        self._slots: dict[str, _Slot] = {}
+        self._by_receipt: dict[str, _Slot] = {}
+        # group -> heap of (seq, generation, slot) for visible messages
+        self._groups: dict[str, list[tuple[int, int, _Slot]]] = {}
+        # heap of (head seq, group) for groups that may have a receivable head
+        self._ready_groups: list[tuple[int, str]] = []
+        # heap of (visible_at, seq, generation, slot) for hidden messages
+        self._hidden: list[tuple[float, int, int, _Slot]] = []
+        # group -> number of hidden (in-flight or delayed) messages
+        self._hidden_counts: dict[str, int] = {}
+
+        # FIFO deduplication: maps dedup_id -> (expiry monotonic time,
+        # message_id), oldest expiry first
+        self._dedup_cache: dict[str, tuple[float, str]] = {}
 
     @property
     def messages(self) -> list[SqsMessage]:
-        """Return the messages list."""
-        return self._messages
+        """Return a snapshot of the queued messages in send order."""
+        return [slot.message for slot in self._slots.values()]
+
+    @property
+    def message_count(self) -> int:
+        """Return the number of messages held by the queue."""
+        return len(self._slots)
+
+    @property
+    def dedup_entries(self) -> list[tuple[str, str, float]]:
+        """Return live ``(dedup_id, message_id, expires_at)`` entries.
+
+        ``expires_at`` is wall-clock time, so entries can outlive a restart.
+        """
+        offset = time.time() - time.monotonic()
+        return [
+            (dedup_id, message_id, expiry + offset)
+            for dedup_id, (expiry, message_id) in self._dedup_cache.items()
+        ]
+
+    def restore_dedup(self, entries: list[tuple[str, str, float]]) -> None:
+        """Reload entries produced by :attr:`dedup_entries`, dropping expired ones."""
+        offset = time.monotonic() - time.time()
+        for dedup_id, message_id, expires_at in sorted(entries, key=lambda e: e[2]):
+            self._dedup_cache[dedup_id] = (expires_at + offset, message_id)
+        self._purge_dedup_cache(time.monotonic())
 
     @property
     def lock(self) -> asyncio.Lock:
@@ -98,32 +179,82 @@ class LocalQueue:
     ) -> str:
         """Enqueue a message and return its ``message_id``."""
         async with self._lock:
-            dedup_id = self._resolve_dedup_id(body, message_dedup_id)
-            if dedup_id is not None and self._is_duplicate(dedup_id):
-                # Return existing message_id for a duplicate within the window
-                return self._find_dedup_message_id(dedup_id)
-
-            message_id = str(uuid.uuid4())
             now = time.monotonic()
-            msg = SqsMessage(
-                message_id=message_id,
-                body=body,
-                message_attributes=message_attributes or {},
-                attributes={"ApproximateReceiveCount": "0"},
-                sent_timestamp=time.time(),
+            self._purge_dedup_cache(now)
+            return self._enqueue(
+                now,
+                body,
+                message_attributes=message_attributes,
+                delay_seconds=delay_seconds,
                 message_group_id=message_group_id,
-                message_dedup_id=dedup_id,
+                message_dedup_id=message_dedup_id,
             )
-            if delay_seconds > 0:
-                msg.visibility_timeout_until = now + delay_seconds
 
-            self._messages.append(msg)
+    async def send_messages(self, bodies: list[str]) -> list[str]:
+        """Enqueue several plain messages under one lock; returns their IDs."""
+        async with self._lock:
+            now = time.monotonic()
+            self._purge_dedup_cache(now)
+            return [self._enqueue(now, body) for body in bodies]
 
-            if dedup_id is not None:
-                self._dedup_cache[dedup_id] = now + 300  # 5-minute window
+    def _enqueue(
+        self,
+        now: float,
+        body: str,
+        message_attributes: dict | None = None,
+        delay_seconds: int = 0,
+        message_group_id: str | None = None,
+        message_dedup_id: str | None = None,
+    ) -> str:
+        """Build and add one message; the caller holds the queue lock."""
+        dedup_id = self._resolve_dedup_id(body, message_dedup_id)
+        if dedup_id is not None and dedup_id in self._dedup_cache:
+            # Return existing message_id for a duplicate within the window
+            return self._dedup_cache[dedup_id][1]
+
+        message_id = str(uuid.uuid4())
+        msg = SqsMessage(
+            message_id=message_id,
+            body=body,
+            message_attributes=message_attributes or {},
+            attributes={"ApproximateReceiveCount": "0"},
+            sent_timestamp=time.time(),
+            message_group_id=message_group_id,
+            message_dedup_id=dedup_id,
+        )
+        if delay_seconds > 0:
+            msg.visibility_timeout_until = now + delay_seconds
+
+        self.add_message(msg)
+
+        if dedup_id is not None:
+            self._dedup_cache[dedup_id] = (now + DEDUP_WINDOW_SECONDS, message_id)
+            if self.journal is not None:
+                expires_at = time.time() + DEDUP_WINDOW_SECONDS
+                self.journal(("dedup", dedup_id, message_id, expires_at))
 
-            self._message_available.set()
-            return message_id
+        return message_id
+
+    def add_message(self, msg: SqsMessage) -> None:
+        """Append an existing *msg*, such as one moved from a source queue.
+
+        The message is hidden until its ``visibility_timeout_until`` and
+        visible immediately if that time has already passed.  Callers are
+        responsible for holding the queue lock where it matters.
+        """
+        group = (msg.message_group_id or _UNGROUPED) if self.is_fifo else _UNGROUPED
+        slot = _Slot(message=msg, seq=self._next_seq, group=group)
+        self._next_seq += 1
+        self._slots[msg.message_id] = slot
+        if msg.receipt_handle is not None:
+            self._by_receipt[msg.receipt_handle] = slot
+        if msg.visibility_timeout_until > time.monotonic():
+            self._hide(slot, msg.visibility_timeout_until)
+        else:
+            self._show(slot)
+        if self.journal is not None:
+            self.journal(("add", msg))
+        self._message_available.set()
 
     # ------------------------------------------------------------------
     # Receive
@@ -142,7 +273,7 @@ class LocalQueue:
 
         while True:
             async with self._lock:
-                self._purge_dedup_cache()
+                self._purge_dedup_cache(time.monotonic())
                 messages = self._collect_visible(max_messages)
                 if messages:
                     return messages
@@ -165,13 +296,50 @@ class LocalQueue:
                     return self._collect_visible(max_messages)
 
     # ------------------------------------------------------------------
-    # Delete
+    # Delete / visibility / purge
     # ------------------------------------------------------------------
 
     async def delete_message(self, receipt_handle: str) -> None:
         """Remove a message from the queue by its *receipt_handle*."""
         async with self._lock:
-            self._messages = [m for m in self._messages if m.receipt_handle != receipt_handle]
+            slot = self._by_receipt.get(receipt_handle)
+            if slot is not None:
+                self._discard(slot)
+
+    async def delete_messages(self, receipt_handles: list[str]) -> None:
+        """Remove every message whose receipt handle is in *receipt_handles*."""
+        async with self._lock:
+            for receipt_handle in receipt_handles:
+                slot = self._by_receipt.get(receipt_handle)
+                if slot is not None:
+                    self._discard(slot)
+
+    async def change_message_visibility(self, receipt_handle: str, visibility_timeout: int) -> bool:
+        """Hide the message for *visibility_timeout* seconds from now.
+
+        Returns *False* if no message holds *receipt_handle*.
+        """
+        async with self._lock:
+            slot = self._by_receipt.get(receipt_handle)
+            if slot is None:
+                return False
+            self._hide(slot, time.monotonic() + visibility_timeout)
+            self._schedule_group(slot.group)
+            if visibility_timeout <= 0:
+                self._message_available.set()
+            return True
+
+    async def purge(self) -> None:
+        """Remove every message from the queue."""
+        async with self._lock:
+            self._slots.clear()
+            self._by_receipt.clear()
+            self._groups.clear()
+            self._ready_groups.clear()
+            self._hidden.clear()
+            self._hidden_counts.clear()
+            if self.journal is not None:
+                self.journal(("purge",))
 
     # ------------------------------------------------------------------
     # Helpers (internal, called under lock)
@@ -186,49 +354,109 @@ class LocalQueue:
         returned in order.
         """
         now = time.monotonic()
-        blocked_groups = self._find_blocked_groups(now)
+        self._release_expired(now)
         result: list[SqsMessage] = []
-        to_dlq: list[SqsMessage] = []
+        batch_groups: set[str] = set()
 
-        for msg in self._messages:
-            if len(result) >= max_messages:
-                break
-            if not self._is_eligible(msg, now, blocked_groups):
-                continue
-            if self._should_route_to_dlq(msg):
-                to_dlq.append(msg)
+        while len(result) < max_messages and self._ready_groups:
+            seq, group = heapq.heappop(self._ready_groups)
+            head = self._group_head(group)
+            if head is None or head.seq != seq or self._is_blocked(group, batch_groups):
                 continue
-            self._mark_received(msg, now)
-            result.append(msg)
-
-        for msg in to_dlq:
-            self._route_to_dlq(msg)
+            heapq.heappop(self._groups[group])
+            if self._should_route_to_dlq(head.message):
+                self._route_to_dlq(head)
+            else:
+                self._mark_received(head, now)
+                batch_groups.add(group)
+                result.append(head.message)
+            self._schedule_group(group, batch_groups)
 
         return result
 
-    def _find_blocked_groups(self, now: float) -> set[str]:
-        """Return FIFO groups that have an in-flight message."""
-        groups: set[str] = set()
-        if self.is_fifo:
-            for msg in self._messages:
-                if msg.message_group_id and msg.visibility_timeout_until > now:
-                    groups.add(msg.message_group_id)
-        return groups
-
-    def _is_eligible(self, msg: SqsMessage, now: float, blocked_groups: set[str]) -> bool:
-        """Return *True* if *msg* can be received right now."""
-        if msg.visibility_timeout_until > now:
-            return False
-        if self.is_fifo and msg.message_group_id in blocked_groups:
-            return False
-        return True
-
-    def _mark_received(self, msg: SqsMessage, now: float) -> None:
-        """Update *msg* state to reflect that it has been received."""
+    def _release_expired(self, now: float) -> None:
+        """Make hidden messages whose visibility time has passed visible."""
+        while self._hidden and self._hidden[0][0] <= now:
+            _, _, generation, slot = heapq.heappop(self._hidden)
+            if generation != slot.generation:
+                continue
+            self._show(slot)
+            self._decrement_hidden(slot.group)
+
+    def _show(self, slot: _Slot) -> None:
+        """Mark *slot* visible and index it in its group heap."""
+        slot.hidden = False
+        slot.generation += 1
+        heapq.heappush(self._groups.setdefault(slot.group, []), (slot.seq, slot.generation, slot))
+        self._schedule_group(slot.group)
+
+    def _hide(self, slot: _Slot, until: float) -> None:
+        """Mark *slot* hidden until the monotonic time *until*."""
+        if not slot.hidden and slot.group != _UNGROUPED:
+            self._hidden_counts[slot.group] = self._hidden_counts.get(slot.group, 0) + 1
+        slot.hidden = True
+        slot.generation += 1
+        slot.message.visibility_timeout_until = until
+        heapq.heappush(self._hidden, (until, slot.seq, slot.generation, slot))
+
+    def _discard(self, slot: _Slot) -> None:
+        """Drop *slot* from every index."""
+        del self._slots[slot.message.message_id]
+        if slot.message.receipt_handle is not None:
+            self._by_receipt.pop(slot.message.receipt_handle, None)
+        slot.generation += 1
+        if self.journal is not None:
+            self.journal(("delete", slot.message.message_id))
+        if slot.hidden:
+            self._decrement_hidden(slot.group)
+        else:
+            self._schedule_group(slot.group)
+
+    def _decrement_hidden(self, group: str) -> None:
+        """Record that a hidden message in *group* left the hidden state."""
+        if group == _UNGROUPED:
+            return
+        remaining = self._hidden_counts[group] - 1
+        if remaining:
+            self._hidden_counts[group] = remaining
+        else:
+            del self._hidden_counts[group]
+            self._schedule_group(group)
+
+    def _group_head(self, group: str) -> _Slot | None:
+        """Return the oldest visible message in *group*, dropping stale entries."""
+        heap = self._groups.get(group)
+        while heap and heap[0][1] != heap[0][2].generation:
+            heapq.heappop(heap)
+        if not heap:
+            self._groups.pop(group, None)
+            return None
+        return heap[0][2]
+
+    def _is_blocked(self, group: str, batch_groups: set[str] | None = None) -> bool:
+        """Return *True* if *group* has a message in flight from an earlier receive."""
+        return group in self._hidden_counts and group not in (batch_groups or ())
+
+    def _schedule_group(self, group: str, batch_groups: set[str] | None = None) -> None:
+        """Offer the current head of *group* to the next receive."""
+        if self._is_blocked(group, batch_groups):
+            return
+        head = self._group_head(group)
+        if head is not None:
+            heapq.heappush(self._ready_groups, (head.seq, group))
+
+    def _mark_received(self, slot: _Slot, now: float) -> None:
+        """Update *slot* state to reflect that it has been received."""
+        msg = slot.message
+        if msg.receipt_handle is not None:
+            self._by_receipt.pop(msg.receipt_handle, None)
         msg.receive_count += 1
         msg.attributes["ApproximateReceiveCount"] = str(msg.receive_count)
         msg.receipt_handle = str(uuid.uuid4())
-        msg.visibility_timeout_until = now + self.visibility_timeout
+        self._by_receipt[msg.receipt_handle] = slot
+        self._hide(slot, now + self.visibility_timeout)
+        if self.journal is not None:
+            self.journal(("receive", msg.message_id, msg.receive_count))
 
     def _should_route_to_dlq(self, msg: SqsMessage) -> bool:
         """Check whether *msg* should be moved to the dead-letter queue."""
@@ -238,14 +466,15 @@ class LocalQueue:
             and msg.receive_count >= self.max_receive_count
         )
 
-    def _route_to_dlq(self, msg: SqsMessage) -> None:
-        """Move *msg* to the dead-letter queue (must be called under lock)."""
-        self._messages.remove(msg)
+    def _route_to_dlq(self, slot: _Slot) -> None:
+        """Move *slot*'s message to the dead-letter queue (must be called under lock)."""
+        self._discard(slot)
         if self.dead_letter_queue is not None:
+            msg = slot.message
             # Reset visibility so DLQ consumers can receive it immediately
             msg.visibility_timeout_until = 0.0
             msg.receipt_handle = None
-            self.dead_letter_queue.messages.append(msg)
+            self.dead_letter_queue.add_message(msg)
 
     def _resolve_dedup_id(self, body: str, explicit_id: str | None) -> str | None:
         """Return the deduplication ID if FIFO dedup is applicable."""
@@ -257,26 +486,17 @@ class LocalQueue:
             return hashlib.sha256(body.encode()).hexdigest()
         return None
 
-    def _is_duplicate(self, dedup_id: str) -> bool:
-        """Return *True* if *dedup_id* is within its 5-minute window."""
-        expiry = self._dedup_cache.get(dedup_id)
-        if expiry is None:
-            return False
-        return time.monotonic() < expiry
-
-    def _find_dedup_message_id(self, dedup_id: str) -> str:
-        """Find the message_id for a duplicate dedup_id."""
-        for msg in self._messages:
-            if msg.message_dedup_id == dedup_id:
-                return msg.message_id
-        return str(uuid.uuid4())  # fallback
-
-    def _purge_dedup_cache(self) -> None:
-        """Remove expired entries from the deduplication cache."""
-        now = time.monotonic()
-        expired = [k for k, v in self._dedup_cache.items() if v <= now]
-        for k in expired:
-            del self._dedup_cache[k]
+    def _purge_dedup_cache(self, now: float) -> None:
+        """Remove expired entries from the deduplication cache.
+
+        Entries are inserted with a fixed window, so the dict is ordered
+        by expiry and only its expired prefix needs to be visited.
+        """
+        while self._dedup_cache:
+            dedup_id, (expiry, _) = next(iter(self._dedup_cache.items()))
+            if expiry > now:
+                return
+            del self._dedup_cache[dedup_id]
 
     @staticmethod
     def md5_of_body(body: str) -> str:
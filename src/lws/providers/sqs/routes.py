@@ -161,12 +161,8 @@ class SqsRouter:
             queue = self.provider.get_queue(queue_name)
             if queue is not None:
                 vt = int(visibility_timeout)
-                now = time.monotonic()
                 for msg_dict in messages:
-                    # Find the underlying message and adjust
-                    for m in queue.messages:
-                        if m.message_id == msg_dict["MessageId"]:
-                            m.visibility_timeout_until = now + vt
+                    await queue.change_message_visibility(msg_dict["ReceiptHandle"], vt)
 
         msg_xml_parts: list[str] = []
         for msg in messages:
@@ -305,11 +301,7 @@ class SqsRouter:
                 status_code=400,
             )
 
-        now = time.monotonic()
-        for msg in queue.messages:
-            if msg.receipt_handle == receipt_handle:
-                msg.visibility_timeout_until = now + visibility_timeout
-                break
+        await queue.change_message_visibility(receipt_handle, visibility_timeout)
 
         xml = (
             "<ChangeMessageVisibilityResponse>"
@@ -331,7 +323,6 @@ class SqsRouter:
                 status_code=400,
             )
 
-        now = time.monotonic()
         n = 1
         while f"ChangeMessageVisibilityBatchRequestEntry.{n}.Id" in params:
             entry_id = params[f"ChangeMessageVisibilityBatchRequestEntry.{n}.Id"]
@@ -342,12 +333,7 @@ class SqsRouter:
                 params.get(f"ChangeMessageVisibilityBatchRequestEntry.{n}.VisibilityTimeout", "0")
             )
 
-            found = False
-            for msg in queue.messages:
-                if msg.receipt_handle == receipt_handle:
-                    msg.visibility_timeout_until = now + vt
-                    found = True
-                    break
+            found = await queue.change_message_visibility(receipt_handle, vt)
 
             if found:
                 successful.append(
@@ -531,11 +517,8 @@ class SqsRouter:
             queue = self.provider.get_queue(queue_name)
             if queue is not None:
                 vt = int(visibility_timeout)
-                now = time.monotonic()
                 for msg_dict in messages:
-                    for m in queue.messages:
-                        if m.message_id == msg_dict["MessageId"]:
-                            m.visibility_timeout_until = now + vt
+                    await queue.change_message_visibility(msg_dict["ReceiptHandle"], vt)
 
         json_messages = []
         for msg in messages:
@@ -725,11 +708,7 @@ class SqsRouter:
                 f"The specified queue does not exist: {queue_name}",
             )
 
-        now = time.monotonic()
-        for msg in queue.messages:
-            if msg.receipt_handle == receipt_handle:
-                msg.visibility_timeout_until = now + visibility_timeout
-                break
+        await queue.change_message_visibility(receipt_handle, visibility_timeout)
 
         return _json_response({})
 
@@ -746,19 +725,13 @@ class SqsRouter:
 
         successful: list[dict] = []
         failed: list[dict] = []
-        now = time.monotonic()
 
         for entry in entries:
             entry_id = entry.get("Id", "")
             receipt_handle = entry.get("ReceiptHandle", "")
             vt = int(entry.get("VisibilityTimeout", 0))
 
-            found = False
-            for msg in queue.messages:
-                if msg.receipt_handle == receipt_handle:
-                    msg.visibility_timeout_until = now + vt
-                    found = True
-                    break
+            found = await queue.change_message_visibility(receipt_handle, vt)
 
             if found:
                 successful.append({"Id": entry_id})
@@ -898,7 +871,7 @@ def _build_queue_attrs(
     # Start with defaults
     attrs: dict[str, str] = {
         "QueueArn": f"arn:aws:sqs:{_FAKE_REGION}:{_FAKE_ACCOUNT}:{queue_name}",
-        "ApproximateNumberOfMessages": str(len(queue.messages)),  # type: ignore[attr-defined]
+        "ApproximateNumberOfMessages": str(queue.message_count),  # type: ignore[attr-defined]
         "ApproximateNumberOfMessagesNotVisible": "0",
         "ApproximateNumberOfMessagesDelayed": "0",
         "VisibilityTimeout": str(queue.visibility_timeout),  # type: ignore[attr-defined]
@@ -0,0 +1,442 @@
+"""Bounded execution history store for the Step Functions provider.
+
+Running executions stay in memory as live ``ExecutionHistory`` objects.
+Once an execution reaches a terminal status it is serialised into a
+SQLite table -- in memory by default, or a scratch file under the data
+directory -- and the Python objects are dropped:
+
+- each input/output payload is stored as JSON text capped at 256 KB, the
+  AWS limit; longer payloads are cut and flagged as truncated;
+- rows are indexed by state machine, status and start time, so
+  ``ListExecutions`` is a seek plus a short range scan, paginated with
+  an opaque ``nextToken``;
+- completed executions are evicted oldest first once the configured
+  count, age or payload byte budget is exceeded.
+
+Executions read back from the table are rebuilt as ``ExecutionHistory``
+objects.  Truncated payloads come back as :class:`TruncatedPayload`
+strings; use :func:`payload_json` to render any payload for the API.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import sqlite3
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from lws.providers.stepfunctions.engine import (
+    ExecutionHistory,
+    ExecutionStatus,
+    StateTransition,
+)
+
+# AWS rejects state input/output larger than 256 KB.
+MAX_PAYLOAD_BYTES = 256 * 1024
+
+_CREATE_SQL = (
+    "CREATE TABLE IF NOT EXISTS executions ("
+    "arn TEXT PRIMARY KEY, state_machine TEXT NOT NULL, status TEXT NOT NULL, "
+    "start_time REAL NOT NULL, end_time REAL, error TEXT, cause TEXT, "
+    "input TEXT, output TEXT, transitions TEXT NOT NULL, "
+    "bytes INTEGER NOT NULL, completed_at REAL NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS executions_by_machine "
+    "ON executions (state_machine, start_time, arn)",
+    "CREATE INDEX IF NOT EXISTS executions_by_status ON executions (status, start_time, arn)",
+    "CREATE INDEX IF NOT EXISTS executions_by_start ON executions (start_time, arn)",
+    "CREATE INDEX IF NOT EXISTS executions_by_age ON executions (completed_at)",
+)
+
+_UPSERT_SQL = "INSERT OR REPLACE INTO executions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+_SUMMARY_COLUMNS = "arn, state_machine, status, start_time, end_time, error, cause"
+
+
+class TruncatedPayload(str):
+    """JSON text of a payload that was cut at the size limit."""
+
+
+@dataclass
+class HistoryConfig:
+    """Retention and storage settings for execution history.
+
+    Attributes:
+        max_executions: Completed executions kept; 0 keeps all.
+        max_age_s: Seconds a completed execution is kept; 0 keeps it forever.
+        max_bytes: Stored payload bytes kept across completed executions;
+            0 means no limit.
+        max_payload_bytes: Size at which a single payload is truncated.
+        spill_path: SQLite file for completed executions, or None to keep
+            the table in memory.
+    """
+
+    max_executions: int = 1000
+    max_age_s: float = 86_400.0
+    max_bytes: int = 64 * 1024 * 1024
+    max_payload_bytes: int = MAX_PAYLOAD_BYTES
+    spill_path: Path | None = None
+
+
+@dataclass
+class ExecutionPage:
+    """One page of executions, newest first, and the token for the next one."""
+
+    executions: list[ExecutionHistory]
+    next_token: str | None = None
+
+
+class ExecutionStore:
+    """Running executions in memory, completed ones in an indexed SQLite table."""
+
+    def __init__(
+        self,
+        config: HistoryConfig | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._config = config or HistoryConfig()
+        self._clock = clock
+        self._running: dict[str, ExecutionHistory] = {}
+        self._conn: sqlite3.Connection | None = None
+        self._count = 0
+        self._bytes = 0
+        self._evicted = 0
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def put(self, history: ExecutionHistory) -> None:
+        """Store *history*; a terminal execution is serialised and evicted in turn."""
+        if history.status == ExecutionStatus.RUNNING:
+            self._running[history.execution_arn] = history
+            self._forget(history.execution_arn)
+            return
+        self._running.pop(history.execution_arn, None)
+        row = self._encode(history)
+        self._forget(history.execution_arn)
+        self._connect().execute(_UPSERT_SQL, row)
+        self._count += 1
+        self._bytes += row[10]
+        self._enforce_retention()
+
+    def clear(self) -> None:
+        """Drop every execution and the backing table."""
+        self._running.clear()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._config.spill_path is not None:
+            self._config.spill_path.unlink(missing_ok=True)
+        self._count = self._bytes = 0
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get(self, execution_arn: str) -> ExecutionHistory | None:
+        """Return the execution with *execution_arn*, including its transitions."""
+        running = self._running.get(execution_arn)
+        if running is not None:
+            return running
+        row = (
+            self._connect()
+            .execute(
+                f"SELECT {_SUMMARY_COLUMNS}, input, output, transitions "
+                "FROM executions WHERE arn = ?",
+                (execution_arn,),
+            )
+            .fetchone()
+        )
+        return _decode(row) if row is not None else None
+
+    def list_page(
+        self,
+        state_machine_name: str | None = None,
+        *,
+        status: str | None = None,
+        max_results: int | None = None,
+        next_token: str | None = None,
+    ) -> ExecutionPage:
+        """Return executions newest first, optionally filtered and paginated.
+
+        Listed completed executions carry their summary fields only, without
+        payloads or transitions.  Raises ValueError for a malformed token.
+        """
+        after = _decode_position(next_token) if next_token else None
+        running = [
+            (h.start_time, h.execution_arn, h)
+            for h in self._running.values()
+            if _wanted(h, state_machine_name, status, after)
+        ]
+        limit = max_results if max_results and max_results > 0 else None
+        completed = self._select_summaries(state_machine_name, status, after, limit)
+        merged = sorted([*running, *completed], key=lambda entry: entry[:2], reverse=True)
+        if limit is None or len(merged) <= limit:
+            return ExecutionPage([entry[2] for entry in merged])
+        page = merged[:limit]
+        last_start, last_arn, _ = page[-1]
+        return ExecutionPage([entry[2] for entry in page], encode_token([last_start, last_arn]))
+
+    def metrics(self) -> dict[str, int]:
+        """Return counts of running and stored executions and stored bytes."""
+        return {
+            "running": len(self._running),
+            "completed": self._count,
+            "bytes": self._bytes,
+            "evicted": self._evicted,
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _select_summaries(
+        self,
+        state_machine_name: str | None,
+        status: str | None,
+        after: tuple[float, str] | None,
+        limit: int | None,
+    ) -> list[tuple[float, str, ExecutionHistory]]:
+        clauses, params = [], []
+        if state_machine_name is not None:
+            clauses.append("state_machine = ?")
+            params.append(state_machine_name)
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status)
+        if after is not None:
+            clauses.append("(start_time, arn) < (?, ?)")
+            params.extend(after)
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        sql = f"SELECT {_SUMMARY_COLUMNS} FROM executions {where}ORDER BY start_time DESC, arn DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit + 1)
+        rows = self._connect().execute(sql, params).fetchall()
+        return [(row[3], row[0], _decode(row)) for row in rows]
+
+    def _encode(self, history: ExecutionHistory) -> tuple:
+        cap = self._config.max_payload_bytes
+        input_text = _cap_payload(history.input_data, cap)
+        output_text = _cap_payload(history.output_data, cap)
+        transitions = json.dumps(
+            [_encode_transition(t, cap) for t in history.transitions], default=str
+        )
+        size = len(transitions) + len(input_text or "") + len(output_text or "")
+        return (
+            history.execution_arn,
+            history.state_machine_name,
+            history.status.value,
+            history.start_time,
+            history.end_time,
+            history.error,
+            history.cause,
+            input_text,
+            output_text,
+            transitions,
+            size,
+            self._clock(),
+        )
+
+    def _forget(self, execution_arn: str) -> None:
+        """Delete a stored row for *execution_arn*, if any."""
+        if self._conn is None:
+            return
+        self._delete(
+            self._conn.execute(
+                "SELECT arn, bytes FROM executions WHERE arn = ?", (execution_arn,)
+            ).fetchall(),
+            evicted=False,
+        )
+
+    def _enforce_retention(self) -> None:
+        conn = self._connect()
+        config = self._config
+        if config.max_age_s > 0:
+            cutoff = self._clock() - config.max_age_s
+            self._delete(
+                conn.execute(
+                    "SELECT arn, bytes FROM executions WHERE completed_at < ?", (cutoff,)
+                ).fetchall()
+            )
+        if 0 < config.max_executions < self._count:
+            self._delete(
+                conn.execute(
+                    "SELECT arn, bytes FROM executions ORDER BY completed_at LIMIT ?",
+                    (self._count - config.max_executions,),
+                ).fetchall()
+            )
+        if 0 < config.max_bytes < self._bytes:
+            self._delete(_oldest_covering(conn, self._bytes - config.max_bytes))
+
+    def _delete(self, rows: list[tuple[str, int]], *, evicted: bool = True) -> None:
+        if not rows:
+            return
+        self._connect().executemany(
+            "DELETE FROM executions WHERE arn = ?", [(arn,) for arn, _ in rows]
+        )
+        self._count -= len(rows)
+        self._bytes -= sum(size for _, size in rows)
+        if evicted:
+            self._evicted += len(rows)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            path = self._config.spill_path
+            if path is not None:
+                # The file only backs this run's history; start from scratch
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.unlink(missing_ok=True)
+            conn = sqlite3.connect(
+                path if path is not None else ":memory:",
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")
+            for statement in _CREATE_SQL:
+                conn.execute(statement)
+            self._conn = conn
+        return self._conn
+
+
+# ---------------------------------------------------------------------------
+# Payloads
+# ---------------------------------------------------------------------------
+
+
+def payload_json(value: Any) -> str:
+    """Render a payload as JSON text for the API, ``"{}"`` when empty."""
+    if isinstance(value, TruncatedPayload):
+        return str(value)
+    return json.dumps(value) if value else "{}"
+
+
+def is_truncated(value: Any) -> bool:
+    """Return True if *value* was cut at the payload size limit."""
+    return isinstance(value, TruncatedPayload)
+
+
+def _cap_payload(value: Any, cap: int) -> str | None:
+    """Serialise *value*, prefixing ``!`` and cutting it when over *cap* bytes."""
+    if value is None:
+        return None
+    if isinstance(value, TruncatedPayload):
+        return "!" + value
+    text = json.dumps(value, default=str)
+    encoded = text.encode("utf-8")
+    if len(encoded) <= cap:
+        return "=" + text
+    return "!" + encoded[:cap].decode("utf-8", errors="ignore")
+
+
+def _restore_payload(text: str | None) -> Any:
+    if text is None:
+        return None
+    if text.startswith("!"):
+        return TruncatedPayload(text[1:])
+    return json.loads(text[1:])
+
+
+def _encode_transition(transition: StateTransition, cap: int) -> list:
+    return [
+        transition.state_name,
+        transition.state_type,
+        transition.timestamp,
+        _cap_payload(transition.input_data, cap),
+        _cap_payload(transition.output_data, cap),
+        transition.error,
+        transition.cause,
+    ]
+
+
+def _decode(row: tuple) -> ExecutionHistory:
+    """Rebuild an ``ExecutionHistory`` from summary columns plus optional payloads."""
+    arn, state_machine, status, start_time, end_time, error, cause = row[:7]
+    history = ExecutionHistory(
+        execution_arn=arn,
+        state_machine_name=state_machine,
+        status=ExecutionStatus(status),
+        start_time=start_time,
+        end_time=end_time,
+        error=error,
+        cause=cause,
+    )
+    if len(row) > 7:
+        history.input_data = _restore_payload(row[7])
+        history.output_data = _restore_payload(row[8])
+        history.transitions = [
+            StateTransition(
+                state_name=name,
+                state_type=state_type,
+                timestamp=timestamp,
+                input_data=_restore_payload(input_text),
+                output_data=_restore_payload(output_text),
+                error=t_error,
+                cause=t_cause,
+            )
+            for name, state_type, timestamp, input_text, output_text, t_error, t_cause in (
+                json.loads(row[9])
+            )
+        ]
+    return history
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _wanted(
+    history: ExecutionHistory,
+    state_machine_name: str | None,
+    status: str | None,
+    after: tuple[float, str] | None,
+) -> bool:
+    """Return True if a running execution passes the listing filters."""
+    if state_machine_name is not None and history.state_machine_name != state_machine_name:
+        return False
+    if status is not None and history.status.value != status:
+        return False
+    return after is None or (history.start_time, history.execution_arn) < after
+
+
+def _oldest_covering(conn: sqlite3.Connection, excess: int) -> list[tuple[str, int]]:
+    """Return the oldest rows whose payload bytes add up to at least *excess*."""
+    rows: list[tuple[str, int]] = []
+    freed = 0
+    for arn, size in conn.execute("SELECT arn, bytes FROM executions ORDER BY completed_at"):
+        rows.append((arn, size))
+        freed += size
+        if freed >= excess:
+            break
+    return rows
+
+
+def encode_token(value: list) -> str:
+    """Encode a pagination position as an opaque token."""
+    return base64.urlsafe_b64encode(json.dumps(value).encode("utf-8")).decode("ascii")
+
+
+def decode_token(token: str) -> list:
+    """Decode a token from :func:`encode_token`; raises ValueError if malformed."""
+    try:
+        value = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+    except (binascii.Error, UnicodeError, json.JSONDecodeError) as exc:
+        raise ValueError(f"Invalid token: {token}") from exc
+    if not isinstance(value, list):
+        raise ValueError(f"Invalid token: {token}")
+    return value
+
+
+def _decode_position(token: str) -> tuple[float, str]:
+    """Decode a ``ListExecutions`` token into a (start_time, arn) position."""
+    value = decode_token(token)
+    if len(value) != 2 or not isinstance(value[0], (int, float)) or not isinstance(value[1], str):
+        raise ValueError(f"Invalid token: {token}")
+    return float(value[0]), value[1]
@@ -2,6 +2,7 @@
 
 Manages state machine definitions, executions, and lifecycle.
 Supports both Standard (async) and Express (sync) workflow types.
+Execution history is kept in a bounded :class:`ExecutionStore`.
 """
 
 from __future__ import annotations
@@ -26,6 +27,15 @@ from lws.providers.stepfunctions.engine import (
     ExecutionHistory,
     ExecutionStatus,
 )
+from lws.providers.stepfunctions.history_store import (
+    ExecutionPage,
+    ExecutionStore,
+    HistoryConfig,
+    decode_token,
+    encode_token,
+    is_truncated,
+    payload_json,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -112,11 +122,12 @@ class StepFunctionsProvider(IStateMachine):
         self,
         state_machines: list[StateMachineConfig] | None = None,
         max_wait_seconds: float = 5.0,
+        history: HistoryConfig | None = None,
     ) -> None:
         self._configs: dict[str, StateMachineConfig] = {}
         self._definitions: dict[str, StateMachineDefinition] = {}
         self._workflow_types: dict[str, WorkflowType] = {}
-        self._executions: dict[str, ExecutionHistory] = {}
+        self._executions = ExecutionStore(history)
         self._compute_providers: dict[str, ICompute] = {}
         self._tags: dict[str, dict[str, str]] = {}
         self._max_wait_seconds = max_wait_seconds
@@ -201,10 +212,28 @@ class StepFunctionsProvider(IStateMachine):
         return self._executions.get(execution_arn)
 
     def list_executions(self, state_machine_name: str | None = None) -> list[ExecutionHistory]:
-        """List executions, optionally filtered by state machine name."""
-        if state_machine_name is None:
-            return list(self._executions.values())
-        return [h for h in self._executions.values() if h.state_machine_name == state_machine_name]
+        """List executions newest first, optionally filtered by state machine name."""
+        return self._executions.list_page(state_machine_name).executions
+
+    def list_executions_page(
+        self,
+        state_machine_name: str | None = None,
+        *,
+        status: str | None = None,
+        max_results: int | None = None,
+        next_token: str | None = None,
+    ) -> ExecutionPage:
+        """Return one page of executions, newest first.
+
+        Raises ValueError if *next_token* is malformed.
+        """
+        return self._executions.list_page(
+            state_machine_name, status=status, max_results=max_results, next_token=next_token
+        )
+
+    def metrics(self) -> dict[str, Any]:
+        """Return execution history counters for ``/_ldk/status``."""
+        return {"history": self._executions.metrics()}
 
     def list_state_machines(self) -> list[str]:
         """Return sorted list of state machine names."""
@@ -224,6 +253,7 @@ class StepFunctionsProvider(IStateMachine):
         definition: str | dict,
         role_arn: str = "",
         workflow_type: str = "STANDARD",
+        definition_substitutions: dict[str, str] | None = None,
     ) -> str:
         """Create a state machine dynamically. Returns the state machine ARN.
 
@@ -236,6 +266,7 @@ class StepFunctionsProvider(IStateMachine):
             definition=definition,
             workflow_type=wf_type,
             role_arn=role_arn,
+            definition_substitutions=definition_substitutions or {},
         )
         self._configs[name] = config
         definition_data = _resolve_definition(config)
@@ -290,6 +321,7 @@ class StepFunctionsProvider(IStateMachine):
             history.error = error
         if cause is not None:
             history.cause = cause
+        self._executions.put(history)
 
     def update_state_machine(
         self,
@@ -346,6 +378,28 @@ class StepFunctionsProvider(IStateMachine):
         Returns a list of event dicts. Raises KeyError if the execution
         does not exist.
         """
+        events, _ = self.get_execution_history_page(execution_arn, max_results)
+        return events
+
+    def get_execution_history_page(
+        self,
+        execution_arn: str,
+        max_results: int | None = None,
+        next_token: str | None = None,
+    ) -> tuple[list[dict], str | None]:
+        """Return one page of history events and the token for the next page.
+
+        Raises KeyError if the execution does not exist and ValueError if
+        *next_token* is malformed.
+        """
+        start = _decode_offset(next_token) if next_token else 0
+        events = self._build_history_events(execution_arn)
+        end = len(events) if max_results is None else start + max_results
+        token = encode_token([end]) if end < len(events) else None
+        return events[start:end], token
+
+    def _build_history_events(self, execution_arn: str) -> list[dict]:
+        """Build every history event of an execution."""
         history = self._executions.get(execution_arn)
         if history is None:
             raise KeyError(f"Execution not found: {execution_arn}")
@@ -360,7 +414,8 @@ class StepFunctionsProvider(IStateMachine):
                 "id": 1,
                 "previousEventId": 0,
                 "executionStartedEventDetails": {
-                    "input": json.dumps(history.input_data) if history.input_data else "{}",
+                    "input": payload_json(history.input_data),
+                    "inputDetails": {"truncated": is_truncated(history.input_data)},
                     "roleArn": "",
                 },
             }
@@ -377,9 +432,8 @@ class StepFunctionsProvider(IStateMachine):
                     "previousEventId": event_id - 1,
                     "stateEnteredEventDetails": {
                         "name": transition.state_name,
-                        "input": (
-                            json.dumps(transition.input_data) if transition.input_data else "{}"
-                        ),
+                        "input": payload_json(transition.input_data),
+                        "inputDetails": {"truncated": is_truncated(transition.input_data)},
                     },
                 }
             )
@@ -390,9 +444,6 @@ class StepFunctionsProvider(IStateMachine):
         if terminal is not None:
             events.append(terminal)
 
-        if max_results is not None:
-            events = events[:max_results]
-
         return events
 
     # ------------------------------------------------------------------
@@ -409,7 +460,7 @@ class StepFunctionsProvider(IStateMachine):
         """Run an EXPRESS (synchronous) execution and return the result."""
         engine = self._create_engine(definition)
         history = await engine.execute(input_data, execution_arn, state_machine_name)
-        self._executions[execution_arn] = history
+        self._executions.put(history)
         return _build_sync_response(history)
 
     async def _start_async_execution(
@@ -428,7 +479,7 @@ class StepFunctionsProvider(IStateMachine):
             start_time=time.time(),
             input_data=input_data,
         )
-        self._executions[execution_arn] = history
+        self._executions.put(history)
 
         # Run in background - actual history will be updated
         import asyncio  # pylint: disable=import-outside-toplevel
@@ -448,7 +499,7 @@ class StepFunctionsProvider(IStateMachine):
         """Run an execution in the background and store the result."""
         try:
             history = await engine.execute(input_data, execution_arn, state_machine_name)
-            self._executions[execution_arn] = history
+            self._executions.put(history)
         except Exception as exc:
             logger.exception("Background execution failed: %s", execution_arn)
             existing = self._executions.get(execution_arn)
@@ -457,6 +508,7 @@ class StepFunctionsProvider(IStateMachine):
                 existing.error = "States.Runtime"
                 existing.cause = str(exc)
                 existing.end_time = time.time()
+                self._executions.put(existing)
 
     def _create_engine(self, definition: StateMachineDefinition) -> ExecutionEngine:
         """Create an execution engine with the current compute bridge."""
@@ -493,7 +545,8 @@ def _build_terminal_event(history: ExecutionHistory, event_id: int) -> dict | No
     if history.status == ExecutionStatus.SUCCEEDED:
         base["type"] = "ExecutionSucceeded"
         base["executionSucceededEventDetails"] = {
-            "output": json.dumps(history.output_data) if history.output_data else "{}",
+            "output": payload_json(history.output_data),
+            "outputDetails": {"truncated": is_truncated(history.output_data)},
         }
         return base
     if history.status == ExecutionStatus.FAILED:
@@ -513,6 +566,14 @@ def _build_terminal_event(history: ExecutionHistory, event_id: int) -> dict | No
     return None
 
 
+def _decode_offset(token: str) -> int:
+    """Decode a ``GetExecutionHistory`` token into an event offset."""
+    value = decode_token(token)
+    if len(value) != 1 or not isinstance(value[0], int) or value[0] < 0:
+        raise ValueError(f"Invalid token: {token}")
+    return value[0]
+
+
 def _extract_function_name(resource_arn: str) -> str:
     """Extract the function name from a Lambda ARN or resource string."""
     if ":function:" in resource_arn:
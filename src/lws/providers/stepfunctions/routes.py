@@ -18,6 +18,7 @@ from lws.providers._shared.aws_chaos import AwsChaosConfig, AwsChaosMiddleware,
 from lws.providers._shared.aws_iam_auth import IamAuthBundle, add_iam_auth_middleware
 from lws.providers._shared.aws_operation_mock import AwsMockConfig, AwsOperationMockMiddleware
 from lws.providers._shared.request_helpers import parse_json_body, resolve_api_action
+from lws.providers.stepfunctions.history_store import is_truncated
 from lws.providers.stepfunctions.provider import StepFunctionsProvider
 
 _logger = get_logger("ldk.stepfunctions")
@@ -117,9 +118,21 @@ class StepFunctionsRouter:
         """Handle ListExecutions API action."""
         sm_arn = body.get("stateMachineArn", "")
         sm_name = sm_arn.rsplit(":", 1)[-1] if ":" in sm_arn else sm_arn
-        executions = self.provider.list_executions(sm_name or None)
-        items = [_format_execution_summary(h) for h in executions]
-        return _json_response({"executions": items})
+        try:
+            page = self.provider.list_executions_page(
+                sm_name or None,
+                status=body.get("statusFilter"),
+                max_results=body.get("maxResults"),
+                next_token=body.get("nextToken"),
+            )
+        except ValueError as exc:
+            return _error_response("InvalidToken", str(exc))
+        result: dict[str, Any] = {
+            "executions": [_format_execution_summary(h) for h in page.executions]
+        }
+        if page.next_token is not None:
+            result["nextToken"] = page.next_token
+        return _json_response(result)
 
     async def _list_state_machines(self, _body: dict) -> Response:
         """Handle ListStateMachines API action."""
@@ -253,16 +266,22 @@ class StepFunctionsRouter:
         max_results = body.get("maxResults")
 
         try:
-            events = self.provider.get_execution_history(
+            events, next_token = self.provider.get_execution_history_page(
                 execution_arn=execution_arn,
                 max_results=max_results,
+                next_token=body.get("nextToken"),
             )
         except KeyError:
             return _error_response(
                 "ExecutionDoesNotExist",
                 f"Execution not found: {execution_arn}",
             )
-        return _json_response({"events": events})
+        except ValueError as exc:
+            return _error_response("InvalidToken", str(exc))
+        result: dict[str, Any] = {"events": events}
+        if next_token is not None:
+            result["nextToken"] = next_token
+        return _json_response(result)
 
 
 # ------------------------------------------------------------------
@@ -305,7 +324,9 @@ def _format_execution(history: Any) -> dict:
     if history.end_time is not None:
         result["stopDate"] = history.end_time
     if history.output_data is not None:
-        result["output"] = json.dumps(history.output_data)
+        output = history.output_data
+        result["output"] = str(output) if is_truncated(output) else json.dumps(output)
+        result["outputDetails"] = {"truncated": is_truncated(output)}
     if history.error:
         result["error"] = history.error
     if history.cause:
@@ -0,0 +1,140 @@
+"""Cached cloud-assembly parsing.
+
+Parsing ``cdk.out`` means loading the manifest, every stack template and
+every asset manifest, then building the ``AppGraph``.  The resulting
+``AppModel`` and ``AppGraph`` are pickled into a snapshot keyed by a hash
+of those files' contents, so an unchanged assembly is loaded in one read.
+The key also covers the installed lws version and the fields of the model
+dataclasses, so snapshots pickled by other code are never loaded.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import hashlib
+import importlib.metadata
+import json
+import logging
+import os
+import pickle
+from functools import lru_cache
+from pathlib import Path
+
+from lws.graph import builder as graph_module
+from lws.graph.builder import AppGraph, build_graph
+from lws.parser import assembly as assembly_module
+from lws.parser.assembly import AppModel, parse_assembly
+
+logger = logging.getLogger(__name__)
+
+_SNAPSHOT_NAME = "assembly.pickle"
+
+# Bump when AppModel or AppGraph change in a way the fields digest misses.
+_SNAPSHOT_VERSION = 1
+_DISTRIBUTION = "local-web-services"
+
+
+@lru_cache(maxsize=1)
+def _code_fingerprint() -> str:
+    """Return a digest of the lws version and the model dataclass fields."""
+    try:
+        version = importlib.metadata.version(_DISTRIBUTION)
+    except importlib.metadata.PackageNotFoundError:
+        version = "unknown"
+    shapes = [version]
+    for module in (assembly_module, graph_module):
+        for name, obj in sorted(vars(module).items()):
+            if isinstance(obj, type) and dataclasses.is_dataclass(obj):
+                fields = ",".join(f"{f.name}:{f.type}" for f in dataclasses.fields(obj))
+                shapes.append(f"{module.__name__}.{name}({fields})")
+    shapes.append(f"AppGraph({','.join(sorted(vars(AppGraph())))})")
+    return hashlib.sha256("\n".join(shapes).encode()).hexdigest()
+
+
+def assembly_key(cdk_out_path: Path) -> str | None:
+    """Return a hash of the files :func:`parse_assembly` reads from *cdk_out_path*.
+
+    The key covers ``manifest.json``, ``tree.json`` and every file a
+    manifest artifact points at (stack templates and asset manifests), as
+    well as the absolute ``cdk.out`` path baked into resolved asset paths
+    and the fingerprint of the code that pickles the snapshot.
+    Returns ``None`` when there is no manifest to key on.
+    """
+    manifest_path = cdk_out_path / "manifest.json"
+    try:
+        manifest_bytes = manifest_path.read_bytes()
+        manifest = json.loads(manifest_bytes)
+    except (OSError, ValueError):
+        return None
+
+    digest = hashlib.sha256()
+    digest.update(
+        f"{_SNAPSHOT_VERSION}\0{_code_fingerprint()}\0{cdk_out_path.resolve()}\0".encode()
+    )
+    digest.update(manifest_bytes)
+    referenced = ["tree.json"]
+    for artifact in (manifest.get("artifacts") or {}).values():
+        properties = artifact.get("properties") or {}
+        referenced.extend(
+            properties[name] for name in ("templateFile", "file") if properties.get(name)
+        )
+    for name in referenced:
+        digest.update(f"\0{name}\0".encode())
+        with contextlib.suppress(OSError):
+            digest.update((cdk_out_path / name).read_bytes())
+    return digest.hexdigest()
+
+
+def load_app(cdk_out_path: Path, cache_dir: Path | None = None) -> tuple[AppModel, AppGraph]:
+    """Parse *cdk_out_path* into an ``AppModel`` and ``AppGraph``, reusing a snapshot.
+
+    Args:
+        cdk_out_path: The ``cdk.out`` directory to parse.
+        cache_dir: Directory holding the snapshot.  Without it the
+            assembly is always parsed.
+
+    Returns:
+        The application model and its graph.
+    """
+    key = assembly_key(cdk_out_path) if cache_dir is not None else None
+    if key is not None:
+        cached = _read_snapshot(cache_dir / _SNAPSHOT_NAME, key)
+        if cached is not None:
+            logger.debug("Loaded cloud assembly from snapshot %s", key[:12])
+            return cached
+
+    app_model = parse_assembly(cdk_out_path)
+    graph = build_graph(app_model)
+    if key is not None:
+        _write_snapshot(cache_dir / _SNAPSHOT_NAME, key, app_model, graph)
+    return app_model, graph
+
+
+def _read_snapshot(path: Path, key: str) -> tuple[AppModel, AppGraph] | None:
+    try:
+        with open(path, "rb") as fh:
+            snapshot = pickle.load(fh)
+    except FileNotFoundError:
+        return None
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.debug("Ignoring unreadable assembly snapshot %s: %s", path, exc)
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get("key") != key:
+        return None
+    return snapshot["model"], snapshot["graph"]
+
+
+def _write_snapshot(path: Path, key: str, app_model: AppModel, graph: AppGraph) -> None:
+    tmp = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "wb") as fh:
+            pickle.dump(
+                {"key": key, "model": app_model, "graph": graph},
+                fh,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp, path)
+    except OSError as exc:
+        logger.debug("Could not write assembly snapshot %s: %s", path, exc)
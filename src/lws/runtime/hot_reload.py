@@ -0,0 +1,334 @@
+"""Incremental hot reload for ``ldk dev``.
+
+When watched files change, :class:`HotReloader` re-synthesises the CDK app,
+asks :class:`~lws.runtime.change_detector.CdkChangeDetector` whether the
+cloud assembly's templates changed, and if so re-parses it and diffs the
+new :class:`~lws.parser.assembly.AppModel` against the running one,
+resource by resource.  Each change is handed to the applier registered for
+its kind (``"function"``, ``"table"``, ...), which hot-patches or restarts
+only the provider that owns the resource.  Functions that read a changed
+table, according to the ``AppGraph``, are restarted too.  Everything else
+keeps running with its in-memory state and open sockets.
+
+Changes with no applier, or that an applier cannot apply to a running
+provider, are reported as needing a restart of ``ldk dev``; the running
+model keeps the old version of those resources so the next reload diffs
+against what is actually running.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from lws.graph.builder import AppGraph, NodeType, build_graph
+from lws.logging.logger import get_logger
+from lws.parser.assembly import AppModel, parse_assembly
+from lws.runtime.change_detector import CdkChangeDetector
+
+_logger = get_logger("ldk.reload")
+
+# (kind, AppModel attribute, name attribute), in the order changes are
+# applied: resources that functions depend on come before the functions.
+_MODEL_KINDS: tuple[tuple[str, str, str], ...] = (
+    ("table", "tables", "name"),
+    ("queue", "queues", "name"),
+    ("bucket", "buckets", "name"),
+    ("topic", "topics", "name"),
+    ("event_bus", "event_buses", "name"),
+    ("ssm_parameter", "ssm_parameters", "name"),
+    ("secret", "secrets", "name"),
+    ("function", "functions", "name"),
+    ("function_url", "function_urls", "function_name"),
+    ("event_rule", "event_rules", "rule_name"),
+    ("state_machine", "state_machines", "name"),
+    ("api", "apis", "name"),
+    ("user_pool", "user_pools", "user_pool_name"),
+    ("ecs_service", "ecs_services", "service_name"),
+)
+
+_NODE_TYPES: dict[str, NodeType] = {
+    "table": NodeType.DYNAMODB_TABLE,
+    "queue": NodeType.SQS_QUEUE,
+    "bucket": NodeType.S3_BUCKET,
+    "topic": NodeType.SNS_TOPIC,
+    "event_bus": NodeType.EVENT_BUS,
+    "function": NodeType.LAMBDA_FUNCTION,
+    "state_machine": NodeType.STATE_MACHINE,
+    "api": NodeType.API_GATEWAY,
+    "ecs_service": NodeType.ECS_SERVICE,
+}
+
+
+@dataclass
+class ResourceChange:
+    """One added, removed or updated resource of the application model.
+
+    Attributes:
+        kind: Resource kind, e.g. ``"function"`` or ``"table"``.
+        name: Resource name within its kind.
+        change_type: One of ``"ADD"``, ``"REMOVE"``, ``"UPDATE"``.
+        old: Previous model object (``None`` for ADDs).
+        new: New model object (``None`` for REMOVEs).
+    """
+
+    kind: str
+    name: str
+    change_type: str
+    old: Any = None
+    new: Any = None
+
+    @property
+    def label(self) -> str:
+        """Return a short description such as ``"UPDATE function Orders"``."""
+        return f"{self.change_type} {self.kind} {self.name}"
+
+
+class RestartRequired(Exception):
+    """Raised by an applier for a change it cannot apply while running."""
+
+
+Applier = Callable[[ResourceChange], Awaitable[None]]
+
+
+@dataclass
+class ReloadResult:
+    """Outcome of one hot reload."""
+
+    applied: list[str] = field(default_factory=list)
+    restart_required: list[str] = field(default_factory=list)
+    affected_nodes: list[str] = field(default_factory=list)
+    duration_ms: float = 0.0
+
+
+def diff_models(old: AppModel, new: AppModel) -> list[ResourceChange]:
+    """Return the resource changes between two application models.
+
+    Resources are matched by kind and name and compared by value.  Changes
+    are ordered by kind so dependencies are applied before their users.
+    """
+    changes: list[ResourceChange] = []
+    for kind, attr, name_attr in _MODEL_KINDS:
+        before = {getattr(r, name_attr, None): r for r in getattr(old, attr, [])}
+        after = {getattr(r, name_attr, None): r for r in getattr(new, attr, [])}
+        for name in sorted(before.keys() | after.keys(), key=str):
+            previous, current = before.get(name), after.get(name)
+            if previous is None:
+                changes.append(ResourceChange(kind, str(name), "ADD", new=current))
+            elif current is None:
+                changes.append(ResourceChange(kind, str(name), "REMOVE", old=previous))
+            elif previous != current:
+                changes.append(ResourceChange(kind, str(name), "UPDATE", previous, current))
+    return changes
+
+
+def running_model(new: AppModel, skipped: list[ResourceChange]) -> AppModel:
+    """Return *new* with the *skipped* changes undone.
+
+    Resources added by a skipped change are dropped, and removed or updated
+    ones get their old version back, so the result describes what the
+    running providers actually serve.
+    """
+    attrs = {kind: (attr, name_attr) for kind, attr, name_attr in _MODEL_KINDS}
+    lists: dict[str, list[Any]] = {}
+    for change in skipped:
+        attr, name_attr = attrs[change.kind]
+        resources = lists.setdefault(attr, list(getattr(new, attr)))
+        kept = [r for r in resources if str(getattr(r, name_attr, None)) != change.name]
+        if change.old is not None:
+            kept.append(change.old)
+        lists[attr] = kept
+    return dataclasses.replace(new, **lists)
+
+
+def affected_nodes(graph: AppGraph, changes: list[ResourceChange]) -> list[str]:
+    """Return the IDs of graph nodes touched by *changes*, in change order."""
+    nodes: list[str] = []
+    for change in changes:
+        node_type = _NODE_TYPES.get(change.kind)
+        node = graph.nodes.get(change.name)
+        if node_type is not None and node is not None and node.node_type == node_type:
+            if change.name not in nodes:
+                nodes.append(change.name)
+    return nodes
+
+
+def dependent_function_changes(
+    graph: AppGraph, model: AppModel, changes: list[ResourceChange]
+) -> list[ResourceChange]:
+    """Return restarts for unchanged functions that read an updated or removed table.
+
+    Function nodes have ``DATA_DEPENDENCY`` edges to the tables named in
+    their environment, so ``graph.get_dependents(table)`` yields the
+    functions whose warm workers may hold stale table state.
+    """
+    functions = {f.name: f for f in model.functions}
+    changed = {c.name for c in changes if c.kind == "function"}
+    extra: list[ResourceChange] = []
+    for dependent in _table_dependents(graph, changes):
+        func = functions.get(dependent)
+        if func is None or dependent in changed:
+            continue
+        changed.add(dependent)
+        extra.append(ResourceChange("function", dependent, "UPDATE", func, func))
+    return extra
+
+
+def _table_dependents(graph: AppGraph, changes: list[ResourceChange]) -> list[str]:
+    """Return the graph dependents of tables that were updated or removed."""
+    dependents: list[str] = []
+    for change in changes:
+        if change.kind == "table" and change.change_type != "ADD" and change.name in graph.nodes:
+            dependents.extend(graph.get_dependents(change.name))
+    return dependents
+
+
+class HotReloader:
+    """Re-synthesise and apply resource changes to running providers.
+
+    Call :meth:`request` (on the event loop) whenever a watched file
+    changes.  Requests arriving while a reload is pending or running are
+    coalesced into one follow-up reload.
+
+    Args:
+        app_model: The application model the providers were created from.
+        graph: The ``AppGraph`` built from *app_model*.
+        synth: Coroutine function that synthesises the app and returns the
+            ``cdk.out`` path.
+        detector: Optional template-level change detector; when given, a
+            synth that leaves every template unchanged skips the reload.
+        parse: Function that parses ``cdk.out`` into an ``AppModel``.
+        debounce_seconds: Quiet period before a requested reload starts.
+    """
+
+    def __init__(
+        self,
+        app_model: AppModel,
+        graph: AppGraph,
+        *,
+        synth: Callable[[], Awaitable[Path]],
+        detector: CdkChangeDetector | None = None,
+        parse: Callable[[Path], AppModel] = parse_assembly,
+        debounce_seconds: float = 0.5,
+    ) -> None:
+        self._model = app_model
+        self._graph = graph
+        self._synth = synth
+        self._detector = detector
+        self._parse = parse
+        self._debounce_seconds = debounce_seconds
+        self._appliers: dict[str, Applier] = {}
+        self._pending = False
+        self._task: asyncio.Task | None = None
+        self.last_result: ReloadResult | None = None
+
+    @property
+    def app_model(self) -> AppModel:
+        """Return the application model currently applied."""
+        return self._model
+
+    @property
+    def graph(self) -> AppGraph:
+        """Return the graph of the application model currently applied."""
+        return self._graph
+
+    def register(self, kind: str, applier: Applier) -> None:
+        """Apply changes of resource *kind* with *applier*."""
+        self._appliers[kind] = applier
+
+    def request(self) -> None:
+        """Schedule a reload after the debounce window."""
+        self._pending = True
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._drain())
+
+    async def join(self) -> None:
+        """Wait for any scheduled or running reload to finish."""
+        if self._task is not None:
+            await self._task
+
+    async def cancel(self) -> None:
+        """Cancel any scheduled or running reload."""
+        if self._task is None or self._task.done():
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+
+    async def _drain(self) -> None:
+        while self._pending:
+            await asyncio.sleep(self._debounce_seconds)
+            self._pending = False
+            try:
+                await self.reload()
+            except Exception as exc:
+                _logger.error("Hot reload failed: %s", exc)
+
+    async def reload(self) -> ReloadResult | None:
+        """Synthesise, diff and apply changes.  Returns None if nothing changed."""
+        started = time.monotonic()
+        cdk_out = await self._synth()
+        template_changes = []
+        if self._detector is not None:
+            template_changes = self._detector.detect_changes()
+            if not template_changes:
+                _logger.debug("No infrastructure changes")
+                return None
+        new_model = self._parse(cdk_out)
+        changes = diff_models(self._model, new_model)
+        changes += dependent_function_changes(self._graph, new_model, changes)
+        new_graph = build_graph(new_model)
+
+        result = ReloadResult(
+            affected_nodes=affected_nodes(new_graph, changes)
+            + [n for n in affected_nodes(self._graph, changes) if n not in new_graph.nodes]
+        )
+        skipped = [change for change in changes if not await self._apply(change, result)]
+        if self._detector is not None:
+            await self._detector.apply_changes(template_changes)
+        if skipped:
+            new_model = running_model(new_model, skipped)
+            new_graph = build_graph(new_model)
+        self._model, self._graph = new_model, new_graph
+
+        result.duration_ms = (time.monotonic() - started) * 1000
+        self.last_result = result
+        self._log_result(result)
+        return result
+
+    async def _apply(self, change: ResourceChange, result: ReloadResult) -> bool:
+        """Apply *change*, recording the outcome.  Returns True if it was applied."""
+        applier = self._appliers.get(change.kind)
+        if applier is None:
+            result.restart_required.append(change.label)
+            return False
+        try:
+            await applier(change)
+        except RestartRequired as exc:
+            result.restart_required.append(f"{change.label} ({exc})")
+            return False
+        except Exception as exc:
+            _logger.error("Failed to apply %s: %s", change.label, exc)
+            result.restart_required.append(change.label)
+            return False
+        result.applied.append(change.label)
+        return True
+
+    @staticmethod
+    def _log_result(result: ReloadResult) -> None:
+        for label in result.applied:
+            _logger.info("Reloaded: %s", label)
+        if result.restart_required:
+            _logger.warning("Restart ldk dev to apply: %s", ", ".join(result.restart_required))
+        _logger.info(
+            "Hot reload finished in %.0fms (%d applied, %d need restart)",
+            result.duration_ms,
+            len(result.applied),
+            len(result.restart_required),
+        )
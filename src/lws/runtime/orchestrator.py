@@ -4,6 +4,11 @@ Starts and stops providers in dependency order derived from the application
 graph's topological sort.  Health-checks each provider after it starts and
 performs reverse-order shutdown on stop or signal.  On shutdown, providers
 that support ``flush()`` are given a chance to persist state before stopping.
+
+When the ``AppGraph`` is supplied, providers are grouped into levels with
+:func:`startup_levels`: every provider in a level only depends on providers
+in earlier levels, so each level is started (and, in reverse, stopped)
+concurrently.  Per-provider start times are kept in :class:`StartupTimings`.
 """
 
 from __future__ import annotations
@@ -13,9 +18,14 @@ import logging
 import os
 import signal
 import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
 
 from rich.console import Console
 
+from lws.graph.builder import AppGraph
 from lws.interfaces.provider import Provider, ProviderStartError
 
 logger = logging.getLogger(__name__)
@@ -23,6 +33,59 @@ logger = logging.getLogger(__name__)
 _console = Console(stderr=True)
 
 
+@dataclass
+class StartupTimings:
+    """How long the last start took, overall and per provider.
+
+    Attributes:
+        total_ms: Wall-clock time of the whole start.
+        levels: Node IDs started concurrently, in start order.
+        providers: Node ID to the time its provider took to start and
+            pass its health check.  Node IDs sharing a provider share
+            its time.
+    """
+
+    total_ms: float = 0.0
+    levels: list[list[str]] = field(default_factory=list)
+    providers: dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable copy."""
+        return {
+            "total_ms": round(self.total_ms, 1),
+            "levels": [list(level) for level in self.levels],
+            "providers": {k: round(v, 1) for k, v in self.providers.items()},
+        }
+
+
+def startup_levels(startup_order: list[str], graph: AppGraph | None = None) -> list[list[str]]:
+    """Group *startup_order* into levels that can be started concurrently.
+
+    Graph nodes are placed one level after the deepest of their
+    ``graph.get_dependencies``.  Node IDs not in the graph (HTTP servers,
+    management and other support providers) have no recorded dependencies
+    and share a final level.  Without a *graph* every node gets its own
+    level, i.e. providers start one at a time in *startup_order*.
+    """
+    if graph is None:
+        return [[node_id] for node_id in startup_order]
+    depth: dict[str, int] = {}
+    levels: list[list[str]] = []
+    trailing: list[str] = []
+    for node_id in startup_order:
+        if node_id not in graph.nodes:
+            trailing.append(node_id)
+            continue
+        level = 1 + max((depth.get(d, -1) for d in graph.get_dependencies(node_id)), default=-1)
+        depth[node_id] = level
+        while len(levels) <= level:
+            levels.append([])
+        levels[level].append(node_id)
+    if trailing:
+        levels.append(trailing)
+    return levels
+
+
 class Orchestrator:
     """Manage the lifecycle of a set of providers according to an AppGraph.
 
@@ -34,6 +97,8 @@ class Orchestrator:
     def __init__(self) -> None:
         self._providers: dict[str, Provider] = {}
         self._startup_order: list[str] = []
+        self._graph: AppGraph | None = None
+        self._timings = StartupTimings()
         self._running = False
         self._stop_event: asyncio.Event | None = None
         self._shutting_down = False
@@ -46,48 +111,84 @@ class Orchestrator:
         self,
         providers: dict[str, Provider],
         startup_order: list[str],
+        graph: AppGraph | None = None,
     ) -> None:
         """Start all providers in *startup_order*.
 
         Args:
             providers: Map of node ID to ``Provider`` instance.
             startup_order: Node IDs in topological (dependency-first) order.
+            graph: Optional application graph; when given, independent
+                providers are started concurrently level by level.
         """
         self._providers = providers
         self._startup_order = startup_order
+        self._graph = graph
         self._stop_event = asyncio.Event()
 
         self._install_signal_handlers()
 
-        for node_id in self._startup_order:
-            provider = self._providers.get(node_id)
-            if provider is None:
-                continue
+        began = time.perf_counter()
+        levels = startup_levels(self._startup_order, graph)
+        self._timings = StartupTimings(levels=levels)
+        seen: set[int] = set()
+        for level in levels:
+            batch = self._batch(level, seen)
+            results = await asyncio.gather(
+                *(self._start_provider(ids, provider) for ids, provider in batch),
+                return_exceptions=True,
+            )
+            for (_ids, provider), result in zip(batch, results, strict=True):
+                if isinstance(result, BaseException):
+                    logger.error("Failed to start %s: %s", provider.name, result)
+                    await self.stop()
+                    raise ProviderStartError(
+                        f"Provider {provider.name} failed to start: {result}"
+                    ) from result
+
+        self._timings.total_ms = (time.perf_counter() - began) * 1000
+        self._running = True
+        logger.info("All providers started in %.0fms", self._timings.total_ms)
 
-            logger.info("Starting provider: %s", provider.name)
-            try:
-                await provider.start()
-            except Exception as exc:
-                logger.error("Failed to start %s: %s", provider.name, exc)
-                await self.stop()
-                raise ProviderStartError(
-                    f"Provider {provider.name} failed to start: {exc}"
-                ) from exc
+    async def _start_provider(self, node_ids: list[str], provider: Provider) -> None:
+        began = time.perf_counter()
+        logger.info("Starting provider: %s", provider.name)
+        await provider.start()
 
-            healthy = await provider.health_check()
-            if not healthy:
-                logger.warning("Provider %s started but health check failed", provider.name)
+        healthy = await provider.health_check()
+        if not healthy:
+            logger.warning("Provider %s started but health check failed", provider.name)
 
-            logger.info("Provider %s started successfully", provider.name)
+        elapsed_ms = (time.perf_counter() - began) * 1000
+        for node_id in node_ids:
+            self._timings.providers[node_id] = elapsed_ms
+        logger.info("Provider %s started successfully in %.0fms", provider.name, elapsed_ms)
 
-        self._running = True
-        logger.info("All providers started")
+    def _batch(self, level: list[str], seen: set[int]) -> list[tuple[list[str], Provider]]:
+        """Return the providers of *level* not in *seen*, with their node IDs.
+
+        A provider registered under several node IDs (one DynamoDB provider
+        serves every table) is returned once.
+        """
+        batch: dict[int, tuple[list[str], Provider]] = {}
+        for node_id in level:
+            provider = self._providers.get(node_id)
+            if provider is None:
+                continue
+            key = id(provider)
+            if key in batch:
+                batch[key][0].append(node_id)
+            elif key not in seen:
+                seen.add(key)
+                batch[key] = ([node_id], provider)
+        return list(batch.values())
 
     async def stop(self) -> None:
         """Stop all providers in reverse startup order.
 
         Before stopping, providers that expose a ``flush()`` coroutine are
-        given a chance to persist their in-memory state to disk.
+        given a chance to persist their in-memory state to disk.  With a
+        graph, the providers of each level are stopped concurrently.
         """
         if not self._providers:
             return
@@ -98,36 +199,72 @@ class Orchestrator:
         # Flush state on providers that support it
         await self._flush_providers()
 
-        for node_id in reversed(self._startup_order):
-            provider = self._providers.get(node_id)
-            if provider is None:
-                continue
-            logger.info("Stopping provider: %s", provider.name)
-            try:
-                await asyncio.wait_for(provider.stop(), timeout=30.0)
-            except TimeoutError:
-                logger.warning("Timed out stopping provider %s — skipping", provider.name)
-            except Exception:
-                logger.exception("Error stopping provider %s", provider.name)
+        levels = startup_levels(self._startup_order, self._graph)
+        await self._each_level(list(reversed(levels)), self._stop_provider)
 
         self._running = False
         self._providers.clear()
         self._startup_order.clear()
         logger.info("All providers stopped")
 
+    @staticmethod
+    async def _stop_provider(provider: Provider) -> None:
+        logger.info("Stopping provider: %s", provider.name)
+        try:
+            await asyncio.wait_for(provider.stop(), timeout=30.0)
+        except TimeoutError:
+            logger.warning("Timed out stopping provider %s — skipping", provider.name)
+        except Exception:
+            logger.exception("Error stopping provider %s", provider.name)
+
+    async def _each_level(
+        self, levels: list[list[str]], action: Callable[[Provider], Awaitable[None]]
+    ) -> None:
+        """Run *action* once per provider, concurrently within each level."""
+        seen: set[int] = set()
+        for level in levels:
+            batch = self._batch(level, seen)
+            await asyncio.gather(*(action(provider) for _ids, provider in batch))
+
+    async def replace(self, node_id: str, provider: Provider | None) -> None:
+        """Swap the provider registered under *node_id* while running.
+
+        The previous provider, if any, is stopped and *provider* is started
+        in its place.  New node IDs are appended to the startup order so
+        they are stopped on shutdown.  Passing ``None`` removes the node.
+        """
+        previous = self._providers.pop(node_id, None)
+        if previous is not None and previous is not provider:
+            logger.info("Stopping provider: %s", previous.name)
+            try:
+                await asyncio.wait_for(previous.stop(), timeout=30.0)
+            except Exception:
+                logger.exception("Error stopping provider %s", previous.name)
+        if provider is None:
+            if node_id in self._startup_order:
+                self._startup_order.remove(node_id)
+            return
+        if provider is not previous:
+            logger.info("Starting provider: %s", provider.name)
+            await provider.start()
+        self._providers[node_id] = provider
+        if node_id not in self._startup_order:
+            self._startup_order.append(node_id)
+
     async def _flush_providers(self) -> None:
         """Call ``flush()`` on every provider that supports it."""
-        for node_id in self._startup_order:
-            provider = self._providers.get(node_id)
-            if provider is None:
-                continue
-            flush_fn = getattr(provider, "flush", None)
-            if flush_fn is not None and callable(flush_fn):
-                try:
-                    logger.info("Flushing state for %s", provider.name)
-                    await flush_fn()
-                except Exception:
-                    logger.exception("Error flushing provider %s", provider.name)
+        levels = startup_levels(self._startup_order, self._graph)
+        await self._each_level(levels, self._flush_provider)
+
+    @staticmethod
+    async def _flush_provider(provider: Provider) -> None:
+        flush_fn = getattr(provider, "flush", None)
+        if flush_fn is not None and callable(flush_fn):
+            try:
+                logger.info("Flushing state for %s", provider.name)
+                await flush_fn()
+            except Exception:
+                logger.exception("Error flushing provider %s", provider.name)
 
     async def wait_for_shutdown(self) -> None:
         """Block until a shutdown signal is received."""
@@ -147,6 +284,11 @@ class Orchestrator:
         """Return the providers dict."""
         return self._providers
 
+    @property
+    def startup_timings(self) -> StartupTimings:
+        """Return the timings of the last start."""
+        return self._timings
+
     @property
     def running(self) -> bool:
         """Return True if all providers have been started and not yet stopped."""
@@ -2,13 +2,22 @@
 
 Manages running ``cdk synth`` for a CDK project, with staleness detection so
 synthesis is only repeated when source files have changed.
+
+Once a ``cdk.out`` is known to be fresh, the mtime and size of every source
+file and the mtime of every scanned directory are persisted next to the
+manifest.  Later checks ``stat`` the indexed entries instead of walking the
+project tree, and only list directories whose mtime changed.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import json
+import os
 import sys
 from pathlib import Path
+from typing import Any
 
 # File extensions considered as CDK source files.
 _SOURCE_EXTENSIONS: frozenset[str] = frozenset({".ts", ".js", ".py", ".java"})
@@ -16,6 +25,10 @@ _SOURCE_EXTENSIONS: frozenset[str] = frozenset({".ts", ".js", ".py", ".java"})
 # Directory names excluded when scanning for source files.
 _EXCLUDED_DIRS: frozenset[str] = frozenset({"node_modules", ".git", "cdk.out"})
 
+# Source index persisted inside cdk.out, next to manifest.json.
+_SOURCE_INDEX_NAME = ".lws-source-index.json"
+_SOURCE_INDEX_VERSION = 1
+
 
 class SynthError(Exception):
     """Raised when cdk synth fails."""
@@ -25,15 +38,124 @@ class SynthError(Exception):
         self.exit_code = exit_code
 
 
-def _iter_source_files(project_dir: Path):
-    """Yield all source files in *project_dir*, skipping excluded directories."""
-    for child in project_dir.iterdir():
+def _relative(project_dir: Path, path: Path) -> str:
+    return path.relative_to(project_dir).as_posix()
+
+
+def _build_source_index(project_dir: Path, manifest_mtime_ns: int) -> dict[str, Any]:
+    """Walk *project_dir* and record the state of its directories and source files."""
+    dirs: dict[str, int] = {}
+    files: dict[str, list[int]] = {}
+    pending = [project_dir]
+    while pending:
+        directory = pending.pop()
+        dirs[_relative(project_dir, directory)] = directory.stat().st_mtime_ns
+        for child in directory.iterdir():
+            if child.is_dir():
+                if child.name not in _EXCLUDED_DIRS:
+                    pending.append(child)
+            elif child.suffix in _SOURCE_EXTENSIONS:
+                st = child.stat()
+                files[_relative(project_dir, child)] = [st.st_mtime_ns, st.st_size]
+    return {
+        "version": _SOURCE_INDEX_VERSION,
+        "manifest_mtime_ns": manifest_mtime_ns,
+        "dirs": dirs,
+        "files": files,
+    }
+
+
+def _load_source_index(project_dir: Path, manifest_mtime_ns: int) -> dict[str, Any] | None:
+    """Return the persisted source index if it was taken for the current manifest."""
+    try:
+        index = json.loads((project_dir / "cdk.out" / _SOURCE_INDEX_NAME).read_text())
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(index, dict)
+        or index.get("version") != _SOURCE_INDEX_VERSION
+        or index.get("manifest_mtime_ns") != manifest_mtime_ns
+    ):
+        return None
+    return index
+
+
+def _save_source_index(project_dir: Path, index: dict[str, Any]) -> None:
+    # The index is only an accelerator; a read-only cdk.out falls back to walking.
+    with contextlib.suppress(OSError):
+        (project_dir / "cdk.out" / _SOURCE_INDEX_NAME).write_text(
+            json.dumps(index, separators=(",", ":"))
+        )
+
+
+def _index_new_directory(project_dir: Path, directory: Path, index: dict[str, Any]) -> bool:
+    """Return True if the unindexed *directory* holds a source file.
+
+    Otherwise the directory and its subdirectories are added to the index,
+    so a source file created in them later is noticed.
+    """
+    found: dict[str, int] = {}
+    pending = [directory]
+    while pending:
+        current = pending.pop()
+        found[_relative(project_dir, current)] = current.stat().st_mtime_ns
+        for child in current.iterdir():
+            if child.is_dir():
+                if child.name not in _EXCLUDED_DIRS:
+                    pending.append(child)
+            elif child.suffix in _SOURCE_EXTENSIONS:
+                return True
+    index["dirs"].update(found)
+    return False
+
+
+def _has_new_sources(project_dir: Path, directory: Path, index: dict[str, Any]) -> bool:
+    """Return True if *directory* gained a source file or a subdirectory holding one."""
+    for child in directory.iterdir():
+        rel = _relative(project_dir, child)
         if child.is_dir():
-            if child.name in _EXCLUDED_DIRS:
+            if child.name in _EXCLUDED_DIRS or rel in index["dirs"]:
                 continue
-            yield from _iter_source_files(child)
-        elif child.suffix in _SOURCE_EXTENSIONS:
-            yield child
+            if _index_new_directory(project_dir, child, index):
+                return True
+        elif child.suffix in _SOURCE_EXTENSIONS and rel not in index["files"]:
+            return True
+    return False
+
+
+def _index_is_stale(project_dir: Path, index: dict[str, Any]) -> bool:
+    """Check the indexed source files and directories for changes.
+
+    Any modified, added or removed source file makes the output stale.
+    Directories whose mtime changed without gaining a source file (an
+    editor swap file, say) have their mtime refreshed in the index, and
+    any new subdirectories are indexed.
+    """
+    for rel, (mtime_ns, size) in index["files"].items():
+        try:
+            st = os.stat(project_dir / rel)
+        except OSError:
+            return True
+        if st.st_mtime_ns != mtime_ns or st.st_size != size:
+            return True
+
+    touched = False
+    for rel, mtime_ns in list(index["dirs"].items()):
+        directory = project_dir / rel
+        try:
+            current_ns = directory.stat().st_mtime_ns
+        except OSError:
+            return True
+        if current_ns == mtime_ns:
+            continue
+        if _has_new_sources(project_dir, directory, index):
+            return True
+        index["dirs"][rel] = current_ns
+        touched = True
+
+    if touched:
+        _save_source_index(project_dir, index)
+    return False
 
 
 def is_synth_stale(project_dir: Path) -> bool:
@@ -42,7 +164,9 @@ def is_synth_stale(project_dir: Path) -> bool:
     Staleness is determined by comparing the mtime of
     ``cdk.out/manifest.json`` against all CDK source files (``.ts``,
     ``.js``, ``.py``, ``.java``) found in *project_dir* (excluding
-    ``node_modules``, ``.git``, and ``cdk.out`` directories).
+    ``node_modules``, ``.git``, and ``cdk.out`` directories).  When a
+    source index persisted for the current manifest exists, only the
+    indexed entries are checked.
 
     Args:
         project_dir: Root of the CDK project.
@@ -54,12 +178,17 @@ def is_synth_stale(project_dir: Path) -> bool:
     if not manifest.exists():
         return True
 
-    manifest_mtime = manifest.stat().st_mtime
+    manifest_stat = manifest.stat()
+    index = _load_source_index(project_dir, manifest_stat.st_mtime_ns)
+    if index is not None:
+        return _index_is_stale(project_dir, index)
 
-    for source_file in _iter_source_files(project_dir):
-        if source_file.stat().st_mtime > manifest_mtime:
+    index = _build_source_index(project_dir, manifest_stat.st_mtime_ns)
+    for mtime_ns, _size in index["files"].values():
+        if mtime_ns > manifest_stat.st_mtime_ns:
             return True
 
+    _save_source_index(project_dir, index)
     return False
 
 
@@ -121,4 +250,9 @@ async def ensure_synth(project_dir: Path, force: bool = False) -> Path:
             exit_code=exit_code,
         )
 
+    manifest = cdk_out / "manifest.json"
+    if manifest.exists():
+        _save_source_index(
+            project_dir, _build_source_index(project_dir, manifest.stat().st_mtime_ns)
+        )
     return cdk_out
@@ -19,23 +19,26 @@ def _service_module_names() -> list[str]:
 
 
 def _registered_module_names() -> set[str]:
-    """Parse lws.py to find all ``from lws.cli.services.<module> import ...`` statements."""
+    """Parse lws.py to find all ``_add_service("lws.cli.services.<module>", ...)`` calls."""
     tree = ast.parse(LWS_CLI_ENTRY.read_text())
     registered = set()
     for node in ast.walk(tree):
         if (
-            isinstance(node, ast.ImportFrom)
-            and node.module
-            and node.module.startswith("lws.cli.services.")
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id == "_add_service"
+            and node.args
+            and isinstance(node.args[0], ast.Constant)
+            and str(node.args[0].value).startswith("lws.cli.services.")
         ):
-            module_name = node.module.split(".")[-1]
+            module_name = node.args[0].value.split(".")[-1]
             registered.add(module_name)
     return registered
 
 
 class TestCliServiceRegistration:
     def test_all_service_modules_are_registered(self):
-        """Every service module in cli/services/ must be imported in lws.py."""
+        """Every service module in cli/services/ must be registered in lws.py."""
         registered = _registered_module_names()
         unregistered = [name for name in _service_module_names() if name not in registered]
 
@@ -0,0 +1,70 @@
+"""Import-time benchmark for the ``lws`` and ``ldk`` CLI entry points.
+
+Imports each entry-point module in a fresh interpreter under
+``python -X importtime`` and reports the median cumulative import time
+of a few runs, together with the modules that cost the most.  Exits
+non-zero when an entry point exceeds its budget, so a change that pulls
+providers or every service group back into CLI startup is caught.
+
+Run with::
+
+    uv run python tests/benchmarks/bench_cli_import.py [runs]
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+
+# Median cumulative import time allowed per entry point, in milliseconds.
+_BUDGET_MS: dict[str, float] = {
+    "lws.cli.lws": 300.0,
+    "lws.cli.ldk": 400.0,
+}
+_TOP_MODULES = 8
+
+
+def _importtime(module: str) -> dict[str, tuple[int, int]]:
+    """Return ``{module: (self_us, cumulative_us)}`` for one import of *module*."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings: dict[str, tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[12:].split("|"))
+        if self_us.isdigit():
+            timings[name] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def _measure(module: str, runs: int) -> tuple[float, list[tuple[str, int]]]:
+    totals: list[float] = []
+    timings: dict[str, tuple[int, int]] = {}
+    for _ in range(runs):
+        timings = _importtime(module)
+        totals.append(timings[module][1] / 1000)
+    heaviest = sorted(timings.items(), key=lambda item: item[1][0], reverse=True)
+    return statistics.median(totals), [(name, t[0]) for name, t in heaviest[:_TOP_MODULES]]
+
+
+def main(runs: int) -> int:
+    over_budget = []
+    for module, budget_ms in _BUDGET_MS.items():
+        median_ms, heaviest = _measure(module, runs)
+        verdict = "ok" if median_ms <= budget_ms else "OVER BUDGET"
+        print(f"{module}: {median_ms:.0f} ms (budget {budget_ms:.0f} ms) {verdict}")
+        for name, self_us in heaviest:
+            print(f"    {self_us / 1000:7.1f} ms  {name}")
+        if median_ms > budget_ms:
+            over_budget.append(module)
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5))
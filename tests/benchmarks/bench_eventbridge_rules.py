@@ -0,0 +1,76 @@
+"""Micro-benchmark: EventBridge rule matching, linear scan vs compiled index.
+
+Matches a batch of events against 300 rules on one bus, first by calling
+``match_event`` for every rule (the pre-index routing loop) and then
+through ``RuleIndex``.  Most rules filter on ``source``/``detail-type``;
+a tenth use prefix or numeric conditions and cannot be pruned.
+
+Run with::
+
+    uv run python tests/benchmarks/bench_eventbridge_rules.py [events]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+
+from lws.providers.eventbridge.pattern_matcher import match_event
+from lws.providers.eventbridge.provider import RuleConfig
+from lws.providers.eventbridge.rule_index import RuleIndex
+
+_RULES = 300
+
+
+def _rules() -> list[RuleConfig]:
+    rules = []
+    for i in range(_RULES):
+        if i % 10 == 0:
+            pattern = {
+                "source": [{"prefix": f"svc.{i % 7}"}],
+                "detail": {"amount": [{"numeric": [">=", i, "<", i + 50]}]},
+            }
+        else:
+            pattern = {"source": [f"svc.{i % 30}"], "detail-type": [f"Type{i % 11}"]}
+        rules.append(
+            RuleConfig(rule_name=f"rule-{i}", event_bus_name="default", event_pattern=pattern)
+        )
+    return rules
+
+
+def _events(count: int) -> list[dict]:
+    rng = random.Random(7)
+    return [
+        {
+            "source": f"svc.{rng.randrange(30)}",
+            "detail-type": f"Type{rng.randrange(11)}",
+            "detail": {"amount": rng.randrange(400)},
+        }
+        for _ in range(count)
+    ]
+
+
+def main(count: int) -> None:
+    rules = _rules()
+    events = _events(count)
+    index = RuleIndex()
+    for rule in rules:
+        index.add(rule)
+
+    t0 = time.perf_counter()
+    linear = [[r for r in rules if r.enabled and match_event(r.event_pattern, e)] for e in events]
+    linear_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    indexed = [index.match(e) for e in events]
+    indexed_s = time.perf_counter() - t0
+
+    assert linear == indexed
+    print(f"{count} events x {_RULES} rules")
+    print(f"  linear  {count / linear_s:10.0f} events/s")
+    print(f"  indexed {count / indexed_s:10.0f} events/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,66 @@
+"""Micro-benchmark: IAM decisions, raw documents vs compiled policies.
+
+Evaluates the same identity and action set repeatedly, first against
+raw policy documents (fnmatch per pattern per call), then against the
+identity's precompiled policies, and finally through ``DecisionCache``.
+
+Run with::
+
+    uv run python tests/benchmarks/bench_iam_auth.py [decisions]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from lws.providers._shared.iam_decision_cache import DecisionCache
+from lws.providers._shared.iam_identity_store import Identity
+from lws.providers._shared.iam_policy_engine import EvaluationContext, evaluate
+
+_ACTIONS = ["dynamodb:GetItem", "dynamodb:Query"]
+
+
+def _identity() -> Identity:
+    statements = [
+        {"Effect": "Allow", "Action": f"sqs:Op{i}*", "Resource": f"arn:aws:sqs:*:q{i}"}
+        for i in range(20)
+    ]
+    statements.append({"Effect": "Allow", "Action": "dynamodb:*", "Resource": "*"})
+    statements.append({"Effect": "Deny", "Action": "dynamodb:DeleteTable", "Resource": "*"})
+    return Identity(name="bench", inline_policies=[{"Statement": statements}])
+
+
+def main(count: int) -> None:
+    identity = _identity()
+    raw = EvaluationContext("bench", _ACTIONS, "*", identity_policies=identity.inline_policies)
+    compiled = EvaluationContext(
+        "bench", _ACTIONS, "*", identity_policies=list(identity.compiled_policies)
+    )
+    cache = DecisionCache()
+    key = ("dynamodb", "bench", tuple(_ACTIONS), "*", 0)
+
+    t0 = time.perf_counter()
+    for _ in range(count):
+        evaluate(raw)
+    raw_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for _ in range(count):
+        evaluate(compiled)
+    compiled_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for _ in range(count):
+        if cache.get(key) is None:
+            cache.put(key, evaluate(compiled))
+    cached_s = time.perf_counter() - t0
+
+    print(f"{count} decisions x {len(_ACTIONS)} actions")
+    print(f"  raw documents {count / raw_s:10.0f} decisions/s")
+    print(f"  compiled      {count / compiled_s:10.0f} decisions/s")
+    print(f"  cached        {count / cached_s:10.0f} decisions/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
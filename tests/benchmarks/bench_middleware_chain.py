@@ -0,0 +1,116 @@
+"""Micro-benchmark: per-request cost of the service middleware chain.
+
+Sends DynamoDB ``GetItem`` requests through two in-process apps and
+reports the mean latency of each:
+
+* ``bare``  -- the DynamoDB router with no middleware at all;
+* ``chain`` -- ``create_dynamodb_app`` with every layer installed: request
+  logging, IAM auth (audit mode), chaos (disabled) and operation mocks
+  (disabled).
+
+The difference is the overhead the middleware chain adds to each request.
+Logging is raised to WARNING so terminal output does not dominate.
+
+Run with::
+
+    uv run python tests/benchmarks/bench_middleware_chain.py [requests]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI
+
+from lws.config.loader import IamAuthConfig, IamAuthServiceConfig
+from lws.interfaces import KeyAttribute, KeySchema, TableConfig
+from lws.providers._shared.aws_chaos import AwsChaosConfig
+from lws.providers._shared.aws_iam_auth import IamAuthBundle
+from lws.providers._shared.aws_operation_mock import AwsMockConfig
+from lws.providers._shared.iam_identity_store import Identity, IdentityStore
+from lws.providers._shared.iam_permissions_map import PermissionsMap
+from lws.providers._shared.iam_resource_policies import ResourcePolicyStore
+from lws.providers.dynamodb.provider import SqliteDynamoProvider
+from lws.providers.dynamodb.routes import DynamoDbRouter, create_dynamodb_app
+
+_TABLE = "BenchTable"
+_HEADERS = {"X-Amz-Target": "DynamoDB_20120810.GetItem"}
+_BODY = {"TableName": _TABLE, "Key": {"pk": {"S": "1"}}}
+
+
+def _iam_bundle() -> IamAuthBundle:
+    store = IdentityStore()
+    store._identities["bench"] = Identity(  # pylint: disable=protected-access
+        name="bench",
+        inline_policies=[
+            {
+                "Version": "2012-10-17",
+                "Statement": [{"Effect": "Allow", "Action": "dynamodb:*", "Resource": "*"}],
+            }
+        ],
+    )
+    return IamAuthBundle(
+        config=IamAuthConfig(
+            mode="audit",
+            default_identity="bench",
+            services={"dynamodb": IamAuthServiceConfig(enabled=True)},
+        ),
+        identity_store=store,
+        permissions_map=PermissionsMap(),
+        resource_policy_store=ResourcePolicyStore(),
+    )
+
+
+async def _mean_latency_us(app: FastAPI, requests: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(min(requests, 200)):
+            await client.post("/", headers=_HEADERS, json=_BODY)
+        t0 = time.perf_counter()
+        for _ in range(requests):
+            await client.post("/", headers=_HEADERS, json=_BODY)
+        return (time.perf_counter() - t0) / requests * 1e6
+
+
+async def _main(requests: int) -> None:
+    logging.getLogger("ldk").setLevel(logging.WARNING)
+    with tempfile.TemporaryDirectory() as tmp:
+        provider = SqliteDynamoProvider(
+            data_dir=Path(tmp),
+            tables=[
+                TableConfig(
+                    table_name=_TABLE,
+                    key_schema=KeySchema(partition_key=KeyAttribute(name="pk", type="S")),
+                )
+            ],
+        )
+        await provider.start()
+        await provider.put_item(_TABLE, {"pk": {"S": "1"}, "value": {"S": "x" * 64}})
+
+        bare = FastAPI()
+        bare.include_router(DynamoDbRouter(provider).router)
+        chain = create_dynamodb_app(
+            provider,
+            chaos=AwsChaosConfig(enabled=False),
+            aws_mock=AwsMockConfig(service="dynamodb", enabled=False),
+            iam_auth=_iam_bundle(),
+        )
+
+        bare_us = await _mean_latency_us(bare, requests)
+        chain_us = await _mean_latency_us(chain, requests)
+        await provider.stop()
+
+    print(f"GetItem x{requests}")
+    print(f"  bare   {bare_us:8.1f} us/request")
+    print(f"  chain  {chain_us:8.1f} us/request")
+    print(f"  overhead {chain_us - bare_us:6.1f} us/request")
+
+
+if __name__ == "__main__":
+    asyncio.run(_main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000))
@@ -0,0 +1,79 @@
+"""Micro-benchmark: sequential vs level-parallel provider startup.
+
+Starts a synthetic application of tables, functions reading them and
+HTTP servers, each provider sleeping for a fixed time in ``start()``,
+once without the ``AppGraph`` (one provider at a time) and once with it
+(each dependency level concurrently).
+
+Run with::
+
+    uv run python tests/benchmarks/bench_orchestrator_startup.py [providers]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+
+from lws.graph.builder import AppGraph, EdgeType, GraphEdge, GraphNode, NodeType
+from lws.interfaces.provider import Provider
+from lws.runtime.orchestrator import Orchestrator
+
+_START_DELAY_S = 0.05
+
+
+class _SleepyProvider(Provider):
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    async def start(self) -> None:
+        await asyncio.sleep(_START_DELAY_S)
+
+    async def stop(self) -> None:
+        return None
+
+    async def health_check(self) -> bool:
+        return True
+
+
+def _app(count: int) -> tuple[dict[str, Provider], list[str], AppGraph]:
+    graph = AppGraph()
+    providers: dict[str, Provider] = {}
+    third = max(count // 3, 1)
+    for i in range(third):
+        graph.add_node(GraphNode(id=f"table{i}", node_type=NodeType.DYNAMODB_TABLE))
+        graph.add_node(GraphNode(id=f"fn{i}", node_type=NodeType.LAMBDA_FUNCTION))
+        graph.add_edge(
+            GraphEdge(source=f"fn{i}", target=f"table{i}", edge_type=EdgeType.DATA_DEPENDENCY)
+        )
+        providers[f"table{i}"] = _SleepyProvider(f"table{i}")
+        providers[f"fn{i}"] = _SleepyProvider(f"fn{i}")
+    for i in range(count - 2 * third):
+        providers[f"__http_{i}__"] = _SleepyProvider(f"http{i}")
+    order = graph.topological_sort() + [k for k in providers if k not in graph.nodes]
+    return providers, order, graph
+
+
+async def _start(count: int, graph: bool) -> float:
+    providers, order, app_graph = _app(count)
+    orchestrator = Orchestrator()
+    await orchestrator.start(providers, order, app_graph if graph else None)
+    total_ms = orchestrator.startup_timings.total_ms
+    await orchestrator.stop()
+    return total_ms
+
+
+def main(count: int) -> None:
+    sequential_ms = asyncio.run(_start(count, graph=False))
+    parallel_ms = asyncio.run(_start(count, graph=True))
+    print(f"{count} providers, {_START_DELAY_S * 1000:.0f} ms start each")
+    print(f"  sequential     {sequential_ms:8.0f} ms")
+    print(f"  level-parallel {parallel_ms:8.0f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 30)
@@ -0,0 +1,73 @@
+"""Micro-benchmark: Step Functions history memory, dict vs bounded store.
+
+Records a soak of completed Express executions, each with a few state
+transitions carrying a ~4 KB payload, first into a plain dict of
+``ExecutionHistory`` objects (the pre-store layout) and then into
+``ExecutionStore`` with its default retention.  Reports the Python heap
+still held afterwards -- the store's SQLite pages are not traced, but
+are bounded by its retention -- and the ListExecutions page time.
+
+Run with::
+
+    uv run python tests/benchmarks/bench_stepfunctions_history.py [executions]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import tracemalloc
+
+from lws.providers.stepfunctions.engine import (
+    ExecutionHistory,
+    ExecutionStatus,
+    StateTransition,
+)
+from lws.providers.stepfunctions.history_store import ExecutionStore
+
+_PAYLOAD = {"items": [{"id": i, "body": "x" * 40} for i in range(80)]}
+
+
+def _history(i: int) -> ExecutionHistory:
+    return ExecutionHistory(
+        execution_arn=f"arn:aws:states:us-east-1:000000000000:execution:sm:{i}",
+        state_machine_name="sm",
+        status=ExecutionStatus.SUCCEEDED,
+        start_time=float(i),
+        end_time=float(i) + 0.01,
+        input_data={"items": list(_PAYLOAD["items"])},
+        output_data={"items": list(_PAYLOAD["items"])},
+        transitions=[
+            StateTransition(f"S{n}", "Pass", float(i), dict(_PAYLOAD), dict(_PAYLOAD))
+            for n in range(3)
+        ],
+    )
+
+
+def _measure(count: int, record) -> float:
+    tracemalloc.start()
+    for i in range(count):
+        record(_history(i))
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / 1024 / 1024
+
+
+def main(count: int) -> None:
+    executions: dict[str, ExecutionHistory] = {}
+    dict_mb = _measure(count, lambda h: executions.__setitem__(h.execution_arn, h))
+
+    store = ExecutionStore()
+    store_mb = _measure(count, store.put)
+    t0 = time.perf_counter()
+    page = store.list_page("sm", max_results=100)
+    list_ms = (time.perf_counter() - t0) * 1000
+
+    print(f"{count} completed executions")
+    print(f"  dict   {dict_mb:8.1f} MB Python heap")
+    print(f"  store  {store_mb:8.1f} MB Python heap ({store.metrics()['completed']} kept)")
+    print(f"  ListExecutions page of {len(page.executions)}: {list_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
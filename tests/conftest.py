@@ -0,0 +1,9 @@
+"""Test-suite wide settings."""
+
+from __future__ import annotations
+
+import os
+
+# LwsClient discovery must not read or write the developer's on-disk cache;
+# tests that cover the cache pass their own DiscoveryCache.
+os.environ.setdefault("LWS_DISCOVERY_TTL", "0")
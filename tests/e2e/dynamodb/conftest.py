@@ -37,6 +37,50 @@ def a_table_was_created(table_name, lws_invoke, e2e_port):
     return {"table_name": table_name}
 
 
+@given(
+    parsers.parse('a table "{table_name}" with a number sort key was created'),
+    target_fixture="given_table",
+)
+def a_table_with_number_sort_key_was_created(table_name, lws_invoke, e2e_port):
+    lws_invoke(
+        [
+            "dynamodb",
+            "create-table",
+            "--table-name",
+            table_name,
+            "--key-schema",
+            '[{"AttributeName":"pk","KeyType":"HASH"},{"AttributeName":"sk","KeyType":"RANGE"}]',
+            "--attribute-definitions",
+            '[{"AttributeName":"pk","AttributeType":"S"},'
+            '{"AttributeName":"sk","AttributeType":"N"}]',
+            "--port",
+            str(e2e_port),
+        ]
+    )
+    return {"table_name": table_name}
+
+
+@given(
+    parsers.parse(
+        'items were put with key "{key}" and sort keys "{sort_keys}" into table "{table_name}"'
+    ),
+)
+def items_were_put_with_sort_keys(key, sort_keys, table_name, lws_invoke, e2e_port):
+    for sort_key in sort_keys.split(","):
+        lws_invoke(
+            [
+                "dynamodb",
+                "put-item",
+                "--table-name",
+                table_name,
+                "--item",
+                json.dumps({"pk": {"S": key}, "sk": {"N": sort_key}}),
+                "--port",
+                str(e2e_port),
+            ]
+        )
+
+
 @given(
     parsers.re(r'an item was put with key "(?P<key>[^"]+)" into table "(?P<table_name>[^"]+)"'),
 )
@@ -310,6 +354,73 @@ def i_scan_table(table_name, e2e_port):
     )
 
 
+@when(
+    parsers.parse('I scan table "{table_name}" with limit {limit:d}'),
+    target_fixture="command_result",
+)
+def i_scan_table_with_limit(table_name, limit, e2e_port):
+    return runner.invoke(
+        app,
+        [
+            "dynamodb",
+            "scan",
+            "--table-name",
+            table_name,
+            "--limit",
+            str(limit),
+            "--port",
+            str(e2e_port),
+        ],
+    )
+
+
+@when(
+    parsers.parse('I scan table "{table_name}" for items with status "{status}"'),
+    target_fixture="command_result",
+)
+def i_scan_table_for_status(table_name, status, e2e_port):
+    return runner.invoke(
+        app,
+        [
+            "dynamodb",
+            "scan",
+            "--table-name",
+            table_name,
+            "--filter-expression",
+            "status = :s",
+            "--expression-attribute-values",
+            json.dumps({":s": {"S": status}}),
+            "--port",
+            str(e2e_port),
+        ],
+    )
+
+
+@when(
+    parsers.parse('I scan all {total:d} segments of table "{table_name}"'),
+    target_fixture="segment_results",
+)
+def i_scan_all_segments(total, table_name, e2e_port):
+    return [
+        runner.invoke(
+            app,
+            [
+                "dynamodb",
+                "scan",
+                "--table-name",
+                table_name,
+                "--segment",
+                str(segment),
+                "--total-segments",
+                str(total),
+                "--port",
+                str(e2e_port),
+            ],
+        )
+        for segment in range(total)
+    ]
+
+
 @when(
     parsers.parse('I transact get item with key "{key}" from table "{table_name}"'),
     target_fixture="command_result",
@@ -456,6 +567,15 @@ def query_result_will_contain_at_least(count, command_result, parse_output):
     assert body["Count"] >= count
 
 
+@then(
+    parsers.parse('the query result sort keys will be "{sort_keys}"'),
+)
+def query_result_sort_keys_will_be(sort_keys, command_result, parse_output):
+    body = parse_output(command_result.output)
+    actual_sort_keys = ",".join(item["sk"]["N"] for item in body["Items"])
+    assert actual_sort_keys == sort_keys
+
+
 @then(
     parsers.parse("the scan result will contain at least {count:d} items"),
 )
@@ -464,6 +584,32 @@ def scan_result_will_contain_at_least(count, command_result, parse_output):
     assert body["Count"] >= count
 
 
+@then(
+    parsers.parse("the scan result will contain exactly {count:d} item"),
+)
+def scan_result_will_contain_exactly(count, command_result, parse_output):
+    body = parse_output(command_result.output)
+    actual_count = body["Count"]
+    assert actual_count == count
+
+
+@then("the scan result will have a last evaluated key")
+def scan_result_will_have_last_evaluated_key(command_result, parse_output):
+    body = parse_output(command_result.output)
+    assert "LastEvaluatedKey" in body
+
+
+@then(
+    parsers.parse("the segment scans will return {count:d} items in total"),
+)
+def segment_scans_will_return_total(count, segment_results, parse_output):
+    actual_count = 0
+    for result in segment_results:
+        assert result.exit_code == 0, result.output
+        actual_count += parse_output(result.output)["Count"]
+    assert actual_count == count
+
+
 @then(
     parsers.parse('the scan result will include key "{key}"'),
 )
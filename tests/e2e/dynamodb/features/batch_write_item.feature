@@ -6,3 +6,11 @@ Feature: DynamoDB BatchWriteItem
     Given a table "e2e-batch-write" was created
     When I batch write items with keys "bw1" and "bw2" into table "e2e-batch-write"
     Then the command will succeed
+
+  @happy @group_commit
+  Scenario: Every item of a batch write is readable after the batch commits
+    Given a table "e2e-batch-write-commit" was created
+    When I batch write items with keys "bc1" and "bc2" into table "e2e-batch-write-commit"
+    Then the command will succeed
+    And item with key "bc1" in table "e2e-batch-write-commit" will have data "val1"
+    And item with key "bc2" in table "e2e-batch-write-commit" will have data "val2"
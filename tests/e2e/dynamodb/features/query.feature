@@ -9,3 +9,11 @@ Feature: DynamoDB Query
     Then the command will succeed
     And the query result will contain at least 1 item
     And the first query result will have data "found"
+
+  @happy @numeric_keys
+  Scenario: Query returns number sort keys in numeric order
+    Given a table "e2e-query-numeric" with a number sort key was created
+    And items were put with key "n1" and sort keys "9,10,2,100" into table "e2e-query-numeric"
+    When I query table "e2e-query-numeric" for key "n1"
+    Then the command will succeed
+    And the query result sort keys will be "2,9,10,100"
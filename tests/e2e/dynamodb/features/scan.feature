@@ -11,3 +11,32 @@ Feature: DynamoDB Scan
     And the scan result will contain at least 2 items
     And the scan result will include key "s1"
     And the scan result will include key "s2"
+
+  @happy @pagination
+  Scenario: Scan with a limit returns a last evaluated key
+    Given a table "e2e-scan-page" was created
+    And an item was put with key "p1" and data "a" into table "e2e-scan-page"
+    And an item was put with key "p2" and data "b" into table "e2e-scan-page"
+    When I scan table "e2e-scan-page" with limit 1
+    Then the command will succeed
+    And the scan result will contain exactly 1 item
+    And the scan result will have a last evaluated key
+
+  @happy @parallel_scan
+  Scenario: Parallel scan segments together return every item
+    Given a table "e2e-scan-segments" was created
+    And an item was put with key "g1" and data "a" into table "e2e-scan-segments"
+    And an item was put with key "g2" and data "b" into table "e2e-scan-segments"
+    And an item was put with key "g3" and data "c" into table "e2e-scan-segments"
+    When I scan all 2 segments of table "e2e-scan-segments"
+    Then the segment scans will return 3 items in total
+
+  @happy @filter_pushdown
+  Scenario: Scan with a filter expression returns only matching items
+    Given a table "e2e-scan-filter" was created
+    And an item was put with key "open-1" and status "open" into table "e2e-scan-filter"
+    And an item was put with key "closed-1" and status "closed" into table "e2e-scan-filter"
+    When I scan table "e2e-scan-filter" for items with status "open"
+    Then the command will succeed
+    And the scan result will contain exactly 1 item
+    And the scan result will include key "open-1"
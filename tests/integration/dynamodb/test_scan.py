@@ -36,3 +36,29 @@ class TestScan:
         assert len(body["Items"]) >= 1
         actual_pks = [item["pk"] for item in body["Items"]]
         assert expected_pk in actual_pks
+
+    async def test_scan_with_limit_returns_last_evaluated_key(self, client: httpx.AsyncClient):
+        # Arrange
+        expected_status_code = 200
+        table_name = "TestTable"
+        for pk in ("limit-a", "limit-b", "limit-c"):
+            await client.post(
+                "/",
+                headers={"X-Amz-Target": "DynamoDB_20120810.PutItem"},
+                json={"TableName": table_name, "Item": {"pk": {"S": pk}}},
+            )
+        expected_last_key = {"pk": {"S": "limit-b"}}
+
+        # Act
+        response = await client.post(
+            "/",
+            headers={"X-Amz-Target": "DynamoDB_20120810.Scan"},
+            json={"TableName": table_name, "Limit": 2},
+        )
+
+        # Assert
+        assert response.status_code == expected_status_code
+        body = response.json()
+        assert len(body["Items"]) == 2
+        actual_last_key = body["LastEvaluatedKey"]
+        assert actual_last_key == expected_last_key
@@ -214,3 +214,28 @@ class TestManagementIamAuthSet:
         assert actual_identity is not None
         actual_policies = actual_identity.inline_policies
         assert actual_policies == [{"Version": "2012-10-17", "Statement": []}]
+
+    def test_post_clears_decision_cache(self):
+        # Arrange
+        from lws.providers._shared.iam_policy_engine import Decision
+
+        orchestrator = Orchestrator()
+        bundle = _make_bundle(mode="enforce")
+        bundle.decision_cache.put(
+            ("dynamodb", "u", ("dynamodb:GetItem",), "*", 0), (Decision.ALLOW, "x")
+        )
+        router = create_management_router(
+            orchestrator=orchestrator,
+            iam_auth_bundle=bundle,
+        )
+        fast_app = FastAPI()
+        fast_app.include_router(router)
+        client = TestClient(fast_app)
+        expected_entries = 0
+
+        # Act
+        client.post("/_ldk/iam-auth", json={"mode": "audit"})
+
+        # Assert
+        actual_entries = len(bundle.decision_cache)
+        assert actual_entries == expected_entries
@@ -7,6 +7,7 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from lws.api.management import create_management_router
+from lws.providers._shared.delivery_scheduler import DeliveryScheduler
 from lws.runtime.orchestrator import Orchestrator
 
 from ._helpers import FakeProvider
@@ -89,3 +90,34 @@ class TestStatusEndpoint:
         actual_ids = {p["id"] for p in data["providers"]}
         assert expected_lambda_id in actual_ids
         assert expected_dynamodb_id in actual_ids
+
+    def test_status_includes_delivery_metrics(self):
+        # Arrange
+        orchestrator = Orchestrator()
+        providers = {"__delivery__": DeliveryScheduler()}
+        app = FastAPI()
+        app.include_router(create_management_router(orchestrator, providers=providers))
+        expected_keys = {"queued", "in_flight", "delivered", "failed", "retried", "latency_ms"}
+
+        # Act
+        resp = TestClient(app).get("/_ldk/status")
+
+        # Assert
+        actual_metrics = resp.json()["providers"][0]["metrics"]
+        assert expected_keys <= set(actual_metrics)
+
+    async def test_status_includes_startup_timings(self):
+        # Arrange
+        orchestrator = Orchestrator()
+        providers = {"dynamodb": FakeProvider("dynamodb")}
+        await orchestrator.start(providers, ["dynamodb"])
+        app = FastAPI()
+        app.include_router(create_management_router(orchestrator, providers=providers))
+
+        # Act
+        resp = TestClient(app).get("/_ldk/status")
+
+        # Assert
+        actual = resp.json()
+        assert actual["startup"]["levels"] == [["dynamodb"]]
+        assert actual["providers"][0]["start_ms"] >= 0
@@ -0,0 +1,35 @@
+"""Unit tests for LwsClient connection pooling."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from lws.cli.services.client import DiscoveryCache, LwsClient
+
+
+class TestConnectionPool:
+    @pytest.mark.asyncio
+    async def test_requests_share_one_http_client(self, tmp_path):
+        # Arrange
+        client = LwsClient(port=3000, cache=DiscoveryCache(tmp_path, ttl=0))
+        client._metadata = {"services": {"sqs": {"port": 3002, "resources": []}}}
+        mock_resp = httpx.Response(
+            200, text="<ok/>", request=httpx.Request("POST", "http://localhost:3002/")
+        )
+
+        # Act
+        with patch("httpx.AsyncClient") as mock_cls:
+            instance = AsyncMock()
+            instance.request.return_value = mock_resp
+            mock_cls.return_value = instance
+            async with client:
+                await client.form_request("sqs", {"Action": "ListQueues"})
+                await client.form_request("sqs", {"Action": "ListQueues"})
+
+        # Assert
+        mock_cls.assert_called_once()
+        assert instance.request.await_count == 2
+        instance.aclose.assert_awaited_once()
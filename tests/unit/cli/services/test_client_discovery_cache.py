@@ -0,0 +1,101 @@
+"""Unit tests for the on-disk discovery cache."""
+
+from __future__ import annotations
+
+import os
+import time
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from lws.cli.services.client import DiscoveryCache, LwsClient
+
+SAMPLE_METADATA = {"port": 3000, "services": {"sqs": {"port": 3002, "resources": []}}}
+
+
+class TestDiscoveryCache:
+    def test_load_returns_stored_metadata(self, tmp_path):
+        # Arrange
+        cache = DiscoveryCache(tmp_path, ttl=30)
+        cache.store(3000, SAMPLE_METADATA)
+
+        # Act
+        actual = cache.load(3000)
+
+        # Assert
+        assert actual == SAMPLE_METADATA
+
+    def test_load_ignores_expired_entry(self, tmp_path):
+        # Arrange
+        cache = DiscoveryCache(tmp_path, ttl=30)
+        cache.store(3000, SAMPLE_METADATA)
+        expired = time.time() - 60
+        os.utime(tmp_path / "discovery-3000.json", (expired, expired))
+
+        # Act
+        actual = cache.load(3000)
+
+        # Assert
+        assert actual is None
+
+    def test_zero_ttl_disables_cache(self, tmp_path):
+        # Arrange
+        cache = DiscoveryCache(tmp_path, ttl=0)
+
+        # Act
+        cache.store(3000, SAMPLE_METADATA)
+
+        # Assert
+        assert cache.load(3000) is None
+        assert not list(tmp_path.iterdir())
+
+    def test_invalidate_removes_entry(self, tmp_path):
+        # Arrange
+        cache = DiscoveryCache(tmp_path, ttl=30)
+        cache.store(3000, SAMPLE_METADATA)
+
+        # Act
+        cache.invalidate(3000)
+
+        # Assert
+        assert cache.load(3000) is None
+
+    @pytest.mark.asyncio
+    async def test_client_skips_request_when_cached(self, tmp_path):
+        # Arrange
+        cache = DiscoveryCache(tmp_path, ttl=30)
+        cache.store(3000, SAMPLE_METADATA)
+        client = LwsClient(port=3000, cache=cache)
+
+        # Act
+        with patch("httpx.AsyncClient") as mock_cls:
+            actual_port = await client.service_port("sqs")
+
+        # Assert
+        assert actual_port == 3002
+        mock_cls.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_client_rediscovers_on_cache_miss(self, tmp_path):
+        # Arrange
+        cache = DiscoveryCache(tmp_path, ttl=30)
+        cache.store(3000, {"port": 3000, "services": {}})
+        client = LwsClient(port=3000, cache=cache)
+        mock_resp = httpx.Response(
+            200,
+            json=SAMPLE_METADATA,
+            request=httpx.Request("GET", "http://localhost:3000/_ldk/resources"),
+        )
+
+        # Act
+        with patch("httpx.AsyncClient") as mock_cls:
+            instance = AsyncMock()
+            instance.get.return_value = mock_resp
+            mock_cls.return_value = instance
+            actual_port = await client.service_port("sqs")
+
+        # Assert
+        assert actual_port == 3002
+        instance.get.assert_awaited_once()
+        assert cache.load(3000) == SAMPLE_METADATA
@@ -0,0 +1,121 @@
+"""Tests for ``lws dynamodb put-item --from-file``."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock, patch
+
+from typer.testing import CliRunner
+
+from lws.cli.lws import app
+
+runner = CliRunner()
+
+_TARGET_PREFIX = "DynamoDB_20120810"
+
+
+def _mock_client(*responses: dict) -> AsyncMock:
+    mock = AsyncMock()
+    mock.__aenter__.return_value = mock
+    mock.json_target_request = AsyncMock(side_effect=list(responses))
+    return mock
+
+
+def _write_items(tmp_path, count: int):
+    source = tmp_path / "items.ndjson"
+    source.write_text(
+        "\n".join(json.dumps({"pk": {"S": f"id-{i}"}}) for i in range(count)) + "\n\n"
+    )
+    return source
+
+
+def _put_from_file(mock: AsyncMock, source) -> object:
+    with patch("lws.cli.services.dynamodb._client", return_value=mock):
+        return runner.invoke(
+            app, ["dynamodb", "put-item", "--table-name", "T", "--from-file", str(source)]
+        )
+
+
+class TestPutItemFromFile:
+    def test_items_are_sent_in_batches_of_25(self, tmp_path) -> None:
+        # Arrange
+        expected_target = f"{_TARGET_PREFIX}.BatchWriteItem"
+        expected_batch_sizes = [25, 25, 10]
+        expected_summary = {"Succeeded": 60, "Failed": 0, "Errors": []}
+        mock = _mock_client(*[{"UnprocessedItems": {}}] * 3)
+
+        # Act
+        result = _put_from_file(mock, _write_items(tmp_path, 60))
+
+        # Assert
+        assert result.exit_code == 0
+        assert json.loads(result.stdout) == expected_summary
+        calls = mock.json_target_request.call_args_list
+        assert {c[0][1] for c in calls} == {expected_target}
+        actual_batch_sizes = sorted(
+            (len(c[0][2]["RequestItems"]["T"]) for c in calls), reverse=True
+        )
+        assert actual_batch_sizes == expected_batch_sizes
+
+    def test_unprocessed_items_are_retried(self, tmp_path) -> None:
+        # Arrange
+        unprocessed = [{"PutRequest": {"Item": {"pk": {"S": "id-1"}}}}]
+        mock = _mock_client({"UnprocessedItems": {"T": unprocessed}}, {"UnprocessedItems": {}})
+        expected_summary = {"Succeeded": 2, "Failed": 0, "Errors": []}
+
+        # Act
+        result = _put_from_file(mock, _write_items(tmp_path, 2))
+
+        # Assert
+        assert result.exit_code == 0
+        assert json.loads(result.stdout) == expected_summary
+        retried = mock.json_target_request.call_args_list[1][0][2]["RequestItems"]["T"]
+        assert retried == unprocessed
+
+    def test_error_response_is_reported_and_exits_non_zero(self, tmp_path) -> None:
+        # Arrange
+        expected_message = "Requested resource not found"
+        mock = _mock_client({"__type": "ResourceNotFoundException", "message": expected_message})
+        expected_summary = {"Succeeded": 0, "Failed": 2, "Errors": [expected_message]}
+
+        # Act
+        result = _put_from_file(mock, _write_items(tmp_path, 2))
+
+        # Assert
+        assert result.exit_code == 1
+        assert json.loads(result.stdout) == expected_summary
+        assert expected_message in result.stderr
+
+    def test_unreachable_ldk_exits_with_error(self, tmp_path) -> None:
+        # Arrange
+        expected_message = "Cannot reach ldk dev on port 3000. Is it running?"
+        mock = _mock_client()
+        mock.service_port = AsyncMock(side_effect=Exception(expected_message))
+
+        # Act
+        result = _put_from_file(mock, _write_items(tmp_path, 1))
+
+        # Assert
+        assert result.exit_code == 1
+        assert expected_message in result.stderr
+        mock.json_target_request.assert_not_awaited()
+
+    def test_invalid_json_line_exits_with_error(self, tmp_path) -> None:
+        # Arrange
+        source = tmp_path / "items.ndjson"
+        source.write_text('{"pk": {"S": "a"}}\nnot json\n')
+        mock = _mock_client()
+
+        # Act
+        result = _put_from_file(mock, source)
+
+        # Assert
+        assert result.exit_code == 1
+        mock.json_target_request.assert_not_awaited()
+
+    def test_requires_item_or_from_file(self) -> None:
+        # Act
+        result = runner.invoke(app, ["dynamodb", "put-item", "--table-name", "T"])
+
+        # Assert
+        assert result.exit_code == 1
@@ -0,0 +1,40 @@
+"""Unit tests for lazy loading of lws CLI service groups."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+
+def _loaded_modules(code: str) -> set[str]:
+    """Run *code* in a fresh interpreter and return the modules it loaded."""
+    script = f"{code}\nimport sys\nprint('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyServices:
+    def test_import_loads_no_service_modules(self) -> None:
+        # Act
+        actual = _loaded_modules("import lws.cli.lws")
+
+        # Assert
+        services = {m for m in actual if m.startswith("lws.cli.services.")}
+        assert services <= {"lws.cli.services", "lws.cli.services.client"}
+
+    def test_invoking_a_service_loads_only_that_service(self) -> None:
+        # Arrange
+        code = (
+            "from typer.testing import CliRunner\n"
+            "from lws.cli.lws import app\n"
+            "CliRunner().invoke(app, ['sqs', '--help'])"
+        )
+
+        # Act
+        actual = _loaded_modules(code)
+
+        # Assert
+        assert "lws.cli.services.sqs" in actual
+        assert "lws.cli.services.dynamodb" not in actual
@@ -0,0 +1,44 @@
+"""Unit tests for the compute provider chosen by ldk dev."""
+
+from __future__ import annotations
+
+from lws.cli.ldk import _build_compute, _lambda_worker_pool_config
+from lws.config.loader import LdkConfig
+from lws.parser.assembly import LambdaFunction
+from lws.providers.lambda_runtime.docker import DockerCompute
+from lws.providers.lambda_runtime.nodejs import NodeJsCompute
+from lws.providers.lambda_runtime.python import PythonCompute
+
+
+def _function(runtime: str) -> LambdaFunction:
+    return LambdaFunction(name="Fn", handler="index.handler", runtime=runtime)
+
+
+class TestBuildCompute:
+    def test_functions_run_in_docker_by_default(self) -> None:
+        # Arrange
+        pool = _lambda_worker_pool_config(LdkConfig())
+
+        # Act
+        actual = _build_compute(_function("python3.12"), {}, {}, pool)
+
+        # Assert
+        assert pool is None
+        assert isinstance(actual, DockerCompute)
+
+    def test_warm_workers_run_python_and_node_locally(self) -> None:
+        # Arrange
+        pool = _lambda_worker_pool_config(
+            LdkConfig(lambda_warm_workers=2, lambda_worker_idle_timeout_ms=1500)
+        )
+
+        # Act
+        python_compute = _build_compute(_function("python3.12"), {}, {}, pool)
+        node_compute = _build_compute(_function("nodejs20.x"), {}, {}, pool)
+        other_compute = _build_compute(_function("java21"), {}, {}, pool)
+
+        # Assert
+        assert (pool.max_workers, pool.idle_timeout) == (2, 1.5)
+        assert isinstance(python_compute, PythonCompute)
+        assert isinstance(node_compute, NodeJsCompute)
+        assert isinstance(other_compute, DockerCompute)
@@ -0,0 +1,22 @@
+"""Unit tests for deferred provider imports in the ldk CLI."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+
+class TestDeferredImports:
+    def test_import_loads_no_provider_modules(self) -> None:
+        # Arrange
+        script = "import sys\nimport lws.cli.ldk\nprint('\\n'.join(sys.modules))"
+
+        # Act
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        )
+        actual = set(result.stdout.split())
+
+        # Assert
+        assert {m for m in actual if m.startswith("lws.providers.")} == set()
+        assert "fastapi" not in actual
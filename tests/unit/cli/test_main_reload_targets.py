@@ -0,0 +1,243 @@
+"""Unit tests for the providers patched by ldk dev hot reload."""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from lws.cli import ldk
+from lws.cli.ldk import _create_cognito_providers, _ReloadTargets
+from lws.graph.builder import build_graph
+from lws.interfaces import InvocationResult, LambdaContext
+from lws.parser.assembly import (
+    ApiDefinition,
+    ApiRoute,
+    AppModel,
+    CognitoUserPool,
+    DynamoTable,
+    LambdaFunction,
+    LambdaFunctionUrl,
+    StateMachine,
+)
+from lws.providers.lambda_runtime.routes import LambdaRegistry
+from lws.providers.lambda_runtime.worker_pool import WorkerPoolConfig
+from lws.providers.stepfunctions.provider import StepFunctionsProvider
+from lws.runtime.hot_reload import HotReloader, ResourceChange, RestartRequired
+
+_HANDLER = """
+def main(event, context):
+    return {"version": VERSION}
+"""
+
+
+def _targets(**overrides) -> _ReloadTargets:
+    fields = {
+        "orchestrator": AsyncMock(),
+        "compute_providers": {},
+        "lambda_registry": LambdaRegistry(),
+        "local_endpoints": {"dynamodb": "http://127.0.0.1:3001"},
+        "dynamo": None,
+        "sqs": None,
+        "s3": None,
+        "sns": None,
+        "eventbridge": None,
+        "stepfunctions": StepFunctionsProvider(),
+        "port": 3000,
+    }
+    fields.update(overrides)
+    return _ReloadTargets(**fields)
+
+
+def _stage(project_dir: Path, version: int) -> LambdaFunction:
+    """Copy the project's ``src`` into a ``cdk.out`` asset, like ``cdk synth`` does."""
+    asset = project_dir / "cdk.out" / f"asset.{version}"
+    shutil.copytree(project_dir / "src", asset)
+    return LambdaFunction(
+        name="Api", handler="handler.main", runtime="python3.12", code_path=asset
+    )
+
+
+def _context() -> LambdaContext:
+    return LambdaContext(
+        function_name="Api",
+        memory_limit_in_mb=128,
+        timeout_seconds=5,
+        aws_request_id="req-1",
+        invoked_function_arn="arn:aws:lambda:us-east-1:000000000000:function:Api",
+    )
+
+
+class TestReloadTargets:
+    async def test_updated_function_gets_a_new_compute_provider(self) -> None:
+        # Arrange
+        targets = _targets()
+        fn = LambdaFunction(name="Api", handler="index.handler", runtime="python3.12", timeout=9)
+        change = ResourceChange("function", "Api", "UPDATE", new=fn)
+
+        # Act
+        await targets.apply_function(change)
+
+        # Assert
+        actual = targets.compute_providers["Api"]
+        assert targets.orchestrator.replace.await_args.args == ("Api", actual)
+        assert targets.lambda_registry.get_compute("Api") is actual
+        assert targets.lambda_registry.get_config("Api")["Timeout"] == 9
+
+    async def test_state_machine_definition_is_replaced(self) -> None:
+        # Arrange
+        targets = _targets()
+        definition = '{"StartAt": "Done", "States": {"Done": {"Type": "Succeed"}}}'
+        change = ResourceChange(
+            "state_machine", "Flow", "UPDATE", new=StateMachine(name="Flow", definition=definition)
+        )
+
+        # Act
+        await targets.apply_state_machine(change)
+
+        # Assert
+        actual = targets.stepfunctions.describe_state_machine("Flow")
+        assert actual["definition"] == definition
+
+    async def test_updated_table_needs_a_restart(self) -> None:
+        # Arrange
+        targets = _targets()
+        change = ResourceChange("table", "Orders", "UPDATE", new=DynamoTable(name="Orders"))
+
+        # Act
+        with pytest.raises(RestartRequired) as exc_info:
+            await targets.apply_table(change)
+
+        # Assert
+        assert "restart" in str(exc_info.value)
+
+    async def test_updated_api_is_served_with_its_new_routes(self) -> None:
+        # Arrange
+        targets = _targets(compute_providers={"Orders": AsyncMock()})
+        api = ApiDefinition(
+            name="Shop",
+            routes=[
+                ApiRoute("GET", "/orders", "Orders"),
+                ApiRoute("GET", "/carts", "Carts"),
+            ],
+        )
+        change = ResourceChange("api", "Shop", "UPDATE", new=api)
+        expected_node_id = "Shop"
+        expected_paths = {"/orders"}
+
+        # Act
+        await targets.apply_api(change)
+
+        # Assert
+        actual_node_id, provider = targets.orchestrator.replace.await_args.args
+        actual_paths = {route.path for route in provider.app.routes} & {"/orders", "/carts"}
+        assert actual_node_id == expected_node_id
+        assert actual_paths == expected_paths
+
+    async def test_removed_api_stops_being_served(self) -> None:
+        # Arrange
+        targets = _targets()
+        change = ResourceChange("api", "Shop", "REMOVE", old=ApiDefinition(name="Shop"))
+        expected_args = ("Shop", None)
+
+        # Act
+        await targets.apply_api(change)
+
+        # Assert
+        actual_args = targets.orchestrator.replace.await_args.args
+        assert actual_args == expected_args
+
+    async def test_updated_function_url_keeps_its_port(self) -> None:
+        # Arrange
+        targets = _targets(compute_providers={"Api": AsyncMock()})
+        targets.lambda_registry.register_function_url("Api", {"_port": 3030})
+        furl = LambdaFunctionUrl("ApiUrl", "Api", cors={"AllowOrigins": ["*"]})
+        change = ResourceChange("function_url", "Api", "UPDATE", new=furl)
+        expected_node_id = "__function_url_Api__"
+        expected_port = 3030
+
+        # Act
+        await targets.apply_function_url(change)
+
+        # Assert
+        actual_node_id, provider = targets.orchestrator.replace.await_args.args
+        assert actual_node_id == expected_node_id
+        assert provider.port == expected_port
+        assert targets.lambda_registry.get_function_url("Api")["Cors"] == furl.cors
+
+    async def test_new_function_url_gets_an_unused_port(self) -> None:
+        # Arrange
+        targets = _targets(compute_providers={"Api": AsyncMock()})
+        targets.lambda_registry.register_function_url("Other", {"_port": 3023})
+        change = ResourceChange("function_url", "Api", "ADD", new=LambdaFunctionUrl("U", "Api"))
+        expected_port = 3024
+
+        # Act
+        await targets.apply_function_url(change)
+
+        # Assert
+        _, provider = targets.orchestrator.replace.await_args.args
+        assert provider.port == expected_port
+
+    async def test_reloaded_cognito_trigger_invokes_the_new_compute(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Arrange
+        old_compute, new_compute = AsyncMock(), AsyncMock()
+        new_compute.invoke.return_value = InvocationResult(
+            payload={"response": {}}, error=None, duration_ms=1.0, request_id="req-1"
+        )
+        compute_providers = {"PreAuth": old_compute}
+        pool = CognitoUserPool(logical_id="Pool", pre_auth_trigger="PreAuth")
+        cognito, _ = _create_cognito_providers(
+            AppModel(user_pools=[pool]), tmp_path, compute_providers
+        )
+        targets = _targets(compute_providers=compute_providers)
+        monkeypatch.setattr(ldk, "_build_compute", lambda *_args: new_compute)
+        fn = LambdaFunction(name="PreAuth", handler="index.handler", runtime="python3.12")
+        await targets.apply_function(ResourceChange("function", "PreAuth", "UPDATE", new=fn))
+        await cognito.start()
+        await cognito.sign_up("alice", "Password1A")
+
+        # Act
+        await cognito.initiate_auth("USER_PASSWORD_AUTH", "alice", "Password1A")
+        await cognito.stop()
+
+        # Assert
+        assert new_compute.invoke.await_count == 1
+        old_compute.invoke.assert_not_awaited()
+
+    async def test_source_edit_recycles_the_warm_worker(self, tmp_path: Path) -> None:
+        # Arrange
+        source = tmp_path / "src" / "handler.py"
+        source.parent.mkdir()
+        source.write_text(_HANDLER.replace("VERSION", "1"))
+        staged = [_stage(tmp_path, 1)]
+
+        async def synth() -> Path:
+            staged.append(_stage(tmp_path, len(staged) + 1))
+            return tmp_path / "cdk.out"
+
+        model = AppModel(functions=[staged[0]])
+        reloader = HotReloader(
+            model,
+            build_graph(model),
+            synth=synth,
+            parse=lambda _cdk_out: AppModel(functions=[staged[-1]]),
+        )
+        targets = _targets(worker_pool=WorkerPoolConfig())
+        targets.register(reloader)
+        compute = ldk._build_compute(staged[0], targets.local_endpoints, {}, targets.worker_pool)
+        targets.compute_providers["Api"] = compute
+        await compute.invoke({}, _context())
+        source.write_text(_HANDLER.replace("VERSION", "2"))
+
+        # Act
+        await reloader.reload()
+        actual = await compute.invoke({}, _context())
+        await compute.stop()
+
+        # Assert
+        assert actual.cold_start is True
@@ -0,0 +1,104 @@
+"""Tests for ``lws sqs send-message --from-file``."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock, patch
+
+from typer.testing import CliRunner
+
+from lws.cli.lws import app
+
+runner = CliRunner()
+
+_QUEUE_URL = "http://localhost:3002/000000000000/MyQueue"
+
+
+def _batch_response(params: dict, failed_ids: frozenset[str] = frozenset()) -> str:
+    ids = [key.split(".")[1] for key in params if key.endswith(".MessageBody")]
+    entries = "".join(
+        f"<SendMessageBatchResultEntry><Id>{i}</Id></SendMessageBatchResultEntry>"
+        for i in ids
+        if i not in failed_ids
+    )
+    errors = "".join(
+        f"<BatchResultErrorEntry><Id>{i}</Id><Code>InternalError</Code>"
+        f"<Message>boom {i}</Message></BatchResultErrorEntry>"
+        for i in ids
+        if i in failed_ids
+    )
+    return (
+        "<SendMessageBatchResponse><SendMessageBatchResult>"
+        f"{entries}{errors}"
+        "</SendMessageBatchResult></SendMessageBatchResponse>"
+    )
+
+
+def _mock_client(form_request) -> AsyncMock:
+    mock = AsyncMock()
+    mock.__aenter__.return_value = mock
+    mock.resolve_resource = AsyncMock(return_value={"queue_url": _QUEUE_URL})
+    mock.form_request = AsyncMock(side_effect=form_request)
+    return mock
+
+
+def _send_from_file(mock: AsyncMock, source) -> object:
+    with patch("lws.cli.services.sqs._client", return_value=mock):
+        return runner.invoke(
+            app, ["sqs", "send-message", "--queue-name", "MyQueue", "--from-file", str(source)]
+        )
+
+
+class TestSendMessageFromFile:
+    def test_lines_are_sent_in_batches_of_10(self, tmp_path) -> None:
+        # Arrange
+        expected_batch_sizes = [10, 10, 3]
+        expected_summary = {"Succeeded": 23, "Failed": 0, "Errors": []}
+        source = tmp_path / "messages.txt"
+        source.write_text("\n".join(f"body-{i}" for i in range(23)) + "\n")
+        mock = _mock_client(lambda _svc, params: _batch_response(params))
+
+        # Act
+        result = _send_from_file(mock, source)
+
+        # Assert
+        assert result.exit_code == 0
+        assert json.loads(result.stdout) == expected_summary
+        calls = mock.form_request.call_args_list
+        assert all(c[0][1]["Action"] == "SendMessageBatch" for c in calls)
+        assert all(c[0][1]["QueueUrl"] == _QUEUE_URL for c in calls)
+        actual_batch_sizes = sorted(
+            (sum(1 for k in c[0][1] if k.endswith(".MessageBody")) for c in calls),
+            reverse=True,
+        )
+        assert actual_batch_sizes == expected_batch_sizes
+
+    def test_failed_entries_are_reported_and_exit_non_zero(self, tmp_path) -> None:
+        # Arrange
+        source = tmp_path / "messages.txt"
+        source.write_text("a\nb\nc\n")
+        mock = _mock_client(lambda _svc, params: _batch_response(params, frozenset({"2"})))
+        expected_summary = {"Succeeded": 2, "Failed": 1, "Errors": ["boom 2"]}
+
+        # Act
+        result = _send_from_file(mock, source)
+
+        # Assert
+        assert result.exit_code == 1
+        assert json.loads(result.stdout) == expected_summary
+
+    def test_failed_request_fails_whole_batch(self, tmp_path) -> None:
+        # Arrange
+        expected_message = "connection refused"
+        source = tmp_path / "messages.txt"
+        source.write_text("a\nb\n")
+        mock = _mock_client(Exception(expected_message))
+        expected_summary = {"Succeeded": 0, "Failed": 2, "Errors": [expected_message]}
+
+        # Act
+        result = _send_from_file(mock, source)
+
+        # Assert
+        assert result.exit_code == 1
+        assert json.loads(result.stdout) == expected_summary
+        assert expected_message in result.stderr
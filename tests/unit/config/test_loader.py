@@ -158,3 +158,124 @@ def test_unknown_variables_in_config_are_ignored(tmp_path: Path) -> None:
     # Assert
     assert config.port == expected_port
     assert not hasattr(config, "custom_setting")
+
+
+def test_yaml_request_logging_keys_are_mapped(tmp_path: Path) -> None:
+    """Dotted ``logging.*`` keys in ldk.yaml configure request logging."""
+    # Arrange
+    expected_body_bytes = 2048
+    expected_sample_rate = 0.25
+    expected_disabled = ["s3", "lambda"]
+    (tmp_path / "ldk.yaml").write_text(
+        f"logging.body_bytes: {expected_body_bytes}\n"
+        f"logging.sample_rate: {expected_sample_rate}\n"
+        'logging.disabled_services: ["s3", "lambda"]\n'
+    )
+
+    # Act
+    config = load_config(tmp_path)
+
+    # Assert
+    assert config.request_log_body_bytes == expected_body_bytes
+    assert config.request_log_sample_rate == expected_sample_rate
+    assert config.request_log_disabled_services == expected_disabled
+
+
+def test_out_of_range_sample_rate_raises_config_error(tmp_path: Path) -> None:
+    """A request_log_sample_rate outside 0.0-1.0 should raise ConfigError."""
+    # Arrange
+    config_file = tmp_path / "lws.config.py"
+    config_file.write_text("request_log_sample_rate = 1.5\n")
+
+    # Act / Assert
+    with pytest.raises(ConfigError, match="Invalid request_log_sample_rate"):
+        load_config(tmp_path)
+
+
+def test_invalid_cognito_hash_executor_raises_config_error(tmp_path: Path) -> None:
+    """cognito_hash_executor must be 'thread' or 'process'."""
+    # Arrange
+    config_file = tmp_path / "lws.config.py"
+    config_file.write_text('cognito_hash_executor = "gpu"\n')
+
+    # Act / Assert
+    with pytest.raises(ConfigError, match="Invalid cognito_hash_executor"):
+        load_config(tmp_path)
+
+
+def test_yaml_delivery_keys_are_mapped(tmp_path: Path) -> None:
+    """Dotted ``delivery.*`` keys in ldk.yaml configure fan-out delivery."""
+    # Arrange
+    expected_concurrency = 16
+    expected_backoff_ms = 250
+    (tmp_path / "ldk.yaml").write_text(
+        f"delivery.max_concurrency: {expected_concurrency}\n"
+        f"delivery.retry_backoff_ms: {expected_backoff_ms}\n"
+    )
+
+    # Act
+    config = load_config(tmp_path)
+
+    # Assert
+    assert config.delivery_max_concurrency == expected_concurrency
+    assert config.delivery_retry_backoff_ms == expected_backoff_ms
+
+
+def test_out_of_range_delivery_batch_size_raises_config_error(tmp_path: Path) -> None:
+    """delivery_batch_size must fit an SQS SendMessageBatch (1-10)."""
+    # Arrange
+    config_file = tmp_path / "lws.config.py"
+    config_file.write_text("delivery_batch_size = 11\n")
+
+    # Act / Assert
+    with pytest.raises(ConfigError, match="Invalid delivery_batch_size"):
+        load_config(tmp_path)
+
+
+def test_yaml_stepfunctions_history_keys_are_mapped(tmp_path: Path) -> None:
+    """Dotted ``stepfunctions.*`` keys in ldk.yaml configure history retention."""
+    # Arrange
+    expected_max_executions = 50
+    expected_max_age_ms = 60_000
+    (tmp_path / "ldk.yaml").write_text(
+        f"stepfunctions.history_max_executions: {expected_max_executions}\n"
+        f"stepfunctions.history_max_age_ms: {expected_max_age_ms}\n"
+    )
+
+    # Act
+    config = load_config(tmp_path)
+
+    # Assert
+    assert config.stepfunctions_history_max_executions == expected_max_executions
+    assert config.stepfunctions_history_max_age_ms == expected_max_age_ms
+
+
+def test_yaml_watch_reload_debounce_is_mapped(tmp_path: Path) -> None:
+    """``watch.reload_debounce_ms`` in ldk.yaml sets the hot reload debounce."""
+    # Arrange
+    expected_debounce_ms = 1500
+    (tmp_path / "ldk.yaml").write_text(f"watch.reload_debounce_ms: {expected_debounce_ms}\n")
+
+    # Act
+    config = load_config(tmp_path)
+
+    # Assert
+    assert config.watch_reload_debounce_ms == expected_debounce_ms
+
+
+def test_yaml_lambda_worker_keys_are_mapped(tmp_path: Path) -> None:
+    """``lambda.*`` keys in ldk.yaml enable warm local Lambda workers."""
+    # Arrange
+    expected_workers = 2
+    expected_idle_ms = 60_000
+    (tmp_path / "ldk.yaml").write_text(
+        f"lambda.warm_workers: {expected_workers}\n"
+        f"lambda.worker_idle_timeout_ms: {expected_idle_ms}\n"
+    )
+
+    # Act
+    config = load_config(tmp_path)
+
+    # Assert
+    assert config.lambda_warm_workers == expected_workers
+    assert config.lambda_worker_idle_timeout_ms == expected_idle_ms
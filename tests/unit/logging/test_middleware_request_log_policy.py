@@ -0,0 +1,115 @@
+"""Unit tests for RequestLoggingMiddleware sampling and per-service switches."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from starlette.types import Message, Receive, Scope, Send
+
+from lws.logging.middleware import (
+    RequestLoggingMiddleware,
+    RequestLogPolicy,
+    configure_request_logging,
+)
+
+
+def _http_scope() -> Scope:
+    return {
+        "type": "http",
+        "method": "POST",
+        "path": "/",
+        "query_string": b"",
+        "headers": [],
+    }
+
+
+async def _receive() -> Message:
+    return {"type": "http.request", "body": b"{}", "more_body": False}
+
+
+async def _send_nothing(_message: Message) -> None:
+    return None
+
+
+def _endpoint(status: int):
+    async def _app(scope: Scope, receive: Receive, send: Send) -> None:
+        await receive()
+        await send({"type": "http.response.start", "status": status, "headers": []})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    return _app
+
+
+@pytest.fixture(autouse=True)
+def restore_policy():
+    yield
+    configure_request_logging(RequestLogPolicy())
+
+
+class TestRequestLogPolicy:
+    async def test_disabled_service_is_not_logged(self) -> None:
+        # Arrange
+        logger = MagicMock()
+        configure_request_logging(RequestLogPolicy(disabled_services=frozenset({"s3"})))
+        app = RequestLoggingMiddleware(_endpoint(200), logger=logger, service_name="s3")
+
+        # Act
+        await app(_http_scope(), _receive, _send_nothing)
+
+        # Assert
+        logger.log_http_request.assert_not_called()
+
+    async def test_unsampled_success_is_not_logged(self) -> None:
+        # Arrange
+        logger = MagicMock()
+        configure_request_logging(RequestLogPolicy(sample_rate=0.0))
+        app = RequestLoggingMiddleware(_endpoint(200), logger=logger, service_name="sqs")
+
+        # Act
+        await app(_http_scope(), _receive, _send_nothing)
+
+        # Assert
+        logger.log_http_request.assert_not_called()
+
+    async def test_unsampled_error_is_logged_without_bodies(self) -> None:
+        # Arrange
+        logger = MagicMock()
+        expected_status = 500
+        configure_request_logging(RequestLogPolicy(sample_rate=0.0))
+        app = RequestLoggingMiddleware(_endpoint(expected_status), logger=logger)
+
+        # Act
+        await app(_http_scope(), _receive, _send_nothing)
+
+        # Assert
+        kwargs = logger.log_http_request.call_args.kwargs
+        assert kwargs["status_code"] == expected_status
+        assert kwargs["request_body"] is None
+        assert kwargs["response_body"] is None
+
+    async def test_zero_body_bytes_skips_capture(self) -> None:
+        # Arrange
+        logger = MagicMock()
+        configure_request_logging(RequestLogPolicy(body_bytes=0))
+        app = RequestLoggingMiddleware(_endpoint(200), logger=logger)
+
+        # Act
+        await app(_http_scope(), _receive, _send_nothing)
+
+        # Assert
+        kwargs = logger.log_http_request.call_args.kwargs
+        assert kwargs["request_body"] is None
+        assert kwargs["response_body"] is None
+
+    async def test_logger_below_info_is_bypassed(self) -> None:
+        # Arrange
+        logger = MagicMock()
+        logger.is_enabled_for.return_value = False
+        app = RequestLoggingMiddleware(_endpoint(200), logger=logger)
+
+        # Act
+        await app(_http_scope(), _receive, _send_nothing)
+
+        # Assert
+        logger.log_http_request.assert_not_called()
@@ -0,0 +1,113 @@
+"""Unit tests for RequestLoggingMiddleware body capture."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+from starlette.responses import StreamingResponse
+from starlette.types import Message, Receive, Scope, Send
+
+from lws.logging.middleware import RequestLoggingMiddleware
+
+
+def _http_scope(method: str = "POST") -> Scope:
+    return {
+        "type": "http",
+        "method": method,
+        "path": "/",
+        "query_string": b"",
+        "headers": [],
+    }
+
+
+def _receive_body(body: bytes) -> Receive:
+    messages: list[Message] = [{"type": "http.request", "body": body, "more_body": False}]
+
+    async def _receive() -> Message:
+        if messages:
+            return messages.pop()
+        await asyncio.Event().wait()
+        return {"type": "http.disconnect"}
+
+    return _receive
+
+
+class TestRequestLoggingMiddlewareTee:
+    async def test_streamed_chunks_are_forwarded_before_the_stream_ends(self) -> None:
+        # Arrange
+        release = asyncio.Event()
+        sent: list[bytes] = []
+        first_chunk_sent = asyncio.Event()
+        expected_first_chunk = b"first"
+
+        async def body():
+            yield expected_first_chunk
+            await release.wait()
+            yield b"second"
+
+        async def send(message: Message) -> None:
+            if message["type"] == "http.response.body" and message.get("body"):
+                sent.append(message["body"])
+                first_chunk_sent.set()
+
+        app = RequestLoggingMiddleware(StreamingResponse(body()), logger=MagicMock())
+
+        # Act
+        task = asyncio.create_task(app(_http_scope("GET"), _receive_body(b""), send))
+        await asyncio.wait_for(first_chunk_sent.wait(), timeout=1)
+        actual_before_release = list(sent)
+        release.set()
+        await task
+
+        # Assert
+        assert actual_before_release == [expected_first_chunk]
+
+    async def test_logs_status_and_bodies(self) -> None:
+        # Arrange
+        expected_request = "Action=ListQueues"
+        expected_response = "ok"
+        expected_status = 201
+        logger = MagicMock()
+
+        async def endpoint(scope: Scope, receive: Receive, send: Send) -> None:
+            await receive()
+            await send({"type": "http.response.start", "status": expected_status, "headers": []})
+            await send({"type": "http.response.body", "body": expected_response.encode()})
+
+        app = RequestLoggingMiddleware(endpoint, logger=logger, service_name="sqs")
+
+        # Act
+        await app(_http_scope(), _receive_body(expected_request.encode()), _send_nothing)
+
+        # Assert
+        kwargs = logger.log_http_request.call_args.kwargs
+        assert kwargs["status_code"] == expected_status
+        assert kwargs["request_body"] == expected_request
+        assert kwargs["response_body"] == expected_response
+
+    async def test_large_response_body_is_truncated(self) -> None:
+        # Arrange
+        logger = MagicMock()
+        chunk = b"x" * 4096
+        expected_prefix = "x" * 10240
+
+        async def endpoint(scope: Scope, receive: Receive, send: Send) -> None:
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            for _ in range(4):
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            await send({"type": "http.response.body", "body": b""})
+
+        app = RequestLoggingMiddleware(endpoint, logger=logger)
+
+        # Act
+        await app(_http_scope("GET"), _receive_body(b""), _send_nothing)
+
+        # Assert
+        actual_body = logger.log_http_request.call_args.kwargs["response_body"]
+        assert actual_body.startswith(expected_prefix)
+        assert not actual_body.startswith(expected_prefix + "x")
+
+
+async def _send_nothing(_message: Message) -> None:
+    return None
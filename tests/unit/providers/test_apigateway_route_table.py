@@ -0,0 +1,118 @@
+"""Tests for the compiled API Gateway V2 route table."""
+
+from __future__ import annotations
+
+import pytest
+
+from lws.providers.apigateway.route_table import RouteTable
+
+
+def _table(*route_keys: str) -> RouteTable:
+    table = RouteTable()
+    for index, route_key in enumerate(route_keys):
+        table.add(f"r{index}", route_key)
+    return table
+
+
+def _ids(table: RouteTable, method: str | None, path: str) -> list[str]:
+    return [m.route_id for m in table.match(method, path)]
+
+
+class TestApiGatewayRouteTable:
+    @pytest.mark.parametrize(
+        ("route_keys", "path", "expected_ids"),
+        [
+            (
+                ("GET /orders/{proxy+}", "GET /orders/{id}", "GET /orders/latest"),
+                "/orders/latest",
+                ["r2", "r1", "r0"],
+            ),
+            (("GET /orders/{proxy+}", "GET /orders/{id}"), "/orders/a/b", ["r0"]),
+            (("ANY /orders", "GET /orders"), "/orders", ["r1", "r0"]),
+            (("POST /orders",), "/orders", []),
+            (("GET /",), "/", ["r0"]),
+            (("GET /{proxy+}",), "/", []),
+            (("GET /orders/{id}",), "/orders/", []),
+        ],
+    )
+    def test_candidates_follow_precedence(
+        self, route_keys: tuple[str, ...], path: str, expected_ids: list[str]
+    ) -> None:
+        # Arrange
+        table = _table(*route_keys)
+
+        # Act
+        actual = _ids(table, "GET", path)
+
+        # Assert
+        assert actual == expected_ids
+
+    def test_path_parameters_are_extracted(self) -> None:
+        # Arrange
+        table = _table("GET /users/{userId}/files/{path+}")
+        expected = {"userId": "u1", "path": "docs/a.txt"}
+
+        # Act
+        (actual,) = table.match("GET", "/users/u1/files/docs/a.txt")
+
+        # Assert
+        assert actual.path_parameters == expected
+
+    def test_literal_route_has_no_path_parameters(self) -> None:
+        # Arrange
+        table = _table("GET /health")
+
+        # Act
+        (actual,) = table.match("GET", "/health")
+
+        # Assert
+        assert actual.path_parameters is None
+
+    def test_removed_route_no_longer_matches_cached_path(self) -> None:
+        # Arrange
+        table = _table("GET /orders/{id}", "GET /orders/{proxy+}")
+        table.match("GET", "/orders/1")
+        expected_ids = ["r1"]
+
+        # Act
+        table.remove("r0")
+        actual = _ids(table, "GET", "/orders/1")
+
+        # Assert
+        assert actual == expected_ids
+
+    def test_any_method_lookup_returns_routes_for_every_method(self) -> None:
+        # Arrange
+        table = _table("GET /orders", "POST /orders", "GET /users")
+        expected_ids = ["r0", "r1"]
+
+        # Act
+        actual = _ids(table, None, "/orders")
+
+        # Assert
+        assert actual == expected_ids
+
+    def test_default_routes_are_tracked_separately(self) -> None:
+        # Arrange
+        table = _table("$default", "GET /orders")
+        expected_defaults = ["r0"]
+
+        # Act
+        actual_matches = _ids(table, "GET", "/anything")
+
+        # Assert
+        assert actual_matches == []
+        assert table.default_route_ids == expected_defaults
+
+    def test_cached_path_parameters_are_not_shared(self) -> None:
+        # Arrange
+        table = _table("GET /orders/{id}")
+        expected_parameters = {"id": "42"}
+        first = table.match("GET", "/orders/42")[0]
+
+        # Act
+        first.path_parameters["id"] = "tampered"
+        actual = table.match("GET", "/orders/42")[0]
+
+        # Assert
+        assert actual.path_parameters == expected_parameters
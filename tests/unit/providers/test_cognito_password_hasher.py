@@ -0,0 +1,136 @@
+"""Tests for off-loop Cognito password hashing and the verified-credential cache."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from lws.providers.cognito import password_hasher
+from lws.providers.cognito.password_hasher import (
+    PasswordHashConfig,
+    PasswordHasher,
+    hash_password,
+    verify_password,
+)
+
+_USER = "alice"
+_PASSWORD = "Password1!"
+
+
+@pytest.fixture
+def hasher():
+    h = PasswordHasher(PasswordHashConfig(iterations=1000))
+    yield h
+    h.close()
+
+
+class TestCognitoPasswordHasher:
+    async def test_hashing_runs_on_worker_thread(
+        self, hasher: PasswordHasher, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Arrange
+        thread_names: list[str] = []
+        expected_prefix = "cognito-hash"
+
+        def recording_hash(*args):
+            thread_names.append(threading.current_thread().name)
+            return hash_password(*args)
+
+        monkeypatch.setattr(password_hasher, "hash_password", recording_hash)
+
+        # Act
+        await hasher.hash(_PASSWORD)
+
+        # Assert
+        assert thread_names[0].startswith(expected_prefix)
+
+    async def test_custom_iterations_are_stored_with_hash(self, hasher: PasswordHasher) -> None:
+        # Arrange
+        expected_prefix = "1000$"
+
+        # Act
+        stored_hash, salt = await hasher.hash(_PASSWORD)
+
+        # Assert
+        assert stored_hash.startswith(expected_prefix)
+        assert verify_password(_PASSWORD, stored_hash, salt)
+
+    def test_default_iterations_keep_plain_hex_hash(self) -> None:
+        # Arrange
+        stored_hash, salt = hash_password(_PASSWORD)
+
+        # Act
+        actual = verify_password(_PASSWORD, stored_hash, salt)
+
+        # Assert
+        assert "$" not in stored_hash
+        assert actual is True
+
+    async def test_repeated_verify_is_served_from_cache(
+        self, hasher: PasswordHasher, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Arrange
+        stored_hash, salt = await hasher.hash(_PASSWORD)
+        calls: list[str] = []
+
+        def counting_verify(*args):
+            calls.append(args[0])
+            return verify_password(*args)
+
+        monkeypatch.setattr(password_hasher, "verify_password", counting_verify)
+        expected_calls = 1
+
+        # Act
+        first = await hasher.verify(_USER, _PASSWORD, stored_hash, salt)
+        second = await hasher.verify(_USER, _PASSWORD, stored_hash, salt)
+
+        # Assert
+        assert first is True
+        assert second is True
+        assert len(calls) == expected_calls
+
+    async def test_wrong_password_is_rejected_and_not_cached(self, hasher: PasswordHasher) -> None:
+        # Arrange
+        stored_hash, salt = await hasher.hash(_PASSWORD)
+
+        # Act
+        first = await hasher.verify(_USER, "Wrong1234!", stored_hash, salt)
+        second = await hasher.verify(_USER, "Wrong1234!", stored_hash, salt)
+
+        # Assert
+        assert first is False
+        assert second is False
+
+    async def test_new_stored_hash_bypasses_cache(self, hasher: PasswordHasher) -> None:
+        # Arrange
+        old_hash, old_salt = await hasher.hash(_PASSWORD)
+        await hasher.verify(_USER, _PASSWORD, old_hash, old_salt)
+        new_hash, new_salt = await hasher.hash("Changed123!")
+
+        # Act
+        actual = await hasher.verify(_USER, _PASSWORD, new_hash, new_salt)
+
+        # Assert
+        assert actual is False
+
+    async def test_zero_ttl_disables_cache(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # Arrange
+        hasher = PasswordHasher(PasswordHashConfig(iterations=1000, verify_cache_ttl_s=0))
+        stored_hash, salt = await hasher.hash(_PASSWORD)
+        calls: list[str] = []
+
+        def counting_verify(*args):
+            calls.append(args[0])
+            return verify_password(*args)
+
+        monkeypatch.setattr(password_hasher, "verify_password", counting_verify)
+        expected_calls = 2
+
+        # Act
+        await hasher.verify(_USER, _PASSWORD, stored_hash, salt)
+        await hasher.verify(_USER, _PASSWORD, stored_hash, salt)
+        hasher.close()
+
+        # Assert
+        assert len(calls) == expected_calls
@@ -0,0 +1,82 @@
+"""Tests for the DynamoDB expression parse cache and compiled predicates."""
+
+from __future__ import annotations
+
+from lws.providers.dynamodb.expressions import (
+    compile_filter_predicate,
+    parse_filter_expression,
+)
+from lws.providers.dynamodb.provider import _parse_key_condition
+from lws.providers.dynamodb.update_expression import parse_update_expression
+
+
+class TestCompiledExpressionCache:
+    def test_filter_expression_parsed_once_per_text(self) -> None:
+        # Arrange
+        expression = "#s = :s AND size(tags) > :n"
+
+        # Act
+        first = parse_filter_expression(expression)
+        second = parse_filter_expression(expression)
+
+        # Assert
+        assert first is second
+
+    def test_update_expression_parsed_once_per_text(self) -> None:
+        # Arrange
+        expression = "SET #n = :n REMOVE stale ADD visits :one"
+
+        # Act
+        first = parse_update_expression(expression)
+        second = parse_update_expression(expression)
+
+        # Assert
+        assert first is second
+
+    def test_cached_key_condition_binds_current_values(self) -> None:
+        # Arrange
+        key_condition = "pk = :pk AND sk BETWEEN :lo AND :hi"
+        expected_where = "pk = ? AND sk BETWEEN ? AND ?"
+        expected_params = ["user#2", "b", "y"]
+        _parse_key_condition(
+            key_condition, {":pk": {"S": "user#1"}, ":lo": {"S": "a"}, ":hi": {"S": "z"}}, None
+        )
+
+        # Act
+        actual_where, actual_params = _parse_key_condition(
+            key_condition, {":pk": {"S": "user#2"}, ":lo": {"S": "b"}, ":hi": {"S": "y"}}, None
+        )
+
+        # Assert
+        assert actual_where == expected_where
+        assert actual_params == expected_params
+
+    def test_compiled_predicate_shares_ast_across_value_bindings(self) -> None:
+        # Arrange
+        expression = "#c = :city"
+        names = {"#c": "city"}
+        item = {"city": "Oslo"}
+
+        # Act
+        matches_oslo = compile_filter_predicate(expression, names, {":city": {"S": "Oslo"}})
+        matches_rome = compile_filter_predicate(expression, names, {":city": {"S": "Rome"}})
+
+        # Assert
+        assert matches_oslo(item) is True
+        assert matches_rome(item) is False
+
+    def test_compiled_predicate_evaluates_many_items(self) -> None:
+        # Arrange
+        predicate = compile_filter_predicate(
+            "attribute_exists(tags) AND contains(tags, :t) AND qty BETWEEN :lo AND :hi",
+            None,
+            {":t": {"S": "red"}, ":lo": {"N": "2"}, ":hi": {"N": "4"}},
+        )
+        items = [{"qty": qty, "tags": ["red"] if qty % 2 else ["blue"]} for qty in range(6)]
+        expected_qtys = [3]
+
+        # Act
+        actual_qtys = [item["qty"] for item in items if predicate(item)]
+
+        # Assert
+        assert actual_qtys == expected_qtys
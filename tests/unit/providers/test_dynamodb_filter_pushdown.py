@@ -0,0 +1,114 @@
+"""Tests for translating DynamoDB FilterExpressions into SQLite predicates."""
+
+from __future__ import annotations
+
+import sqlite3
+
+from lws.providers.dynamodb.expressions import parse_filter_expression
+from lws.providers.dynamodb.filter_pushdown import compile_filter_sql
+
+
+def _matching_ids(expression: str, values: dict, rows: dict[str, str], names=None) -> list[str]:
+    sql_filter = compile_filter_sql(parse_filter_expression(expression), names, values)
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE items (id TEXT, item_json TEXT)")
+    conn.executemany("INSERT INTO items VALUES (?, ?)", list(rows.items()))
+    cursor = conn.execute(
+        f"SELECT id FROM items WHERE {sql_filter.sql} ORDER BY id", sql_filter.params
+    )
+    return [row[0] for row in cursor]
+
+
+class TestFilterPushdown:
+    def test_string_equality_matches_plain_and_typed_items(self) -> None:
+        # Arrange
+        rows = {
+            "a": '{"status": "open"}',
+            "b": '{"status": {"S": "open"}}',
+            "c": '{"status": {"S": "closed"}}',
+            "d": '{"other": "open"}',
+        }
+        expected_ids = ["a", "b"]
+
+        # Act
+        actual_ids = _matching_ids("#s = :s", {":s": {"S": "open"}}, rows, {"#s": "status"})
+
+        # Assert
+        assert actual_ids == expected_ids
+
+    def test_number_comparison_reads_typed_numbers_numerically(self) -> None:
+        # Arrange
+        rows = {"a": '{"qty": {"N": "9"}}', "b": '{"qty": {"N": "10"}}', "c": '{"qty": 11}'}
+        expected_ids = ["b", "c"]
+
+        # Act
+        actual_ids = _matching_ids("qty >= :n", {":n": {"N": "10"}}, rows)
+
+        # Assert
+        assert actual_ids == expected_ids
+
+    def test_begins_with_is_case_sensitive(self) -> None:
+        # Arrange
+        rows = {"a": '{"sku": "ABC-1"}', "b": '{"sku": "abc-2"}', "c": '{"sku": {"S": "ABD"}}'}
+        expected_ids = ["a"]
+
+        # Act
+        actual_ids = _matching_ids("begins_with(sku, :p)", {":p": {"S": "ABC"}}, rows)
+
+        # Assert
+        assert actual_ids == expected_ids
+
+    def test_between_in_and_attribute_functions_combine(self) -> None:
+        # Arrange
+        rows = {
+            "a": '{"qty": 2, "color": "red"}',
+            "b": '{"qty": 5, "color": "blue", "gone": true}',
+            "c": '{"qty": 3, "color": "green"}',
+            "d": '{"qty": 4, "color": "blue"}',
+        }
+        values = {":lo": {"N": "2"}, ":hi": {"N": "4"}, ":r": {"S": "red"}, ":b": {"S": "blue"}}
+        expected_ids = ["a", "d"]
+
+        # Act
+        actual_ids = _matching_ids(
+            "qty BETWEEN :lo AND :hi AND color IN (:r, :b) AND attribute_not_exists(gone)",
+            values,
+            rows,
+        )
+
+        # Assert
+        assert actual_ids == expected_ids
+
+    def test_other_typed_attribute_is_left_to_python(self) -> None:
+        # Arrange
+        rows = {"a": '{"qty": "12"}', "b": '{"qty": 5}', "c": '{"qty": 12}', "d": "{}"}
+        expected_ids = ["a", "c"]
+
+        # Act
+        actual_ids = _matching_ids("qty > :n", {":n": {"N": "10"}}, rows)
+        actual = compile_filter_sql(parse_filter_expression("qty > :n"), None, {":n": 10})
+
+        # Assert
+        assert actual_ids == expected_ids
+        assert actual.exact is False
+
+    def test_untranslatable_conjunct_leaves_partial_filter(self) -> None:
+        # Arrange
+        ast = parse_filter_expression("status = :s AND NOT contains(tags, :t)")
+
+        # Act
+        actual = compile_filter_sql(ast, None, {":s": {"S": "open"}, ":t": {"S": "x"}})
+
+        # Assert
+        assert actual is not None
+        assert actual.exact is False
+
+    def test_nested_path_is_not_pushed_down(self) -> None:
+        # Arrange
+        ast = parse_filter_expression("profile.city = :c")
+
+        # Act
+        actual = compile_filter_sql(ast, None, {":c": {"S": "Oslo"}})
+
+        # Assert
+        assert actual is None
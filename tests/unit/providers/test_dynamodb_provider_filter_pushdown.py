@@ -0,0 +1,158 @@
+"""Tests for SqliteDynamoProvider FilterExpression pushdown into SQLite."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from lws.interfaces import KeyAttribute, KeySchema, TableConfig
+from lws.providers.dynamodb.provider import SqliteDynamoProvider
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+def _table_config() -> TableConfig:
+    return TableConfig(
+        table_name="tickets",
+        key_schema=KeySchema(partition_key=KeyAttribute(name="ticketId", type="S")),
+    )
+
+
+@pytest.fixture
+async def provider(tmp_path: Path):
+    p = SqliteDynamoProvider(
+        data_dir=tmp_path,
+        tables=[_table_config()],
+        consistency_delay_ms=0,
+    )
+    await p.start()
+    statuses = ["open", "closed", "open", "closed", "closed", "open"]
+    await p.batch_write_items(
+        "tickets",
+        put_items=[
+            {
+                "ticketId": {"S": f"t{idx}"},
+                "status": {"S": status},
+                "priority": {"N": str(idx)},
+                "tags": {"SS": ["urgent"] if idx % 2 else ["later"]},
+            }
+            for idx, status in enumerate(statuses)
+        ],
+    )
+    yield p
+    await p.stop()
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestFilterPushdown:
+    async def test_scan_filters_dynamo_json_items(self, provider):
+        # Arrange
+        expected_ids = ["t0", "t2", "t5"]
+
+        # Act
+        page = await provider.scan_page(
+            "tickets",
+            filter_expression="#s = :s",
+            expression_names={"#s": "status"},
+            expression_values={":s": {"S": "open"}},
+        )
+
+        # Assert
+        actual_ids = sorted(item["ticketId"]["S"] for item in page.items)
+        assert actual_ids == expected_ids
+
+    async def test_scanned_count_includes_rows_pruned_in_sql(self, provider):
+        # Arrange
+        expected_scanned = 6
+        expected_count = 3
+
+        # Act
+        page = await provider.scan_page(
+            "tickets",
+            filter_expression="#s = :s",
+            expression_names={"#s": "status"},
+            expression_values={":s": {"S": "closed"}},
+        )
+
+        # Assert
+        assert page.scanned_count == expected_scanned
+        assert page.count == expected_count
+
+    async def test_limit_still_applies_before_pushed_down_filter(self, provider):
+        # Arrange
+        expected_scanned = 2
+        expected_key = {"ticketId": {"S": "t1"}}
+
+        # Act
+        page = await provider.scan_page(
+            "tickets",
+            filter_expression="priority > :p",
+            expression_values={":p": {"N": "3"}},
+            limit=2,
+        )
+
+        # Assert
+        assert page.scanned_count == expected_scanned
+        assert page.items == []
+        actual_key = page.last_evaluated_key
+        assert actual_key == expected_key
+
+    async def test_partial_pushdown_evaluates_rest_in_python(self, provider):
+        # Arrange
+        expected_ids = ["t5"]
+
+        # Act
+        page = await provider.scan_page(
+            "tickets",
+            filter_expression="#s = :s AND contains(tags, :t) AND NOT priority < :p",
+            expression_names={"#s": "status"},
+            expression_values={":s": {"S": "open"}, ":t": {"S": "urgent"}, ":p": {"N": "3"}},
+        )
+
+        # Assert
+        actual_ids = [item["ticketId"]["S"] for item in page.items]
+        assert actual_ids == expected_ids
+
+    async def test_scanned_count_comes_from_the_page_query(self, provider):
+        # Arrange
+        statements: list[str] = []
+        async with provider._read_pools[
+            "tickets"
+        ].acquire() as conn:  # pylint: disable=protected-access
+            await conn.set_trace_callback(statements.append)
+        expected_statements = 1
+
+        # Act
+        await provider.scan_page(
+            "tickets",
+            filter_expression="#s = :s",
+            expression_names={"#s": "status"},
+            expression_values={":s": {"S": "closed"}},
+        )
+
+        # Assert
+        actual_statements = len(statements)
+        assert actual_statements == expected_statements
+
+    async def test_numeric_string_matches_number_placeholder_like_fallback(self, provider):
+        # Arrange
+        await provider.put_item("tickets", {"ticketId": {"S": "t9"}, "priority": {"S": "7"}})
+        expected_ids = ["t4", "t5", "t9"]
+
+        # Act
+        page = await provider.scan_page(
+            "tickets",
+            filter_expression="priority > :p",
+            expression_values={":p": {"N": "3"}},
+        )
+
+        # Assert
+        actual_ids = sorted(item["ticketId"]["S"] for item in page.items)
+        assert actual_ids == expected_ids
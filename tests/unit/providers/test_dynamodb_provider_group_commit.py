@@ -0,0 +1,211 @@
+"""Tests for SqliteDynamoProvider single-transaction batches and group commit."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from lws.interfaces import (
+    GsiDefinition,
+    KeyAttribute,
+    KeySchema,
+    TableConfig,
+)
+from lws.providers.dynamodb.provider import SqliteDynamoProvider
+from lws.providers.dynamodb.streams import EventName
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+def _table_config() -> TableConfig:
+    return TableConfig(
+        table_name="orders",
+        key_schema=KeySchema(
+            partition_key=KeyAttribute(name="orderId", type="S"),
+            sort_key=KeyAttribute(name="itemId", type="S"),
+        ),
+        gsi_definitions=[
+            GsiDefinition(
+                index_name="byStatus",
+                key_schema=KeySchema(
+                    partition_key=KeyAttribute(name="status", type="S"),
+                    sort_key=KeyAttribute(name="createdAt", type="S"),
+                ),
+            ),
+        ],
+    )
+
+
+def _order(item_id: str, status: str = "active") -> dict:
+    return {"orderId": "o1", "itemId": item_id, "status": status, "createdAt": item_id}
+
+
+async def _start(tmp_path: Path, window_ms: int, dispatcher=None):
+    p = SqliteDynamoProvider(
+        data_dir=tmp_path,
+        tables=[_table_config()],
+        consistency_delay_ms=0,
+        stream_dispatcher=dispatcher,
+        group_commit_window_ms=window_ms,
+    )
+    await p.start()
+    conn = p._connections["orders"]  # pylint: disable=protected-access
+    conn.commit = AsyncMock(wraps=conn.commit)
+    return p, conn.commit
+
+
+@pytest.fixture
+def dispatcher() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+async def provider(tmp_path: Path, dispatcher: AsyncMock):
+    p, commit = await _start(tmp_path, window_ms=0, dispatcher=dispatcher)
+    yield p, commit
+    await p.stop()
+
+
+@pytest.fixture
+async def grouped_provider(tmp_path: Path):
+    p, commit = await _start(tmp_path, window_ms=50)
+    yield p, commit
+    await p.stop()
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestGroupCommit:
+    async def test_batch_write_commits_once(self, provider):
+        # Arrange
+        p, commit = provider
+        expected_count = 25
+        items = [_order(f"i{idx:02d}") for idx in range(expected_count)]
+
+        # Act
+        await p.batch_write_items("orders", put_items=items)
+
+        # Assert
+        commit.assert_awaited_once()
+        actual_count = len(await p.scan("orders"))
+        assert actual_count == expected_count
+
+    async def test_batch_write_emits_stream_event_per_item(self, provider, dispatcher):
+        # Arrange
+        p, _ = provider
+        await p.put_item("orders", _order("i0"))
+        dispatcher.emit.reset_mock()
+        expected_events = [EventName.MODIFY, EventName.INSERT, EventName.REMOVE]
+
+        # Act
+        await p.batch_write_items(
+            "orders",
+            put_items=[_order("i0", status="done"), _order("i1")],
+            delete_keys=[{"orderId": "o1", "itemId": "i0"}],
+        )
+
+        # Assert
+        actual_events = [c.kwargs["event_name"] for c in dispatcher.emit.await_args_list]
+        assert actual_events == expected_events
+
+    async def test_batch_delete_removes_gsi_entries(self, provider):
+        # Arrange
+        p, _ = provider
+        await p.batch_write_items("orders", put_items=[_order("i0"), _order("i1")])
+        expected_ids = ["i1"]
+
+        # Act
+        await p.batch_write_items("orders", delete_keys=[{"orderId": "o1", "itemId": "i0"}])
+
+        # Assert
+        actual = await p.query(
+            "orders",
+            "#s = :s",
+            expression_names={"#s": "status"},
+            expression_values={":s": "active"},
+            index_name="byStatus",
+        )
+        actual_ids = [item["itemId"] for item in actual]
+        assert actual_ids == expected_ids
+
+    async def test_concurrent_puts_share_one_commit(self, grouped_provider):
+        # Arrange
+        p, commit = grouped_provider
+        expected_count = 10
+
+        # Act
+        await asyncio.gather(*(p.put_item("orders", _order(f"i{idx}")) for idx in range(10)))
+
+        # Assert
+        commit.assert_awaited_once()
+        actual_count = len(await p.scan("orders"))
+        assert actual_count == expected_count
+
+    async def test_stop_flushes_pending_commit(self, tmp_path: Path):
+        # Arrange
+        p, _ = await _start(tmp_path, window_ms=60_000)
+        put = asyncio.create_task(p.put_item("orders", _order("i0")))
+        await asyncio.sleep(0.05)
+
+        # Act
+        await p.stop()
+
+        # Assert
+        await put
+        p, _ = await _start(tmp_path, window_ms=0)
+        actual = await p.get_item("orders", {"orderId": "o1", "itemId": "i0"})
+        await p.stop()
+        assert actual is not None
+
+    async def test_transact_write_items_commits_once_per_table(self, provider):
+        # Arrange
+        p, commit = provider
+        expected_status = "shipped"
+        transact_items = [
+            {"Put": {"TableName": "orders", "Item": _order("i0")}},
+            {
+                "Update": {
+                    "TableName": "orders",
+                    "Key": {"orderId": "o1", "itemId": "i0"},
+                    "UpdateExpression": "SET #s = :s",
+                    "ExpressionAttributeNames": {"#s": "status"},
+                    "ExpressionAttributeValues": {":s": expected_status},
+                }
+            },
+            {"ConditionCheck": {"TableName": "orders", "Key": {"orderId": "o1"}}},
+        ]
+
+        # Act
+        await p.transact_write_items(transact_items)
+
+        # Assert
+        commit.assert_awaited_once()
+        actual = await p.get_item("orders", {"orderId": "o1", "itemId": "i0"})
+        actual_status = actual["status"]
+        assert actual_status == expected_status
+
+    async def test_get_item_does_not_see_uncommitted_writes(self, tmp_path: Path):
+        # Arrange
+        p, _ = await _start(tmp_path, window_ms=60_000)
+        key = {"orderId": "o1", "itemId": "i0"}
+        put = asyncio.create_task(p.put_item("orders", _order("i0")))
+        await asyncio.sleep(0.05)
+
+        # Act
+        actual_before_commit = await p.get_item("orders", key)
+        await p._committers["orders"].flush()  # pylint: disable=protected-access
+        await put
+        actual_after_commit = await p.get_item("orders", key)
+        await p.stop()
+
+        # Assert
+        assert actual_before_commit is None
+        assert actual_after_commit is not None
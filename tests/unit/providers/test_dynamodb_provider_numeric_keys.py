@@ -0,0 +1,147 @@
+"""Tests for SqliteDynamoProvider ordering and range conditions on number keys."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from lws.interfaces import KeyAttribute, KeySchema, TableConfig
+from lws.providers.dynamodb.provider import SqliteDynamoProvider
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+_SEQUENCES = [9, 10, 2, 100, -5, 1.5]
+
+
+def _table_config() -> TableConfig:
+    return TableConfig(
+        table_name="events",
+        key_schema=KeySchema(
+            partition_key=KeyAttribute(name="streamId", type="S"),
+            sort_key=KeyAttribute(name="seq", type="N"),
+        ),
+    )
+
+
+def _event(seq: int | float) -> dict:
+    return {"streamId": {"S": "s1"}, "seq": {"N": str(seq)}}
+
+
+def _seqs(items: list[dict]) -> list[str]:
+    return [item["seq"]["N"] for item in items]
+
+
+@pytest.fixture
+async def provider(tmp_path: Path):
+    p = SqliteDynamoProvider(data_dir=tmp_path, tables=[_table_config()], consistency_delay_ms=0)
+    await p.start()
+    for seq in _SEQUENCES:
+        await p.put_item("events", _event(seq))
+    yield p
+    await p.stop()
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestNumericKeys:
+    async def test_query_orders_number_sort_keys_numerically(self, provider):
+        # Arrange
+        expected_seqs = ["-5", "1.5", "2", "9", "10", "100"]
+
+        # Act
+        page = await provider.query_page(
+            "events", "streamId = :s", expression_values={":s": {"S": "s1"}}
+        )
+
+        # Assert
+        actual_seqs = _seqs(page.items)
+        assert actual_seqs == expected_seqs
+
+    async def test_query_backward_orders_number_sort_keys_numerically(self, provider):
+        # Arrange
+        expected_seqs = ["100", "10", "9", "2", "1.5", "-5"]
+
+        # Act
+        page = await provider.query_page(
+            "events",
+            "streamId = :s",
+            expression_values={":s": {"S": "s1"}},
+            scan_index_forward=False,
+        )
+
+        # Assert
+        actual_seqs = _seqs(page.items)
+        assert actual_seqs == expected_seqs
+
+    async def test_range_condition_compares_numbers(self, provider):
+        # Arrange
+        expected_seqs = ["9", "10"]
+
+        # Act
+        page = await provider.query_page(
+            "events",
+            "streamId = :s AND seq BETWEEN :lo AND :hi",
+            expression_values={":s": {"S": "s1"}, ":lo": {"N": "3"}, ":hi": {"N": "50"}},
+        )
+
+        # Assert
+        actual_seqs = _seqs(page.items)
+        assert actual_seqs == expected_seqs
+
+    async def test_pagination_resumes_after_number_key(self, provider):
+        # Arrange
+        expected_seqs = ["10", "100"]
+
+        # Act
+        page = await provider.query_page(
+            "events",
+            "streamId = :s",
+            expression_values={":s": {"S": "s1"}},
+            exclusive_start_key=_event(9),
+        )
+
+        # Assert
+        actual_seqs = _seqs(page.items)
+        assert actual_seqs == expected_seqs
+
+    async def test_get_item_matches_equal_number_spellings(self, provider):
+        # Arrange
+        expected_seq = "10"
+
+        # Act
+        actual = await provider.get_item("events", {"streamId": {"S": "s1"}, "seq": {"N": "10.0"}})
+
+        # Assert
+        actual_seq = actual["seq"]["N"]
+        assert actual_seq == expected_seq
+
+    async def test_start_retypes_tables_created_with_text_keys(self, tmp_path: Path):
+        # Arrange
+        db_dir = tmp_path / "dynamodb"
+        db_dir.mkdir()
+        with sqlite3.connect(db_dir / "events.db") as conn:
+            conn.execute(
+                "CREATE TABLE items (pk TEXT, sk TEXT, item_json TEXT, PRIMARY KEY (pk, sk))"
+            )
+            conn.executemany(
+                "INSERT INTO items VALUES ('s1', ?, ?)",
+                [(str(seq), f'{{"streamId": "s1", "seq": {seq}}}') for seq in (9, 10, 2)],
+            )
+        expected_seqs = [2, 9, 10]
+        p = SqliteDynamoProvider(data_dir=tmp_path, tables=[_table_config()])
+
+        # Act
+        await p.start()
+        page = await p.query_page("events", "streamId = :s", expression_values={":s": "s1"})
+        await p.stop()
+
+        # Assert
+        actual_seqs = [item["seq"] for item in page.items]
+        assert actual_seqs == expected_seqs
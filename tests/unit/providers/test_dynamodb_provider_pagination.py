@@ -0,0 +1,195 @@
+"""Tests for SqliteDynamoProvider keyset pagination (query_page / scan_page)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from lws.interfaces import (
+    GsiDefinition,
+    KeyAttribute,
+    KeySchema,
+    TableConfig,
+)
+from lws.providers.dynamodb.provider import SqliteDynamoProvider
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+def _table_config() -> TableConfig:
+    return TableConfig(
+        table_name="orders",
+        key_schema=KeySchema(
+            partition_key=KeyAttribute(name="orderId", type="S"),
+            sort_key=KeyAttribute(name="itemId", type="S"),
+        ),
+        gsi_definitions=[
+            GsiDefinition(
+                index_name="byStatus",
+                key_schema=KeySchema(
+                    partition_key=KeyAttribute(name="status", type="S"),
+                    sort_key=KeyAttribute(name="createdAt", type="S"),
+                ),
+            ),
+        ],
+    )
+
+
+@pytest.fixture
+async def provider(tmp_path: Path):
+    p = SqliteDynamoProvider(data_dir=tmp_path, tables=[_table_config()], consistency_delay_ms=0)
+    await p.start()
+    for order in ("o1", "o2"):
+        for idx in range(3):
+            await p.put_item(
+                "orders",
+                {
+                    "orderId": order,
+                    "itemId": f"i{idx}",
+                    "status": "active" if idx % 2 == 0 else "done",
+                    "createdAt": f"{order}-{idx}",
+                },
+            )
+    yield p
+    await p.stop()
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestPagination:
+    async def test_scan_limit_returns_last_evaluated_key(self, provider):
+        # Arrange
+        expected_key = {"orderId": "o1", "itemId": "i1"}
+
+        # Act
+        page = await provider.scan_page("orders", limit=2)
+
+        # Assert
+        assert page.count == 2
+        actual_key = page.last_evaluated_key
+        assert actual_key == expected_key
+
+    async def test_scan_exclusive_start_key_resumes_after_key(self, provider):
+        # Arrange
+        start_key = {"orderId": "o1", "itemId": "i2"}
+        expected_ids = [("o2", "i0"), ("o2", "i1"), ("o2", "i2")]
+
+        # Act
+        page = await provider.scan_page("orders", exclusive_start_key=start_key)
+
+        # Assert
+        actual_ids = [(item["orderId"], item["itemId"]) for item in page.items]
+        assert actual_ids == expected_ids
+        assert page.last_evaluated_key is None
+
+    async def test_scan_pages_cover_every_item_once(self, provider):
+        # Arrange
+        expected_total = 6
+        seen: list[tuple[str, str]] = []
+        start_key = None
+
+        # Act
+        while True:
+            page = await provider.scan_page("orders", limit=4, exclusive_start_key=start_key)
+            seen.extend((item["orderId"], item["itemId"]) for item in page.items)
+            start_key = page.last_evaluated_key
+            if start_key is None:
+                break
+
+        # Assert
+        assert len(seen) == expected_total
+        assert len(set(seen)) == expected_total
+
+    async def test_scan_limit_applies_before_filter(self, provider):
+        # Arrange
+        expected_status = "done"
+
+        # Act
+        page = await provider.scan_page(
+            "orders",
+            filter_expression="#s = :s",
+            expression_names={"#s": "status"},
+            expression_values={":s": {"S": expected_status}},
+            limit=3,
+        )
+
+        # Assert
+        assert page.scanned_count == 3
+        assert page.count == 1
+        actual_status = page.items[0]["status"]
+        assert actual_status == expected_status
+
+    async def test_scan_count_only_omits_items(self, provider):
+        # Arrange
+        expected_count = 6
+
+        # Act
+        page = await provider.scan_page("orders", count_only=True)
+
+        # Assert
+        assert page.count == expected_count
+        assert page.items == []
+
+    async def test_query_scan_index_backward_reverses_order(self, provider):
+        # Arrange
+        expected_ids = ["i2", "i1", "i0"]
+
+        # Act
+        page = await provider.query_page(
+            "orders",
+            "orderId = :pk",
+            expression_values={":pk": "o1"},
+            scan_index_forward=False,
+        )
+
+        # Assert
+        actual_ids = [item["itemId"] for item in page.items]
+        assert actual_ids == expected_ids
+
+    async def test_query_backward_pagination_resumes_below_key(self, provider):
+        # Arrange
+        start_key = {"orderId": "o1", "itemId": "i2"}
+        expected_ids = ["i1"]
+
+        # Act
+        page = await provider.query_page(
+            "orders",
+            "orderId = :pk",
+            expression_values={":pk": "o1"},
+            limit=1,
+            exclusive_start_key=start_key,
+            scan_index_forward=False,
+        )
+
+        # Assert
+        actual_ids = [item["itemId"] for item in page.items]
+        assert actual_ids == expected_ids
+
+    async def test_query_gsi_last_evaluated_key_includes_index_keys(self, provider):
+        # Arrange
+        expected_key = {
+            "orderId": "o1",
+            "itemId": "i0",
+            "status": "active",
+            "createdAt": "o1-0",
+        }
+
+        # Act
+        page = await provider.query_page(
+            "orders",
+            "#s = :s",
+            expression_names={"#s": "status"},
+            expression_values={":s": "active"},
+            index_name="byStatus",
+            limit=1,
+        )
+
+        # Assert
+        actual_key = page.last_evaluated_key
+        assert actual_key == expected_key
@@ -0,0 +1,128 @@
+"""Tests for SqliteDynamoProvider Parallel Scan (Segment / TotalSegments)."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from lws.interfaces import KeyAttribute, KeySchema, TableConfig
+from lws.providers.dynamodb.provider import SqliteDynamoProvider
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+_ITEM_COUNT = 40
+
+
+@pytest.fixture
+async def provider(tmp_path: Path):
+    p = SqliteDynamoProvider(
+        data_dir=tmp_path,
+        tables=[
+            TableConfig(
+                table_name="events",
+                key_schema=KeySchema(partition_key=KeyAttribute(name="eventId", type="S")),
+            )
+        ],
+        read_pool_size=2,
+    )
+    await p.start()
+    await p.batch_write_items("events", put_items=[{"eventId": f"e{i}"} for i in range(25)])
+    await p.batch_write_items(
+        "events", put_items=[{"eventId": f"e{i}"} for i in range(25, _ITEM_COUNT)]
+    )
+    yield p
+    await p.stop()
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestParallelScan:
+    async def test_segments_partition_the_table(self, provider):
+        # Arrange
+        total_segments = 4
+        expected_ids = {f"e{i}" for i in range(_ITEM_COUNT)}
+
+        # Act
+        pages = await asyncio.gather(
+            *(
+                provider.scan_page("events", segment=seg, total_segments=total_segments)
+                for seg in range(total_segments)
+            )
+        )
+
+        # Assert
+        actual_ids = [item["eventId"] for page in pages for item in page.items]
+        assert len(actual_ids) == _ITEM_COUNT
+        assert set(actual_ids) == expected_ids
+
+    async def test_single_segment_returns_everything(self, provider):
+        # Arrange
+        expected_count = _ITEM_COUNT
+
+        # Act
+        page = await provider.scan_page("events", segment=0, total_segments=1)
+
+        # Assert
+        assert page.count == expected_count
+
+    async def test_segment_paginates_within_segment(self, provider):
+        # Arrange
+        total_segments = 2
+        full = await provider.scan_page("events", segment=1, total_segments=total_segments)
+        expected_ids = [item["eventId"] for item in full.items]
+        seen: list[str] = []
+        start_key = None
+
+        # Act
+        while True:
+            page = await provider.scan_page(
+                "events",
+                segment=1,
+                total_segments=total_segments,
+                limit=3,
+                exclusive_start_key=start_key,
+            )
+            seen.extend(item["eventId"] for item in page.items)
+            start_key = page.last_evaluated_key
+            if start_key is None:
+                break
+
+        # Assert
+        assert seen == expected_ids
+
+    async def test_segment_without_total_raises(self, provider):
+        # Arrange
+        table_name = "events"
+
+        # Act
+        # Assert
+        with pytest.raises(ValueError):
+            await provider.scan_page(table_name, segment=0)
+
+    async def test_segment_out_of_range_raises(self, provider):
+        # Arrange
+        table_name = "events"
+
+        # Act
+        # Assert
+        with pytest.raises(ValueError):
+            await provider.scan_page(table_name, segment=2, total_segments=2)
+
+    async def test_scan_sees_writes_committed_after_pool_opened(self, provider):
+        # Arrange
+        await provider.scan_page("events")
+        await provider.put_item("events", {"eventId": "late"})
+        expected_count = _ITEM_COUNT + 1
+
+        # Act
+        page = await provider.scan_page("events", count_only=True)
+
+        # Assert
+        assert page.count == expected_count
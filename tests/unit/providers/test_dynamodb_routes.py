@@ -7,7 +7,7 @@ from unittest.mock import AsyncMock
 import httpx
 import pytest
 
-from lws.interfaces.key_value_store import IKeyValueStore
+from lws.interfaces.key_value_store import IKeyValueStore, ItemPage
 from lws.providers.dynamodb.routes import create_dynamodb_app
 
 # ---------------------------------------------------------------------------
@@ -26,6 +26,8 @@ def mock_store() -> AsyncMock:
     store.update_item.return_value = {}
     store.query.return_value = []
     store.scan.return_value = []
+    store.query_page.return_value = ItemPage()
+    store.scan_page.return_value = ItemPage()
     store.batch_get_items.return_value = []
     store.batch_write_items.return_value = None
     return store
@@ -185,9 +187,11 @@ async def test_update_item(client: httpx.AsyncClient, mock_store: AsyncMock) ->
 @pytest.mark.asyncio
 async def test_query(client: httpx.AsyncClient, mock_store: AsyncMock) -> None:
     # Arrange
-    mock_store.query.return_value = [
-        {"pk": {"S": "user#1"}, "sk": {"S": "order#1"}},
-    ]
+    mock_store.query_page.return_value = ItemPage(
+        items=[{"pk": {"S": "user#1"}, "sk": {"S": "order#1"}}],
+        count=1,
+        scanned_count=1,
+    )
     payload = {
         "TableName": "Orders",
         "KeyConditionExpression": "pk = :pk",
@@ -215,10 +219,11 @@ async def test_query(client: httpx.AsyncClient, mock_store: AsyncMock) -> None:
 @pytest.mark.asyncio
 async def test_scan(client: httpx.AsyncClient, mock_store: AsyncMock) -> None:
     # Arrange
-    mock_store.scan.return_value = [
-        {"pk": {"S": "a"}},
-        {"pk": {"S": "b"}},
-    ]
+    mock_store.scan_page.return_value = ItemPage(
+        items=[{"pk": {"S": "a"}}, {"pk": {"S": "b"}}],
+        count=2,
+        scanned_count=2,
+    )
     payload = {"TableName": "Users"}
     expected_status_code = 200
     expected_count = 2
@@ -35,6 +35,7 @@ def mock_store() -> AsyncMock:
     store.scan.return_value = []
     store.batch_get_items.return_value = []
     store.batch_write_items.return_value = None
+    store.transact_write_items.return_value = None
     store.describe_table.return_value = {
         "TableName": "MyTable",
         "TableStatus": "ACTIVE",
@@ -104,7 +105,6 @@ class TestTransactWriteItems:
             ]
         }
         expected_status_code = 200
-        expected_put_count = 2
 
         # Act
         resp = await mock_client.post("/", json=payload, headers=_target("TransactWriteItems"))
@@ -112,11 +112,7 @@ class TestTransactWriteItems:
         # Assert
         assert resp.status_code == expected_status_code
         assert resp.json() == {}
-        assert mock_store.put_item.await_count == expected_put_count
-        mock_store.put_item.assert_any_await(
-            "Users", {"pk": {"S": "user#1"}, "name": {"S": "Alice"}}
-        )
-        mock_store.put_item.assert_any_await("Users", {"pk": {"S": "user#2"}, "name": {"S": "Bob"}})
+        mock_store.transact_write_items.assert_awaited_once_with(payload["TransactItems"])
 
     @pytest.mark.asyncio
     async def test_transact_write_delete_items(
@@ -140,7 +136,7 @@ class TestTransactWriteItems:
 
         # Assert
         assert resp.status_code == expected_status_code
-        mock_store.delete_item.assert_awaited_once_with("Users", {"pk": {"S": "user#1"}})
+        mock_store.transact_write_items.assert_awaited_once_with(payload["TransactItems"])
 
     @pytest.mark.asyncio
     async def test_transact_write_mixed_operations(
@@ -179,8 +175,7 @@ class TestTransactWriteItems:
         # Assert
         assert resp.status_code == expected_status_code
         assert resp.json() == {}
-        mock_store.put_item.assert_awaited_once()
-        mock_store.delete_item.assert_awaited_once()
+        mock_store.transact_write_items.assert_awaited_once_with(payload["TransactItems"])
 
     @pytest.mark.asyncio
     async def test_transact_write_update_item(
@@ -207,13 +202,7 @@ class TestTransactWriteItems:
 
         # Assert
         assert resp.status_code == expected_status_code
-        mock_store.update_item.assert_awaited_once_with(
-            "Users",
-            {"pk": {"S": "user#1"}},
-            "SET #n = :val",
-            expression_values={":val": {"S": "Updated"}},
-            expression_names={"#n": "name"},
-        )
+        mock_store.transact_write_items.assert_awaited_once_with(payload["TransactItems"])
 
     @pytest.mark.asyncio
     async def test_transact_write_empty_list(
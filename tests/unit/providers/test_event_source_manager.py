@@ -42,6 +42,37 @@ class TestEventSourceManager:
         # Assert
         mock_poller.start.assert_awaited_once()
 
+    async def test_activate_sqs_passes_scaling_and_batching_options(self) -> None:
+        # Arrange
+        manager = EventSourceManager(
+            queue_providers={"my-queue": AsyncMock()},
+            stream_dispatchers={},
+            compute_providers={"my-function": AsyncMock()},
+        )
+        mapping = {
+            "UUID": "test-uuid-3",
+            "EventSourceArn": "arn:aws:sqs:us-east-1:000000000000:my-queue",
+            "FunctionArn": "my-function",
+            "MaximumBatchingWindowInSeconds": 5,
+            "ScalingConfig": {"MaximumConcurrency": 4},
+            "FunctionResponseTypes": ["ReportBatchItemFailures"],
+        }
+        expected_window = 5
+        expected_concurrency = 4
+
+        # Act
+        with patch(
+            "lws.providers.lambda_runtime.event_source_manager.SqsEventSourcePoller"
+        ) as mock_poller_cls:
+            mock_poller_cls.return_value = AsyncMock()
+            await manager.activate(mapping)
+
+        # Assert
+        actual = mock_poller_cls.call_args.kwargs["mappings"][0]
+        assert actual.maximum_batching_window == expected_window
+        assert actual.maximum_concurrency == expected_concurrency
+        assert actual.report_batch_item_failures is True
+
     async def test_deactivate_stops_poller(self) -> None:
         # Arrange
         queue_provider = AsyncMock()
@@ -0,0 +1,131 @@
+"""Tests for the compiled EventBridge rule index."""
+
+from __future__ import annotations
+
+import pytest
+
+from lws.providers.eventbridge.pattern_matcher import match_event
+from lws.providers.eventbridge.provider import EventBridgeProvider, RuleConfig
+from lws.providers.eventbridge.rule_index import RuleIndex, compile_pattern
+
+_PATTERNS = [
+    {"source": ["my.app"]},
+    {"source": ["my.app", "other.app"], "detail-type": ["OrderPlaced"]},
+    {"source": [{"prefix": "my."}]},
+    {"detail": {"amount": [{"numeric": [">=", 100, "<", 200]}]}},
+    {"detail": {"color": [{"anything-but": ["red", "blue"]}]}},
+    {"detail": {"color": [{"anything-but": "red"}]}},
+    {"detail": {"missing": [{"exists": False}], "color": [{"exists": True}]}},
+    {"detail": {"count": [1, {"numeric": [">", 5]}]}},
+    {"detail": {"tags": [["a", "b"]]}},
+    {"detail": "not-a-list"},
+    {"source": [None]},
+]
+
+_EVENTS = [
+    {"source": "my.app", "detail-type": "OrderPlaced", "detail": {"amount": 150}},
+    {"source": "other.app", "detail-type": "OrderPlaced", "detail": {"color": "green"}},
+    {"source": "my.other", "detail": {"color": "red", "count": 1}},
+    {"source": "third", "detail": {"amount": "120", "count": 7, "tags": ["a", "b"]}},
+    {"detail-type": "X", "detail": {"amount": 250, "color": "blue"}},
+    {"source": ["my.app"], "detail": ["not", "a", "dict"]},
+]
+
+
+def _rule(name: str, pattern: dict, bus: str = "default") -> RuleConfig:
+    return RuleConfig(rule_name=name, event_bus_name=bus, event_pattern=pattern)
+
+
+class TestEventBridgeRuleIndex:
+    @pytest.mark.parametrize("pattern", _PATTERNS)
+    def test_compiled_pattern_agrees_with_match_event(self, pattern: dict) -> None:
+        # Arrange
+        expected = [match_event(pattern, event) for event in _EVENTS]
+        compiled = compile_pattern(pattern)
+
+        # Act
+        actual = [compiled(event) for event in _EVENTS]
+
+        # Assert
+        assert actual == expected
+
+    @pytest.mark.parametrize("event", _EVENTS)
+    def test_index_matches_same_rules_as_linear_scan(self, event: dict) -> None:
+        # Arrange
+        rules = [_rule(f"rule-{i}", pattern) for i, pattern in enumerate(_PATTERNS)]
+        index = RuleIndex()
+        for rule in rules:
+            index.add(rule)
+        expected = [r.rule_name for r in rules if match_event(r.event_pattern, event)]
+
+        # Act
+        actual = [r.rule_name for r in index.match(event)]
+
+        # Assert
+        assert actual == expected
+
+    def test_only_rules_filed_under_event_source_are_evaluated(self) -> None:
+        # Arrange
+        index = RuleIndex()
+        for i in range(300):
+            index.add(_rule(f"rule-{i}", {"source": [f"app.{i}"], "detail-type": ["Tick"]}))
+        evaluated: list[str] = []
+        for name, compiled in index._rules.items():
+            inner = compiled.matches
+            compiled.matches = lambda event, n=name, f=inner: evaluated.append(n) or f(event)
+        expected_names = ["rule-42"]
+
+        # Act
+        actual = [r.rule_name for r in index.match({"source": "app.42", "detail-type": "Tick"})]
+
+        # Assert
+        assert actual == expected_names
+        assert evaluated == expected_names
+
+    def test_disabled_rule_is_skipped_without_reindexing(self) -> None:
+        # Arrange
+        rule = _rule("r", {"source": ["my.app"]})
+        index = RuleIndex()
+        index.add(rule)
+
+        # Act
+        rule.enabled = False
+        actual = index.match({"source": "my.app"})
+
+        # Assert
+        assert actual == []
+
+    def test_replaced_rule_uses_new_pattern_and_keeps_position(self) -> None:
+        # Arrange
+        index = RuleIndex()
+        index.add(_rule("first", {"source": ["a"]}))
+        index.add(_rule("second", {"source": [{"prefix": ""}]}))
+        expected_names = ["first", "second"]
+        expected_stale = ["second"]
+
+        # Act
+        index.add(_rule("first", {"source": ["b"]}))
+        stale = index.match({"source": "a"})
+        actual = index.match({"source": "b"})
+
+        # Assert
+        assert [r.rule_name for r in stale] == expected_stale
+        assert [r.rule_name for r in actual] == expected_names
+
+    async def test_provider_moves_rule_between_buses(self) -> None:
+        # Arrange
+        provider = EventBridgeProvider()
+        await provider.start()
+        await provider.put_rule("r", "default", {"source": ["my.app"]})
+        event = {"source": "my.app"}
+        expected_names = ["r"]
+
+        # Act
+        await provider.put_rule("r", "custom", {"source": ["my.app"]})
+        on_default = provider._match_rules(event, "default")
+        on_custom = provider._match_rules(event, "custom")
+        await provider.stop()
+
+        # Assert
+        assert on_default == []
+        assert [r.rule_name for r in on_custom] == expected_names
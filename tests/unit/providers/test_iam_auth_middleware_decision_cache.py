@@ -0,0 +1,87 @@
+"""Unit tests for decision caching in AwsIamAuthMiddleware."""
+
+from __future__ import annotations
+
+import httpx
+from fastapi import FastAPI, Request, Response
+
+from lws.config.loader import IamAuthConfig, IamAuthServiceConfig
+from lws.providers._shared.aws_chaos import ErrorFormat
+from lws.providers._shared.aws_iam_auth import IamAuthBundle, add_iam_auth_middleware
+from lws.providers._shared.iam_identity_store import IdentityStore
+from lws.providers._shared.iam_permissions_map import PermissionsMap
+from lws.providers._shared.iam_resource_policies import ResourcePolicyStore
+
+
+def _policy(action: str) -> dict:
+    return {
+        "Version": "2012-10-17",
+        "Statement": [{"Effect": "Allow", "Action": action, "Resource": "*"}],
+    }
+
+
+def _make_bundle() -> IamAuthBundle:
+    store = IdentityStore()
+    store.register_identity("app-user", inline_policies=[_policy("dynamodb:GetItem")])
+    return IamAuthBundle(
+        config=IamAuthConfig(
+            mode="enforce",
+            default_identity="app-user",
+            services={"dynamodb": IamAuthServiceConfig(enabled=True)},
+        ),
+        identity_store=store,
+        permissions_map=PermissionsMap(),
+        resource_policy_store=ResourcePolicyStore(),
+    )
+
+
+def _create_test_app(bundle: IamAuthBundle) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/")
+    async def handler(request: Request) -> Response:
+        return Response(content='{"ok": true}', media_type="application/json")
+
+    add_iam_auth_middleware(app, "dynamodb", bundle, ErrorFormat.JSON)
+    return app
+
+
+async def _post(app: FastAPI, operation: str) -> int:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/",
+            headers={"X-Amz-Target": f"DynamoDB_20120810.{operation}"},
+            json={"TableName": "T"},
+        )
+    return response.status_code
+
+
+class TestIamAuthMiddlewareDecisionCache:
+    async def test_repeated_request_reuses_decision(self) -> None:
+        # Arrange
+        bundle = _make_bundle()
+        app = _create_test_app(bundle)
+        expected_stats = {"entries": 1, "hits": 1, "misses": 1}
+
+        # Act
+        first = await _post(app, "GetItem")
+        second = await _post(app, "GetItem")
+
+        # Assert
+        assert (first, second) == (200, 200)
+        assert bundle.decision_cache.stats() == expected_stats
+
+    async def test_register_identity_invalidates_cached_decision(self) -> None:
+        # Arrange
+        bundle = _make_bundle()
+        app = _create_test_app(bundle)
+        denied = await _post(app, "PutItem")
+
+        # Act
+        bundle.identity_store.register_identity("app-user", inline_policies=[_policy("dynamodb:*")])
+        allowed = await _post(app, "PutItem")
+
+        # Assert
+        assert denied == 403
+        assert allowed == 200
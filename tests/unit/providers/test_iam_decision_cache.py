@@ -0,0 +1,62 @@
+"""Unit tests for the IAM decision cache."""
+
+from __future__ import annotations
+
+from lws.providers._shared.iam_decision_cache import DecisionCache
+from lws.providers._shared.iam_policy_engine import Decision
+
+
+def _key(identity: str, version: int = 0) -> tuple:
+    return ("dynamodb", identity, ("dynamodb:GetItem",), "*", version)
+
+
+class TestIamDecisionCache:
+    def test_get_returns_stored_decision(self) -> None:
+        # Arrange
+        cache = DecisionCache()
+        expected = (Decision.ALLOW, "Identity policy Allow")
+        cache.put(_key("alice"), expected)
+
+        # Act
+        actual = cache.get(_key("alice"))
+
+        # Assert
+        assert actual == expected
+        assert cache.stats() == {"entries": 1, "hits": 1, "misses": 0}
+
+    def test_different_store_version_misses(self) -> None:
+        # Arrange
+        cache = DecisionCache()
+        cache.put(_key("alice", version=1), (Decision.ALLOW, "Identity policy Allow"))
+
+        # Act
+        actual = cache.get(_key("alice", version=2))
+
+        # Assert
+        assert actual is None
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        # Arrange
+        cache = DecisionCache(max_entries=2)
+        cache.put(_key("alice"), (Decision.ALLOW, "a"))
+        cache.put(_key("bob"), (Decision.ALLOW, "b"))
+        cache.get(_key("alice"))
+
+        # Act
+        cache.put(_key("carol"), (Decision.DENY, "c"))
+
+        # Assert
+        assert cache.get(_key("bob")) is None
+        assert cache.get(_key("alice")) == (Decision.ALLOW, "a")
+        assert len(cache) == 2
+
+    def test_clear_drops_every_entry(self) -> None:
+        # Arrange
+        cache = DecisionCache()
+        cache.put(_key("alice"), (Decision.ALLOW, "a"))
+
+        # Act
+        cache.clear()
+
+        # Assert
+        assert cache.get(_key("alice")) is None
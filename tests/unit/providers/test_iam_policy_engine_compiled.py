@@ -0,0 +1,94 @@
+"""Unit tests for compiled IAM policies."""
+
+from __future__ import annotations
+
+from lws.providers._shared.iam_identity_store import IdentityStore
+from lws.providers._shared.iam_policy_engine import (
+    CompiledPolicy,
+    Decision,
+    EvaluationContext,
+    compile_policy,
+    evaluate,
+)
+from lws.providers._shared.iam_resource_policies import ResourcePolicyStore
+
+_POLICY = {
+    "Version": "2012-10-17",
+    "Statement": [
+        {"Effect": "Allow", "Action": "DynamoDB:Get*", "Resource": "arn:aws:dynamodb:*"},
+        {"Effect": "Deny", "Action": ["dynamodb:DeleteTable"], "Resource": "*"},
+    ],
+}
+
+
+class TestIamPolicyEngineCompiled:
+    def test_compiled_policy_gives_same_decision_as_document(self) -> None:
+        # Arrange
+        compiled = compile_policy(_POLICY)
+        cases = [
+            (["dynamodb:GetItem"], "arn:aws:dynamodb:us-east-1:000:table/T"),
+            (["dynamodb:PutItem"], "arn:aws:dynamodb:us-east-1:000:table/T"),
+            (["dynamodb:DeleteTable"], "*"),
+            (["dynamodb:GetItem"], "arn:aws:s3:::bucket"),
+        ]
+
+        # Act
+        expected = [
+            evaluate(EvaluationContext("u", a, r, identity_policies=[_POLICY])) for a, r in cases
+        ]
+        actual = [
+            evaluate(EvaluationContext("u", a, r, identity_policies=[compiled])) for a, r in cases
+        ]
+
+        # Assert
+        assert actual == expected
+        assert actual[0] == (Decision.ALLOW, "Identity policy Allow")
+        assert actual[2] == (Decision.DENY, "Explicit Deny")
+
+    def test_action_patterns_are_lowered_at_compile_time(self) -> None:
+        # Arrange
+        compiled = compile_policy(_POLICY)
+
+        # Act
+        actual = compiled.allows("dynamodb:getitem", "arn:aws:dynamodb:x")
+
+        # Assert
+        assert actual is True
+
+    def test_registered_identity_is_compiled_and_bumps_version(self) -> None:
+        # Arrange
+        store = IdentityStore()
+        version_before = store.version
+
+        # Act
+        store.register_identity("alice", inline_policies=[_POLICY], boundary_policy=_POLICY)
+        actual = store.get_identity("alice")
+
+        # Assert
+        assert actual is not None
+        assert store.version == version_before + 1
+        assert len(actual.compiled_policies) == 1
+        assert isinstance(actual.compiled_boundary, CompiledPolicy)
+
+    def test_resource_policies_are_compiled_at_load(self, tmp_path) -> None:
+        # Arrange
+        path = tmp_path / "resource_policies.yaml"
+        path.write_text(
+            "resource_policies:\n"
+            "  s3:\n"
+            "    my-bucket:\n"
+            "      Statement:\n"
+            "        - Effect: Allow\n"
+            "          Principal: '*'\n"
+            "          Action: s3:GetObject\n"
+            "          Resource: '*'\n"
+        )
+
+        # Act
+        store = ResourcePolicyStore(path)
+        actual = store.get_compiled_policy("s3", "my-bucket")
+
+        # Assert
+        assert actual is not None
+        assert actual.allows_principal("anyone", ["s3:getobject"], "x") is True
+        assert store.get_compiled_policy("s3", "missing") is None
@@ -1,8 +1,14 @@
-"""Unit tests for _matches_action in iam_policy_engine."""
+"""Unit tests for action matching in compiled IAM policies."""
 
 from __future__ import annotations
 
-from lws.providers._shared.iam_policy_engine import _matches_action
+from lws.providers._shared.iam_policy_engine import compile_policy
+
+
+def _matches_action(pattern: str, action: str) -> bool:
+    policy = compile_policy({"Statement": [{"Effect": "Allow", "Action": pattern}]})
+    # evaluate() lower-cases actions before handing them to the compiled policy
+    return policy.allows(action.lower(), "arn:aws:s3:::my-bucket")
 
 
 class TestMatchesAction:
@@ -1,8 +1,15 @@
-"""Unit tests for _matches_resource in iam_policy_engine."""
+"""Unit tests for resource matching in compiled IAM policies."""
 
 from __future__ import annotations
 
-from lws.providers._shared.iam_policy_engine import _matches_resource
+from lws.providers._shared.iam_policy_engine import compile_policy
+
+
+def _matches_resource(pattern: str, resource: str) -> bool:
+    policy = compile_policy(
+        {"Statement": [{"Effect": "Allow", "Action": "*", "Resource": pattern}]}
+    )
+    return policy.allows("s3:getobject", resource)
 
 
 class TestMatchesResource:
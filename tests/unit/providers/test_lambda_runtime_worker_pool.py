@@ -0,0 +1,187 @@
+"""Tests for warm Python and Node.js Lambda worker pools."""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+from pathlib import Path
+
+import pytest
+
+from lws.interfaces import ComputeConfig, LambdaContext
+from lws.providers.lambda_runtime.nodejs import NodeJsCompute
+from lws.providers.lambda_runtime.python import PythonCompute
+from lws.providers.lambda_runtime.worker_pool import WorkerPoolConfig
+
+_PY_HANDLER = """
+import os
+import time
+
+CALLS = 0
+
+
+def main(event, context):
+    global CALLS
+    CALLS += 1
+    if event.get("exit"):
+        os._exit(3)
+    print("noise on stdout")
+    time.sleep(event.get("sleep", 0))
+    return {"calls": CALLS, "pid": os.getpid(), "request_id": context.aws_request_id}
+"""
+
+_JS_HANDLER = """
+let calls = 0;
+exports.handler = async (event, context) => {
+    calls += 1;
+    console.log("noise on stdout");
+    return {calls: calls, requestId: context.awsRequestId};
+};
+"""
+
+
+def _context(request_id: str = "req-1") -> LambdaContext:
+    return LambdaContext(
+        function_name="fn",
+        memory_limit_in_mb=128,
+        timeout_seconds=5,
+        aws_request_id=request_id,
+        invoked_function_arn="arn:aws:lambda:us-east-1:000000000000:function:fn",
+    )
+
+
+def _python_compute(code_path: Path, **pool_kwargs) -> PythonCompute:
+    (code_path / "handler.py").write_text(_PY_HANDLER)
+    config = ComputeConfig(
+        function_name="fn",
+        handler="handler.main",
+        runtime="python3.12",
+        code_path=code_path,
+        timeout=2,
+    )
+    return PythonCompute(config, sdk_env={}, pool=WorkerPoolConfig(**pool_kwargs))
+
+
+@pytest.fixture()
+async def compute(tmp_path: Path):
+    c = _python_compute(tmp_path)
+    yield c
+    await c.stop()
+
+
+class TestLambdaWorkerPool:
+    async def test_second_invocation_reuses_warm_worker(self, compute) -> None:
+        # Arrange
+        expected_calls = 2
+        expected_request_id = "req-2"
+        first = await compute.invoke({}, _context("req-1"))
+
+        # Act
+        second = await compute.invoke({}, _context(expected_request_id))
+
+        # Assert
+        assert first.cold_start is True
+        assert second.cold_start is False
+        assert second.payload["calls"] == expected_calls
+        assert second.payload["pid"] == first.payload["pid"]
+        assert second.payload["request_id"] == expected_request_id
+
+    async def test_concurrency_limit_caps_worker_count(self, tmp_path: Path) -> None:
+        # Arrange
+        c = _python_compute(tmp_path, max_workers=2)
+        expected_pids = 2
+
+        # Act
+        results = await asyncio.gather(*(c.invoke({"sleep": 0.2}, _context()) for _ in range(4)))
+        await c.stop()
+
+        # Assert
+        actual_pids = len({result.payload["pid"] for result in results})
+        assert actual_pids == expected_pids
+
+    async def test_idle_worker_is_evicted(self, tmp_path: Path) -> None:
+        # Arrange
+        c = _python_compute(tmp_path, idle_timeout=0.05)
+        await c.invoke({}, _context())
+        await asyncio.sleep(0.2)
+
+        # Act
+        result = await c.invoke({}, _context())
+        await c.stop()
+
+        # Assert
+        assert result.cold_start is True
+        assert result.payload["calls"] == 1
+
+    async def test_code_change_recycles_workers(self, compute, tmp_path: Path) -> None:
+        # Arrange
+        await compute.invoke({}, _context())
+
+        # Act
+        await compute.recycle_workers(tmp_path / "handler.py")
+        result = await compute.invoke({}, _context())
+
+        # Assert
+        assert result.cold_start is True
+
+    async def test_change_outside_code_path_keeps_workers(self, compute) -> None:
+        # Arrange
+        await compute.invoke({}, _context())
+
+        # Act
+        await compute.recycle_workers(Path("/somewhere/else.py"))
+        result = await compute.invoke({}, _context())
+
+        # Assert
+        assert result.cold_start is False
+
+    async def test_timed_out_worker_is_replaced(self, compute) -> None:
+        # Arrange
+        timed_out = await compute.invoke({"sleep": 5}, _context())
+
+        # Act
+        result = await compute.invoke({}, _context())
+
+        # Assert
+        assert timed_out.error is not None
+        assert result.cold_start is True
+        assert result.error is None
+
+    async def test_crashed_worker_returns_error_and_is_replaced(self, compute) -> None:
+        # Arrange
+        first = await compute.invoke({}, _context())
+        expected_error = "Failed to parse subprocess output: ''"
+
+        # Act
+        crashed = await compute.invoke({"exit": True}, _context())
+        result = await compute.invoke({}, _context())
+
+        # Assert
+        assert crashed.payload is None
+        assert crashed.error == expected_error
+        assert result.cold_start is True
+        assert result.error is None
+        assert result.payload["pid"] != first.payload["pid"]
+
+    @pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+    async def test_node_worker_stays_warm(self, tmp_path: Path) -> None:
+        # Arrange
+        (tmp_path / "index.js").write_text(_JS_HANDLER)
+        config = ComputeConfig(
+            function_name="fn",
+            handler="index.handler",
+            runtime="nodejs20.x",
+            code_path=tmp_path,
+            timeout=5,
+        )
+        c = NodeJsCompute(config, sdk_env={}, pool=WorkerPoolConfig())
+        await c.invoke({}, _context("req-1"))
+        expected_payload = {"calls": 2, "requestId": "req-2"}
+
+        # Act
+        result = await c.invoke({}, _context("req-2"))
+        await c.stop()
+
+        # Assert
+        assert result.cold_start is False
+        assert result.payload == expected_payload
@@ -0,0 +1,154 @@
+"""Tests for the persistent S3 key index behind ListObjectsV2."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from lws.providers.s3.key_index import S3KeyIndex
+from lws.providers.s3.storage import LocalBucketStorage
+
+_BUCKET = "photos"
+_KEYS = ["2023/a.jpg", "2023/b.jpg", "2024/c.jpg", "2024/d/e.jpg", "index.html", "readme.md"]
+
+
+@pytest.fixture
+async def storage(tmp_path: Path):
+    s = LocalBucketStorage(tmp_path)
+    for key in _KEYS:
+        await s.put_object(_BUCKET, key, key.encode())
+    yield s
+    s.close()
+
+
+class TestS3KeyIndex:
+    async def test_delimiter_rolls_up_common_prefixes(self, storage: LocalBucketStorage) -> None:
+        # Arrange
+        expected_prefixes = ["2023/", "2024/"]
+        expected_keys = ["index.html", "readme.md"]
+
+        # Act
+        result = await storage.list_objects(_BUCKET, delimiter="/")
+
+        # Assert
+        assert result["common_prefixes"] == expected_prefixes
+        assert [item["key"] for item in result["contents"]] == expected_keys
+
+    async def test_prefix_and_delimiter_list_one_level(self, storage: LocalBucketStorage) -> None:
+        # Arrange
+        expected_prefixes = ["2024/d/"]
+        expected_keys = ["2024/c.jpg"]
+
+        # Act
+        result = await storage.list_objects(_BUCKET, prefix="2024/", delimiter="/")
+
+        # Assert
+        assert result["common_prefixes"] == expected_prefixes
+        assert [item["key"] for item in result["contents"]] == expected_keys
+
+    async def test_pages_across_common_prefixes(self, storage: LocalBucketStorage) -> None:
+        # Arrange
+        expected_items = ["2023/", "2024/", "index.html", "readme.md"]
+        actual_items: list[str] = []
+        token = None
+
+        # Act
+        while True:
+            page = await storage.list_objects(
+                _BUCKET, delimiter="/", max_keys=1, continuation_token=token
+            )
+            actual_items += page["common_prefixes"] + [i["key"] for i in page["contents"]]
+            token = page["next_token"]
+            if not page["is_truncated"]:
+                break
+
+        # Assert
+        assert actual_items == expected_items
+
+    async def test_start_after_skips_earlier_keys(self, storage: LocalBucketStorage) -> None:
+        # Arrange
+        expected_keys = ["2024/d/e.jpg", "index.html", "readme.md"]
+
+        # Act
+        result = await storage.list_objects(_BUCKET, start_after="2024/c.jpg")
+
+        # Assert
+        assert [item["key"] for item in result["contents"]] == expected_keys
+
+    async def test_listing_reads_size_and_etag_from_index(
+        self, storage: LocalBucketStorage, tmp_path: Path
+    ) -> None:
+        # Arrange
+        expected_size = len(b"readme.md")
+        (tmp_path / "s3" / ".metadata" / _BUCKET / "readme.md.json").unlink()
+
+        # Act
+        result = await storage.list_objects(_BUCKET, prefix="readme")
+
+        # Assert
+        item = result["contents"][0]
+        assert item["size"] == expected_size
+        assert item["etag"]
+
+    async def test_delete_removes_key_from_listing(self, storage: LocalBucketStorage) -> None:
+        # Arrange
+        expected_keys = ["2023/b.jpg"]
+
+        # Act
+        await storage.delete_object(_BUCKET, "2023/a.jpg")
+        result = await storage.list_objects(_BUCKET, prefix="2023/")
+
+        # Assert
+        assert [item["key"] for item in result["contents"]] == expected_keys
+
+    async def test_missing_index_is_rebuilt_from_disk(self, tmp_path: Path) -> None:
+        # Arrange
+        bucket_dir = tmp_path / "s3" / _BUCKET
+        (bucket_dir / "docs").mkdir(parents=True)
+        (bucket_dir / "docs" / "guide.txt").write_bytes(b"hello")
+        meta_dir = tmp_path / "s3" / ".metadata" / _BUCKET / "docs"
+        meta_dir.mkdir(parents=True)
+        expected_etag = "abc123"
+        (meta_dir / "guide.txt.json").write_text(json.dumps({"etag": expected_etag, "size": 5}))
+
+        # Act
+        index = S3KeyIndex(tmp_path / "s3")
+        page = index.list_page(_BUCKET)
+        index.close()
+
+        # Assert
+        assert [item["etag"] for item in page.contents] == [expected_etag]
+
+    async def test_object_added_outside_provider_triggers_rebuild(self, tmp_path: Path) -> None:
+        # Arrange
+        storage = LocalBucketStorage(tmp_path)
+        await storage.put_object(_BUCKET, "a.txt", b"a")
+        storage.close()
+        (tmp_path / "s3" / _BUCKET / "b.txt").write_bytes(b"b")
+        expected_keys = ["a.txt", "b.txt"]
+
+        # Act
+        index = S3KeyIndex(tmp_path / "s3")
+        page = index.list_page(_BUCKET)
+        index.close()
+
+        # Assert
+        assert [item["key"] for item in page.contents] == expected_keys
+
+    async def test_unclean_shutdown_triggers_rebuild(self, tmp_path: Path) -> None:
+        # Arrange
+        storage = LocalBucketStorage(tmp_path)
+        await storage.put_object(_BUCKET, "a.txt", b"a")
+        storage._index._conn.execute("UPDATE objects SET size = 99")
+        storage._index._conn = None  # simulate a crash: never closed
+        expected_size = 1
+
+        # Act
+        index = S3KeyIndex(tmp_path / "s3")
+        page = index.list_page(_BUCKET)
+        index.close()
+
+        # Assert
+        assert [item["size"] for item in page.contents] == [expected_size]
@@ -0,0 +1,128 @@
+"""Tests for disk-backed S3 multipart uploads."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from lws.providers.s3.provider import S3Provider
+
+_BUCKET = "test-bucket"
+_KEY = "large.bin"
+
+
+async def _start(tmp_path: Path) -> S3Provider:
+    p = S3Provider(data_dir=tmp_path, buckets=[_BUCKET])
+    await p.start()
+    return p
+
+
+async def _chunks(data: bytes, size: int = 1000):
+    for offset in range(0, len(data), size):
+        yield data[offset : offset + size]
+
+
+@pytest.fixture
+async def provider(tmp_path: Path):
+    p = await _start(tmp_path)
+    yield p
+    await p.stop()
+
+
+class TestMultipartSpool:
+    async def test_parts_are_spooled_to_disk(self, provider: S3Provider, tmp_path: Path) -> None:
+        # Arrange
+        data = b"z" * 5000
+        upload_id = provider.create_multipart_upload(_BUCKET, _KEY)
+        expected_etag = hashlib.md5(data).hexdigest()
+
+        # Act
+        actual_etag = await provider.upload_part_stream(_BUCKET, _KEY, upload_id, 1, _chunks(data))
+
+        # Assert
+        part_path = tmp_path / "s3" / ".multipart" / upload_id / "1.part"
+        assert actual_etag == expected_etag
+        assert part_path.read_bytes() == data
+
+    async def test_concurrent_parts_complete_in_part_order(self, provider: S3Provider) -> None:
+        # Arrange
+        parts = {n: bytes([n]) * (3000 + n) for n in range(1, 6)}
+        upload_id = provider.create_multipart_upload(_BUCKET, _KEY)
+        expected_body = b"".join(parts[n] for n in sorted(parts))
+
+        # Act
+        await asyncio.gather(
+            *(
+                provider.upload_part_stream(_BUCKET, _KEY, upload_id, n, _chunks(data))
+                for n, data in reversed(parts.items())
+            )
+        )
+        await provider.complete_multipart_upload(_BUCKET, _KEY, upload_id)
+
+        # Assert
+        actual_body = await provider.get_object(_BUCKET, _KEY)
+        assert actual_body == expected_body
+
+    async def test_complete_returns_multipart_etag(self, provider: S3Provider) -> None:
+        # Arrange
+        part1, part2 = b"first", b"second"
+        upload_id = provider.create_multipart_upload(_BUCKET, _KEY)
+        provider.upload_part(_BUCKET, _KEY, upload_id, 1, part1)
+        provider.upload_part(_BUCKET, _KEY, upload_id, 2, part2)
+        digests = hashlib.md5(part1).digest() + hashlib.md5(part2).digest()
+        expected_etag = f"{hashlib.md5(digests).hexdigest()}-2"
+
+        # Act
+        result = await provider.complete_multipart_upload(_BUCKET, _KEY, upload_id)
+
+        # Assert
+        meta = await provider.storage.head_object(_BUCKET, _KEY)
+        assert result["ETag"] == expected_etag
+        assert meta["etag"] == expected_etag
+
+    async def test_upload_survives_restart(self, tmp_path: Path) -> None:
+        # Arrange
+        p = await _start(tmp_path)
+        upload_id = p.create_multipart_upload(_BUCKET, _KEY)
+        p.upload_part(_BUCKET, _KEY, upload_id, 1, b"before ")
+        await p.stop()
+        expected_body = b"before after"
+
+        # Act
+        p = await _start(tmp_path)
+        p.upload_part(_BUCKET, _KEY, upload_id, 2, b"after")
+        await p.complete_multipart_upload(_BUCKET, _KEY, upload_id)
+
+        # Assert
+        actual_body = await p.get_object(_BUCKET, _KEY)
+        await p.stop()
+        assert actual_body == expected_body
+
+    async def test_complete_removes_spool_directory(
+        self, provider: S3Provider, tmp_path: Path
+    ) -> None:
+        # Arrange
+        upload_id = provider.create_multipart_upload(_BUCKET, _KEY)
+        provider.upload_part(_BUCKET, _KEY, upload_id, 1, b"data")
+
+        # Act
+        await provider.complete_multipart_upload(_BUCKET, _KEY, upload_id)
+
+        # Assert
+        assert not (tmp_path / "s3" / ".multipart" / upload_id).exists()
+
+    async def test_abort_removes_spool_directory(
+        self, provider: S3Provider, tmp_path: Path
+    ) -> None:
+        # Arrange
+        upload_id = provider.create_multipart_upload(_BUCKET, _KEY)
+        provider.upload_part(_BUCKET, _KEY, upload_id, 1, b"data")
+
+        # Act
+        provider.abort_multipart_upload(upload_id)
+
+        # Assert
+        assert not (tmp_path / "s3" / ".multipart" / upload_id).exists()
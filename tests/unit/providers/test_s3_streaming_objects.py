@@ -0,0 +1,229 @@
+"""Tests for streaming S3 GetObject/PutObject with Range and conditional requests."""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import httpx
+import pytest
+
+from lws.providers.s3.provider import S3Provider
+from lws.providers.s3.routes import create_s3_app
+from lws.providers.s3.storage import LocalBucketStorage
+
+_BUCKET = "assets"
+_KEY = "blob.bin"
+_BODY = bytes(range(256)) * 64
+
+
+@pytest.fixture
+async def provider(tmp_path: Path):
+    p = S3Provider(data_dir=tmp_path, buckets=[_BUCKET])
+    await p.start()
+    yield p
+    await p.stop()
+
+
+@pytest.fixture
+async def client(provider: S3Provider):
+    await provider.storage.put_object(_BUCKET, _KEY, _BODY)
+    transport = httpx.ASGITransport(app=create_s3_app(provider))
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as c:
+        yield c
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+class TestStreamingObjects:
+    async def test_streamed_put_computes_md5_across_chunks(self, tmp_path: Path) -> None:
+        # Arrange
+        storage = LocalBucketStorage(tmp_path)
+        parts = [b"a" * 1000, b"b" * 3000, b"c"]
+        expected_etag = f'"{hashlib.md5(b"".join(parts)).hexdigest()}"'
+        expected_size = 4001
+
+        # Act
+        result = await storage.put_object_stream(_BUCKET, _KEY, _chunks(*parts))
+
+        # Assert
+        meta = await storage.head_object(_BUCKET, _KEY)
+        assert result["ETag"] == expected_etag
+        assert meta["size"] == expected_size
+        assert list((tmp_path / "s3" / ".tmp").iterdir()) == []
+
+    async def test_failed_upload_keeps_previous_object(self, tmp_path: Path) -> None:
+        # Arrange
+        storage = LocalBucketStorage(tmp_path)
+        expected_body = b"original"
+        await storage.put_object(_BUCKET, _KEY, expected_body)
+
+        async def broken():
+            yield b"partial"
+            raise ConnectionError
+
+        # Act
+        with pytest.raises(ConnectionError):
+            await storage.put_object_stream(_BUCKET, _KEY, broken())
+
+        # Assert
+        actual_obj = await storage.get_object(_BUCKET, _KEY)
+        assert actual_obj["body"] == expected_body
+        assert list((tmp_path / "s3" / ".tmp").iterdir()) == []
+
+    async def test_new_body_is_never_visible_with_old_metadata(self, tmp_path: Path) -> None:
+        # Arrange
+        storage = LocalBucketStorage(tmp_path)
+        await storage.put_object(_BUCKET, _KEY, b"old")
+        new_body = b"new body, longer"
+        expected_etag = hashlib.md5(new_body).hexdigest()
+        seen_at_rename: list[str] = []
+        original_commit = storage._commit_object
+
+        def _recording_commit(staging_path: Path, path: Path) -> None:
+            seen_at_rename.append(
+                storage._read_metadata(storage._metadata_path(_BUCKET, _KEY))["etag"]
+            )
+            original_commit(staging_path, path)
+
+        storage._commit_object = _recording_commit
+
+        # Act
+        await storage.put_object(_BUCKET, _KEY, new_body)
+
+        # Assert
+        assert seen_at_rename == [expected_etag]
+
+    async def test_head_size_follows_body_file(self, tmp_path: Path) -> None:
+        # Arrange
+        storage = LocalBucketStorage(tmp_path)
+        await storage.put_object(_BUCKET, _KEY, b"old")
+        replacement = b"replaced outside the sidecar"
+        expected_size = len(replacement)
+        (tmp_path / "s3" / _BUCKET / _KEY).write_bytes(replacement)
+
+        # Act
+        meta = await storage.head_object(_BUCKET, _KEY)
+
+        # Assert
+        assert meta["size"] == expected_size
+
+    async def test_iter_object_reads_only_requested_range(self, tmp_path: Path) -> None:
+        # Arrange
+        storage = LocalBucketStorage(tmp_path)
+        await storage.put_object(_BUCKET, _KEY, _BODY)
+        expected_body = _BODY[100:1100]
+
+        # Act
+        chunks = [c async for c in storage.iter_object(_BUCKET, _KEY, 100, 1099, chunk_size=256)]
+
+        # Assert
+        assert b"".join(chunks) == expected_body
+        assert max(len(c) for c in chunks) == 256
+
+    async def test_put_object_route_streams_body(
+        self, client: httpx.AsyncClient, provider: S3Provider
+    ) -> None:
+        # Arrange
+        expected_body = b"x" * 100_000
+
+        # Act
+        resp = await client.put(
+            f"/{_BUCKET}/upload.bin", content=_chunks(expected_body[:10], expected_body[10:])
+        )
+
+        # Assert
+        actual_obj = await provider.storage.get_object(_BUCKET, "upload.bin")
+        assert resp.status_code == 200
+        assert actual_obj["body"] == expected_body
+
+    async def test_get_object_returns_full_body(self, client: httpx.AsyncClient) -> None:
+        # Arrange
+        expected_length = str(len(_BODY))
+
+        # Act
+        resp = await client.get(f"/{_BUCKET}/{_KEY}")
+
+        # Assert
+        assert resp.status_code == 200
+        assert resp.content == _BODY
+        assert resp.headers["content-length"] == expected_length
+
+    @pytest.mark.parametrize(
+        ("range_header", "expected_start", "expected_end"),
+        [
+            ("bytes=10-19", 10, 19),
+            ("bytes=16000-", 16000, 16383),
+            ("bytes=-5", 16379, 16383),
+            ("bytes=16380-99999", 16380, 16383),
+        ],
+    )
+    async def test_range_returns_partial_content(
+        self, client: httpx.AsyncClient, range_header: str, expected_start: int, expected_end: int
+    ) -> None:
+        # Arrange
+        expected_content_range = f"bytes {expected_start}-{expected_end}/{len(_BODY)}"
+
+        # Act
+        resp = await client.get(f"/{_BUCKET}/{_KEY}", headers={"range": range_header})
+
+        # Assert
+        assert resp.status_code == 206
+        assert resp.content == _BODY[expected_start : expected_end + 1]
+        assert resp.headers["content-range"] == expected_content_range
+
+    async def test_unsatisfiable_range_returns_416(self, client: httpx.AsyncClient) -> None:
+        # Arrange
+        expected_content_range = f"bytes */{len(_BODY)}"
+
+        # Act
+        resp = await client.get(f"/{_BUCKET}/{_KEY}", headers={"range": "bytes=99999-"})
+
+        # Assert
+        assert resp.status_code == 416
+        assert resp.headers["content-range"] == expected_content_range
+
+    async def test_malformed_range_returns_whole_object(self, client: httpx.AsyncClient) -> None:
+        # Act
+        resp = await client.get(f"/{_BUCKET}/{_KEY}", headers={"range": "bytes=0-1,5-6"})
+
+        # Assert
+        assert resp.status_code == 200
+        assert resp.content == _BODY
+
+    async def test_matching_if_none_match_returns_304(self, client: httpx.AsyncClient) -> None:
+        # Arrange
+        etag = (await client.head(f"/{_BUCKET}/{_KEY}")).headers["etag"]
+
+        # Act
+        resp = await client.get(f"/{_BUCKET}/{_KEY}", headers={"if-none-match": etag})
+
+        # Assert
+        assert resp.status_code == 304
+        assert resp.content == b""
+
+    async def test_if_modified_since_in_future_returns_304(self, client: httpx.AsyncClient) -> None:
+        # Arrange
+        since = "Fri, 01 Jan 2100 00:00:00 GMT"
+
+        # Act
+        resp = await client.get(f"/{_BUCKET}/{_KEY}", headers={"if-modified-since": since})
+
+        # Assert
+        assert resp.status_code == 304
+
+    async def test_if_modified_since_in_past_returns_object(
+        self, client: httpx.AsyncClient
+    ) -> None:
+        # Arrange
+        since = "Mon, 01 Jan 2001 00:00:00 GMT"
+
+        # Act
+        resp = await client.get(f"/{_BUCKET}/{_KEY}", headers={"if-modified-since": since})
+
+        # Assert
+        assert resp.status_code == 200
+        assert resp.content == _BODY
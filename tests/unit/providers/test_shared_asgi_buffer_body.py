@@ -0,0 +1,120 @@
+"""Unit tests for the shared raw-ASGI middleware helpers."""
+
+from __future__ import annotations
+
+from starlette.types import Message, Receive, Scope, Send
+
+from lws.providers._shared.asgi import BODY_SCOPE_KEY, buffer_body
+from lws.providers._shared.aws_chaos import AwsChaosConfig, AwsChaosMiddleware, ErrorFormat
+from lws.providers._shared.aws_operation_mock import AwsMockConfig, AwsOperationMockMiddleware
+
+
+def _http_scope(headers: list[tuple[bytes, bytes]] | None = None) -> Scope:
+    return {
+        "type": "http",
+        "method": "POST",
+        "path": "/",
+        "query_string": b"",
+        "headers": headers or [],
+    }
+
+
+def _chunked_receive(chunks: list[bytes], calls: list[int]) -> Receive:
+    pending = list(chunks)
+
+    async def _receive() -> Message:
+        calls.append(1)
+        body = pending.pop(0)
+        return {"type": "http.request", "body": body, "more_body": bool(pending)}
+
+    return _receive
+
+
+async def _noop_send(_message: Message) -> None:
+    return None
+
+
+class TestSharedAsgiBufferBody:
+    async def test_body_is_read_once_and_replayed(self) -> None:
+        # Arrange
+        expected_body = b"Action=SendMessage&MessageBody=hi"
+        calls: list[int] = []
+        scope = _http_scope()
+        receive = _chunked_receive([expected_body[:10], expected_body[10:]], calls)
+
+        # Act
+        first, downstream = await buffer_body(scope, receive)
+        second, downstream = await buffer_body(scope, downstream)
+        replayed = await downstream()
+
+        # Assert
+        assert first == expected_body
+        assert second == expected_body
+        assert replayed["body"] == expected_body
+        assert scope[BODY_SCOPE_KEY] == expected_body
+        assert len(calls) == 2
+
+    async def test_form_body_is_shared_by_stacked_layers(self) -> None:
+        # Arrange
+        expected_body = b"Action=ListQueues"
+        calls: list[int] = []
+        seen: list[bytes] = []
+
+        async def endpoint(scope: Scope, receive: Receive, send: Send) -> None:
+            seen.append((await receive())["body"])
+
+        config = AwsMockConfig(service="sqs")
+        app = AwsOperationMockMiddleware(
+            AwsOperationMockMiddleware(endpoint, mock_config=config, service="sqs"),
+            mock_config=config,
+            service="sqs",
+        )
+        headers = [(b"content-type", b"application/x-www-form-urlencoded")]
+
+        # Act
+        await app(_http_scope(headers), _chunked_receive([expected_body], calls), _noop_send)
+
+        # Assert
+        assert seen == [expected_body]
+        assert len(calls) == 1
+
+    async def test_json_body_is_not_buffered(self) -> None:
+        # Arrange
+        calls: list[int] = []
+        received: list[Receive] = []
+
+        async def endpoint(scope: Scope, receive: Receive, send: Send) -> None:
+            received.append(receive)
+
+        receive = _chunked_receive([b"{}"], calls)
+        app = AwsOperationMockMiddleware(
+            endpoint, mock_config=AwsMockConfig(service="dynamodb"), service="dynamodb"
+        )
+        headers = [(b"x-amz-target", b"DynamoDB_20120810.GetItem")]
+
+        # Act
+        await app(_http_scope(headers), receive, _noop_send)
+
+        # Assert
+        assert received == [receive]
+        assert calls == []
+
+    async def test_disabled_layer_passes_receive_through(self) -> None:
+        # Arrange
+        calls: list[int] = []
+        received: list[Receive] = []
+
+        async def endpoint(scope: Scope, receive: Receive, send: Send) -> None:
+            received.append(receive)
+
+        receive = _chunked_receive([b"{}"], calls)
+        app = AwsChaosMiddleware(
+            endpoint, chaos_config=AwsChaosConfig(enabled=False), error_format=ErrorFormat.JSON
+        )
+
+        # Act
+        await app(_http_scope(), receive, _noop_send)
+
+        # Assert
+        assert received == [receive]
+        assert calls == []
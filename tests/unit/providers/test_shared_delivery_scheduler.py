@@ -0,0 +1,151 @@
+"""Tests for the bounded fan-out delivery scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+from lws.providers._shared.delivery_scheduler import DeliveryConfig, DeliveryScheduler
+
+
+def _recorder(release: asyncio.Event | None = None, failures: int = 0):
+    """Return a handler that records its batches and tracks peak concurrency."""
+    state = SimpleNamespace(batches=[], running=0, peak=0, failures=failures)
+
+    async def handler(items: list[int]) -> None:
+        state.running += 1
+        state.peak = max(state.peak, state.running)
+        try:
+            if release is not None:
+                await release.wait()
+            if state.failures:
+                state.failures -= 1
+                raise RuntimeError("target unavailable")
+            state.batches.append(items)
+        finally:
+            state.running -= 1
+
+    handler.state = state
+    return handler
+
+
+class TestSharedDeliveryScheduler:
+    async def test_per_target_concurrency_is_capped(self) -> None:
+        # Arrange
+        release = asyncio.Event()
+        handler = _recorder(release)
+        scheduler = DeliveryScheduler(DeliveryConfig(max_per_target=2))
+        expected_peak = 2
+
+        # Act
+        for i in range(10):
+            await scheduler.submit("lambda:fn", i, handler)
+        await asyncio.sleep(0.01)
+        release.set()
+        await scheduler.join()
+
+        # Assert
+        assert handler.state.peak == expected_peak
+        assert sorted(item for batch in handler.state.batches for item in batch) == list(range(10))
+
+    async def test_global_concurrency_is_capped_across_targets(self) -> None:
+        # Arrange
+        release = asyncio.Event()
+        handler = _recorder(release)
+        scheduler = DeliveryScheduler(DeliveryConfig(max_concurrency=3, max_per_target=8))
+        expected_peak = 3
+
+        # Act
+        for i in range(6):
+            await scheduler.submit(f"lambda:fn-{i}", i, handler)
+        await asyncio.sleep(0.01)
+        release.set()
+        await scheduler.join()
+
+        # Assert
+        assert handler.state.peak == expected_peak
+
+    async def test_full_lane_makes_publisher_wait(self) -> None:
+        # Arrange
+        release = asyncio.Event()
+        handler = _recorder(release)
+        scheduler = DeliveryScheduler(DeliveryConfig(max_per_target=1, queue_size=2))
+        for i in range(3):
+            await scheduler.submit("sqs:q", i, handler)
+        await asyncio.sleep(0.01)
+
+        # Act
+        blocked = asyncio.create_task(scheduler.submit("sqs:q", 3, handler))
+        await asyncio.sleep(0.01)
+        was_blocked = not blocked.done()
+        release.set()
+        await blocked
+        await scheduler.join()
+
+        # Assert
+        assert was_blocked is True
+        assert scheduler.metrics()["delivered"] == 4
+
+    async def test_batchable_items_are_delivered_together(self) -> None:
+        # Arrange
+        handler = _recorder()
+        scheduler = DeliveryScheduler(DeliveryConfig(max_per_target=1, batch_size=3))
+        expected_batches = [[0, 1, 2], [3, 4]]
+
+        # Act
+        for i in range(5):
+            await scheduler.submit("sqs:q", i, handler, batchable=True)
+        await scheduler.join()
+
+        # Assert
+        assert handler.state.batches == expected_batches
+
+    async def test_failed_delivery_is_retried(self) -> None:
+        # Arrange
+        handler = _recorder(failures=1)
+        scheduler = DeliveryScheduler(DeliveryConfig(retry_backoff_s=0.001))
+
+        # Act
+        await scheduler.submit("lambda:fn", 1, handler)
+        await scheduler.join()
+        actual = scheduler.metrics()
+
+        # Assert
+        assert handler.state.batches == [[1]]
+        assert actual["retried"] == 1
+        assert actual["delivered"] == 1
+        assert actual["failed"] == 0
+
+    async def test_delivery_fails_after_max_attempts(self) -> None:
+        # Arrange
+        handler = _recorder(failures=5)
+        scheduler = DeliveryScheduler(DeliveryConfig(max_attempts=2, retry_backoff_s=0.001))
+        expected_failed = 1
+
+        # Act
+        await scheduler.submit("lambda:fn", 1, handler)
+        await scheduler.join()
+        actual = scheduler.metrics()
+
+        # Assert
+        assert handler.state.batches == []
+        assert actual["failed"] == expected_failed
+
+    async def test_metrics_report_queued_deliveries_per_target(self) -> None:
+        # Arrange
+        release = asyncio.Event()
+        handler = _recorder(release)
+        scheduler = DeliveryScheduler(DeliveryConfig(max_per_target=1))
+        for i in range(4):
+            await scheduler.submit("sqs:q", i, handler)
+        await asyncio.sleep(0.01)
+        expected_queued = 3
+
+        # Act
+        actual = scheduler.metrics()
+        await scheduler.stop()
+
+        # Assert
+        assert actual["queued"] == expected_queued
+        assert actual["in_flight"] == 1
+        assert actual["targets"] == {"sqs:q": expected_queued}
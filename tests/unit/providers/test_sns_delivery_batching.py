@@ -0,0 +1,58 @@
+"""Tests for SNS fan-out through the shared delivery scheduler."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock
+
+from lws.interfaces.queue import IQueue
+from lws.providers._shared.delivery_scheduler import DeliveryScheduler
+from lws.providers.sns.provider import SnsProvider, TopicConfig
+
+_TOPIC = "orders"
+_TOPIC_ARN = "arn:aws:sns:us-east-1:000000000000:orders"
+_QUEUE = "order-queue"
+
+
+class TestSnsDeliveryBatching:
+    async def test_burst_to_sqs_subscriber_is_sent_as_batches(self) -> None:
+        # Arrange
+        delivery = DeliveryScheduler()
+        provider = SnsProvider(
+            topics=[TopicConfig(topic_name=_TOPIC, topic_arn=_TOPIC_ARN)], scheduler=delivery
+        )
+        queue = AsyncMock(spec=IQueue)
+        provider.set_queue_provider(queue)
+        await provider.start()
+        await provider.subscribe(_TOPIC, "sqs", f"arn:aws:sqs:us-east-1:000000000000:{_QUEUE}")
+        expected_messages = [f"message-{i}" for i in range(12)]
+
+        # Act
+        for message in expected_messages:
+            await provider.publish(_TOPIC, message)
+        await delivery.join()
+        await provider.stop()
+
+        # Assert
+        batch_calls = queue.send_message_batch.call_args_list
+        actual_sizes = [len(call.args[1]) for call in batch_calls]
+        actual_messages = [
+            json.loads(body)["Message"] for call in batch_calls for body in call.args[1]
+        ]
+        assert actual_sizes == [10, 2]
+        assert {call.args[0] for call in batch_calls} == {_QUEUE}
+        assert actual_messages == expected_messages
+
+    async def test_shared_scheduler_is_left_running_on_stop(self) -> None:
+        # Arrange
+        delivery = DeliveryScheduler()
+        await delivery.start()
+        provider = SnsProvider(scheduler=delivery)
+        await provider.start()
+
+        # Act
+        await provider.stop()
+        actual = await delivery.health_check()
+
+        # Assert
+        assert actual is True
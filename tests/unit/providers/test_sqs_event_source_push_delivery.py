@@ -0,0 +1,192 @@
+"""Tests for long-polling SQS event-source delivery to Lambda."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from lws.interfaces.compute import ICompute, InvocationResult
+from lws.providers.sqs.event_source import EventSourceMapping, SqsEventSourcePoller
+from lws.providers.sqs.provider import QueueConfig, SqsProvider
+
+_QUEUE = "jobs"
+_FUNCTION = "worker"
+
+
+def _result(payload: dict | None = None) -> InvocationResult:
+    return InvocationResult(payload=payload, error=None, duration_ms=1.0, request_id="r1")
+
+
+def _poller(queue_provider, compute, **mapping_kwargs) -> SqsEventSourcePoller:
+    mapping = EventSourceMapping(queue_name=_QUEUE, function_name=_FUNCTION, **mapping_kwargs)
+    return SqsEventSourcePoller(
+        queue_provider=queue_provider,
+        compute_providers={_FUNCTION: compute},
+        mappings=[mapping],
+        poll_interval=5.0,
+    )
+
+
+def _bodies(call) -> list[str]:
+    return [record["body"] for record in call.args[0]["Records"]]
+
+
+@pytest.fixture()
+async def queue_provider():
+    p = SqsProvider(queues=[QueueConfig(queue_name=_QUEUE, visibility_timeout=30)])
+    await p.start()
+    yield p
+    await p.stop()
+
+
+class TestEventSourcePushDelivery:
+    async def test_message_after_quiet_period_is_delivered_promptly(self, queue_provider):
+        # Arrange
+        compute = AsyncMock(spec=ICompute)
+        compute.invoke.return_value = _result()
+        poller = _poller(queue_provider, compute)
+        await poller.start()
+        await asyncio.sleep(0.2)
+        expected_bodies = ["wake-up"]
+
+        # Act
+        await queue_provider.send_message(_QUEUE, "wake-up")
+        await asyncio.sleep(0.1)
+        await poller.stop()
+
+        # Assert
+        actual_bodies = _bodies(compute.invoke.await_args)
+        assert actual_bodies == expected_bodies
+
+    async def test_batching_window_collects_later_messages(self, queue_provider):
+        # Arrange
+        compute = AsyncMock(spec=ICompute)
+        compute.invoke.return_value = _result()
+        poller = _poller(queue_provider, compute, batch_size=3, maximum_batching_window=2)
+        await poller.start()
+        expected_bodies = ["m0", "m1", "m2"]
+
+        # Act
+        for body in expected_bodies:
+            await queue_provider.send_message(_QUEUE, body)
+            await asyncio.sleep(0.05)
+        await asyncio.sleep(0.1)
+        await poller.stop()
+
+        # Assert
+        compute.invoke.assert_awaited_once()
+        actual_bodies = _bodies(compute.invoke.await_args)
+        assert actual_bodies == expected_bodies
+
+    async def test_batching_window_long_polls_without_overshooting(self, queue_provider):
+        # Arrange
+        compute = AsyncMock(spec=ICompute)
+        compute.invoke.return_value = _result()
+        queue_provider.receive_messages = AsyncMock(wraps=queue_provider.receive_messages)
+        poller = _poller(queue_provider, compute, batch_size=3, maximum_batching_window=1)
+        await poller.start()
+        expected_fill_wait = 1
+
+        # Act
+        await queue_provider.send_message(_QUEUE, "m0")
+        await asyncio.sleep(1.2)
+        await poller.stop()
+
+        # Assert
+        compute.invoke.assert_awaited_once()
+        actual_fill_wait = queue_provider.receive_messages.await_args_list[1].kwargs[
+            "wait_time_seconds"
+        ]
+        assert actual_fill_wait == expected_fill_wait
+        assert _bodies(compute.invoke.await_args) == ["m0"]
+
+    async def test_maximum_concurrency_runs_invocations_in_parallel(self, queue_provider):
+        # Arrange
+        expected_peak = 3
+        running = 0
+        peak = 0
+
+        async def slow_invoke(_event, _context):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.1)
+            running -= 1
+            return _result()
+
+        compute = AsyncMock(spec=ICompute)
+        compute.invoke.side_effect = slow_invoke
+        poller = _poller(queue_provider, compute, batch_size=1, maximum_concurrency=3)
+        await poller.start()
+
+        # Act
+        for idx in range(3):
+            await queue_provider.send_message(_QUEUE, f"m{idx}")
+        await asyncio.sleep(0.05)
+        actual_peak = peak
+        await poller.stop()
+
+        # Assert
+        assert actual_peak == expected_peak
+
+    async def test_reported_item_failures_stay_in_queue(self, queue_provider):
+        # Arrange
+        failed_id = await queue_provider.send_message(_QUEUE, "bad")
+        await queue_provider.send_message(_QUEUE, "good")
+        compute = AsyncMock(spec=ICompute)
+        compute.invoke.return_value = _result(
+            {"batchItemFailures": [{"itemIdentifier": failed_id}]}
+        )
+        poller = _poller(queue_provider, compute, report_batch_item_failures=True)
+        expected_remaining = 1
+
+        # Act
+        await poller.start()
+        await asyncio.sleep(0.1)
+        await poller.stop()
+
+        # Assert
+        queue = queue_provider.get_queue(_QUEUE)
+        actual_remaining = queue.message_count
+        assert actual_remaining == expected_remaining
+        assert queue.messages[0].message_id == failed_id
+
+    async def test_unknown_failure_identifier_fails_whole_batch(self, queue_provider):
+        # Arrange
+        await queue_provider.send_message(_QUEUE, "a")
+        await queue_provider.send_message(_QUEUE, "b")
+        compute = AsyncMock(spec=ICompute)
+        compute.invoke.return_value = _result({"batchItemFailures": [{"itemIdentifier": "nope"}]})
+        poller = _poller(queue_provider, compute, report_batch_item_failures=True)
+        expected_remaining = 2
+
+        # Act
+        await poller.start()
+        await asyncio.sleep(0.1)
+        await poller.stop()
+
+        # Assert
+        actual_remaining = queue_provider.get_queue(_QUEUE).message_count
+        assert actual_remaining == expected_remaining
+
+    async def test_successful_batch_is_deleted_in_one_call(self, queue_provider):
+        # Arrange
+        for idx in range(4):
+            await queue_provider.send_message(_QUEUE, f"m{idx}")
+        queue_provider.delete_message_batch = AsyncMock(wraps=queue_provider.delete_message_batch)
+        compute = AsyncMock(spec=ICompute)
+        compute.invoke.return_value = _result()
+        poller = _poller(queue_provider, compute)
+        expected_remaining = 0
+
+        # Act
+        await poller.start()
+        await asyncio.sleep(0.1)
+        await poller.stop()
+
+        # Assert
+        queue_provider.delete_message_batch.assert_awaited_once()
+        actual_remaining = queue_provider.get_queue(_QUEUE).message_count
+        assert actual_remaining == expected_remaining
@@ -0,0 +1,189 @@
+"""Tests for durable SQS queues backed by an append-only log and snapshots."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from lws.providers.sqs import persistence
+from lws.providers.sqs.persistence import COMPACT_AFTER_RECORDS, QueueJournal
+from lws.providers.sqs.provider import QueueConfig, SqsProvider
+
+
+async def _start(tmp_path: Path, **kwargs) -> SqsProvider:
+    p = SqsProvider(queues=[QueueConfig(queue_name="jobs")], data_dir=tmp_path, **kwargs)
+    await p.start()
+    return p
+
+
+class TestQueueJournal:
+    async def test_messages_survive_restart(self, tmp_path: Path) -> None:
+        # Arrange
+        p = await _start(tmp_path)
+        for body in ["a", "b", "c"]:
+            await p.send_message("jobs", body)
+        await p.stop()
+        expected_bodies = ["a", "b", "c"]
+
+        # Act
+        p = await _start(tmp_path)
+        received = await p.receive_messages("jobs", max_messages=10)
+        await p.stop()
+
+        # Assert
+        actual_bodies = [m["Body"] for m in received]
+        assert actual_bodies == expected_bodies
+
+    async def test_deleted_messages_stay_deleted(self, tmp_path: Path) -> None:
+        # Arrange
+        p = await _start(tmp_path)
+        await p.send_message("jobs", "done")
+        await p.send_message("jobs", "pending")
+        received = await p.receive_messages("jobs", max_messages=1)
+        await p.delete_message("jobs", received[0]["ReceiptHandle"])
+        await p.stop()
+        expected_bodies = ["pending"]
+
+        # Act
+        p = await _start(tmp_path)
+        restored = await p.receive_messages("jobs", max_messages=10)
+        await p.stop()
+
+        # Assert
+        actual_bodies = [m["Body"] for m in restored]
+        assert actual_bodies == expected_bodies
+
+    async def test_in_flight_message_keeps_receive_count(self, tmp_path: Path) -> None:
+        # Arrange
+        p = await _start(tmp_path)
+        await p.send_message("jobs", "retry-me")
+        await p.receive_messages("jobs", max_messages=1)
+        await p.stop()
+        expected_count = "2"
+
+        # Act
+        p = await _start(tmp_path)
+        restored = await p.receive_messages("jobs", max_messages=1)
+        await p.stop()
+
+        # Assert
+        actual_count = restored[0]["Attributes"]["ApproximateReceiveCount"]
+        assert actual_count == expected_count
+
+    async def test_compaction_truncates_log_and_keeps_state(self, tmp_path: Path) -> None:
+        # Arrange
+        p = await _start(tmp_path, compact_after_records=1)
+        await p.send_message("jobs", "kept")
+        expected_bodies = ["kept"]
+
+        # Act
+        await p.flush()
+        await p.stop()
+
+        # Assert
+        assert (tmp_path / "sqs" / "jobs.log").stat().st_size == 0
+        p = await _start(tmp_path)
+        restored = await p.receive_messages("jobs", max_messages=10)
+        await p.stop()
+        actual_bodies = [m["Body"] for m in restored]
+        assert actual_bodies == expected_bodies
+
+    async def test_torn_final_log_line_is_ignored(self, tmp_path: Path) -> None:
+        # Arrange
+        p = await _start(tmp_path)
+        await p.send_message("jobs", "whole")
+        await p.stop()
+        with (tmp_path / "sqs" / "jobs.log").open("a", encoding="utf-8") as log:
+            log.write('{"op": "add", "mess')
+        expected_bodies = ["whole"]
+
+        # Act
+        actual_messages = QueueJournal(tmp_path / "sqs", "jobs").replay()
+
+        # Assert
+        actual_bodies = [m.body for m in actual_messages]
+        assert actual_bodies == expected_bodies
+
+    async def test_delete_queue_removes_files(self, tmp_path: Path) -> None:
+        # Arrange
+        p = await _start(tmp_path)
+        await p.send_message("jobs", "gone")
+        await p.flush()
+
+        # Act
+        await p.delete_queue("jobs")
+        await p.stop()
+
+        # Assert
+        actual_files = list((tmp_path / "sqs").iterdir())
+        assert actual_files == []
+
+    async def test_in_memory_provider_writes_nothing(self, tmp_path: Path) -> None:
+        # Arrange
+        p = SqsProvider(queues=[QueueConfig(queue_name="jobs")])
+        await p.start()
+
+        # Act
+        await p.send_message("jobs", "ephemeral")
+        await p.flush()
+        await p.stop()
+
+        # Assert
+        assert not (tmp_path / "sqs").exists()
+
+    @pytest.mark.parametrize("compact_after_records", [COMPACT_AFTER_RECORDS, 1])
+    async def test_fifo_dedup_survives_restart(
+        self, tmp_path: Path, compact_after_records: int
+    ) -> None:
+        # Arrange
+        config = QueueConfig(queue_name="jobs.fifo", is_fifo=True, content_based_dedup=True)
+        p = SqsProvider(
+            queues=[config], data_dir=tmp_path, compact_after_records=compact_after_records
+        )
+        await p.start()
+        expected_id = await p.send_message("jobs.fifo", "once")
+        await p.flush()
+        await p.stop()
+        expected_count = 1
+
+        # Act
+        p = SqsProvider(queues=[config], data_dir=tmp_path)
+        await p.start()
+        actual_id = await p.send_message("jobs.fifo", "once")
+        received = await p.receive_messages("jobs.fifo", max_messages=10)
+        await p.stop()
+
+        # Assert
+        assert actual_id == expected_id
+        actual_count = len(received)
+        assert actual_count == expected_count
+
+    async def test_remove_waits_for_in_progress_flush(self, tmp_path: Path) -> None:
+        # Arrange
+        journal = QueueJournal(tmp_path / "sqs", "jobs")
+        journal.append(("purge",))
+        release = threading.Event()
+        original_append = persistence._append_durably  # pylint: disable=protected-access
+
+        def blocking_append(path: Path, text: str) -> None:
+            release.wait()
+            original_append(path, text)
+
+        with mock.patch.object(persistence, "_append_durably", blocking_append):
+            flush = asyncio.create_task(journal.flush())
+            await asyncio.sleep(0.05)
+
+            # Act
+            remove = asyncio.create_task(journal.remove())
+            await asyncio.sleep(0.05)
+            removed_early = remove.done()
+            release.set()
+            await asyncio.gather(flush, remove)
+
+        # Assert
+        assert removed_early is False
+        assert not (tmp_path / "sqs" / "jobs.log").exists()
@@ -0,0 +1,133 @@
+"""Tests for the indexed receive, delete, and visibility paths of LocalQueue."""
+
+from __future__ import annotations
+
+import asyncio
+
+from lws.providers.sqs.queue import LocalQueue
+
+
+class TestLocalQueueIndex:
+    async def test_fifo_batch_merges_groups_in_send_order(self) -> None:
+        # Arrange
+        queue = LocalQueue(queue_name="orders.fifo", is_fifo=True)
+        for body, group in [("a1", "a"), ("b1", "b"), ("a2", "a"), ("b2", "b")]:
+            await queue.send_message(body, message_group_id=group)
+        expected_bodies = ["a1", "b1", "a2", "b2"]
+
+        # Act
+        received = await queue.receive_messages(max_messages=10)
+
+        # Assert
+        actual_bodies = [m.body for m in received]
+        assert actual_bodies == expected_bodies
+
+    async def test_fifo_group_blocked_while_in_flight(self) -> None:
+        # Arrange
+        queue = LocalQueue(queue_name="orders.fifo", is_fifo=True)
+        await queue.send_message("a1", message_group_id="a")
+        await queue.send_message("a2", message_group_id="a")
+        await queue.send_message("b1", message_group_id="b")
+        await queue.receive_messages(max_messages=1)
+        expected_bodies = ["b1"]
+
+        # Act
+        received = await queue.receive_messages(max_messages=10)
+
+        # Assert
+        actual_bodies = [m.body for m in received]
+        assert actual_bodies == expected_bodies
+
+    async def test_group_unblocks_when_in_flight_message_deleted(self) -> None:
+        # Arrange
+        queue = LocalQueue(queue_name="orders.fifo", is_fifo=True)
+        await queue.send_message("a1", message_group_id="a")
+        await queue.send_message("a2", message_group_id="a")
+        first = await queue.receive_messages(max_messages=1)
+        await queue.delete_message(first[0].receipt_handle)
+        expected_bodies = ["a2"]
+
+        # Act
+        received = await queue.receive_messages(max_messages=10)
+
+        # Assert
+        actual_bodies = [m.body for m in received]
+        assert actual_bodies == expected_bodies
+
+    async def test_redelivered_message_keeps_its_place(self) -> None:
+        # Arrange
+        queue = LocalQueue(queue_name="jobs")
+        await queue.send_message("first")
+        received = await queue.receive_messages(max_messages=1)
+        await queue.send_message("second")
+        await queue.change_message_visibility(received[0].receipt_handle, 0)
+        expected_bodies = ["first", "second"]
+
+        # Act
+        redelivered = await queue.receive_messages(max_messages=10)
+
+        # Assert
+        actual_bodies = [m.body for m in redelivered]
+        assert actual_bodies == expected_bodies
+
+    async def test_change_visibility_with_unknown_receipt_returns_false(self) -> None:
+        # Arrange
+        queue = LocalQueue(queue_name="jobs")
+        await queue.send_message("hello")
+
+        # Act
+        actual = await queue.change_message_visibility("not-a-receipt", 0)
+
+        # Assert
+        assert actual is False
+
+    async def test_old_receipt_handle_stops_working_after_redelivery(self) -> None:
+        # Arrange
+        queue = LocalQueue(queue_name="jobs", visibility_timeout=0)
+        await queue.send_message("hello")
+        first = await queue.receive_messages(max_messages=1)
+        old_receipt = first[0].receipt_handle
+        await asyncio.sleep(0.01)
+        await queue.receive_messages(max_messages=1)
+        expected_count = 1
+
+        # Act
+        await queue.delete_message(old_receipt)
+
+        # Assert
+        actual_count = queue.message_count
+        assert actual_count == expected_count
+
+    async def test_dead_lettered_message_is_receivable_from_dlq(self) -> None:
+        # Arrange
+        dlq = LocalQueue(queue_name="jobs-dlq")
+        queue = LocalQueue(
+            queue_name="jobs", visibility_timeout=0, dead_letter_queue=dlq, max_receive_count=1
+        )
+        await queue.send_message("poison")
+        await queue.receive_messages(max_messages=1)
+        await asyncio.sleep(0.01)
+        await queue.receive_messages(max_messages=1)
+        expected_body = "poison"
+
+        # Act
+        received = await dlq.receive_messages(max_messages=1)
+
+        # Assert
+        actual_body = received[0].body
+        assert actual_body == expected_body
+        assert queue.message_count == 0
+
+    async def test_purge_empties_every_index(self) -> None:
+        # Arrange
+        queue = LocalQueue(queue_name="jobs")
+        for idx in range(5):
+            await queue.send_message(f"m{idx}", delay_seconds=idx)
+
+        # Act
+        await queue.purge()
+
+        # Assert
+        assert queue.message_count == 0
+        assert queue.messages == []
+        assert await queue.receive_messages(max_messages=10) == []
@@ -0,0 +1,47 @@
+"""Tests for batched sends on LocalQueue and SqsProvider."""
+
+from __future__ import annotations
+
+from lws.providers.sqs.provider import QueueConfig, SqsProvider
+from lws.providers.sqs.queue import LocalQueue
+
+
+class TestLocalQueueSendMessages:
+    async def test_batch_is_received_in_send_order(self) -> None:
+        # Arrange
+        queue = LocalQueue(queue_name="orders")
+        expected_bodies = ["a", "b", "c"]
+
+        # Act
+        message_ids = await queue.send_messages(expected_bodies)
+        received = await queue.receive_messages(max_messages=10)
+
+        # Assert
+        assert [m.body for m in received] == expected_bodies
+        assert [m.message_id for m in received] == message_ids
+
+    async def test_content_dedup_applies_within_batch(self) -> None:
+        # Arrange
+        queue = LocalQueue(queue_name="orders.fifo", is_fifo=True, content_based_dedup=True)
+        expected_count = 1
+
+        # Act
+        first_id, second_id = await queue.send_messages(["same", "same"])
+
+        # Assert
+        assert first_id == second_id
+        assert queue.message_count == expected_count
+
+    async def test_provider_send_message_batch_targets_named_queue(self) -> None:
+        # Arrange
+        provider = SqsProvider(queues=[QueueConfig(queue_name="orders")])
+        await provider.start()
+        expected_bodies = ["x", "y"]
+
+        # Act
+        await provider.send_message_batch("orders", expected_bodies)
+        received = await provider.receive_messages("orders", max_messages=10)
+        await provider.stop()
+
+        # Assert
+        assert [m["Body"] for m in received] == expected_bodies
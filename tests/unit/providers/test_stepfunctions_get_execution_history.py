@@ -193,3 +193,75 @@ class TestGetExecutionHistory:
         events = data["events"]
         actual_last_event_type = events[-1]["type"]
         assert actual_last_event_type == expected_last_event_type
+
+    async def test_get_execution_history_pages_with_next_token(
+        self, client: httpx.AsyncClient
+    ) -> None:
+        """GetExecutionHistory should return a nextToken that resumes the listing."""
+        # Arrange
+        expected_types = ["ExecutionStarted", "StateEntered", "ExecutionSucceeded"]
+        start_resp = await _request(
+            client,
+            "StartSyncExecution",
+            {
+                "stateMachineArn": "arn:aws:states:us-east-1:000:stateMachine:test-express",
+                "input": "{}",
+            },
+        )
+        arn = start_resp.json()["executionArn"]
+
+        # Act
+        first = (
+            await _request(client, "GetExecutionHistory", {"executionArn": arn, "maxResults": 2})
+        ).json()
+        second = (
+            await _request(
+                client,
+                "GetExecutionHistory",
+                {"executionArn": arn, "maxResults": 2, "nextToken": first["nextToken"]},
+            )
+        ).json()
+
+        # Assert
+        actual_types = [e["type"] for e in first["events"] + second["events"]]
+        assert actual_types == expected_types
+        assert "nextToken" not in second
+
+    async def test_list_executions_pages_with_next_token(self, client: httpx.AsyncClient) -> None:
+        """ListExecutions should page newest first with maxResults and nextToken."""
+        # Arrange
+        sm_arn = "arn:aws:states:us-east-1:000:stateMachine:test-express"
+        started = []
+        for _ in range(3):
+            resp = await _request(client, "StartSyncExecution", {"stateMachineArn": sm_arn})
+            started.append(resp.json()["executionArn"])
+
+        # Act
+        first = (
+            await _request(client, "ListExecutions", {"stateMachineArn": sm_arn, "maxResults": 2})
+        ).json()
+        second = (
+            await _request(
+                client,
+                "ListExecutions",
+                {"stateMachineArn": sm_arn, "maxResults": 2, "nextToken": first["nextToken"]},
+            )
+        ).json()
+
+        # Assert
+        actual = [e["executionArn"] for e in first["executions"] + second["executions"]]
+        assert sorted(actual) == sorted(started)
+        assert len(first["executions"]) == 2
+        assert "nextToken" not in second
+
+    async def test_list_executions_rejects_malformed_token(self, client: httpx.AsyncClient) -> None:
+        """ListExecutions with a malformed nextToken should return InvalidToken."""
+        # Arrange
+        expected_error_type = "InvalidToken"
+
+        # Act
+        resp = await _request(client, "ListExecutions", {"nextToken": "garbage"})
+
+        # Assert
+        assert resp.status_code == 400
+        assert resp.json()["__type"] == expected_error_type
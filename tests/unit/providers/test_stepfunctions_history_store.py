@@ -0,0 +1,165 @@
+"""Tests for the bounded Step Functions execution history store."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from lws.providers.stepfunctions.engine import (
+    ExecutionHistory,
+    ExecutionStatus,
+    StateTransition,
+)
+from lws.providers.stepfunctions.history_store import (
+    ExecutionStore,
+    HistoryConfig,
+    TruncatedPayload,
+    payload_json,
+)
+
+
+def _history(
+    name: str,
+    start_time: float,
+    *,
+    state_machine: str = "sm",
+    status: ExecutionStatus = ExecutionStatus.SUCCEEDED,
+    payload: object = None,
+) -> ExecutionHistory:
+    return ExecutionHistory(
+        execution_arn=f"arn:aws:states:us-east-1:000000000000:execution:{state_machine}:{name}",
+        state_machine_name=state_machine,
+        status=status,
+        start_time=start_time,
+        end_time=start_time + 1,
+        input_data=payload,
+        output_data=payload,
+        transitions=[StateTransition("Pass", "Pass", start_time, payload, payload)],
+    )
+
+
+def _names(executions: list[ExecutionHistory]) -> list[str]:
+    return [h.execution_arn.rsplit(":", 1)[-1] for h in executions]
+
+
+class TestStepFunctionsHistoryStore:
+    def test_completed_execution_round_trips(self) -> None:
+        # Arrange
+        store = ExecutionStore()
+        expected = _history("a", 10.0, payload={"k": [1, 2]})
+
+        # Act
+        store.put(expected)
+        actual = store.get(expected.execution_arn)
+
+        # Assert
+        assert actual == expected
+
+    def test_oversized_payload_is_truncated(self) -> None:
+        # Arrange
+        store = ExecutionStore(HistoryConfig(max_payload_bytes=32))
+        history = _history("big", 1.0, payload={"data": "x" * 100})
+
+        # Act
+        store.put(history)
+        actual = store.get(history.execution_arn)
+
+        # Assert
+        assert isinstance(actual.output_data, TruncatedPayload)
+        assert len(payload_json(actual.output_data)) == 32
+        assert isinstance(actual.transitions[0].input_data, TruncatedPayload)
+
+    def test_count_retention_evicts_oldest(self) -> None:
+        # Arrange
+        store = ExecutionStore(HistoryConfig(max_executions=2))
+
+        # Act
+        for i, name in enumerate(["a", "b", "c"]):
+            store.put(_history(name, float(i)))
+
+        # Assert
+        assert _names(store.list_page().executions) == ["c", "b"]
+        assert store.metrics()["evicted"] == 1
+
+    def test_age_retention_evicts_expired(self) -> None:
+        # Arrange
+        now = [100.0]
+        store = ExecutionStore(HistoryConfig(max_age_s=10), clock=lambda: now[0])
+        store.put(_history("old", 1.0))
+        now[0] = 120.0
+
+        # Act
+        store.put(_history("new", 2.0))
+
+        # Assert
+        assert _names(store.list_page().executions) == ["new"]
+
+    def test_byte_retention_evicts_until_under_budget(self) -> None:
+        # Arrange
+        store = ExecutionStore(HistoryConfig(max_bytes=400))
+
+        # Act
+        for i in range(5):
+            store.put(_history(f"e{i}", float(i), payload={"data": "x" * 50}))
+
+        # Assert
+        actual = store.metrics()
+        assert actual["bytes"] <= 400
+        assert actual["completed"] < 5
+        assert store.get(_history("e4", 4.0).execution_arn) is not None
+
+    def test_list_page_paginates_newest_first(self) -> None:
+        # Arrange
+        store = ExecutionStore()
+        for i in range(5):
+            store.put(_history(f"e{i}", float(i)))
+        store.put(_history("run", 2.5, status=ExecutionStatus.RUNNING))
+
+        # Act
+        first = store.list_page(max_results=3)
+        second = store.list_page(max_results=3, next_token=first.next_token)
+
+        # Assert
+        assert _names(first.executions) == ["e4", "e3", "run"]
+        assert _names(second.executions) == ["e2", "e1", "e0"]
+        assert second.next_token is None
+
+    def test_list_page_filters_by_machine_and_status(self) -> None:
+        # Arrange
+        store = ExecutionStore()
+        store.put(_history("a", 1.0, state_machine="one"))
+        store.put(_history("b", 2.0, state_machine="two"))
+        store.put(_history("c", 3.0, state_machine="two", status=ExecutionStatus.FAILED))
+
+        # Act
+        actual = store.list_page("two", status="SUCCEEDED")
+
+        # Assert
+        assert _names(actual.executions) == ["b"]
+
+    def test_malformed_token_raises_value_error(self) -> None:
+        # Arrange
+        store = ExecutionStore()
+
+        # Act
+        with pytest.raises(ValueError, match="Invalid token") as exc_info:
+            store.list_page(next_token="not-a-token")
+
+        # Assert
+        assert exc_info.type is ValueError
+
+    def test_spill_file_is_removed_on_clear(self, tmp_path: Path) -> None:
+        # Arrange
+        path = tmp_path / "stepfunctions" / "history.sqlite"
+        store = ExecutionStore(HistoryConfig(spill_path=path))
+        store.put(_history("a", 1.0))
+        created = path.exists()
+
+        # Act
+        store.clear()
+
+        # Assert
+        assert created is True
+        assert path.exists() is False
+        assert store.metrics()["completed"] == 0
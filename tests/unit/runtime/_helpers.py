@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 from lws.interfaces.provider import Provider, ProviderStatus
 
 
@@ -31,3 +33,25 @@ class FakeProvider(Provider):
 
     async def health_check(self) -> bool:
         return self._status is ProviderStatus.RUNNING
+
+
+class SlowProvider(FakeProvider):
+    """FakeProvider whose start and stop take *delay* seconds."""
+
+    def __init__(self, provider_name: str, delay: float, events: list[str]) -> None:
+        super().__init__(provider_name)
+        self._delay = delay
+        self._events = events
+        self.start_calls = 0
+
+    async def start(self) -> None:
+        self.start_calls += 1
+        self._events.append(f"start:{self.name}")
+        await asyncio.sleep(self._delay)
+        await super().start()
+        self._events.append(f"started:{self.name}")
+
+    async def stop(self) -> None:
+        self._events.append(f"stop:{self.name}")
+        await asyncio.sleep(self._delay)
+        await super().stop()
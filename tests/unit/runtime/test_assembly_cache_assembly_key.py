@@ -0,0 +1,83 @@
+"""Unit tests for the cloud-assembly snapshot key."""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from lws.parser import assembly as assembly_module
+from lws.runtime import assembly_cache
+from lws.runtime.assembly_cache import assembly_key
+
+
+@pytest.fixture(autouse=True)
+def _fresh_fingerprint():
+    assembly_cache._code_fingerprint.cache_clear()
+    yield
+    assembly_cache._code_fingerprint.cache_clear()
+
+
+def _write_manifest(cdk_out: Path) -> None:
+    (cdk_out / "manifest.json").write_text(json.dumps({"artifacts": {}}))
+
+
+class TestAssemblyKey:
+    def test_missing_manifest_has_no_key(self, tmp_path: Path) -> None:
+        # Act
+        actual = assembly_key(tmp_path)
+
+        # Assert
+        assert actual is None
+
+    def test_key_follows_template_content(self, tmp_path: Path) -> None:
+        # Arrange
+        manifest = {
+            "artifacts": {
+                "MyStack": {
+                    "type": "aws:cloudformation:stack",
+                    "properties": {"templateFile": "MyStack.template.json"},
+                },
+            },
+        }
+        (tmp_path / "manifest.json").write_text(json.dumps(manifest))
+        template = tmp_path / "MyStack.template.json"
+        template.write_text('{"Resources": {}}')
+        before = assembly_key(tmp_path)
+
+        # Act
+        template.write_text('{"Resources": {"Q": {"Type": "AWS::SQS::Queue"}}}')
+        actual = assembly_key(tmp_path)
+
+        # Assert
+        assert actual != before
+
+    def test_key_follows_installed_version(self, tmp_path: Path) -> None:
+        # Arrange
+        _write_manifest(tmp_path)
+        before = assembly_key(tmp_path)
+        assembly_cache._code_fingerprint.cache_clear()
+
+        # Act
+        with patch("importlib.metadata.version", return_value="999.0.0"):
+            actual = assembly_key(tmp_path)
+
+        # Assert
+        assert actual != before
+
+    def test_key_follows_model_fields(self, tmp_path: Path, monkeypatch) -> None:
+        # Arrange
+        _write_manifest(tmp_path)
+        before = assembly_key(tmp_path)
+        assembly_cache._code_fingerprint.cache_clear()
+        changed = dataclasses.make_dataclass("SqsQueue", [("queue_name", str), ("extra", int)])
+
+        # Act
+        monkeypatch.setattr(assembly_module, "SqsQueue", changed)
+        actual = assembly_key(tmp_path)
+
+        # Assert
+        assert actual != before
@@ -0,0 +1,90 @@
+"""Unit tests for the content-hash keyed cloud-assembly snapshot."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from lws.runtime.assembly_cache import load_app
+
+
+def _write_json(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def _table_template(table_name: str) -> dict:
+    return {
+        "Resources": {
+            "MyTable": {
+                "Type": "AWS::DynamoDB::Table",
+                "Properties": {
+                    "TableName": table_name,
+                    "KeySchema": [{"AttributeName": "pk", "KeyType": "HASH"}],
+                },
+            },
+        },
+    }
+
+
+def _make_cdk_out(cdk_out: Path, table_name: str = "orders") -> None:
+    _write_json(cdk_out / "MyStack.template.json", _table_template(table_name))
+    _write_json(
+        cdk_out / "manifest.json",
+        {
+            "version": "21.0.0",
+            "artifacts": {
+                "MyStack": {
+                    "type": "aws:cloudformation:stack",
+                    "properties": {"templateFile": "MyStack.template.json"},
+                },
+            },
+        },
+    )
+
+
+class TestLoadApp:
+    def test_unchanged_assembly_is_loaded_from_the_snapshot(self, tmp_path: Path) -> None:
+        # Arrange
+        cdk_out = tmp_path / "cdk.out"
+        cache_dir = tmp_path / "cache"
+        _make_cdk_out(cdk_out)
+        load_app(cdk_out, cache_dir)
+
+        # Act
+        with patch("lws.runtime.assembly_cache.parse_assembly") as parse:
+            actual_model, actual_graph = load_app(cdk_out, cache_dir)
+
+        # Assert
+        parse.assert_not_called()
+        assert [t.table_name for t in actual_model.tables] == ["orders"]
+        assert "orders" in actual_graph.nodes
+
+    def test_changed_template_is_parsed_again(self, tmp_path: Path) -> None:
+        # Arrange
+        cdk_out = tmp_path / "cdk.out"
+        cache_dir = tmp_path / "cache"
+        _make_cdk_out(cdk_out)
+        load_app(cdk_out, cache_dir)
+        _write_json(cdk_out / "MyStack.template.json", _table_template("invoices"))
+
+        # Act
+        actual_model, _graph = load_app(cdk_out, cache_dir)
+
+        # Assert
+        assert [t.table_name for t in actual_model.tables] == ["invoices"]
+
+    def test_corrupt_snapshot_is_ignored(self, tmp_path: Path) -> None:
+        # Arrange
+        cdk_out = tmp_path / "cdk.out"
+        cache_dir = tmp_path / "cache"
+        _make_cdk_out(cdk_out)
+        cache_dir.mkdir()
+        (cache_dir / "assembly.pickle").write_bytes(b"not a pickle")
+
+        # Act
+        actual_model, _graph = load_app(cdk_out, cache_dir)
+
+        # Assert
+        assert [t.table_name for t in actual_model.tables] == ["orders"]
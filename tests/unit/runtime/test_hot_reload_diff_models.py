@@ -0,0 +1,79 @@
+"""Unit tests for diffing application models on hot reload."""
+
+from __future__ import annotations
+
+from lws.graph.builder import build_graph
+from lws.parser.assembly import AppModel, DynamoTable, LambdaFunction, SqsQueue
+from lws.runtime.hot_reload import affected_nodes, dependent_function_changes, diff_models
+
+
+def _function(name: str, timeout: int = 30, table: str = "Orders") -> LambdaFunction:
+    return LambdaFunction(
+        name=name,
+        handler="index.handler",
+        runtime="python3.12",
+        timeout=timeout,
+        environment={"TABLE_NAME": table},
+    )
+
+
+class TestHotReloadDiffModels:
+    def test_reports_added_removed_and_updated_resources(self) -> None:
+        # Arrange
+        old = AppModel(functions=[_function("Api"), _function("Worker")], queues=[SqsQueue("a")])
+        new = AppModel(
+            functions=[_function("Api", timeout=60)], queues=[SqsQueue("a"), SqsQueue("b")]
+        )
+        expected_labels = ["ADD queue b", "UPDATE function Api", "REMOVE function Worker"]
+
+        # Act
+        actual = diff_models(old, new)
+
+        # Assert
+        assert [c.label for c in actual] == expected_labels
+        assert actual[1].old.timeout == 30
+        assert actual[1].new.timeout == 60
+
+    def test_identical_models_have_no_changes(self) -> None:
+        # Arrange
+        old = AppModel(functions=[_function("Api")], tables=[DynamoTable("Orders")])
+        new = AppModel(functions=[_function("Api")], tables=[DynamoTable("Orders")])
+
+        # Act
+        actual = diff_models(old, new)
+
+        # Assert
+        assert actual == []
+
+    def test_functions_reading_a_changed_table_are_restarted(self) -> None:
+        # Arrange
+        old = AppModel(
+            functions=[_function("Reader"), _function("Other", table="Users")],
+            tables=[DynamoTable("Orders"), DynamoTable("Users")],
+        )
+        new = AppModel(
+            functions=old.functions,
+            tables=[
+                DynamoTable("Orders", key_schema=[{"attribute_name": "id"}]),
+                DynamoTable("Users"),
+            ],
+        )
+        changes = diff_models(old, new)
+
+        # Act
+        actual = dependent_function_changes(build_graph(old), new, changes)
+
+        # Assert
+        assert [c.label for c in actual] == ["UPDATE function Reader"]
+
+    def test_affected_nodes_follow_graph_node_ids(self) -> None:
+        # Arrange
+        old = AppModel(functions=[_function("Api")], tables=[DynamoTable("Orders")])
+        new = AppModel(functions=[_function("Api", timeout=5)], tables=[DynamoTable("Orders")])
+        expected_nodes = ["Api"]
+
+        # Act
+        actual = affected_nodes(build_graph(new), diff_models(old, new))
+
+        # Assert
+        assert actual == expected_nodes
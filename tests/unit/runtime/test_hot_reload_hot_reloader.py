@@ -0,0 +1,107 @@
+"""Unit tests for the HotReloader pipeline."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from lws.graph.builder import build_graph
+from lws.parser.assembly import AppModel, LambdaFunction, SqsQueue
+from lws.runtime.hot_reload import HotReloader, ResourceChange, RestartRequired
+
+
+def _reloader(models: list[AppModel], **kwargs) -> tuple[HotReloader, list[int]]:
+    """Return a reloader whose synth/parse steps serve *models* in turn."""
+    synths: list[int] = []
+    current = models[0]
+
+    async def synth() -> Path:
+        synths.append(len(synths))
+        return Path("cdk.out")
+
+    def parse(_path: Path) -> AppModel:
+        return models[min(len(synths), len(models) - 1)]
+
+    reloader = HotReloader(
+        current, build_graph(current), synth=synth, parse=parse, debounce_seconds=0.01, **kwargs
+    )
+    return reloader, synths
+
+
+class TestHotReloader:
+    async def test_changes_are_dispatched_to_registered_appliers(self) -> None:
+        # Arrange
+        new = AppModel(queues=[SqsQueue("jobs")])
+        reloader, _ = _reloader([AppModel(), new])
+        applied: list[ResourceChange] = []
+
+        async def apply_queue(change: ResourceChange) -> None:
+            applied.append(change)
+
+        reloader.register("queue", apply_queue)
+
+        # Act
+        actual = await reloader.reload()
+
+        # Assert
+        assert [c.label for c in applied] == ["ADD queue jobs"]
+        assert actual.applied == ["ADD queue jobs"]
+        assert actual.affected_nodes == ["jobs"]
+        assert reloader.app_model is new
+
+    async def test_unhandled_changes_need_a_restart(self) -> None:
+        # Arrange
+        fn = LambdaFunction(name="Api", handler="index.handler", runtime="python3.12")
+        reloader, _ = _reloader([AppModel(), AppModel(functions=[fn], queues=[SqsQueue("q")])])
+
+        async def apply_queue(change: ResourceChange) -> None:
+            raise RestartRequired("queue attributes changed")
+
+        reloader.register("queue", apply_queue)
+
+        # Act
+        actual = await reloader.reload()
+
+        # Assert
+        assert actual.applied == []
+        assert actual.restart_required == [
+            "ADD queue q (queue attributes changed)",
+            "ADD function Api",
+        ]
+
+    async def test_unapplied_changes_keep_the_running_model(self) -> None:
+        # Arrange
+        running_queue = SqsQueue("q")
+        new = AppModel(queues=[SqsQueue("jobs"), SqsQueue("q", is_fifo=True)])
+        reloader, _ = _reloader([AppModel(queues=[running_queue]), new, new])
+
+        async def apply_queue(change: ResourceChange) -> None:
+            if change.change_type != "ADD":
+                raise RestartRequired("queue attributes changed")
+
+        reloader.register("queue", apply_queue)
+        expected_queues = [SqsQueue("jobs"), running_queue]
+        expected_restart = ["UPDATE queue q (queue attributes changed)"]
+
+        # Act
+        await reloader.reload()
+        actual_queues = reloader.app_model.queues
+        retried = await reloader.reload()
+
+        # Assert
+        assert actual_queues == expected_queues
+        assert retried.restart_required == expected_restart
+
+    async def test_requests_during_a_reload_are_coalesced(self) -> None:
+        # Arrange
+        reloader, synths = _reloader([AppModel(), AppModel(queues=[SqsQueue("q")])])
+
+        # Act
+        for _ in range(5):
+            reloader.request()
+        await asyncio.sleep(0)
+        reloader.request()
+        await reloader.join()
+
+        # Assert
+        assert len(synths) == 1
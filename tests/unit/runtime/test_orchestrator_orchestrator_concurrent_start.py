@@ -0,0 +1,55 @@
+"""Unit tests for level-parallel provider start and stop."""
+
+from __future__ import annotations
+
+from lws.graph.builder import AppGraph, EdgeType, GraphEdge, GraphNode, NodeType
+from lws.runtime.orchestrator import Orchestrator
+
+from ._helpers import SlowProvider
+
+
+def _graph() -> AppGraph:
+    graph = AppGraph()
+    graph.add_node(GraphNode(id="Orders", node_type=NodeType.DYNAMODB_TABLE))
+    graph.add_node(GraphNode(id="Users", node_type=NodeType.DYNAMODB_TABLE))
+    graph.add_node(GraphNode(id="Api", node_type=NodeType.LAMBDA_FUNCTION))
+    graph.add_edge(GraphEdge(source="Api", target="Orders", edge_type=EdgeType.DATA_DEPENDENCY))
+    return graph
+
+
+class TestOrchestratorConcurrentStart:
+    async def test_dependencies_start_before_dependents_and_siblings_overlap(self) -> None:
+        # Arrange
+        events: list[str] = []
+        dynamo = SlowProvider("dynamo", 0.02, events)
+        api = SlowProvider("api", 0.0, events)
+        http = [SlowProvider(f"http-{i}", 0.02, events) for i in range(3)]
+        providers = {"Orders": dynamo, "Users": dynamo, "Api": api}
+        providers.update({f"__http_{i}__": p for i, p in enumerate(http)})
+        orchestrator = Orchestrator()
+
+        # Act
+        await orchestrator.start(providers, list(providers), _graph())
+        actual = orchestrator.startup_timings
+
+        # Assert
+        assert dynamo.start_calls == 1
+        assert events.index("started:dynamo") < events.index("start:api")
+        assert events[-6:-3] == ["start:http-0", "start:http-1", "start:http-2"]
+        assert actual.providers["Orders"] == actual.providers["Users"]
+        assert set(actual.providers) == set(providers)
+
+    async def test_stop_runs_levels_in_reverse(self) -> None:
+        # Arrange
+        events: list[str] = []
+        dynamo = SlowProvider("dynamo", 0.0, events)
+        api = SlowProvider("api", 0.0, events)
+        orchestrator = Orchestrator()
+        await orchestrator.start({"Orders": dynamo, "Api": api}, ["Orders", "Api"], _graph())
+
+        # Act
+        await orchestrator.stop()
+
+        # Assert
+        assert events[-2:] == ["stop:api", "stop:dynamo"]
+        assert dynamo.stopped is True
@@ -0,0 +1,49 @@
+"""Unit tests for swapping providers on a running Orchestrator."""
+
+from __future__ import annotations
+
+from lws.runtime.orchestrator import Orchestrator
+
+from ._helpers import FakeProvider
+
+
+class TestOrchestratorReplace:
+    async def test_replace_stops_old_and_starts_new_provider(self) -> None:
+        # Arrange
+        orchestrator = Orchestrator()
+        old, new = FakeProvider("old"), FakeProvider("new")
+        await orchestrator.start({"fn": old}, ["fn"])
+
+        # Act
+        await orchestrator.replace("fn", new)
+
+        # Assert
+        assert old.stopped is True
+        assert new.started is True
+        assert orchestrator.providers["fn"] is new
+
+    async def test_new_node_is_stopped_on_shutdown(self) -> None:
+        # Arrange
+        orchestrator = Orchestrator()
+        added = FakeProvider("added")
+        await orchestrator.start({"a": FakeProvider("a")}, ["a"])
+
+        # Act
+        await orchestrator.replace("b", added)
+        await orchestrator.stop()
+
+        # Assert
+        assert added.stopped is True
+
+    async def test_replace_with_none_removes_the_node(self) -> None:
+        # Arrange
+        orchestrator = Orchestrator()
+        removed = FakeProvider("removed")
+        await orchestrator.start({"fn": removed}, ["fn"])
+
+        # Act
+        await orchestrator.replace("fn", None)
+
+        # Assert
+        assert removed.stopped is True
+        assert "fn" not in orchestrator.providers
@@ -0,0 +1,55 @@
+"""Unit tests for grouping providers into concurrent startup levels."""
+
+from __future__ import annotations
+
+from lws.graph.builder import AppGraph, EdgeType, GraphEdge, GraphNode, NodeType
+from lws.runtime.orchestrator import startup_levels
+
+
+def _graph() -> AppGraph:
+    """Two tables, a function reading one of them, and a queue."""
+    graph = AppGraph()
+    for node_id, node_type in (
+        ("Orders", NodeType.DYNAMODB_TABLE),
+        ("Users", NodeType.DYNAMODB_TABLE),
+        ("Api", NodeType.LAMBDA_FUNCTION),
+        ("Jobs", NodeType.SQS_QUEUE),
+    ):
+        graph.add_node(GraphNode(id=node_id, node_type=node_type))
+    graph.add_edge(GraphEdge(source="Api", target="Orders", edge_type=EdgeType.DATA_DEPENDENCY))
+    return graph
+
+
+class TestStartupLevels:
+    def test_independent_nodes_share_a_level(self) -> None:
+        # Arrange
+        order = ["Orders", "Users", "Jobs", "Api"]
+        expected_levels = [["Orders", "Users", "Jobs"], ["Api"]]
+
+        # Act
+        actual = startup_levels(order, _graph())
+
+        # Assert
+        assert actual == expected_levels
+
+    def test_nodes_outside_the_graph_start_last_together(self) -> None:
+        # Arrange
+        order = ["Orders", "Api", "__sqs_http__", "__management_http__"]
+        expected_levels = [["Orders"], ["Api"], ["__sqs_http__", "__management_http__"]]
+
+        # Act
+        actual = startup_levels(order, _graph())
+
+        # Assert
+        assert actual == expected_levels
+
+    def test_without_a_graph_nodes_start_one_at_a_time(self) -> None:
+        # Arrange
+        order = ["a", "b", "c"]
+        expected_levels = [["a"], ["b"], ["c"]]
+
+        # Act
+        actual = startup_levels(order)
+
+        # Assert
+        assert actual == expected_levels
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import time
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -71,6 +72,78 @@ def test_is_synth_stale_excludes_node_modules(tmp_path: Path) -> None:
     assert is_synth_stale(tmp_path) is False
 
 
+def _fresh_project(tmp_path: Path) -> Path:
+    """Create a project whose cdk.out is newer than its sources and index it."""
+    lib = tmp_path / "lib"
+    lib.mkdir()
+    (lib / "stack.ts").write_text("// stack")
+    time.sleep(0.05)
+    cdk_out = tmp_path / "cdk.out"
+    cdk_out.mkdir()
+    (cdk_out / "manifest.json").write_text("{}")
+    assert is_synth_stale(tmp_path) is False
+    return lib
+
+
+def test_is_synth_stale_persists_source_index(tmp_path: Path) -> None:
+    """A fresh check records the scanned sources next to the manifest."""
+    _fresh_project(tmp_path)
+
+    index = json.loads((tmp_path / "cdk.out" / ".lws-source-index.json").read_text())
+
+    assert set(index["files"]) == {"lib/stack.ts"}
+
+
+def test_is_synth_stale_index_detects_modified_source(tmp_path: Path) -> None:
+    """An indexed source whose size changed makes synth stale."""
+    lib = _fresh_project(tmp_path)
+
+    (lib / "stack.ts").write_text("// stack, edited")
+
+    assert is_synth_stale(tmp_path) is True
+
+
+def test_is_synth_stale_index_detects_new_source_directory(tmp_path: Path) -> None:
+    """A new directory holding a source file makes synth stale."""
+    lib = _fresh_project(tmp_path)
+
+    (lib / "constructs").mkdir()
+    (lib / "constructs" / "queue.ts").write_text("// queue")
+
+    assert is_synth_stale(tmp_path) is True
+
+
+def test_is_synth_stale_index_detects_source_in_new_empty_directory(tmp_path: Path) -> None:
+    """A source file added to a directory created after the last check makes synth stale."""
+    _fresh_project(tmp_path)
+    (tmp_path / "newdir" / "nested").mkdir(parents=True)
+    assert is_synth_stale(tmp_path) is False
+
+    (tmp_path / "newdir" / "nested" / "stack.ts").write_text("// stack")
+
+    assert is_synth_stale(tmp_path) is True
+
+
+def test_is_synth_stale_index_ignores_new_non_source_file(tmp_path: Path) -> None:
+    """Files that are not CDK sources do not make synth stale."""
+    lib = _fresh_project(tmp_path)
+
+    (lib / "notes.md").write_text("notes")
+
+    assert is_synth_stale(tmp_path) is False
+
+
+def test_is_synth_stale_ignores_index_for_other_manifest(tmp_path: Path) -> None:
+    """An index taken for an older manifest is discarded in favour of a walk."""
+    lib = _fresh_project(tmp_path)
+    (lib / "stack.ts").write_text("// stack, edited")
+    time.sleep(0.05)
+
+    (tmp_path / "cdk.out" / "manifest.json").write_text('{"version": "2"}')
+
+    assert is_synth_stale(tmp_path) is False
+
+
 # ---------------------------------------------------------------------------
 # ensure_synth
 # ---------------------------------------------------------------------------